@@ -102,6 +102,75 @@ options:
     default: "cloudera.cloud"
     aliases:
       - agent_header
+  pool_size:
+    description:
+      - The number of keep-alive connections to retain per Cloudera on cloud API host.
+      - When greater than V(0), requests reuse established TCP and TLS sessions rather than performing a new handshake for every call.
+      - If V(0), each request opens a new connection.
+    type: int
+    required: False
+    default: 0
+    aliases:
+      - connection_pool_size
+  pool_idle_timeout:
+    description:
+      - The number of seconds an idle pooled connection may be reused before it is discarded.
+      - Only used when O(pool_size) is greater than V(0).
+    type: int
+    required: False
+    default: 30
+  rate_limit:
+    description:
+      - The maximum number of requests per second this task sends to the Cloudera on cloud API.
+      - Requests above the limit are delayed on the client rather than sent and rejected with HTTP 429.
+      - If V(0), requests are not limited, but a C(Retry-After) from the API still pauses further requests.
+    type: float
+    required: False
+    default: 0
+  rate_limit_burst:
+    description:
+      - The number of requests that may be sent at once before O(rate_limit) applies.
+      - Defaults to the rate limit, rounded up.
+    type: int
+    required: False
+  endpoint_rate_limits:
+    description:
+      - Requests per second for individual API endpoints, overriding O(rate_limit).
+      - Each key is an API path prefix, for example C(/api/v1/iam/) or C(/api/v1/iam/listUsers); the longest matching prefix applies.
+      - Each prefix is limited independently of other endpoints.
+    type: dict
+    required: False
+  response_cache:
+    description:
+      - Whether to cache the responses of describe and list calls on disk, so later tasks and runs can reuse them.
+      - Entries are keyed by the endpoint, the API operation, the request body and the access key.
+      - A create, update or delete call removes the cached entries of the same service that it could make stale.
+      - Within a task, a cached entry is used at most once, so waiting for a resource always observes its current state.
+      - If not provided, the API will attempt to use the value from the environment variable E(CDP_RESPONSE_CACHE).
+    type: bool
+    required: False
+    default: False
+  response_cache_dir:
+    description:
+      - The directory in which cached responses are stored.
+      - Cached responses may contain sensitive details, so the directory and its files are created readable by the owner only.
+      - If not provided, the API will attempt to use the value from the environment variable E(CDP_RESPONSE_CACHE_DIR).
+    type: path
+    required: False
+    default: ~/.cache/cloudera.cloud/responses
+  response_cache_ttl:
+    description:
+      - The number of seconds for which a cached response is valid.
+    type: int
+    required: False
+    default: 300
+  response_cache_max_size:
+    description:
+      - The maximum size of the response cache in megabytes.
+      - When exceeded, the least recently used responses are removed.
+    type: int
+    required: False
+    default: 50
   strict:
     description:
       - Legacy CDPy SDK error handling.
@@ -32,7 +32,7 @@ DOCUMENTATION = """
                 - A CDP Public Cloud Environment name.
             required: True
     notes:
-        - Requires C(cdpy).
+        - Uses the CDP credentials of the C(CDP_ACCESS_KEY_ID) and C(CDP_PRIVATE_KEY) environment variables, else of the C(CDP_PROFILE) profile of the C(~/.cdp/credentials) file.
     seealso:
         - module: cloudera.cloud.datalake_runtime_info
           description: Cloudera CDP Public Cloud Datalake Runtime module
@@ -60,8 +60,15 @@ from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_native
 from ansible.utils.display import Display
 
-from cdpy.cdpy import Cdpy
-from cdpy.common import CdpError
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_datalake import (
+    CdpDatalakeClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_service import (
+    get_lookup_client,
+)
 
 display = Display()
 
@@ -71,9 +78,10 @@ class LookupModule(LookupBase):
         self.set_options(var_options=variables, direct=kwargs)
 
         try:
+            client = CdpDatalakeClient(api_client=get_lookup_client())
             results = []
             for term in terms:
-                env = Cdpy().datalake.describe_all_datalakes(term)
+                env = client.describe_all_datalakes(term)
                 if not env:
                     raise AnsibleError("No Datalake found for Environment '%s'" % term)
                 elif len(env) > 1:
@@ -51,7 +51,7 @@ DOCUMENTATION = """
             default: False
     notes:
         - You can pass the C(Undefined) object as C(default) to force an undefined error.
-        - Requires C(cdpy).
+        - Uses the CDP credentials of the C(CDP_ACCESS_KEY_ID) and C(CDP_PRIVATE_KEY) environment variables, else of the C(CDP_PROFILE) profile of the C(~/.cdp/credentials) file.
 """
 
 EXAMPLES = """
@@ -91,10 +91,14 @@ from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_native
 
-from cdpy.cdpy import Cdpy
-from cdpy.common import CdpError
-
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_datalake import (
+    CdpDatalakeClient,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_service import (
+    get_lookup_client,
     parse_services,
 )
 
@@ -109,17 +113,16 @@ class LookupModule(LookupBase):
             )
 
         try:
+            client = CdpDatalakeClient(api_client=get_lookup_client())
             dl = None
             if self.get_option("datalake"):
-                dl = Cdpy().datalake.describe_datalake(self.get_option("datalake"))
+                dl = client.describe_datalake(self.get_option("datalake"))
                 if dl is None:
                     raise AnsibleError(
                         "No Datalake found for '%s'" % self.get_option("datalake"),
                     )
             else:
-                env = Cdpy().datalake.describe_all_datalakes(
-                    self.get_option("environment"),
-                )
+                env = client.describe_all_datalakes(self.get_option("environment"))
                 if not env:
                     raise AnsibleError(
                         "No Environment found for '%s'"
@@ -41,7 +41,7 @@ DOCUMENTATION = """
             default: False
 
     notes:
-        - Requires C(cdpy).
+        - Uses the CDP credentials of the C(CDP_ACCESS_KEY_ID) and C(CDP_PRIVATE_KEY) environment variables, else of the C(CDP_PROFILE) profile of the C(~/.cdp/credentials) file.
 """
 
 
@@ -67,8 +67,15 @@ from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_text, to_native
 from ansible.utils.display import Display
 
-from cdpy.cdpy import Cdpy
-from cdpy.common import CdpError
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_env import (
+    CdpEnvClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_service import (
+    get_lookup_client,
+)
 
 
 display = Display()
@@ -79,9 +86,12 @@ class LookupModule(LookupBase):
         self.set_options(var_options=variables, direct=kwargs)
 
         try:
+            client = CdpEnvClient(api_client=get_lookup_client())
             results = []
             for term in LookupBase._flatten(terms):
-                environment = Cdpy().environments.describe_environment(term)
+                environment = client.describe_environment(term)
+                if environment is None:
+                    raise AnsibleError("No Environment found for '%s'" % term)
                 freeipa_client_domain = environment["freeipa"]["domain"]
 
                 if self.get_option("detailed"):
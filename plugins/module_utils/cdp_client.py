@@ -20,20 +20,75 @@ A common Ansible-based REST client for the Cloudera on Cloud Platform (CDP)
 
 import abc
 import configparser
+import contextlib
+import datetime
 import functools
+import hashlib
+import http.client
+import io
 import json
 import os
+import queue
+import random
+import socket
+import ssl
+import tempfile
+import threading
 import time
 
 from base64 import b64decode, urlsafe_b64encode
 from collections import OrderedDict
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from email.utils import formatdate
-from typing import Any, Dict, Optional, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple, Union
 from urllib.parse import urlparse
+from urllib.request import getproxies_environment, proxy_bypass_environment
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.urls import fetch_url
+
+
+# The cryptography package and ansible.module_utils.urls (with the TLS and
+# X.509 support it loads) dominate the import time of this module. Ansible
+# starts a fresh interpreter for every task, so both are imported on first
+# use rather than when a module is loaded.
+
+
+def fetch_url(
+    module: AnsibleModule,
+    url: str,
+    **kwargs,
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Make an HTTP request with Ansible's fetch_url, importing
+    ansible.module_utils.urls on first use.
+
+    Args:
+        module: The Ansible module making the request
+        url: Full request URL
+        **kwargs: Keyword arguments passed to fetch_url
+
+    Returns:
+        Tuple of (resp, info) as returned by fetch_url
+    """
+    from ansible.module_utils.urls import fetch_url as ansible_fetch_url
+
+    return ansible_fetch_url(module, url, **kwargs)
+
+
+def load_ed25519_private_key(seed: bytes) -> Any:
+    """
+    Parse an Ed25519 private key, importing the cryptography package on first
+    use.
+
+    Args:
+        seed: The 32-byte private key seed
+
+    Returns:
+        The Ed25519PrivateKey
+    """
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    return ed25519.Ed25519PrivateKey.from_private_bytes(seed)
 
 
 class CdpCredentialError(Exception):
@@ -145,7 +200,7 @@ def create_signature_string(
     seed = b64decode(private_key)
     if len(seed) != 32:
         raise Exception("Not an Ed25519 private key!")
-    parsed_private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed)
+    parsed_private_key = load_ed25519_private_key(seed)
 
     signature = parsed_private_key.sign(
         canonical_string.encode("utf-8"),
@@ -215,6 +270,82 @@ def make_signature_header(
     return signature_header
 
 
+class CdpRequestSigner:
+    """
+    Signs CDP API requests with a pre-parsed Ed25519 private key.
+
+    The private key is decoded and parsed, and the authentication parameters
+    are encoded, once at construction. Signing a request then only builds the
+    canonical request string and signs it.
+    """
+
+    AUTH_METHOD = "ed25519v1"
+
+    def __init__(self, access_key: str, private_key: str):
+        """
+        Initialize the request signer.
+
+        Args:
+            access_key: CDP access key ID
+            private_key: Base64-encoded Ed25519 private key seed
+
+        Raises:
+            CdpCredentialError: If the private key is not an ed25519v1 key
+        """
+        if len(private_key) != 44:
+            raise CdpCredentialError("Only ed25519v1 keys are supported!")
+
+        seed = b64decode(private_key)
+        if len(seed) != 32:
+            raise Exception("Not an Ed25519 private key!")
+
+        self.access_key = access_key
+        self._private_key = load_ed25519_private_key(seed)
+        self._encoded_authn_params = create_encoded_authn_params_string(
+            access_key,
+            self.AUTH_METHOD,
+        )
+
+    def sign(self, method: str, uri: str, headers: Dict[str, str]) -> str:
+        """
+        Generate the x-altus-auth header value for a request.
+
+        Args:
+            method: HTTP method
+            uri: Request URI or path
+            headers: Request headers
+
+        Returns:
+            The signature header value
+        """
+        canonical_string = create_canonical_request_string(
+            method,
+            uri,
+            headers,
+            self.AUTH_METHOD,
+        )
+        signature = self._private_key.sign(canonical_string.encode("utf-8"))
+        return create_signature_header(
+            self._encoded_authn_params,
+            urlsafe_b64encode(signature).strip().decode("utf-8"),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def get_request_signer(access_key: str, private_key: str) -> CdpRequestSigner:
+    """
+    Return the request signer for a credential pair, creating it on first use.
+
+    Args:
+        access_key: CDP access key ID
+        private_key: Base64-encoded Ed25519 private key seed
+
+    Returns:
+        The shared CdpRequestSigner for these credentials
+    """
+    return CdpRequestSigner(access_key, private_key)
+
+
 class CdpError(Exception):
     """CDP Client Error Exception"""
 
@@ -231,6 +362,23 @@ class CdpError(Exception):
         self.status = status
 
 
+class CdpMutationError(CdpError):
+    """Raised when some of a batch of mutating requests fail."""
+
+    def __init__(self, msg: str, applied: int, errors: List[Dict[str, str]]):
+        """
+        Initialize the mutation error.
+
+        Args:
+            msg: Error message
+            applied: Number of mutations that succeeded
+            errors: The failed mutations, each with its C(item) and C(error)
+        """
+        super().__init__(msg)
+        self.applied = applied
+        self.errors = errors
+
+
 class CdpClient:
     """Abstract base class for CDP REST API clients."""
 
@@ -284,6 +432,29 @@ class CdpClient:
         """Execute HTTP DELETE request."""
         pass
 
+    @contextlib.contextmanager
+    def raising_errors(self) -> Iterator[None]:
+        """
+        Raise CdpError for requests that fail on the current thread within this context.
+
+        Clients that otherwise report failed requests by other means, e.g. by
+        failing the Ansible module, override this so that callers can collect
+        the errors of individual requests.
+        """
+        yield
+
+    @contextlib.contextmanager
+    def reporting_errors(self) -> Iterator[None]:
+        """
+        Report a CdpError raised within this context as a failed request.
+
+        The counterpart of C(raising_errors), for errors collected from other
+        threads: clients that report failed requests by other means, e.g. by
+        failing the Ansible module, override this so that such an error is
+        reported once, from the calling thread.
+        """
+        yield
+
     @staticmethod
     def paginated(default_page_size=100):
         """
@@ -305,30 +476,17 @@ class CdpClient:
         def decorator(func):
             @functools.wraps(func)
             def wrapper(self, *args, **kwargs):
-                # Add default page size if not specified
-                paginated_kwargs = kwargs.copy()
-                if "pageSize" not in paginated_kwargs:
-                    # Use instance page size if available, otherwise use decorator default
-                    page_size = getattr(
-                        self,
-                        "page_size",
-                        default_page_size,
-                    )
-                    paginated_kwargs["pageSize"] = page_size
+                pages = _iter_pages(func, self, default_page_size, args, kwargs)
 
                 # Get the initial response
-                response = func(self, *args, **paginated_kwargs)
+                response = next(pages)
 
                 if not isinstance(response, dict):
                     return response
 
                 # Determine which pagination token is used
-                next_token_key = None
-                if "nextPageToken" in response:
-                    next_token_key = "nextPageToken"
-                elif "nextToken" in response:
-                    next_token_key = "nextToken"
-                else:
+                next_token_key = _next_token_key(response)
+                if next_token_key is None:
                     # No pagination token found, return as-is
                     return response
 
@@ -345,29 +503,7 @@ class CdpClient:
                         all_items[key] = value
 
                 # Continue pagination while nextToken exists
-                while next_token_key in all_items:
-                    token = all_items.pop(next_token_key)
-
-                    # Add pagination parameters
-                    paginated_kwargs = kwargs.copy()
-                    paginated_kwargs["pageToken"] = token
-
-                    # Add default page size if not specified
-                    if "pageSize" not in paginated_kwargs:
-                        # Use instance page size if available, otherwise use decorator default
-                        page_size = getattr(
-                            self,
-                            "page_size",
-                            default_page_size,
-                        )
-                        paginated_kwargs["pageSize"] = page_size
-
-                    # Get next page
-                    next_page = func(self, *args, **paginated_kwargs)
-
-                    if not isinstance(next_page, dict):
-                        break
-
+                for next_page in pages:
                     # Combine list data from this page
                     for key in list_keys:
                         if key in next_page and isinstance(next_page[key], list):
@@ -378,12 +514,1163 @@ class CdpClient:
                         if key not in list_keys and not key.startswith("page"):
                             all_items[key] = value
 
+                all_items.pop(next_token_key, None)
                 return all_items
 
+            wrapper.default_page_size = default_page_size
             return wrapper
 
         return decorator
 
+    @staticmethod
+    def iter_pages(method, *args, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the raw pages of a paginated CDP API method.
+
+        Each page is requested only when the caller asks for it, so breaking out
+        of the loop stops any further API calls. Use this instead of calling the
+        method directly when searching for a single entry or when the combined
+        response would be too large to hold in memory.
+
+        Usage:
+            for page in CdpClient.iter_pages(iam_client.list_users):
+                ...
+
+        Args:
+            method: A bound method decorated with C(CdpClient.paginated)
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Iterator of page responses
+
+        Raises:
+            TypeError: If the method is not decorated with C(CdpClient.paginated)
+        """
+        func = getattr(method, "__wrapped__", None)
+        instance = getattr(method, "__self__", None)
+        if func is None or instance is None:
+            raise TypeError(
+                f"{getattr(method, '__name__', method)!r} is not a bound paginated method",
+            )
+        default_page_size = getattr(method, "default_page_size", 100)
+        return _iter_pages(func, instance, default_page_size, args, kwargs)
+
+    @staticmethod
+    def iter_items(method, key: str, *args, **kwargs) -> Iterator[Any]:
+        """
+        Iterate over the entries of a list field across the pages of a paginated CDP API method.
+
+        Usage:
+            for user in CdpClient.iter_items(iam_client.list_users, "users"):
+                ...
+
+        Args:
+            method: A bound method decorated with C(CdpClient.paginated)
+            key: The response field holding the list of entries, e.g. C(users)
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Iterator of list entries
+        """
+        for page in CdpClient.iter_pages(method, *args, **kwargs):
+            if not isinstance(page, dict):
+                return
+            yield from page.get(key) or []
+
+
+def _next_token_key(response: Dict[str, Any]) -> Optional[str]:
+    """Return the pagination token field used by a CDP API response, if any."""
+    if "nextPageToken" in response:
+        return "nextPageToken"
+    if "nextToken" in response:
+        return "nextToken"
+    return None
+
+
+def _iter_pages(
+    func,
+    instance,
+    default_page_size: int,
+    args: tuple,
+    kwargs: Dict[str, Any],
+) -> Iterator[Any]:
+    """
+    Lazily request successive pages from an undecorated paginated API method.
+
+    The first response is always yielded, even if it is not a dict, so callers
+    can pass it through unchanged. Iteration ends when a response carries no
+    (or an empty) pagination token or a subsequent response is not a dict.
+    """
+
+    def page_kwargs(token=None):
+        paginated_kwargs = kwargs.copy()
+        if token is not None:
+            paginated_kwargs["pageToken"] = token
+
+        # Add default page size if not specified
+        if "pageSize" not in paginated_kwargs:
+            # Use instance page size if available, otherwise use decorator default
+            paginated_kwargs["pageSize"] = getattr(
+                instance,
+                "page_size",
+                default_page_size,
+            )
+        return paginated_kwargs
+
+    page = func(instance, *args, **page_kwargs())
+    yield page
+
+    if not isinstance(page, dict):
+        return
+
+    next_token_key = _next_token_key(page)
+    if next_token_key is None:
+        return
+
+    while page.get(next_token_key):
+        page = func(instance, *args, **page_kwargs(page[next_token_key]))
+        if not isinstance(page, dict):
+            return
+        yield page
+
+
+def concurrent_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    parallelism: int = 1,
+) -> List[Any]:
+    """
+    Apply a function to each item using a bounded pool of worker threads.
+
+    Results are returned in the order of the input items, regardless of the
+    order in which the workers complete, so output stays deterministic. With a
+    C(parallelism) of 1 or less, the items are processed sequentially in the
+    calling thread. If any call raises, pending calls are cancelled and the
+    first exception, in input order, is re-raised.
+
+    Args:
+        func: Function to call with each item
+        items: Items to process
+        parallelism: Maximum number of concurrent calls
+
+    Returns:
+        List of results, one per item, in input order
+    """
+    items = list(items)
+    if parallelism <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def concurrent_requests(
+    api_client: Any,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    parallelism: int = 1,
+) -> List[Any]:
+    """
+    Apply a function making requests to each item using a bounded pool of worker threads.
+
+    Like C(concurrent_map), but each call runs within the C(raising_errors)
+    context of the client, so that a failed request raises CdpError in its
+    worker rather than failing the module from that thread. The first error,
+    in input order, is then reported once from the calling thread, within
+    the C(reporting_errors) context of the client.
+
+    Args:
+        api_client: The client making the requests, e.g. a CdpClient or a
+            service client providing C(raising_errors) and C(reporting_errors)
+        func: Function to call with each item
+        items: Items to process
+        parallelism: Maximum number of concurrent calls
+
+    Returns:
+        List of results, one per item, in input order
+    """
+
+    def run(item: Any) -> Any:
+        with api_client.raising_errors():
+            return func(item)
+
+    with api_client.reporting_errors():
+        return concurrent_map(run, items, parallelism)
+
+
+def concurrent_calls(
+    calls: Iterable[Callable[[], Any]],
+    parallelism: int = 1,
+    timeout: Optional[float] = None,
+) -> List[Tuple[Any, Optional[BaseException]]]:
+    """
+    Run independent calls concurrently, each within its own timeout.
+
+    Unlike C(concurrent_map), a failing call does not abort the others; its
+    exception is returned in place of its result, so callers can report
+    partial results. Each call runs in a daemon thread, and at most
+    C(parallelism) calls run at once. A call still running C(timeout) seconds
+    after it started is abandoned with a C(TimeoutError) and its slot is
+    given to the next call; an abandoned thread cannot be stopped, but does
+    not hold up the exit of the module.
+
+    Args:
+        calls: Functions without arguments to call
+        parallelism: Maximum number of concurrent calls
+        timeout: Maximum duration of each call in seconds; None for no limit
+
+    Returns:
+        List of (result, error) tuples, one per call, in input order; error is
+        None if the call succeeded
+    """
+    calls = list(calls)
+    results: List[Tuple[Any, Optional[BaseException]]] = [(None, None)] * len(calls)
+
+    if timeout is None and (parallelism <= 1 or len(calls) <= 1):
+        for index, call in enumerate(calls):
+            try:
+                results[index] = (call(), None)
+            except Exception as e:
+                results[index] = (None, e)
+        return results
+
+    completed: "queue.Queue[Tuple[int, Any, Optional[BaseException]]]" = queue.Queue()
+
+    def run(index: int, call: Callable[[], Any]) -> None:
+        try:
+            completed.put((index, call(), None))
+        except BaseException as e:
+            completed.put((index, None, e))
+
+    pending = list(enumerate(calls))
+    pending.reverse()
+    running: Dict[int, float] = {}  # index -> deadline
+    while pending or running:
+        while pending and len(running) < max(parallelism, 1):
+            index, call = pending.pop()
+            running[index] = (
+                time.monotonic() + timeout if timeout is not None else float("inf")
+            )
+            threading.Thread(target=run, args=(index, call), daemon=True).start()
+
+        wait = min(running.values()) - time.monotonic()
+        try:
+            index, result, error = completed.get(
+                timeout=max(wait, 0) if wait != float("inf") else None,
+            )
+            # Ignore late completions of abandoned calls
+            if running.pop(index, None) is not None:
+                results[index] = (result, error)
+        except queue.Empty:
+            now = time.monotonic()
+            for index, deadline in list(running.items()):
+                if deadline <= now:
+                    del running[index]
+                    results[index] = (
+                        None,
+                        TimeoutError(f"Timed out after {timeout} seconds"),
+                    )
+
+    return results
+
+
+def apply_mutations(
+    api_client: Any,
+    mutations: Iterable[Tuple[str, Callable[[], Any]]],
+    parallelism: int = 1,
+) -> int:
+    """
+    Apply independent mutating requests using a bounded pool of worker threads.
+
+    Every mutation is attempted, even if others fail, and the errors are
+    collected per item rather than failing on the first one.
+
+    Args:
+        api_client: The client making the requests, e.g. a CdpClient or a
+            service client providing C(raising_errors)
+        mutations: Pairs of a label identifying the changed item, e.g. a CRN, and
+            a function without arguments making the request
+        parallelism: Maximum number of concurrent requests
+
+    Returns:
+        The number of mutations applied
+
+    Raises:
+        CdpMutationError: If any mutation failed
+    """
+    mutations = list(mutations)
+
+    def run(call: Callable[[], Any]) -> Any:
+        with api_client.raising_errors():
+            return call()
+
+    results = concurrent_calls(
+        [functools.partial(run, call) for _, call in mutations],
+        parallelism=parallelism,
+    )
+
+    errors = [
+        dict(item=label, error=str(error))
+        for (label, _), (_, error) in zip(mutations, results)
+        if error is not None
+    ]
+    if errors:
+        raise CdpMutationError(
+            f"{len(errors)} of {len(mutations)} changes failed: "
+            + "; ".join(f"{e['item']}: {e['error']}" for e in errors),
+            applied=len(mutations) - len(errors),
+            errors=errors,
+        )
+    return len(mutations)
+
+
+class CdpListFilter:
+    """
+    Equality predicates on the entries of a CDP list operation.
+
+    Predicates that the API can evaluate are pushed into the request, so
+    that fewer entries are transferred. The filters of the API are often
+    broader than an equality, e.g. a C(searchTerm) matching any part of a
+    name, so every predicate is still checked on the returned entries.
+    Predicates that the API cannot evaluate are only checked on the entries,
+    one at a time as the pages are read.
+
+    Usage:
+        predicate = CdpListFilter(name="my-flow")
+        flows = predicate.apply(
+            CdpClient.iter_items(
+                df_client.list_flow_definitions,
+                "flows",
+                **predicate.arguments(name="search_term"),
+            ),
+        )
+    """
+
+    def __init__(self, predicates: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """
+        Initialize the filter.
+
+        Args:
+            predicates: Mapping of entry field to required value; a dotted
+                field, e.g. C(status.state), reads a nested value
+            **kwargs: Further predicates, for fields that are valid names
+
+        Predicates with a value of None are ignored.
+        """
+        self.predicates = {
+            field: value
+            for field, value in {**(predicates or {}), **kwargs}.items()
+            if value is not None
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.predicates)
+
+    def arguments(self, **pushdown: str) -> Dict[str, Any]:
+        """
+        Return the arguments pushing predicates into the request.
+
+        Args:
+            **pushdown: Mapping of entry field to the list method argument, or
+                request field, that the API filters that field by
+
+        Returns:
+            The arguments for the predicates the API can evaluate
+        """
+        return {
+            argument: self.predicates[field]
+            for field, argument in pushdown.items()
+            if field in self.predicates
+        }
+
+    @staticmethod
+    def _value(entry: Any, field: str) -> Any:
+        for key in field.split("."):
+            if not isinstance(entry, dict):
+                return None
+            entry = entry.get(key)
+        return entry
+
+    def matches(self, entry: Any) -> bool:
+        """Return True if the entry satisfies every predicate."""
+        return all(
+            self._value(entry, field) == value
+            for field, value in self.predicates.items()
+        )
+
+    def apply(self, entries: Iterable[Any]) -> Iterator[Any]:
+        """
+        Lazily yield the entries satisfying every predicate.
+
+        Args:
+            entries: The entries, e.g. an iterator over the pages of a list call
+
+        Returns:
+            Iterator of the matching entries
+        """
+        if not self.predicates:
+            return iter(entries)
+        return (entry for entry in entries if self.matches(entry))
+
+
+class CdpStreamingBody(abc.ABC):
+    """
+    Request body that is streamed from a file-like source rather than held in memory.
+
+    Pass an instance as the C(data) of a request. Every attempt, retry, and
+    redirect calls C(open) for a fresh reader, so the body is never buffered
+    in full and can be sent more than once.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the streaming body.
+
+        Args:
+            data: The small, in-memory part of the request, e.g. names and CRNs
+        """
+        self.data = data if data is not None else {}
+
+    @abc.abstractmethod
+    def open(self) -> Tuple[Any, int]:
+        """
+        Open a new reader positioned at the start of the body.
+
+        Returns:
+            Tuple of (binary file-like reader, content length in bytes)
+        """
+        pass
+
+
+class CdpRequestNotSentError(OSError):
+    """Raised when a request failed before any of it was sent, so it is safe to send again."""
+
+
+class CdpConnectionPool:
+    """
+    Keep-alive HTTP(S) connection pool for the CDP REST API.
+
+    Connections are keyed by scheme, host, and port, so every request to the
+    same CDP endpoint reuses an already established TCP and TLS session instead
+    of performing a fresh handshake. The pool is thread-safe; concurrent callers
+    each check out their own connection, and at most C(max_size) idle
+    connections are retained per host.
+    """
+
+    DEFAULT_PORTS = {"http": 80, "https": 443}
+
+    def __init__(
+        self,
+        max_size: int = 1,
+        idle_timeout: int = 30,
+        validate_certs: bool = True,
+        http_agent: Optional[str] = None,
+        use_proxy: bool = True,
+    ):
+        """
+        Initialize the connection pool.
+
+        Args:
+            max_size: Maximum number of idle connections retained per host
+            idle_timeout: Seconds an idle connection may be reused before it is discarded
+            validate_certs: Verify the TLS certificate of HTTPS endpoints
+            http_agent: Optional User-Agent header value for every request
+            use_proxy: Honor the C(https_proxy)/C(http_proxy) environment variables
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.validate_certs = validate_certs
+        self.http_agent = http_agent
+        self.use_proxy = use_proxy
+
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[Any, float]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+        # Transport statistics (a new connection is a new TCP/TLS handshake)
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    @property
+    def handshakes_avoided(self) -> int:
+        """Number of requests served on a reused connection."""
+        return self.requests_sent - self.connections_opened
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            if self.validate_certs:
+                self._ssl_context = ssl.create_default_context()
+            else:
+                self._ssl_context = ssl._create_unverified_context()
+        return self._ssl_context
+
+    def _connect(self, key: Tuple[str, str, int], timeout: int) -> Any:
+        """Open a new connection for the scheme, host, and port key."""
+        scheme, host, port = key
+
+        proxy = None
+        if self.use_proxy and not proxy_bypass_environment(host):
+            proxy = getproxies_environment().get(scheme)
+
+        if proxy:
+            parsed_proxy = urlparse(proxy)
+            target_host = parsed_proxy.hostname
+            target_port = parsed_proxy.port or self.DEFAULT_PORTS.get(
+                parsed_proxy.scheme,
+                80,
+            )
+        else:
+            target_host, target_port = host, port
+
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                target_host,
+                target_port,
+                timeout=timeout,
+                context=self._get_ssl_context(),
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                target_host,
+                target_port,
+                timeout=timeout,
+            )
+
+        if proxy:
+            conn.set_tunnel(host, port)
+
+        conn.connect()
+
+        # Headers and body are written separately; do not let Nagle delay the body
+        conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        with self._lock:
+            self.connections_opened += 1
+
+        return conn
+
+    def _acquire(self, key: Tuple[str, str, int], timeout: int) -> Tuple[Any, bool]:
+        """Check out an idle connection for the key, or open a new one."""
+        now = time.monotonic()
+        stale = []
+        conn = None
+
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+
+        for candidate in stale:
+            candidate.close()
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        return self._connect(key, timeout), False
+
+    def _release(self, key: Tuple[str, str, int], conn: Any) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_size:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+    @staticmethod
+    def _is_stale(error: Exception, sent: bool) -> bool:
+        """
+        Return whether an error shows that a reused connection was closed before the request was accepted.
+
+        Only then is it safe to send the request again, since the server
+        cannot have processed it. A reset while sending, or an empty status
+        line in place of the response, shows a keep-alive connection that the
+        server had already closed. Timeouts, and errors after the response
+        began, are never retried, since the request may have been processed.
+
+        Args:
+            error: The error raised by the connection
+            sent: Whether the request was sent in full
+
+        Returns:
+            True if the request can be sent again on a fresh connection
+        """
+        if isinstance(error, http.client.RemoteDisconnected):
+            return True
+        return not sent and isinstance(error, (BrokenPipeError, ConnectionResetError))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[Union[str, bytes, Any]] = None,
+        timeout: int = 60,
+    ) -> Tuple[Optional[io.BytesIO], Dict[str, Any]]:
+        """
+        Send a request over a pooled connection.
+
+        The response is read in full so that the connection can be returned to
+        the pool immediately. The return value mirrors the C(fetch_url) tuple:
+        a readable response (or None for error statuses) and an info dictionary
+        with the status, message, lowercase response headers, and, for error
+        statuses, the response body.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            body: Optional request body, either in memory or a seekable binary reader
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Tuple of (response, info)
+
+        Raises:
+            CdpRequestNotSentError: If no connection could be opened for the request
+            OSError, http.client.HTTPException: On other connection failures
+        """
+        parsed = urlparse(url)
+        scheme = parsed.scheme or "https"
+        key = (
+            scheme,
+            parsed.hostname or "",
+            parsed.port or self.DEFAULT_PORTS.get(scheme, 443),
+        )
+
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+
+        request_headers = dict(headers)
+        if self.http_agent and "User-Agent" not in request_headers:
+            request_headers["User-Agent"] = self.http_agent
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        # Remember where a streamed body starts, so it can be sent again
+        start = body.tell() if hasattr(body, "read") else None
+
+        try:
+            conn, reused = self._acquire(key, timeout)
+        except OSError as e:
+            raise CdpRequestNotSentError(str(e)) from e
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            sent = True
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            if not (reused and self._is_stale(e, sent)):
+                raise
+            # The server closed the idle keep-alive connection; retry once on a fresh one
+            if start is not None:
+                body.seek(start)
+            try:
+                conn = self._connect(key, timeout)
+            except OSError as e:
+                raise CdpRequestNotSentError(str(e)) from e
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                resp = conn.getresponse()
+                payload = resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+
+        with self._lock:
+            self.requests_sent += 1
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        info: Dict[str, Any] = {}
+        for name, value in resp.getheaders():
+            name = name.lower()
+            if name in info:
+                info[name] = ", ".join((info[name], value))
+            else:
+                info[name] = value
+
+        info.update(url=url, status=resp.status)
+
+        if resp.status >= 400:
+            info.update(
+                msg=f"HTTP Error {resp.status}: {resp.reason}",
+                body=payload,
+            )
+            return None, info
+
+        info["msg"] = f"OK ({len(payload)} bytes)"
+        return io.BytesIO(payload), info
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: The header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        The delay in seconds, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(
+        (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(),
+        0.0,
+    )
+
+
+def full_jitter_backoff(attempt: int, base: float = 0.5, cap: float = 5) -> float:
+    """
+    Return a full-jitter exponential backoff delay.
+
+    The delay is drawn uniformly between 0 and C(min(cap, base * 2**attempt)),
+    which spreads retries from concurrent callers instead of having them all
+    retry at the same moment.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling of the first retry in seconds
+        cap: Maximum delay ceiling in seconds
+
+    Returns:
+        The delay in seconds
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+class _TokenBucket:
+    """Token bucket with support for a temporary pause, e.g. from Retry-After."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        now = time.monotonic()
+        wait = max(self.paused_until - now, 0.0)
+        if self.rate > 0:
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated) * self.rate,
+            )
+            self.updated = now
+            # Tokens may go negative, queueing concurrent callers behind each other
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+
+class CdpRateLimiter:
+    """
+    Client-side token-bucket rate limiter for the CDP REST API.
+
+    Requests are paced at C(rate) requests per second, allowing bursts of up
+    to C(burst) requests. Individual endpoints may be given their own rate
+    through C(endpoints), a mapping of API path prefix, e.g.
+    C(/api/v1/iam/) or C(/api/v1/iam/listUsers), to requests per second; the
+    longest matching prefix wins and every prefix has its own bucket. A rate
+    of 0 disables pacing, but the bucket can still be paused, so a
+    Retry-After from the server holds back every request to that bucket.
+    The limiter is thread-safe.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0,
+        burst: Optional[int] = None,
+        endpoints: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Default requests per second; 0 for no limit
+            burst: Bucket capacity; defaults to the rate rounded up, at least 1
+            endpoints: Mapping of API path prefix to requests per second
+        """
+        self._lock = threading.Lock()
+        self._burst = burst
+        self._default = _TokenBucket(rate, self._burst_for(rate))
+        self._endpoints: Dict[str, _TokenBucket] = {}
+        for prefix, endpoint_rate in (endpoints or {}).items():
+            self._endpoints["/" + prefix.lstrip("/")] = _TokenBucket(
+                endpoint_rate,
+                self._burst_for(endpoint_rate),
+            )
+        # Longest prefix first
+        self._prefixes = sorted(self._endpoints, key=len, reverse=True)
+
+    def _burst_for(self, rate: float) -> int:
+        if self._burst is not None:
+            return self._burst
+        return max(1, int(-(-rate // 1)))
+
+    def _bucket(self, path: str) -> _TokenBucket:
+        path = "/" + path.lstrip("/")
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return self._endpoints[prefix]
+        return self._default
+
+    def acquire(self, path: str) -> float:
+        """
+        Block until a request to the given path may be sent.
+
+        Args:
+            path: The API path of the request
+
+        Returns:
+            The time spent waiting in seconds
+        """
+        with self._lock:
+            wait = self._bucket(path).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, path: str, delay: float) -> None:
+        """
+        Hold back requests sharing the bucket of the given path.
+
+        Args:
+            path: The API path that was throttled
+            delay: Seconds to pause, e.g. from a Retry-After header
+        """
+        with self._lock:
+            bucket = self._bucket(path)
+            bucket.paused_until = max(bucket.paused_until, time.monotonic() + delay)
+
+
+class CdpRetryBudget:
+    """
+    Limit retries to a fraction of the requests made by a client.
+
+    Each request deposits C(ratio) of a retry, on top of a fixed allowance of
+    C(minimum) retries. When the budget is spent, failed requests are not
+    retried, so a service that is already overloaded is not hit with a
+    multiple of the original load. The budget is thread-safe.
+    """
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10):
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Retries earned per request
+            minimum: Retries always available
+        """
+        self.ratio = ratio
+        self.minimum = minimum
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a request, which earns part of a retry."""
+        with self._lock:
+            self.requests += 1
+
+    def spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        with self._lock:
+            if self.retries >= self.minimum + self.ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+
+class CdpResponseCache:
+    """
+    Opt-in on-disk cache for idempotent CDP API responses.
+
+    Only POST requests to C(describe*) and C(list*) operations are cached.
+    Each entry is keyed by the endpoint, method, path, canonical JSON body and
+    access key, so different tenants, users and arguments never share an
+    entry, and is stored as a JSON file under a per-service directory. Entries
+    expire after C(ttl) seconds. When the total size of the cache exceeds
+    C(max_size) bytes, the least recently used entries are evicted, using the
+    file modification time as the last access time.
+
+    A mutating request invalidates the entries of the same service that
+    could be affected: every list entry, and every describe entry sharing a
+    string value, e.g. a resource name or CRN, with the mutating request.
+
+    An entry is served at most once per process; a repeated read of the same
+    key goes to the API and refreshes the entry. A cache therefore spans tasks
+    and runs, but polling loops within a task always observe fresh state.
+
+    The cache is best-effort: I/O errors are treated as cache misses.
+    """
+
+    CACHEABLE_PREFIXES = ("describe", "list")
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: int = 300,
+        max_size: int = 50 * 1024 * 1024,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            directory: Directory in which to store entries; created if missing
+            ttl: Seconds for which an entry is valid
+            max_size: Maximum total size of the cache in bytes
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._served = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def cacheable(cls, method: str, path: str) -> bool:
+        """Return True if the request is an idempotent describe or list call."""
+        operation = path.rstrip("/").rsplit("/", 1)[-1]
+        return method == "POST" and operation.startswith(cls.CACHEABLE_PREFIXES)
+
+    @staticmethod
+    def _service(path: str) -> str:
+        """Return the service segment of an API path, e.g. iam for /api/v1/iam/listUsers."""
+        segments = [s for s in path.split("/") if s]
+        if len(segments) > 2 and segments[0] == "api":
+            return segments[2]
+        return segments[0] if segments else "_"
+
+    @staticmethod
+    def _identifiers(body: Any) -> List[str]:
+        """Return the string values of a request body, e.g. resource names and CRNs."""
+        found = set()
+        pending = [body]
+        while pending:
+            value = pending.pop()
+            if isinstance(value, str):
+                found.add(value)
+            elif isinstance(value, dict):
+                pending.extend(value.values())
+            elif isinstance(value, list):
+                pending.extend(value)
+        return sorted(found)
+
+    def key(
+        self,
+        base_url: str,
+        method: str,
+        path: str,
+        body: Any,
+        access_key: str,
+    ) -> str:
+        """
+        Create the cache key of a request.
+
+        Args:
+            base_url: The API endpoint
+            method: HTTP method
+            path: Path on the API endpoint
+            body: The request body, before serialization
+            access_key: The access key signing the request
+
+        Returns:
+            The hex digest identifying the request
+        """
+        canonical = json.dumps(
+            [base_url, method, "/" + path.strip("/"), body, access_key],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _file(self, key: str, path: str) -> str:
+        return os.path.join(self.directory, self._service(path), f"{key}.json")
+
+    def get(self, key: str, path: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: The cache key of the request
+            path: Path on the API endpoint
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        with self._lock:
+            served = key in self._served
+            self._served.add(key)
+        entry_file = self._file(key, path)
+        if not served:
+            try:
+                with open(entry_file, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                if entry.get("expires", 0) > time.time():
+                    os.utime(entry_file)
+                    self.hits += 1
+                    return entry.get("response")
+                os.remove(entry_file)
+            except (OSError, ValueError):
+                pass
+        self.misses += 1
+        return None
+
+    def put(self, key: str, path: str, body: Any, response: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: The cache key of the request
+            path: Path on the API endpoint
+            body: The request body, before serialization
+            response: The decoded response
+        """
+        entry = dict(
+            expires=time.time() + self.ttl,
+            path=path,
+            list=path.rstrip("/").rsplit("/", 1)[-1].startswith("list"),
+            identifiers=self._identifiers(body),
+            response=response,
+        )
+        entry_file = self._file(key, path)
+        try:
+            os.makedirs(os.path.dirname(entry_file), mode=0o700, exist_ok=True)
+            # Write atomically; mkstemp creates the file readable by the owner only
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(entry_file), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, separators=(",", ":"))
+                os.replace(tmp, entry_file)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except (OSError, TypeError, ValueError):
+            return
+        self._evict()
+
+    def invalidate(self, path: str, body: Any) -> int:
+        """
+        Remove the entries a mutating request could make stale.
+
+        Args:
+            path: Path on the API endpoint of the mutating request
+            body: The request body, before serialization
+
+        Returns:
+            The number of entries removed
+        """
+        identifiers = set(self._identifiers(body))
+        service_dir = os.path.join(self.directory, self._service(path))
+        removed = 0
+        try:
+            names = os.listdir(service_dir)
+        except OSError:
+            return 0
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            entry_file = os.path.join(service_dir, name)
+            try:
+                with open(entry_file, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                entry_identifiers = set(entry.get("identifiers", []))
+                if (
+                    entry.get("list")
+                    or not identifiers
+                    or not entry_identifiers
+                    or identifiers & entry_identifiers
+                ):
+                    os.remove(entry_file)
+                    removed += 1
+            except (OSError, ValueError):
+                continue
+        return removed
+
+    def _evict(self) -> None:
+        """Remove expired entries, then the least recently used until within the size limit."""
+        now = time.time()
+        entries = []
+        total = 0
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                entry_file = os.path.join(root, name)
+                try:
+                    stat = os.stat(entry_file)
+                    if stat.st_mtime + self.ttl < now:
+                        os.remove(entry_file)
+                        continue
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_file))
+                total += stat.st_size
+
+        for _, size, entry_file in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(entry_file)
+            except OSError:
+                pass
+            total -= size
+
 
 class AnsibleCdpClient(CdpClient):
     """Ansible-based CDP client using native Ansible HTTP methods."""
@@ -397,6 +1684,12 @@ class AnsibleCdpClient(CdpClient):
         timeout_seconds: int = 60,
         proxy_context_path: Optional[str] = None,
         default_page_size: int = 100,
+        pool_size: int = 0,
+        pool_idle_timeout: int = 30,
+        rate_limit: float = 0,
+        rate_limit_burst: Optional[int] = None,
+        endpoint_rate_limits: Optional[Dict[str, float]] = None,
+        response_cache: Optional[CdpResponseCache] = None,
     ):
         """
         Initialize CDP client with Ansible module.
@@ -404,9 +1697,16 @@ class AnsibleCdpClient(CdpClient):
         Args:
             module: AnsibleModule instance
             base_url: Base URL for CDP API
-            timeout_seconds: Request timeout in seconds
+            timeout_seconds: Request timeout in seconds, and the longest Retry-After honoured
             proxy_context_path: Optional CDP proxy context path
             default_page_size: Default page size for paginated requests
+            pool_size: Number of keep-alive connections retained per host.
+                If 0, each request uses Ansible's fetch_url instead.
+            pool_idle_timeout: Seconds an idle pooled connection may be reused
+            rate_limit: Requests per second; 0 for no client-side limit
+            rate_limit_burst: Maximum burst of requests above the rate limit
+            endpoint_rate_limits: Mapping of API path prefix to requests per second
+            response_cache: Optional on-disk cache for describe and list responses
         """
         super().__init__(default_page_size=default_page_size)
 
@@ -417,6 +1717,23 @@ class AnsibleCdpClient(CdpClient):
         self.access_key = access_key
         self.private_key = private_key
 
+        # Request signer, created from the credentials on first use
+        self._signer: Optional[CdpRequestSigner] = None
+
+        # Pacing and Retry-After cool-downs, shared by all threads using this client
+        self.rate_limiter = CdpRateLimiter(
+            rate=rate_limit,
+            burst=rate_limit_burst,
+            endpoints=endpoint_rate_limits,
+        )
+        self.retry_budget = CdpRetryBudget()
+
+        # Optional on-disk cache of describe and list responses
+        self.response_cache = response_cache
+
+        # Per-thread switch to raise errors rather than fail the module
+        self._errors = threading.local()
+
         # Build headers
         self.headers = {
             "Content-Type": "application/json",
@@ -427,17 +1744,122 @@ class AnsibleCdpClient(CdpClient):
         if self.proxy_context_path:
             self.headers["X-ProxyContextPath"] = self.proxy_context_path
 
+        # Use a keep-alive connection pool if requested
+        self.pool: Optional[CdpConnectionPool] = None
+        if pool_size > 0:
+            self.pool = CdpConnectionPool(
+                max_size=pool_size,
+                idle_timeout=pool_idle_timeout,
+                validate_certs=self.module.params.get("endpoint_tls", True),
+                http_agent=self.module.params.get("http_agent"),
+            )
+
     def _url(self, path: str) -> str:
         """Construct full URL from path."""
         return f"{self.base_url}/{path.strip('/')}"
 
+    @staticmethod
+    def _is_idempotent(method: str, path: str) -> bool:
+        """Return True if a request can be repeated without side effects, i.e. a GET or a describe, get, or list call."""
+        operation = path.rstrip("/").rsplit("/", 1)[-1]
+        return method == "GET" or operation.startswith(("describe", "get", "list"))
+
+    def _sign(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        """
+        Create the x-altus-auth header value for a request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL or path
+            headers: Request headers
+
+        Returns:
+            The signature header value
+        """
+        if self._signer is None:
+            self._signer = get_request_signer(self.access_key, self.private_key)
+        return self._signer.sign(method, url, headers)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[Union[str, CdpStreamingBody]],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Send a single HTTP request, using the connection pool if enabled.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            body: Request body (may be None), or a body to stream from its source
+
+        Returns:
+            Tuple of (resp, info) in the form returned by fetch_url
+        """
+        if isinstance(body, CdpStreamingBody):
+            reader, length = body.open()
+            try:
+                return self._send(
+                    method,
+                    url,
+                    dict(headers, **{"Content-Length": str(length)}),
+                    reader,
+                )
+            finally:
+                reader.close()
+
+        if self.pool is not None:
+            return self.pool.request(
+                method,
+                url,
+                headers=headers,
+                body=body,
+                timeout=self.timeout,
+            )
+
+        # Populate validate_certs from endpoint_tls
+        self.module.params["validate_certs"] = self.module.params.get(
+            "endpoint_tls",
+            True,
+        )
+
+        return fetch_url(
+            self.module,
+            url,
+            method=method,
+            headers=headers,
+            data=body,
+            timeout=self.timeout,
+        )
+
+    def _warn(self, msg: str) -> None:
+        """
+        Report a warning about a request, by default through the Ansible module.
+
+        Args:
+            msg: The warning message
+        """
+        self.module.warn(msg)
+
+    def _fail(self, error: Exception) -> None:
+        """
+        Report a failed request, by default by failing the Ansible module.
+
+        Args:
+            error: The error that failed the request
+        """
+        self.module.fail_json(msg=str(error))
+
     def _handle_special_status_code(
         self,
         status_code: int,
         info: Dict[str, Any],
         method: str,
         url: str,
-        body: Optional[str],
+        body: Optional[Union[str, CdpStreamingBody]],
         headers: Dict[str, str],
     ) -> Optional[tuple]:
         """
@@ -469,7 +1891,7 @@ class AnsibleCdpClient(CdpClient):
         squelch: Dict[int, Any] = {},
     ) -> Any:
         """
-        Make HTTP request with retry logic using Ansible's fetch_url.
+        Make HTTP request with retry logic using Ansible's fetch_url or the connection pool.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -489,22 +1911,7 @@ class AnsibleCdpClient(CdpClient):
 
         try:
             url = self._url(path)
-
-            # Create the CDP signature headers
-            self.headers["x-altus-date"] = formatdate(usegmt=True)
-            self.headers["x-altus-auth"] = make_signature_header(
-                method,
-                url,
-                self.headers,
-                self.access_key,
-                self.private_key,
-            )
-
-            # Populate validate_certs from endpoint_tls
-            self.module.params["validate_certs"] = self.module.params.get(
-                "endpoint_tls",
-                True,
-            )
+            signed_url = url
 
             # Add query parameters to URL if provided
             if params:
@@ -518,25 +1925,47 @@ class AnsibleCdpClient(CdpClient):
                         query_params.append(f"{key}={value}")
                 url = f"{url}?{'&'.join(query_params)}"
 
-            # Prepare request body
+            # Prepare request body; a streaming body is opened when it is sent
             body = None
-            if json_data is not None:
-                body = json.dumps(json_data)
-            elif data is not None:
-                body = json.dumps(data)
+            payload = json_data if json_data is not None else data
+            if isinstance(payload, CdpStreamingBody):
+                body, payload = payload, payload.data
+            elif payload is not None:
+                body = json.dumps(payload)
+
+            # Serve describe and list calls from the response cache, and drop
+            # entries that a mutating call may make stale before sending it
+            cache_key = None
+            if self.response_cache is not None:
+                if self.response_cache.cacheable(method, path):
+                    cache_key = self.response_cache.key(
+                        self.base_url,
+                        method,
+                        path,
+                        payload,
+                        self.access_key,
+                    )
+                    cached = self.response_cache.get(cache_key, path)
+                    if cached is not None:
+                        return cached
+                elif method != "GET":
+                    self.response_cache.invalidate(path, payload)
 
             # Retry logic
             last_error = None
             for attempt in range(max_retries):
                 try:
-                    resp, info = fetch_url(
-                        self.module,
-                        url,
-                        method=method,
-                        headers=self.headers,
-                        data=body,
-                        timeout=self.timeout,
-                    )
+                    self.rate_limiter.acquire(path)
+                    self.retry_budget.record_request()
+
+                    # Sign each attempt on a per-request copy of the headers, so
+                    # retries carry a fresh x-altus-date and concurrent requests
+                    # on the same client do not overwrite each other
+                    headers = dict(self.headers)
+                    headers["x-altus-date"] = formatdate(usegmt=True)
+                    headers["x-altus-auth"] = self._sign(method, signed_url, headers)
+
+                    resp, info = self._send(method, url, headers, body)
 
                     status_code = info["status"]
 
@@ -547,7 +1976,7 @@ class AnsibleCdpClient(CdpClient):
                         method,
                         url,
                         body,
-                        self.headers,
+                        headers,
                     )
                     if special_handling is not None:
                         resp, info = special_handling
@@ -561,9 +1990,7 @@ class AnsibleCdpClient(CdpClient):
                         raise CdpError(f"Forbidden access to {path}", status=403)
 
                     if status_code in squelch:
-                        self.module.warn(
-                            f"Squelched error {status_code} for {url}",
-                        )
+                        self._warn(f"Squelched error {status_code} for {url}")
                         return squelch[status_code]
 
                     # Handle success responses
@@ -576,9 +2003,17 @@ class AnsibleCdpClient(CdpClient):
                             response_text = resp.read().decode("utf-8")
                             if response_text:
                                 try:
-                                    return json.loads(response_text)
+                                    result = json.loads(response_text)
                                 except json.JSONDecodeError:
                                     return {"response": response_text}
+                                if cache_key is not None and result is not None:
+                                    self.response_cache.put(
+                                        cache_key,
+                                        path,
+                                        payload,
+                                        result,
+                                    )
+                                return result
                             else:
                                 return {}
                         else:
@@ -614,10 +2049,24 @@ class AnsibleCdpClient(CdpClient):
 
                     # Retry on server errors (5xx) or specific client errors
                     if status_code >= 500 or status_code in [408, 429]:
-                        if attempt < max_retries - 1:
-                            # Exponential backoff: 0.5s, 1s, 2s, 4s, 5s (max)
-                            wait_time = min(0.5 * (2**attempt), 5)
-                            time.sleep(wait_time)
+                        if attempt < max_retries - 1 and self.retry_budget.spend():
+                            # Honour Retry-After, else full-jitter exponential backoff
+                            wait_time = parse_retry_after(info.get("retry-after"))
+                            if wait_time is None:
+                                wait_time = full_jitter_backoff(attempt)
+                            elif wait_time > self.timeout:
+                                # Fail rather than hold back requests for hours
+                                raise CdpError(
+                                    f"{error_message} [{status_code}] for {url}; "
+                                    f"Retry-After of {wait_time:.0f} seconds exceeds "
+                                    f"the {self.timeout} second timeout",
+                                    status=status_code,
+                                )
+                            if status_code == 429 or "retry-after" in info:
+                                # Throttled, so hold back every request sharing this endpoint's bucket
+                                self.rate_limiter.pause(path, wait_time)
+                            else:
+                                time.sleep(wait_time)
                             last_error = CdpError(
                                 f"{error_message} for {url}",
                                 status=status_code,
@@ -629,17 +2078,24 @@ class AnsibleCdpClient(CdpClient):
                 except CdpError:
                     raise
                 except (Exception, OSError) as e:
-                    # Retry on connection errors
-                    if attempt < max_retries - 1:
-                        wait_time = min(0.5 * (2**attempt), 5)
-                        time.sleep(wait_time)
+                    # Retry on connection errors, unless the server may have
+                    # processed a request that is not safe to repeat
+                    if (
+                        attempt < max_retries - 1
+                        and (
+                            isinstance(e, CdpRequestNotSentError)
+                            or self._is_idempotent(method, path)
+                        )
+                        and self.retry_budget.spend()
+                    ):
+                        time.sleep(full_jitter_backoff(attempt))
                         last_error = CdpError(
                             f"Connection error for {url}: {str(e)}",
                         )
                         continue
                     else:
                         raise CdpError(
-                            f"Request failed after {max_retries} attempts for {url}: {str(e)}",
+                            f"Request failed after {attempt + 1} attempts for {url}: {str(e)}",
                         )
 
             # If we exhausted all retries
@@ -647,7 +2103,31 @@ class AnsibleCdpClient(CdpClient):
                 raise last_error
             raise CdpError(f"Request failed for {url}")
         except Exception as e:
-            self.module.fail_json(msg=str(e))
+            if getattr(self._errors, "raising", False):
+                if isinstance(e, CdpError):
+                    raise
+                raise CdpError(str(e)) from e
+            self._fail(e)
+
+    @contextlib.contextmanager
+    def raising_errors(self) -> Iterator[None]:
+        """Raise CdpError for requests that fail on the current thread, rather than failing the module."""
+        previous = getattr(self._errors, "raising", False)
+        self._errors.raising = True
+        try:
+            yield
+        finally:
+            self._errors.raising = previous
+
+    @contextlib.contextmanager
+    def reporting_errors(self) -> Iterator[None]:
+        """Fail the module with a CdpError raised within this context, unless raising errors."""
+        try:
+            yield
+        except CdpError as e:
+            if getattr(self._errors, "raising", False):
+                raise
+            self._fail(e)
 
     def get(
         self,
@@ -20,7 +20,6 @@ A common Ansible Module for shared functions in the Cloudera CDP Collection
 
 from functools import wraps
 
-from cdpy.cdpy import Cdpy
 from cdpy.common import CdpError, CdpWarning
 
 
@@ -58,7 +57,10 @@ class CdpModule(object):
         self.log_lines = []
         self.changed = False
 
-        # Client Wrapper
+        # Client Wrapper; cdpy.cdpy loads every service client of the SDK, so
+        # it is only imported once a module is constructed
+        from cdpy.cdpy import Cdpy
+
         self.cdpy = Cdpy(
             debug=self.debug,
             tls_verify=self.verify_tls,
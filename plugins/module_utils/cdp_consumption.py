@@ -18,7 +18,7 @@
 A REST client for the Cloudera on Cloud Platform (CDP) Consumption API
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
@@ -72,3 +72,25 @@ class CdpConsumptionClient:
             "/api/v1/consumption/listComputeUsageRecords",
             json_data=json_data,
         )
+
+    def iter_compute_usage_records(
+        self,
+        from_timestamp: str,
+        to_timestamp: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over compute usage records within a time range, fetching each page only as it is consumed.
+
+        Args:
+            from_timestamp: Start timestamp for usage records
+            to_timestamp: End timestamp for usage records
+
+        Returns:
+            Iterator of usage record dicts
+        """
+        return CdpClient.iter_items(
+            self.list_compute_usage_records,
+            "records",
+            from_timestamp=from_timestamp,
+            to_timestamp=to_timestamp,
+        )
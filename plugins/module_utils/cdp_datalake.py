@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A REST client for the Cloudera on Cloud Platform (CDP) Data Lake API
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+)
+
+
+class CdpDatalakeClient:
+    """CDP Data Lake API client."""
+
+    def __init__(self, api_client: CdpClient):
+        """
+        Initialize CDP Data Lake client.
+
+        Args:
+            api_client: CdpClient instance for managing HTTP method calls
+        """
+        self.api_client = api_client
+
+    def list_datalakes(
+        self,
+        environment_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List Data Lakes, optionally only those of an environment.
+
+        Args:
+            environment_name: Optional name or CRN of the environment
+
+        Returns:
+            List of Data Lake summaries
+        """
+        json_data: Dict[str, Any] = {}
+        if environment_name:
+            json_data["environmentName"] = environment_name
+
+        response = self.api_client.post(
+            "/api/v1/datalake/listDatalakes",
+            json_data=json_data,
+            squelch={404: {"datalakes": []}},
+        )
+
+        return response.get("datalakes", []) if response else []
+
+    def describe_datalake(self, datalake_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a Data Lake by name or CRN.
+
+        Args:
+            datalake_name: Name or CRN of the Data Lake
+
+        Returns:
+            Data Lake details dict, or None if the Data Lake doesn't exist
+        """
+        response = self.api_client.post(
+            "/api/v1/datalake/describeDatalake",
+            json_data={"datalakeName": datalake_name},
+            squelch={404: None},
+        )
+
+        return response.get("datalake") if response else None
+
+    def describe_all_datalakes(
+        self,
+        environment_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Describe all Data Lakes, optionally only those of an environment.
+
+        Args:
+            environment_name: Optional name or CRN of the environment
+
+        Returns:
+            List of Data Lake details; Data Lakes removed after the listing are
+            skipped
+        """
+        datalakes = []
+        for summary in self.list_datalakes(environment_name):
+            datalake = self.describe_datalake(summary["crn"])
+            if datalake is not None:
+                datalakes.append(datalake)
+        return datalakes
@@ -22,6 +22,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
     CdpError,
+    CdpListFilter,
+    concurrent_requests,
 )
 
 
@@ -81,12 +83,11 @@ class CdpDeClient:
             squelch={404: {"services": []}},
         )
 
-        if env_name:
-            services = result.get("services", [])
-            filtered_services = [
-                s for s in services if s.get("environmentName") == env_name
-            ]
-            result["services"] = filtered_services
+        # The API has no environment filter, so the services are filtered
+        # as they are read
+        predicate = CdpListFilter(environmentName=env_name or None)
+        if predicate:
+            result["services"] = list(predicate.apply(result.get("services", [])))
 
         return result
 
@@ -135,6 +136,49 @@ class CdpDeClient:
                         return result
         return None
 
+    def describe_all_services(
+        self,
+        env_name: Optional[str] = None,
+        parallelism: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Describe all Data Engineering services, optionally filtered by environment.
+
+        The services are described concurrently by up to C(parallelism)
+        workers, in the order they are listed. Services in a failed state
+        cannot be described and are returned as listed; services that are
+        gone by the time they are described are skipped.
+
+        Args:
+            env_name: Optional environment name to filter services by
+            parallelism: Maximum number of concurrent describe calls
+
+        Returns:
+            List of service details
+        """
+        services = self.list_services(env_name=env_name).get("services", [])
+
+        describable = [
+            svc for svc in services if svc.get("status") not in self.FAILED_STATUSES
+        ]
+        descriptions = concurrent_requests(
+            self.api_client,
+            lambda svc: self.describe_service(svc["clusterId"]),
+            describable,
+            parallelism,
+        )
+        described = {
+            svc["clusterId"]: desc for svc, desc in zip(describable, descriptions)
+        }
+
+        result = []
+        for svc in services:
+            if svc.get("status") in self.FAILED_STATUSES:
+                result.append(svc)
+            elif (described.get(svc["clusterId"]) or {}).get("service"):
+                result.append(described[svc["clusterId"]]["service"])
+        return result
+
     def get_service_by_cluster_id(self, cluster_id: str) -> Optional[Dict[str, Any]]:
         """
         Get service details by cluster ID.
@@ -18,14 +18,25 @@
 A REST client for the Cloudera on Cloud Platform (CDP) DataFlow API
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import tempfile
 import time
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
     CdpError,
+    CdpListFilter,
+    concurrent_requests,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df_client import (
     CdpDfApiClient,
+    FlowDefinitionFile,
 )
 
 
@@ -156,6 +167,124 @@ def format_tags_for_api(
     ]
 
 
+def flow_content_hash(
+    file_path: Optional[str] = None,
+    content: Optional[str] = None,
+) -> str:
+    """
+    Return the SHA-256 hex digest of a flow definition.
+
+    A file is hashed as it is read, so large flow definitions are never held
+    in memory. Content is hashed as its UTF-8 encoding, so a file and the same
+    content passed as a string have the same digest.
+
+    Args:
+        file_path: Path to the flow definition file
+        content: The flow definition content, if no file is given
+
+    Returns:
+        The hex digest
+    """
+    if file_path is not None:
+        return FlowDefinitionFile(file_path).sha256()
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+
+
+def latest_flow_version(flow: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    Return the number of the latest version of a flow definition.
+
+    Args:
+        flow: The flow details, with its versions or version count
+
+    Returns:
+        The latest version, or None if it is not known
+    """
+    if not flow:
+        return None
+    versions = [v["version"] for v in flow.get("versions") or [] if "version" in v]
+    if versions:
+        return max(versions)
+    return flow.get("versionCount")
+
+
+class CdpFlowManifest:
+    """
+    Local record of the content imported into each DataFlow CustomFlow.
+
+    DataFlow does not store a digest of a flow definition, so for every flow
+    imported by this collection the manifest records the SHA-256 of its
+    content and the version the content became. A record is only trusted
+    while that version is still the latest, so a version imported by any other
+    means is never mistaken for unchanged content.
+
+    Each flow is stored as a JSON file, named by the digest of the flow CRN,
+    in C(directory). The manifest is best-effort: I/O errors are treated as
+    missing records.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the manifest.
+
+        Args:
+            directory: Directory in which to store records; created if missing
+        """
+        self.directory = os.path.expanduser(directory)
+
+    def _file(self, flow_crn: str) -> str:
+        name = hashlib.sha256(flow_crn.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".json")
+
+    def get(self, flow_crn: Optional[str], version: Optional[int]) -> Optional[str]:
+        """
+        Return the digest of the content imported as the given flow version.
+
+        Args:
+            flow_crn: The CRN of the flow
+            version: The latest version of the flow
+
+        Returns:
+            The hex digest, or None if the version was not recorded
+        """
+        if not flow_crn or version is None:
+            return None
+        try:
+            with open(self._file(flow_crn), "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("flowCrn") != flow_crn or record.get("version") != version:
+            return None
+        return record.get("sha256")
+
+    def put(self, flow_crn: Optional[str], sha256: str, version: Optional[int]) -> None:
+        """
+        Record the digest of the content imported as a flow version.
+
+        Args:
+            flow_crn: The CRN of the flow
+            sha256: The hex digest of the imported content
+            version: The version the content was imported as
+        """
+        if not flow_crn or version is None:
+            return
+        record = dict(flowCrn=flow_crn, version=version, sha256=sha256)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # Write atomically, so concurrent tasks never read a partial record
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(record, f)
+                os.replace(tmp, self._file(flow_crn))
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except OSError:
+            return
+
+
 class CdpDfClient:
     """CDP DataFlow API client."""
 
@@ -179,6 +308,10 @@ class CdpDfClient:
         """
         self.api_client = api_client
 
+        # CRNs of the listed services and deployments, by name
+        self._service_crns: Dict[str, str] = {}
+        self._deployment_crns: Dict[str, str] = {}
+
     # Service state constants
     FAILED_STATES = ["BAD_HEALTH", "UNKNOWN"]
     REMOVABLE_STATES = [
@@ -226,12 +359,24 @@ class CdpDfClient:
         if sorts is not None:
             data["sorts"] = sorts
 
-        return self.api_client.post(
+        response = self.api_client.post(
             "/api/v1/df/listServices",
             data=data,
             squelch={404: {"services": []}},
         )
 
+        # Disabled services cannot be described, so only enabled ones are
+        # remembered
+        for service in response.get("services", []):
+            if (
+                service.get("name")
+                and service.get("crn")
+                and service.get("status", {}).get("state") not in self.DISABLED_STATES
+            ):
+                self._service_crns.setdefault(service["name"], service["crn"])
+
+        return response
+
     def describe_service(self, crn: str) -> Dict[str, Any]:
         """
         Describe a DataFlow service.
@@ -253,19 +398,29 @@ class CdpDfClient:
         """
         Get service details by environment name.
 
+        The CRNs of listed services are remembered, so repeated lookups
+        describe the service without listing the services again.
+
         Args:
             name: The environment name
 
         Returns:
             Service details dict, or None if not found or disabled
         """
-        services = self.list_services(search_term=name)
-        for service in services.get("services", []):
-            if service.get("name") == name:
-                if service.get("status", {}).get("state") in self.DISABLED_STATES:
-                    return None
-                return self.describe_service(service.get("crn"))
-        return None
+        crn = self._service_crns.get(name)
+        if crn is not None:
+            result = self.describe_service(crn)
+            if result and result.get("service"):
+                return result
+            # The service is gone; forget it and list the services again
+            self._service_crns.pop(name, None)
+
+        service = self._find_service(CdpListFilter(name=name))
+        if service is None:
+            return None
+        if service.get("status", {}).get("state") in self.DISABLED_STATES:
+            return None
+        return self.describe_service(service.get("crn"))
 
     def get_service_by_crn(self, crn: str) -> Optional[Dict[str, Any]]:
         """
@@ -277,14 +432,13 @@ class CdpDfClient:
         Returns:
             Service details dict, or None if not found or disabled
         """
-        services = self.list_services()
-        for service in services.get("services", []):
-            if service.get("crn") == crn:
-                # Skip describe for disabled services (returns 500)
-                if service.get("status", {}).get("state") in self.DISABLED_STATES:
-                    return None
-                return self.describe_service(crn)
-        return None
+        service = self._find_service(CdpListFilter(crn=crn))
+        if service is None:
+            return None
+        # Skip describe for disabled services (returns 500)
+        if service.get("status", {}).get("state") in self.DISABLED_STATES:
+            return None
+        return self.describe_service(crn)
 
     def get_service_by_env_crn(self, env_crn: str) -> Optional[Dict[str, Any]]:
         """
@@ -296,14 +450,65 @@ class CdpDfClient:
         Returns:
             Service details dict, or None if not found or disabled
         """
-        services = self.list_services()
-        for service in services.get("services", []):
-            if service.get("environmentCrn") == env_crn:
-                # Skip describe for disabled services (returns 500)
-                if service.get("status", {}).get("state") in self.DISABLED_STATES:
-                    return None
-                return self.describe_service(service.get("crn"))
-        return None
+        service = self._find_service(CdpListFilter(environmentCrn=env_crn))
+        if service is None:
+            return None
+        # Skip describe for disabled services (returns 500)
+        if service.get("status", {}).get("state") in self.DISABLED_STATES:
+            return None
+        return self.describe_service(service.get("crn"))
+
+    def _find_service(self, predicate: CdpListFilter) -> Optional[Dict[str, Any]]:
+        """
+        Find the first service matching a filter.
+
+        The name is pushed into the request as the search term; the pages are
+        read only until a match is found.
+
+        Args:
+            predicate: The filter on the ServiceSummary fields
+
+        Returns:
+            The ServiceSummary, or None if no service matches
+        """
+        return next(
+            predicate.apply(
+                CdpClient.iter_items(
+                    self.list_services,
+                    "services",
+                    **predicate.arguments(name="search_term"),
+                ),
+            ),
+            None,
+        )
+
+    def describe_all_services(self, parallelism: int = 1) -> List[Dict[str, Any]]:
+        """
+        Describe all enabled DataFlow services.
+
+        The services are described concurrently by up to C(parallelism)
+        workers, in the order they are listed. Disabled services cannot be
+        described and are skipped, as are services that are gone by the time
+        they are described.
+
+        Args:
+            parallelism: Maximum number of concurrent describe calls
+
+        Returns:
+            List of service details
+        """
+        services = [
+            svc
+            for svc in self.list_services().get("services", [])
+            if svc.get("status", {}).get("state") not in self.DISABLED_STATES
+        ]
+        described = concurrent_requests(
+            self.api_client,
+            lambda svc: self.describe_service(svc["crn"]),
+            services,
+            parallelism,
+        )
+        return [d["service"] for d in described if d and d.get("service")]
 
     def enable_service(
         self,
@@ -519,7 +724,7 @@ class CdpDfClient:
             service_crn: The CRN of the service
             target_states: List of acceptable target states
             timeout: Maximum time to wait in seconds
-            delay: Polling interval in seconds
+            delay: Longest polling interval in seconds; shortens after state changes
             terminate_deployments: Whether to terminate all deployments (used when disabling)
             persist: Whether to retain database records (used when disabling)
 
@@ -573,26 +778,16 @@ class CdpDfClient:
                     f"Cannot disable service in state '{current_state}'. ",
                 )
 
-        # Wait for target state
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                raise CdpError(
-                    f"Timeout waiting for DataFlow service to reach {target_states} "
-                    f"after {timeout} seconds",
-                )
-
-            result = self._get_service_state(service_crn)
-
+        def settled(result: Optional[Tuple[str, Dict[str, Any]]]) -> bool:
             # Service no longer exists
             if result is None:
-                return None
+                return True
 
             current_state, service_details = result
 
             # Check if in target state
             if current_state in target_states:
-                return service_details
+                return True
 
             # Check if in failed state
             if current_state in self.FAILED_STATES:
@@ -601,7 +796,28 @@ class CdpDfClient:
                     f"DataFlow service entered failed state '{current_state}': {msg}",
                 )
 
-            time.sleep(delay)
+            return False
+
+        # Wait for target state
+        waiter = CdpWaiter(
+            timeout=max(timeout - (time.time() - start_time), 0),
+            delay=delay,
+            label=f"DataFlow service {service_crn}",
+        )
+
+        try:
+            result = waiter.wait(
+                lambda: self._get_service_state(service_crn),
+                until=settled,
+                state=lambda result: result[0] if result is not None else None,
+            )
+        except CdpWaitTimeout:
+            raise CdpError(
+                f"Timeout waiting for DataFlow service to reach {target_states} "
+                f"after {timeout} seconds",
+            )
+
+        return result[1] if result is not None else None
 
     # ========================================================================
     # Deployment Management Methods
@@ -614,12 +830,14 @@ class CdpDfClient:
         pageToken: Optional[str] = None,
         pageSize: Optional[int] = None,
         sorts: Optional[List[str]] = None,
+        search_term: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         List DataFlow deployments.
 
         Args:
             filters: Filter criteria (see list-filter-options)
+            search_term: Search term to filter by name
             pageToken: Pagination token for getting the next page
             pageSize: Number of results per page (1-100)
             sorts: Sort criteria (updated|name|state|dataSent|dataReceived):(asc|desc)
@@ -630,6 +848,8 @@ class CdpDfClient:
                 - nextToken: Token for next page (if available)
         """
         data: Dict[str, Any] = {}
+        if search_term is not None:
+            data["searchTerm"] = search_term
         if filters is not None:
             data["filters"] = filters
         if pageToken is not None:
@@ -639,12 +859,18 @@ class CdpDfClient:
         if sorts is not None:
             data["sorts"] = sorts
 
-        return self.api_client.post(
+        response = self.api_client.post(
             "/api/v1/df/listDeployments",
             data=data,
             squelch={404: {"deployments": []}},
         )
 
+        for deployment in response.get("deployments", []):
+            if deployment.get("name") and deployment.get("crn"):
+                self._deployment_crns.setdefault(deployment["name"], deployment["crn"])
+
+        return response
+
     def describe_deployment(self, deployment_crn: str) -> Dict[str, Any]:
         """
         Describe a DataFlow deployment.
@@ -666,17 +892,66 @@ class CdpDfClient:
         """
         Get deployment details by name.
 
+        The CRNs of listed deployments are remembered, so repeated lookups
+        describe the deployment without listing the deployments again.
+        Otherwise, the name is pushed into the request as the search term.
+
         Args:
             name: The deployment name
 
         Returns:
             Deployment details dict, or None if not found
         """
-        deployments = self.list_deployments()
-        for deployment in deployments.get("deployments", []):
-            if deployment.get("name") == name:
-                return self.describe_deployment(deployment.get("crn"))
-        return None
+        crn = self._deployment_crns.get(name)
+        if crn is not None:
+            result = self.describe_deployment(crn)
+            if result and result.get("deployment"):
+                return result
+            # The deployment is gone; forget it and list the deployments again
+            self._deployment_crns.pop(name, None)
+
+        predicate = CdpListFilter(name=name)
+        deployment = next(
+            predicate.apply(
+                CdpClient.iter_items(
+                    self.list_deployments,
+                    "deployments",
+                    **predicate.arguments(name="search_term"),
+                ),
+            ),
+            None,
+        )
+        if deployment is None:
+            return None
+        return self.describe_deployment(deployment.get("crn"))
+
+    def describe_all_deployments(
+        self,
+        filters: Optional[List[str]] = None,
+        parallelism: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Describe all DataFlow deployments, optionally filtered.
+
+        The deployments are described concurrently by up to C(parallelism)
+        workers, in the order they are listed. Deployments that are gone by
+        the time they are described are skipped.
+
+        Args:
+            filters: Filter criteria (see list-filter-options)
+            parallelism: Maximum number of concurrent describe calls
+
+        Returns:
+            List of deployment details
+        """
+        deployments = self.list_deployments(filters=filters).get("deployments", [])
+        described = concurrent_requests(
+            self.api_client,
+            lambda dep: self.describe_deployment(dep["crn"]),
+            deployments,
+            parallelism,
+        )
+        return [d["deployment"] for d in described if d and d.get("deployment")]
 
     def get_deployment_by_crn(self, crn: str) -> Optional[Dict[str, Any]]:
         """
@@ -829,14 +1104,23 @@ class CdpDfClient:
         Returns:
             Flow details dict, or None if not found
         """
-        flows = self.list_flow_definitions(search_term=name)
-        for flow in flows.get("flows", []):
-            if flow.get("name") == name:
-                result = self.describe_flow(flow.get("crn"))
-                if result:
-                    flow_obj = result.get("flow", result)
-                    return flow_obj.get("flowDetail", flow_obj)
-                return None
+        predicate = CdpListFilter(name=name)
+        flow = next(
+            predicate.apply(
+                CdpClient.iter_items(
+                    self.list_flow_definitions,
+                    "flows",
+                    **predicate.arguments(name="search_term"),
+                ),
+            ),
+            None,
+        )
+        if flow is None:
+            return None
+        result = self.describe_flow(flow.get("crn"))
+        if result:
+            flow_obj = result.get("flow", result)
+            return flow_obj.get("flowDetail", flow_obj)
         return None
 
     def get_flow_by_crn(self, crn: str) -> Optional[Dict[str, Any]]:
@@ -861,11 +1145,12 @@ class CdpDfClient:
     def import_flow_definition(
         self,
         name: str,
-        file_content: str,
+        file_content: Optional[str] = None,
         description: Optional[str] = None,
         comments: Optional[str] = None,
         collection_crn: Optional[str] = None,
         tags: Optional[list] = None,
+        file_path: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Import a new flow definition.
@@ -881,6 +1166,8 @@ class CdpDfClient:
             collection_crn: The CRN of the collection to assign the flow to
             tags: List of tags for the initial flow definition version.
                   Each tag should be a dict with 'tagName' (required) and 'tagColor' (optional)
+            file_path: Path to a flow definition file to stream from disk,
+                  instead of file_content
 
         Returns:
             Dictionary containing the imported flow details
@@ -888,7 +1175,6 @@ class CdpDfClient:
 
         data: Dict[str, Any] = {
             "name": name,
-            "file": file_content,
         }
         if description is not None:
             data["description"] = description
@@ -901,15 +1187,16 @@ class CdpDfClient:
 
         return self.api_client.post(
             "/api/v1/df/importFlowDefinition",
-            data=data,
+            data=self._flow_payload(data, file_content, file_path),
         )
 
     def import_flow_definition_version(
         self,
         flow_crn: str,
-        file_content: str,
+        file_content: Optional[str] = None,
         comments: Optional[str] = None,
         tags: Optional[list] = None,
+        file_path: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Import a new flow definition version to an existing flow.
@@ -920,13 +1207,14 @@ class CdpDfClient:
             comments: Comments for the new version
             tags: List of tags for the flow definition version.
                   Each tag should be a dict with 'tagName' (required) and 'tagColor' (optional)
+            file_path: Path to a flow definition file to stream from disk,
+                  instead of file_content
 
         Returns:
             Dictionary containing the new version details
         """
         data: Dict[str, Any] = {
             "flowCrn": flow_crn,
-            "file": file_content,
         }
         if comments is not None:
             data["comments"] = comments
@@ -935,9 +1223,25 @@ class CdpDfClient:
 
         return self.api_client.post(
             "/api/v1/df/importFlowDefinitionVersion",
-            data=data,
+            data=self._flow_payload(data, file_content, file_path),
         )
 
+    @staticmethod
+    def _flow_payload(
+        data: Dict[str, Any],
+        file_content: Optional[str],
+        file_path: Optional[str],
+    ) -> Union[Dict[str, Any], FlowDefinitionFile]:
+        """
+        Attach the flow definition to a flow import request.
+
+        A file path is streamed from disk, so large flow definitions are never
+        read into memory; otherwise the content is sent as the C(file) field.
+        """
+        if file_path is not None:
+            return FlowDefinitionFile(file_path, data)
+        return dict(data, file=file_content)
+
     def delete_flow(self, flow_crn: str) -> Dict[str, Any]:
         """
         Delete a flow definition.
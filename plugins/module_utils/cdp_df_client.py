@@ -18,20 +18,186 @@
 DataFlow-specific CDP API client with support for 308 redirects
 """
 
+import hashlib
+import io
 import json
+import os
 import time
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Iterator, Optional, Tuple, Union, List
 from urllib.parse import urlparse, quote
 from email.utils import formatdate
-from ansible.module_utils.urls import fetch_url
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     AnsibleCdpClient,
     CdpError,
-    make_signature_header,
+    CdpStreamingBody,
 )
 
 
+def build_flow_headers(
+    request_data: Dict[str, Any],
+    headers: Dict[str, str],
+) -> Dict[str, str]:
+    """
+    Move flow import metadata into the DataFlow extension format headers.
+
+    Args:
+        request_data: The flow import request, e.g. name, description, and tags
+        headers: Request headers dictionary (will be modified in-place)
+
+    Returns:
+        The headers
+
+    Reference:
+        cdpcli/extensions/df/__init__.py::_build_upload_flow_headers
+    """
+    # Extract metadata and move to custom headers (URI-encoded)
+    if "name" in request_data:
+        headers["Flow-Definition-Name"] = quote(request_data["name"])
+    if "description" in request_data:
+        headers["Flow-Definition-Description"] = quote(
+            request_data["description"],
+        )
+    if "comments" in request_data:
+        headers["Flow-Definition-Comments"] = quote(request_data["comments"])
+    if "collectionCrn" in request_data:
+        headers["Flow-Definition-Collection-Identifier"] = quote(
+            request_data["collectionCrn"],
+        )
+    if "tags" in request_data:
+        tags_json = '{ "tags": ' + json.dumps(request_data["tags"]) + "}"
+        headers["Flow-Definition-Tags"] = quote(tags_json)
+    return headers
+
+
+class FlowDefinitionFile(CdpStreamingBody):
+    """
+    Flow import request whose flow definition is streamed from a file on disk.
+
+    The initial request sends the usual JSON body, with the file content
+    encoded into the C(file) field chunk by chunk as it is read. When DataFlow
+    redirects the import to the catalog, C(extension) re-streams the file from
+    its starting offset as the raw body of the extension format request.
+    """
+
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+    ):
+        """
+        Initialize the flow import request.
+
+        Args:
+            path: Path to the flow definition file
+            data: The flow import metadata, without the C(file) field
+            offset: Byte offset of the flow definition within the file
+        """
+        super().__init__(data)
+        self.path = path
+        self.offset = offset
+        self._length: Optional[int] = None
+
+    def _chunks(self) -> Iterator[bytes]:
+        """Yield the JSON request body, encoding the file content as it is read."""
+        # The file is the last field, so the body ends with its closing quote
+        yield json.dumps(dict(self.data, file=""))[:-2].encode("utf-8")
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+            for chunk in iter(lambda: text.read(self.CHUNK_SIZE), ""):
+                # Escape each chunk as the body of a JSON string literal
+                yield json.dumps(chunk)[1:-1].encode("ascii")
+        yield b'"}'
+
+    def open(self) -> Tuple[Any, int]:
+        """Open a reader of the JSON request body."""
+        if self._length is None:
+            # Measured with a streaming pass, as the server needs a Content-Length
+            self._length = sum(len(chunk) for chunk in self._chunks())
+        return _ChunkReader(self._chunks), self._length
+
+    def sha256(self) -> str:
+        """Return the SHA-256 hex digest of the flow definition, read in chunks."""
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def extension(self, headers: Dict[str, str]) -> CdpStreamingBody:
+        """
+        Return the raw flow definition body of the extension format request.
+
+        Args:
+            headers: Request headers dictionary (will be modified in-place)
+
+        Returns:
+            A body streaming the file from its starting offset
+        """
+        build_flow_headers(self.data, headers)
+        return _FileSlice(self.path, self.offset)
+
+
+class _FileSlice(CdpStreamingBody):
+    """Stream a file as-is, from a byte offset to its end."""
+
+    def __init__(self, path: str, offset: int = 0):
+        super().__init__()
+        self.path = path
+        self.offset = offset
+
+    def open(self) -> Tuple[Any, int]:
+        f = open(self.path, "rb")
+        f.seek(self.offset)
+        return f, os.fstat(f.fileno()).st_size - self.offset
+
+
+class _ChunkReader(io.RawIOBase):
+    """Binary reader over a restartable generator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._factory = chunks
+        self.seek(0)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("can only seek to the start")
+        self._chunks = self._factory()
+        self._pending = b""
+        self._position = 0
+        return 0
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._chunks.close()
+        super().close()
+
+
 class CdpDfApiClient(AnsibleCdpClient):
     """
     DataFlow-specific CDP API client that extends AnsibleCdpClient.
@@ -64,23 +230,7 @@ class CdpDfApiClient(AnsibleCdpClient):
         """
         try:
             request_data = json.loads(body)
-
-            # Extract metadata and move to custom headers (URI-encoded)
-            if "name" in request_data:
-                headers["Flow-Definition-Name"] = quote(request_data["name"])
-            if "description" in request_data:
-                headers["Flow-Definition-Description"] = quote(
-                    request_data["description"],
-                )
-            if "comments" in request_data:
-                headers["Flow-Definition-Comments"] = quote(request_data["comments"])
-            if "collectionCrn" in request_data:
-                headers["Flow-Definition-Collection-Identifier"] = quote(
-                    request_data["collectionCrn"],
-                )
-            if "tags" in request_data:
-                tags_json = '{ "tags": ' + json.dumps(request_data["tags"]) + "}"
-                headers["Flow-Definition-Tags"] = quote(tags_json)
+            build_flow_headers(request_data, headers)
 
             # Body becomes raw flow content (not wrapped in JSON)
             transformed_body = request_data.get("file", "")
@@ -108,7 +258,7 @@ class CdpDfApiClient(AnsibleCdpClient):
         info: Dict[str, Any],
         method: str,
         url: str,
-        body: Optional[str],
+        body: Optional[Union[str, CdpStreamingBody]],
         headers: Dict[str, str],
     ) -> Optional[tuple]:
         """
@@ -146,7 +296,10 @@ class CdpDfApiClient(AnsibleCdpClient):
         redirect_body = body
         redirect_headers = dict(headers)
 
-        if is_df_flow_import and body:
+        if is_df_flow_import and isinstance(body, FlowDefinitionFile):
+            # Re-stream the file from disk rather than decoding the sent body
+            redirect_body = body.extension(redirect_headers)
+        elif is_df_flow_import and body:
             # Transform to DataFlow extension format
             redirect_body, redirect_headers = self._transform_df_flow_payload(
                 body,
@@ -155,20 +308,11 @@ class CdpDfApiClient(AnsibleCdpClient):
 
         # Re-sign for the redirect URL (signature uses path only)
         redirect_headers["x-altus-date"] = formatdate(usegmt=True)
-        redirect_headers["x-altus-auth"] = make_signature_header(
+        redirect_headers["x-altus-auth"] = self._sign(
             method,
             redirect_path,
             redirect_headers,
-            self.access_key,
-            self.private_key,
         )
 
         # Follow the redirect
-        return fetch_url(
-            self.module,
-            redirect_url,
-            method=method,
-            headers=redirect_headers,
-            data=redirect_body,
-            timeout=self.timeout,
-        )
+        return self._send(method, redirect_url, redirect_headers, redirect_body)
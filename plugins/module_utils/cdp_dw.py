@@ -18,27 +18,37 @@
 A REST client for the Cloudera Data Warehouse (CDW) API
 """
 
-from dataclasses import dataclass
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
+    CdpListFilter,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
+    CdpWatcher,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     NULLABLE,
+    CdpModel,
+    cdp_model,
     from_dict,
 )
 
 
-@dataclass
-class Connector:
+@cdp_model
+class Connector(CdpModel):
     """CDP Data Warehouse Database Connector."""
 
     id: Union[str, None, NULLABLE] = NULLABLE
@@ -53,8 +63,8 @@ class Connector:
     updatedBy: Union[str, None, NULLABLE] = NULLABLE
 
 
-@dataclass
-class ConnectorTestJob:
+@cdp_model
+class ConnectorTestJob(CdpModel):
     """CDP Data Warehouse Connector Test Job details."""
 
     jobId: Union[str, None, NULLABLE] = NULLABLE
@@ -65,8 +75,8 @@ class ConnectorTestJob:
     outputLog: Union[str, None, NULLABLE] = NULLABLE
 
 
-@dataclass
-class VirtualWarehouse:
+@cdp_model
+class VirtualWarehouse(CdpModel):
     """CDP Data Warehouse Virtual Warehouse.
 
     C(associatedConnectors) is stored as the raw API map,
@@ -93,8 +103,8 @@ class VirtualWarehouse:
     associatedConnectors: Union[Dict[str, Any], None, NULLABLE] = NULLABLE
 
 
-@dataclass
-class DwSecretProperties:
+@cdp_model
+class DwSecretProperties(CdpModel):
     """Properties of a CDW secret."""
 
     azureVaultName: Union[str, None, NULLABLE] = NULLABLE
@@ -102,8 +112,8 @@ class DwSecretProperties:
     version: Union[str, None, NULLABLE] = NULLABLE
 
 
-@dataclass
-class DwSecret:
+@cdp_model
+class DwSecret(CdpModel):
     """Details of a single CDW secret."""
 
     secretName: Union[str, None, NULLABLE] = NULLABLE
@@ -341,14 +351,18 @@ class CdpDwClient:
         self,
         cluster_id: str,
         name: Optional[str] = None,
+        catalog_id: Optional[str] = None,
     ) -> List[VirtualWarehouse]:
         """
         List Virtual Warehouses in a cluster.
 
+        The API filters by cluster only, so the other filters are applied to
+        the entries before they are marshalled.
+
         Args:
             cluster_id: The ID of the cluster
-            name: Optional Virtual Warehouse name to filter by (exact match).
-                When provided, only the matching entry is marshalled.
+            name: Optional Virtual Warehouse name to filter by (exact match)
+            catalog_id: Optional Database Catalog ID to filter by
 
         Returns:
             List of VirtualWarehouse dataclass instances
@@ -358,10 +372,10 @@ class CdpDwClient:
             data={"clusterId": cluster_id},
             squelch={404: {"vws": []}},
         )
+        predicate = CdpListFilter(name=name, dbcId=catalog_id)
         return [
             from_dict(VirtualWarehouse, vw)
-            for vw in response.get("vws", [])
-            if name is None or vw.get("name") == name
+            for vw in predicate.apply(response.get("vws", []))
         ]
 
     def get_vw_by_id(
@@ -407,6 +421,62 @@ class CdpDwClient:
         vws = self.list_vws(cluster_id, name=name)
         return vws[0] if vws else None
 
+    def wait_for_vws(
+        self,
+        vws: Iterable[Tuple[str, str]],
+        until: Callable[[Optional[VirtualWarehouse]], bool],
+        waiter: CdpWaiter,
+    ) -> Dict[Tuple[str, str], Optional[VirtualWarehouse]]:
+        """
+        Wait for many Virtual Warehouses at once, listing each cluster once per poll.
+
+        Rather than describing every warehouse on its own schedule, a
+        CdpWatcher lists every cluster that still has an unsettled warehouse
+        once per poll and checks all of that cluster's warehouses against the
+        listing. A warehouse that is settled is not checked again.
+
+        Args:
+            vws: Pairs of cluster ID and Virtual Warehouse ID to wait for
+            until: Predicate on a warehouse, or None if it is not listed, that
+                ends the wait for it; may raise to abort on failure states
+            waiter: The waiter pacing the polls
+
+        Returns:
+            Dictionary of the settled warehouse, or None, keyed by the pair of
+            cluster ID and Virtual Warehouse ID
+
+        Raises:
+            CdpWaitTimeout: If any warehouse does not settle before the timeout;
+                its C(last) is the dictionary of the unsettled warehouses
+        """
+        watcher = CdpWatcher(waiter)
+        self.register_watches(watcher)
+        for cluster_id, vw_id in vws:
+            watcher.watch("vw", cluster_id, vw_id, until=until)
+
+        try:
+            settled = watcher.wait()
+        except CdpWaitTimeout as e:
+            e.last = {(scope, key): vw for (_, scope, key), vw in e.last.items()}
+            raise
+        return {(scope, key): vw for (_, scope, key), vw in settled.items()}
+
+    def register_watches(self, watcher: CdpWatcher) -> None:
+        """
+        Register the Virtual Warehouses as the C(vw) resource type of a watcher.
+
+        The scope of a watched warehouse is its cluster ID, and its key is its ID.
+
+        Args:
+            watcher: The watcher polling the warehouses
+        """
+        watcher.register(
+            "vw",
+            self.list_vws,
+            key=lambda vw: vw.id,
+            state=lambda vw: vw.status,
+        )
+
     def create_vw(
         self,
         cluster_id: str,
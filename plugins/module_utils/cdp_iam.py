@@ -18,11 +18,20 @@
 A REST client for the Cloudera on Cloud Platform (CDP) IAM API
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
     CdpError,
+    apply_mutations,
+    concurrent_requests,
 )
 
 
@@ -37,6 +46,17 @@ class CdpIamClient:
             api_client: CdpClient instance for managing HTTP method calls
         """
         self.api_client = api_client
+        self.user_index = CdpIamUserIndex(self)
+
+    def use_user_index(self, path: Optional[str] = None, ttl: int = 300) -> None:
+        """
+        Replace the in-process user index, e.g. with one persisted across runs.
+
+        Args:
+            path: File in which to persist the index; None to keep it in memory only
+            ttl: Seconds for which a persisted index is reused
+        """
+        self.user_index = CdpIamUserIndex(self, path=path, ttl=ttl)
 
     @staticmethod
     def get_user_diff_exclude_keys() -> List[str]:
@@ -94,6 +114,14 @@ class CdpIamClient:
         """Check if a user CRN represents a machine user."""
         return ":machineUser:" in user_crn
 
+    def raising_errors(self):
+        """Raise CdpError for requests that fail on the current thread, rather than failing the module."""
+        return self.api_client.raising_errors()
+
+    def reporting_errors(self):
+        """Report a CdpError raised within this context as a failed request."""
+        return self.api_client.reporting_errors()
+
     def get_group_details(self, group_name: str) -> Optional[Dict[str, Any]]:
         """
         Get complete group information including members, roles, and resource assignments.
@@ -148,7 +176,8 @@ class CdpIamClient:
         current_members: List[str],
         desired_users: List[str],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage group membership (add/remove users and machine users).
 
@@ -157,40 +186,19 @@ class CdpIamClient:
             current_members: List of current member CRNs
             desired_users: List of desired user CRNs
             purge: If True, remove users not in desired list
+            parallelism: Maximum number of concurrent membership changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
+            The number of membership changes made
 
-        if purge:
-            # Remove all users not in desired list
-            users_to_remove = [
-                user for user in current_members if user not in desired_users
-            ]
-            for user_crn in users_to_remove:
-                if self._is_machine_user(user_crn):
-                    self.remove_machine_user_from_group(
-                        machine_user_name=user_crn,
-                        group_name=group_name,
-                    )
-                else:
-                    self.remove_user_from_group(user_id=user_crn, group_name=group_name)
-                changed = True
-
-        # Add missing users
-        users_to_add = [user for user in desired_users if user not in current_members]
-        for user_crn in users_to_add:
-            if self._is_machine_user(user_crn):
-                self.add_machine_user_to_group(
-                    machine_user_name=user_crn,
-                    group_name=group_name,
-                )
-            else:
-                self.add_user_to_group(user_id=user_crn, group_name=group_name)
-            changed = True
-
-        return changed
+        Raises:
+            CdpMutationError: If any membership change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.GROUP, group_name, purge)
+            .plan("members", current_members, desired_users)
+            .apply(self, parallelism)
+        )
 
     def manage_group_roles(
         self,
@@ -198,7 +206,8 @@ class CdpIamClient:
         current_roles: List[str],
         desired_roles: List[str],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage group role assignments.
 
@@ -207,28 +216,19 @@ class CdpIamClient:
             current_roles: List of current role CRNs
             desired_roles: List of desired role CRNs
             purge: If True, remove roles not in desired list
+            parallelism: Maximum number of concurrent role changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
-
-        if purge:
-            # Remove all roles not in desired list
-            roles_to_remove = [
-                role for role in current_roles if role not in desired_roles
-            ]
-            for role_crn in roles_to_remove:
-                self.unassign_group_role(group_name=group_name, role=role_crn)
-                changed = True
-
-        # Add missing roles
-        roles_to_add = [role for role in desired_roles if role not in current_roles]
-        for role_crn in roles_to_add:
-            self.assign_group_role(group_name=group_name, role=role_crn)
-            changed = True
+            The number of role changes made
 
-        return changed
+        Raises:
+            CdpMutationError: If any role change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.GROUP, group_name, purge)
+            .plan("roles", current_roles, desired_roles)
+            .apply(self, parallelism)
+        )
 
     def manage_group_resource_roles(
         self,
@@ -236,7 +236,8 @@ class CdpIamClient:
         current_assignments: List[Dict[str, str]],
         desired_assignments: List[Dict[str, str]],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage group resource role assignments.
 
@@ -245,64 +246,19 @@ class CdpIamClient:
             current_assignments: List of current resource role assignments
             desired_assignments: List of desired resource role assignments
             purge: If True, remove assignments not in desired list
+            parallelism: Maximum number of concurrent assignment changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
+            The number of assignment changes made
 
-        # Normalize current assignments for comparison
-        current_normalized = [
-            {
-                "resource": a.get("resourceCrn"),
-                "role": a.get("resourceRoleCrn"),
-            }
-            for a in current_assignments
-        ]
-
-        # Normalize desired assignments
-        desired_normalized = [
-            {
-                "resource": a.get("resource") or a.get("resourceCrn"),
-                "role": a.get("role") or a.get("resourceRoleCrn"),
-            }
-            for a in desired_assignments
-        ]
-
-        if purge:
-            # Remove all assignments not in desired list
-            assignments_to_remove = [
-                a for a in current_normalized if a not in desired_normalized
-            ]
-            for assignment in assignments_to_remove:
-                self.unassign_group_resource_role(
-                    group_name=group_name,
-                    resource_crn=assignment[
-                        "resource"
-                    ],  # pyright: ignore[reportArgumentType]
-                    resource_role_crn=assignment[
-                        "role"
-                    ],  # pyright: ignore[reportArgumentType]
-                )
-                changed = True
-
-        # Add missing assignments
-        assignments_to_add = [
-            a for a in desired_normalized if a not in current_normalized
-        ]
-        for assignment in assignments_to_add:
-            self.assign_group_resource_role(
-                group_name=group_name,
-                resource_crn=assignment[
-                    "resource"
-                ],  # pyright: ignore[reportArgumentType]
-                resource_role_crn=assignment[
-                    "role"
-                ],  # pyright: ignore[reportArgumentType]
-            )
-            changed = True
-
-        return changed
+        Raises:
+            CdpMutationError: If any assignment change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.GROUP, group_name, purge)
+            .plan("resource_roles", current_assignments, desired_assignments)
+            .apply(self, parallelism)
+        )
 
     @CdpClient.paginated()
     def list_groups(
@@ -376,6 +332,21 @@ class CdpIamClient:
             json_data=json_data,
         )
 
+    def iter_users(
+        self,
+        user_ids: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over IAM users, fetching each page only as it is consumed.
+
+        Args:
+            user_ids: Optional list of user IDs or CRNs to filter by
+
+        Returns:
+            Iterator of basic User dicts from the listUsers responses
+        """
+        return CdpClient.iter_items(self.list_users, "users", user_ids=user_ids)
+
     def list_users_filtered(
         self,
         filters: Dict[str, str],
@@ -383,7 +354,7 @@ class CdpIamClient:
         """
         List IAM users filtered by regex patterns on user fields.
 
-        Fetches all users and returns only those where every filter key's value
+        Streams all users and returns only those where every filter key's value
         matches the corresponding regex pattern.
 
         Args:
@@ -395,12 +366,11 @@ class CdpIamClient:
         """
 
         compiled = {k: re.compile(v) for k, v in filters.items()}
-        result = self.list_users()
         matched = []
-        for user in result.get("users", []):
+        for user in self.iter_users():
             for field, pattern in compiled.items():
                 value = user.get(field)
-                if not (value and re.search(pattern, str(value))):
+                if not (value and pattern.search(str(value))):
                     break
             else:
                 matched.append(user)
@@ -755,6 +725,9 @@ class CdpIamClient:
                 },
             )
             return result
+        except CdpError:
+            # A failed request, raised rather than reported, must not drop the user
+            raise
         except Exception:
             return None
 
@@ -763,7 +736,9 @@ class CdpIamClient:
         Get complete user information by email address.
 
         This method searches for a user by email and returns complete user details.
-        Useful for idempotency when user_id is not available.
+        Useful for idempotency when user_id is not available. The user is found
+        through the user index, so paging through the users stops as soon as a
+        match is found, and later lookups reuse the pages already read.
 
         Args:
             email: The email address of the user to find
@@ -772,74 +747,113 @@ class CdpIamClient:
             Complete user information dict, or None if user doesn't exist
         """
         try:
-            users_response = self.list_users()
-            users = users_response.get("users", [])
-
-            for user in users:
-                if user.get("email") == email:
-                    user_id = user.get("userId")
-                    return self.get_user_details(user_id=user_id)
-            return None
+            user = self.user_index.find("email", email)
+            if user is None:
+                return None
+            details = self.get_user_details(user_id=user.get("userId"))
+            if details is None and self.user_index.persisted:
+                # The persisted index is stale; look the user up in the tenant
+                self.user_index.discard()
+                return self.get_user_details_by_email(email)
+            return details
+        except CdpError:
+            raise
         except Exception:
             return None
 
-    def manage_user_groups(
+    def find_users(self, field: str, values: List[str]) -> List[Dict[str, Any]]:
+        """
+        Find users by email, workload username, user ID, or CRN.
+
+        Args:
+            field: The User field to match, one of CdpIamUserIndex.KEYS
+            values: The values to find
+
+        Returns:
+            List of basic User dicts, in the order of the given values; values
+            without a matching user are skipped
+        """
+        return self.user_index.find_all(field, values)
+
+    def resolve_user_groups(
         self,
-        user_id: str,
         current_groups: List[str],
         desired_groups: List[str],
-        purge: bool = False,
-    ) -> bool:
+    ) -> List[str]:
         """
-        Manage user group memberships.
+        Resolve the current groups of a user to names and check the desired groups exist.
+
+        Both lookups are made with a single C(listGroups) call.
 
         Note: This method will NOT create groups automatically. Groups must exist
         before adding users to them. Use the iam_group module to create groups.
 
         Args:
-            user_id: The user ID or CRN
             current_groups: List of current group CRNs (from list_groups_for_user)
             desired_groups: List of desired group names
-            purge: If True, remove user from groups not in desired list
 
         Returns:
-            True if changes were made, False otherwise
+            The names of the current groups
 
         Raises:
             CdpError: If a desired group does not exist
         """
-        changed = False
-
-        # Fetch actual group names for current group CRNs
-        current_group_names = set()
-        if current_groups:
-            groups_response = self.list_groups(group_names=current_groups)
-            for group in groups_response.get("groups", []):
-                group_name = group.get("groupName")
-                if group_name:
-                    current_group_names.add(group_name)
-
-        desired_group_names = set(desired_groups)
-
-        if purge:
-            groups_to_remove = current_group_names - desired_group_names
-            for group_name in groups_to_remove:
-                self.remove_user_from_group(user_id=user_id, group_name=group_name)
-                changed = True
-
-        groups_to_add = desired_group_names - current_group_names
-        for group_name in groups_to_add:
-            # Check if group exists, raise error if it doesn't
-            if not self.get_group_details(group_name):
+        lookup = list(dict.fromkeys(current_groups + desired_groups))
+        if not lookup:
+            return []
+
+        groups = self.list_groups(group_names=lookup).get("groups", [])
+        current = set(current_groups)
+        current_names = [
+            g.get("groupName")
+            for g in groups
+            if g.get("groupName") and g.get("crn") in current
+        ]
+
+        known = {g.get("groupName") for g in groups}
+        for group_name in desired_groups:
+            if group_name not in known:
                 raise CdpError(
                     f"Group '{group_name}' does not exist. "
                     f"Please create the group using the iam_group module before adding users to it.",
                     status=404,
                 )
-            self.add_user_to_group(user_id=user_id, group_name=group_name)
-            changed = True
+        return current_names
+
+    def manage_user_groups(
+        self,
+        user_id: str,
+        current_groups: List[str],
+        desired_groups: List[str],
+        purge: bool = False,
+        parallelism: int = 1,
+    ) -> int:
+        """
+        Manage user group memberships.
+
+        Note: This method will NOT create groups automatically. Groups must exist
+        before adding users to them. Use the iam_group module to create groups.
 
-        return changed
+        Args:
+            user_id: The user ID or CRN
+            current_groups: List of current group CRNs (from list_groups_for_user)
+            desired_groups: List of desired group names
+            purge: If True, remove user from groups not in desired list
+            parallelism: Maximum number of concurrent membership changes
+
+        Returns:
+            The number of membership changes made
+
+        Raises:
+            CdpError: If a desired group does not exist
+            CdpMutationError: If any membership change failed
+        """
+        current_names = self.resolve_user_groups(current_groups, desired_groups)
+        return (
+            CdpIamPlan(CdpIamPlan.USER, user_id, purge)
+            .plan("groups", current_names, desired_groups)
+            .apply(self, parallelism)
+        )
 
     def manage_user_roles(
         self,
@@ -847,7 +861,8 @@ class CdpIamClient:
         current_roles: List[str],
         desired_roles: List[str],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage user role assignments.
 
@@ -856,26 +871,19 @@ class CdpIamClient:
             current_roles: List of current role CRNs
             desired_roles: List of desired role CRNs
             purge: If True, remove roles not in desired list
+            parallelism: Maximum number of concurrent role changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
-
-        if purge:
-            roles_to_remove = [
-                role for role in current_roles if role not in desired_roles
-            ]
-            for role in roles_to_remove:
-                self.unassign_user_role(user_id=user_id, role=role)
-                changed = True
+            The number of role changes made
 
-        roles_to_add = [role for role in desired_roles if role not in current_roles]
-        for role in roles_to_add:
-            self.assign_user_role(user_id=user_id, role=role)
-            changed = True
-
-        return changed
+        Raises:
+            CdpMutationError: If any role change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.USER, user_id, purge)
+            .plan("roles", current_roles, desired_roles)
+            .apply(self, parallelism)
+        )
 
     def manage_user_resource_roles(
         self,
@@ -883,7 +891,8 @@ class CdpIamClient:
         current_assignments: List[Dict[str, str]],
         desired_assignments: List[Dict[str, str]],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage user resource role assignments.
 
@@ -892,41 +901,19 @@ class CdpIamClient:
             current_assignments: List of current resource role assignments
             desired_assignments: List of desired resource role assignments
             purge: If True, remove assignments not in desired list
+            parallelism: Maximum number of concurrent assignment changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
+            The number of assignment changes made
 
-        # Normalize current assignments for comparison
-        def normalize_assignment(assignment: Dict[str, str]) -> tuple:
-            resource = assignment.get("resource") or assignment.get("resourceCrn")
-            role = assignment.get("role") or assignment.get("resourceRoleCrn")
-            return (resource, role)
-
-        current_set = {normalize_assignment(a) for a in current_assignments}
-        desired_set = {normalize_assignment(a) for a in desired_assignments}
-
-        if purge:
-            assignments_to_remove = current_set - desired_set
-            for resource_crn, resource_role_crn in assignments_to_remove:
-                self.unassign_user_resource_role(
-                    user_id=user_id,
-                    resource_crn=resource_crn,
-                    resource_role_crn=resource_role_crn,
-                )
-                changed = True
-
-        assignments_to_add = desired_set - current_set
-        for resource_crn, resource_role_crn in assignments_to_add:
-            self.assign_user_resource_role(
-                user_id=user_id,
-                resource_crn=resource_crn,
-                resource_role_crn=resource_role_crn,
-            )
-            changed = True
-
-        return changed
+        Raises:
+            CdpMutationError: If any assignment change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.USER, user_id, purge)
+            .plan("resource_roles", current_assignments, desired_assignments)
+            .apply(self, parallelism)
+        )
 
     def assign_user_role(self, user_id: str, role: str) -> Dict[str, Any]:
         """
@@ -1587,6 +1574,25 @@ class CdpIamClient:
             squelch={404: {}},
         )
 
+    def iter_machine_users(
+        self,
+        machine_user_names: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over IAM machine users, fetching each page only as it is consumed.
+
+        Args:
+            machine_user_names: Optional list of machine user names or CRNs to filter by
+
+        Returns:
+            Iterator of basic MachineUser dicts from the listMachineUsers responses
+        """
+        return CdpClient.iter_items(
+            self.list_machine_users,
+            "machineUsers",
+            machine_user_names=machine_user_names,
+        )
+
     def get_machine_user_details(
         self,
         machine_user_name: str,
@@ -1640,7 +1646,8 @@ class CdpIamClient:
         current_roles: List[str],
         desired_roles: List[str],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage machine user role assignments.
 
@@ -1649,34 +1656,19 @@ class CdpIamClient:
             current_roles: List of current role CRNs
             desired_roles: List of desired role CRNs
             purge: If True, remove roles not in desired list
+            parallelism: Maximum number of concurrent role changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
+            The number of role changes made
 
-        if purge:
-            # Remove all roles not in desired list
-            roles_to_remove = [
-                role for role in current_roles if role not in desired_roles
-            ]
-            for role_crn in roles_to_remove:
-                self.unassign_machine_user_role(
-                    machine_user_name=machine_user_name,
-                    role=role_crn,
-                )
-                changed = True
-
-        # Add missing roles
-        roles_to_add = [role for role in desired_roles if role not in current_roles]
-        for role_crn in roles_to_add:
-            self.assign_machine_user_role(
-                machine_user_name=machine_user_name,
-                role=role_crn,
-            )
-            changed = True
-
-        return changed
+        Raises:
+            CdpMutationError: If any role change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.MACHINE_USER, machine_user_name, purge)
+            .plan("roles", current_roles, desired_roles)
+            .apply(self, parallelism)
+        )
 
     def manage_machine_user_resource_roles(
         self,
@@ -1684,7 +1676,8 @@ class CdpIamClient:
         current_assignments: List[Dict[str, str]],
         desired_assignments: List[Dict[str, str]],
         purge: bool = False,
-    ) -> bool:
+        parallelism: int = 1,
+    ) -> int:
         """
         Manage machine user resource role assignments.
 
@@ -1693,56 +1686,19 @@ class CdpIamClient:
             current_assignments: List of current resource role assignments
             desired_assignments: List of desired resource role assignments
             purge: If True, remove assignments not in desired list
+            parallelism: Maximum number of concurrent assignment changes
 
         Returns:
-            True if changes were made, False otherwise
-        """
-        changed = False
-
-        # Normalize current assignments for comparison
-        current_normalized = [
-            {
-                "resource": a.get("resourceCrn"),
-                "role": a.get("resourceRoleCrn"),
-            }
-            for a in current_assignments
-        ]
-
-        # Normalize desired assignments
-        desired_normalized = [
-            {
-                "resource": a.get("resource") or a.get("resourceCrn"),
-                "role": a.get("role") or a.get("resourceRoleCrn"),
-            }
-            for a in desired_assignments
-        ]
-
-        if purge:
-            # Remove all assignments not in desired list
-            assignments_to_remove = [
-                a for a in current_normalized if a not in desired_normalized
-            ]
-            for assignment in assignments_to_remove:
-                self.unassign_machine_user_resource_role(
-                    machine_user_name=machine_user_name,
-                    resource_crn=assignment["resource"],
-                    resource_role_crn=assignment["role"],
-                )
-                changed = True
-
-        # Add missing assignments
-        assignments_to_add = [
-            a for a in desired_normalized if a not in current_normalized
-        ]
-        for assignment in assignments_to_add:
-            self.assign_machine_user_resource_role(
-                machine_user_name=machine_user_name,
-                resource_crn=assignment["resource"],
-                resource_role_crn=assignment["role"],
-            )
-            changed = True
+            The number of assignment changes made
 
-        return changed
+        Raises:
+            CdpMutationError: If any assignment change failed
+        """
+        return (
+            CdpIamPlan(CdpIamPlan.MACHINE_USER, machine_user_name, purge)
+            .plan("resource_roles", current_assignments, desired_assignments)
+            .apply(self, parallelism)
+        )
 
     def create_machine_user(self, machine_user_name: str) -> Dict[str, Any]:
         """
@@ -2030,3 +1986,694 @@ class CdpIamClient:
             "/api/v1/iam/getDefaultIdentityProvider",
             json_data={},
         )
+
+
+class CdpIamUserIndex:
+    """
+    Index of the IAM users of a CDP tenant by user ID, email, workload
+    username, and CRN.
+
+    Users are read from C(listUsers) only as far as needed. A lookup returns
+    as soon as the page holding the match has been read, and the users read
+    so far are kept, so later lookups continue where the last one stopped.
+    Only a miss reads all remaining pages; after that, every lookup is
+    answered from memory.
+
+    If a C(path) is given, the complete index is also written to that file,
+    readable by the owner only, and reused by later runs for C(ttl) seconds.
+    A persisted index can be stale, so a miss against it reads the tenant
+    again, and callers that find a hit to be stale can C(discard) it.
+    """
+
+    KEYS = ("userId", "email", "workloadUsername", "crn")
+
+    def __init__(
+        self,
+        client: "CdpIamClient",
+        path: Optional[str] = None,
+        ttl: int = 300,
+    ):
+        """
+        Initialize the user index.
+
+        Args:
+            client: CdpIamClient used to list the users
+            path: File in which to persist the index; None to keep it in memory only
+            ttl: Seconds for which a persisted index is reused
+        """
+        self.client = client
+        self.path = os.path.expanduser(path) if path else None
+        self.ttl = ttl
+        self._reset()
+        self._load()
+
+    @staticmethod
+    def file_for(directory: str, endpoint: str, access_key: str) -> str:
+        """
+        Return the file of the persisted index for a tenant and access key.
+
+        Args:
+            directory: Directory in which to store the index
+            endpoint: The API endpoint
+            access_key: The access key listing the users
+
+        Returns:
+            The path of the index file
+        """
+        digest = hashlib.sha256(f"{endpoint}|{access_key}".encode("utf-8"))
+        return os.path.join(
+            os.path.expanduser(directory),
+            f"{digest.hexdigest()}.json",
+        )
+
+    def _reset(self) -> None:
+        self._index: Dict[str, Dict[str, Dict[str, Any]]] = {k: {} for k in self.KEYS}
+        self._users: List[Dict[str, Any]] = []
+        self._pages: Optional[Iterator[Dict[str, Any]]] = None
+        self.complete = False
+        self.persisted = False
+
+    def _add(self, user: Dict[str, Any]) -> None:
+        self._users.append(user)
+        for key in self.KEYS:
+            if user.get(key):
+                self._index[key].setdefault(user[key], user)
+
+    def _load(self) -> None:
+        """Load the persisted index, if it is still valid."""
+        if not self.path:
+            return
+        try:
+            if os.stat(self.path).st_mtime + self.ttl <= time.time():
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                users = json.load(f)
+        except (OSError, ValueError):
+            return
+        for user in users:
+            self._add(user)
+        self.complete = True
+        self.persisted = True
+
+    def _save(self) -> None:
+        """Persist the complete index; errors are ignored."""
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            # Write atomically; mkstemp creates the file readable by the owner only
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._users, f, separators=(",", ":"))
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except (OSError, TypeError, ValueError):
+            return
+
+    def _read(self) -> Iterator[Dict[str, Any]]:
+        """Read and index the users not yet read, yielding each one."""
+        if self._pages is None:
+            self._pages = self.client.iter_users()
+        for user in self._pages:
+            self._add(user)
+            yield user
+        if not self.complete:
+            self.complete = True
+            self._save()
+
+    def discard(self) -> None:
+        """Forget all indexed users, and remove the persisted index."""
+        if self.path:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        self._reset()
+
+    def find(self, key: str, value: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a user.
+
+        Args:
+            key: The User field to match, one of KEYS
+            value: The value to find
+
+        Returns:
+            The basic User dict, or None if no user matches
+        """
+        return next(iter(self.find_all(key, [value])), None)
+
+    def find_all(self, key: str, values: List[str]) -> List[Dict[str, Any]]:
+        """
+        Find users, reading only as many pages as needed to find them all.
+
+        Args:
+            key: The User field to match, one of KEYS
+            values: The values to find
+
+        Returns:
+            List of basic User dicts, in the order of the given values; values
+            without a matching user are skipped
+        """
+        if key not in self.KEYS:
+            raise ValueError(f"Users are not indexed by '{key}'")
+
+        pending = {v for v in values if v not in self._index[key]}
+        if pending and self.persisted:
+            self._reset()
+            pending = set(values)
+        index = self._index[key]
+        if pending and not self.complete:
+            for user in self._read():
+                pending.discard(user.get(key))
+                if not pending:
+                    break
+        return [index[v] for v in dict.fromkeys(values) if v in index]
+
+    @property
+    def users(self) -> List[Dict[str, Any]]:
+        """All users of the tenant."""
+        if not self.complete:
+            for _ in self._read():
+                pass
+        return list(self._users)
+
+
+class CdpIamSnapshot:
+    """
+    In-memory snapshot of the IAM entities of a CDP tenant.
+
+    The snapshot is assembled from bulk list calls rather than per-entity
+    lookups. Each collection is fetched at most once, on first use, and then
+    indexed so that repeated queries are answered from memory:
+
+    - CRN to entity, for users, machine users, and groups
+    - Group CRN to member CRNs
+    - Member CRN to group CRNs, i.e. the inverse of the group members
+
+    Group memberships are resolved with one C(listGroupMembers) call per
+    group instead of one C(listGroupsForUser) call per user. Role
+    assignments have no bulk API and are fetched per entity, running up to
+    C(parallelism) calls at once.
+    """
+
+    def __init__(self, client: CdpIamClient, parallelism: int = 1):
+        """
+        Initialize the IAM snapshot.
+
+        Args:
+            client: CdpIamClient used to fetch the IAM entities
+            parallelism: Maximum number of per-entity calls to run concurrently
+        """
+        self.client = client
+        self.parallelism = parallelism
+
+        self._users: Optional[List[Dict[str, Any]]] = None
+        self._machine_users: Optional[List[Dict[str, Any]]] = None
+        self._groups: Optional[List[Dict[str, Any]]] = None
+        self._by_crn: Dict[str, Dict[str, Any]] = {}
+        self._group_members: Optional[Dict[str, List[str]]] = None
+        self._member_groups: Optional[Dict[str, List[str]]] = None
+
+    def _index(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for entity in entities:
+            if entity.get("crn"):
+                self._by_crn[entity["crn"]] = entity
+        return entities
+
+    @property
+    def users(self) -> List[Dict[str, Any]]:
+        """All users of the tenant, as returned by C(listUsers)."""
+        if self._users is None:
+            self._users = self._index(self.client.list_users().get("users", []))
+        return self._users
+
+    @property
+    def machine_users(self) -> List[Dict[str, Any]]:
+        """All machine users of the tenant, as returned by C(listMachineUsers)."""
+        if self._machine_users is None:
+            self._machine_users = self._index(
+                self.client.list_machine_users().get("machineUsers", []),
+            )
+        return self._machine_users
+
+    @property
+    def groups(self) -> List[Dict[str, Any]]:
+        """All groups of the tenant, as returned by C(listGroups)."""
+        if self._groups is None:
+            self._groups = self._index(
+                self.client.list_groups().get("groups", []),
+            )
+        return self._groups
+
+    @property
+    def group_members(self) -> Dict[str, List[str]]:
+        """Index of group CRN to the CRNs of its users and machine users."""
+        if self._group_members is None:
+            members = concurrent_requests(
+                self.client,
+                lambda group: self.client.list_group_members(
+                    group_name=group["crn"],
+                ).get("memberCrns", []),
+                self.groups,
+                parallelism=self.parallelism,
+            )
+            self._group_members = {
+                group["crn"]: crns for group, crns in zip(self.groups, members)
+            }
+        return self._group_members
+
+    @property
+    def member_groups(self) -> Dict[str, List[str]]:
+        """Index of user or machine user CRN to the CRNs of its groups."""
+        if self._member_groups is None:
+            self._member_groups = {}
+            for group_crn, member_crns in self.group_members.items():
+                for member_crn in member_crns:
+                    self._member_groups.setdefault(member_crn, []).append(group_crn)
+        return self._member_groups
+
+    def get(self, crn: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a user, machine user, or group by CRN.
+
+        Only the collection matching the CRN's resource type is fetched.
+
+        Args:
+            crn: The entity CRN
+
+        Returns:
+            The entity dict, or None if it doesn't exist
+        """
+        if ":machineUser:" in crn:
+            entities = self.machine_users
+        elif ":group:" in crn:
+            entities = self.groups
+        elif ":user:" in crn:
+            entities = self.users
+        else:
+            return None
+        return self._by_crn.get(crn) if entities else None
+
+    def user_details(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build complete user information for the given users.
+
+        The result has the same shape as CdpIamClient.get_user_details. Group
+        memberships come from the snapshot's member index, which takes one
+        C(listGroupMembers) call per group of the tenant; for fewer users than
+        groups, e.g. a filtered listing, they are instead listed per user
+        unless the index is already built.
+
+        Args:
+            users: Basic User dicts, e.g. from the listUsers response
+
+        Returns:
+            List of complete user information dicts, in the order of the given users
+        """
+
+        per_user = (
+            bool(users)
+            and self._member_groups is None
+            and len(users) < len(self.groups)
+        )
+
+        def assignments(user: Dict[str, Any]) -> Dict[str, Any]:
+            user_id = user.get("userId")
+            assigned = {
+                "roles": self.client.list_user_assigned_roles(user=user_id).get(
+                    "roleCrns",
+                    [],
+                ),
+                "resourceAssignments": self.client.list_user_assigned_resource_roles(
+                    user=user_id,
+                ).get("resourceAssignments", []),
+            }
+            if per_user:
+                assigned["groups"] = self.client.list_groups_for_user(
+                    user_id=user_id,
+                ).get("groupCrns", [])
+            return assigned
+
+        member_groups = self.member_groups if users and not per_user else {}
+
+        return [
+            {
+                **user,
+                **assigned,
+                "groups": assigned.get(
+                    "groups",
+                    member_groups.get(user.get("crn"), []),
+                ),
+            }
+            for user, assigned in zip(
+                users,
+                concurrent_requests(
+                    self.client,
+                    assignments,
+                    users,
+                    parallelism=self.parallelism,
+                ),
+            )
+        ]
+
+    def machine_user_details(
+        self,
+        machine_users: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Build complete machine user information for the given machine users.
+
+        The result has the same shape as CdpIamClient.get_machine_user_details.
+
+        Args:
+            machine_users: Basic MachineUser dicts, e.g. from the listMachineUsers response
+
+        Returns:
+            List of complete machine user information dicts, in the order of the given machine users
+        """
+
+        def assignments(machine_user: Dict[str, Any]) -> Dict[str, Any]:
+            name = machine_user.get("machineUserName")
+            return {
+                "roles": self.client.list_machine_user_assigned_roles(
+                    machine_user_name=name,
+                ).get("roleCrns", []),
+                "resourceAssignments": (
+                    self.client.list_machine_user_assigned_resource_roles(
+                        machine_user_name=name,
+                    ).get("resourceAssignments", [])
+                ),
+            }
+
+        return [
+            {
+                "machineUserName": machine_user.get("machineUserName"),
+                "crn": machine_user.get("crn"),
+                "creationDate": machine_user.get("creationDate"),
+                "status": machine_user.get("status"),
+                "workloadUsername": machine_user.get("workloadUsername"),
+                **assigned,
+            }
+            for machine_user, assigned in zip(
+                machine_users,
+                concurrent_requests(
+                    self.client,
+                    assignments,
+                    machine_users,
+                    parallelism=self.parallelism,
+                ),
+            )
+        ]
+
+    def group_details(self, groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build complete group information for the given groups.
+
+        The result has the same shape as CdpIamClient.get_group_details.
+
+        Args:
+            groups: Basic Group dicts, e.g. from the listGroups response
+
+        Returns:
+            List of complete group information dicts, in the order of the given groups
+        """
+
+        def assignments(group: Dict[str, Any]) -> Dict[str, Any]:
+            group_name = group.get("groupName")
+            return {
+                "roles": self.client.list_group_assigned_roles(
+                    group_name=group_name,
+                ).get("roleCrns", []),
+                "resourceAssignments": self.client.list_group_assigned_resource_roles(
+                    group_name=group_name,
+                ).get("resourceAssignments", []),
+            }
+
+        group_members = self.group_members if groups else {}
+
+        return [
+            {
+                "groupName": group.get("groupName"),
+                "crn": group.get("crn"),
+                "creationDate": group.get("creationDate"),
+                "syncMembershipOnUserLogin": group.get("syncMembershipOnUserLogin"),
+                "members": group_members.get(group.get("crn"), []),
+                **assigned,
+            }
+            for group, assigned in zip(
+                groups,
+                concurrent_requests(
+                    self.client,
+                    assignments,
+                    groups,
+                    parallelism=self.parallelism,
+                ),
+            )
+        ]
+
+
+class CdpIamPlan:
+    """
+    Change plan reconciling the memberships and role assignments of one IAM
+    user, machine user, or group with their desired state.
+
+    The plan is computed in one pass from the current and desired state,
+    without making any mutating calls, so check mode and diff mode are served
+    from it. Lists are compared as sets, and the changes keep the order of the
+    input lists. Applying the plan submits all changes as one batch to a
+    bounded pool of workers.
+
+    The attributes are C(members) of a group, C(groups) of a user, given by
+    name, and C(roles) and C(resource_roles) of any principal. Resource roles
+    are given as dicts with C(resource) and C(role), or C(resourceCrn) and
+    C(resourceRoleCrn), keys.
+    """
+
+    USER = "user"
+    MACHINE_USER = "machine_user"
+    GROUP = "group"
+
+    def __init__(self, kind: str, name: Optional[str], purge: bool = False):
+        """
+        Initialize an empty plan.
+
+        Args:
+            kind: The type of principal, one of USER, MACHINE_USER, or GROUP
+            name: The user ID, machine user name, or group name; may be set
+                later, e.g. once a new user is created
+            purge: If True, remove memberships and roles not in the desired state
+        """
+        self.kind = kind
+        self.name = name
+        self.purge = purge
+        self.changes: List[Dict[str, Any]] = []
+        self.before: Dict[str, List[Any]] = {}
+        self.after: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    @classmethod
+    def for_user(
+        cls,
+        client: "CdpIamClient",
+        user: Optional[Dict[str, Any]],
+        groups: Optional[List[str]] = None,
+        roles: Optional[List[str]] = None,
+        resource_roles: Optional[List[Dict[str, str]]] = None,
+        purge: bool = False,
+    ) -> "CdpIamPlan":
+        """
+        Plan the changes to a user.
+
+        The current group CRNs of the user are resolved to names, and the
+        desired groups are checked, with a single C(listGroups) call.
+
+        Args:
+            client: CdpIamClient used for the group lookup
+            user: The current user details, or None if the user does not exist yet
+            groups: Desired group names
+            roles: Desired role CRNs
+            resource_roles: Desired resource role assignments
+            purge: If True, remove memberships and roles not in the desired state
+
+        Returns:
+            The plan
+
+        Raises:
+            CdpError: If a desired group does not exist
+        """
+        user = user or {}
+        plan = cls(cls.USER, user.get("userId"), purge)
+
+        if groups is not None or purge:
+            current_groups = client.resolve_user_groups(
+                current_groups=user.get("groups", []),
+                desired_groups=groups or [],
+            )
+            plan.plan("groups", current_groups, groups)
+
+        plan.plan("roles", user.get("roles", []), roles)
+        plan.plan(
+            "resource_roles",
+            user.get("resourceAssignments", []),
+            resource_roles,
+        )
+        return plan
+
+    @staticmethod
+    def _key(attribute: str, item: Any) -> Any:
+        """Return the hashable identity of an item of an attribute."""
+        if attribute == "resource_roles":
+            return (
+                item.get("resource") or item.get("resourceCrn"),
+                item.get("role") or item.get("resourceRoleCrn"),
+            )
+        return item
+
+    @staticmethod
+    def _item(attribute: str, key: Any) -> Any:
+        """Return the user-facing form of an item identity."""
+        if attribute == "resource_roles":
+            return dict(resource=key[0], role=key[1])
+        return key
+
+    def plan(
+        self,
+        attribute: str,
+        current: List[Any],
+        desired: Optional[List[Any]],
+    ) -> "CdpIamPlan":
+        """
+        Plan the changes to one attribute.
+
+        Args:
+            attribute: One of members, groups, roles, or resource_roles
+            current: The current items
+            desired: The desired items; if None, the attribute is left
+                unchanged unless the plan purges
+
+        Returns:
+            The plan, for chaining
+        """
+        if desired is None and not self.purge:
+            return self
+
+        current_keys = dict.fromkeys(self._key(attribute, i) for i in current)
+        desired_keys = dict.fromkeys(self._key(attribute, i) for i in desired or [])
+
+        removes = (
+            [k for k in current_keys if k not in desired_keys] if self.purge else []
+        )
+        adds = [k for k in desired_keys if k not in current_keys]
+
+        for action, keys in (("remove", removes), ("add", adds)):
+            for key in keys:
+                self.changes.append(
+                    dict(action=action, attribute=attribute, item=key),
+                )
+
+        if removes or adds:
+            removed = set(removes)
+            self.before[attribute] = [self._item(attribute, k) for k in current_keys]
+            self.after[attribute] = [
+                self._item(attribute, k)
+                for k in list(current_keys) + adds
+                if k not in removed
+            ]
+        return self
+
+    def diff(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Return the before and after state of the changed attributes, e.g. for diff mode."""
+        return dict(before=dict(self.before), after=dict(self.after))
+
+    def _call(
+        self,
+        client: "CdpIamClient",
+        change: Dict[str, Any],
+    ) -> Callable[[], Any]:
+        """Return the client call making a planned change."""
+        add = change["action"] == "add"
+        attribute = change["attribute"]
+        item = change["item"]
+
+        if attribute == "members":
+            member = "machine_user" if client._is_machine_user(item) else "user"
+            if add:
+                method = f"add_{member}_to_group"
+            else:
+                method = f"remove_{member}_from_group"
+            member_arg = "machine_user_name" if member == "machine_user" else "user_id"
+            return partial(
+                getattr(client, method),
+                group_name=self.name,
+                **{member_arg: item},
+            )
+
+        if attribute == "groups":
+            method = "add_user_to_group" if add else "remove_user_from_group"
+            return partial(getattr(client, method), user_id=self.name, group_name=item)
+
+        principal_arg = {
+            self.USER: "user_id",
+            self.MACHINE_USER: "machine_user_name",
+            self.GROUP: "group_name",
+        }[self.kind]
+        verb = "assign" if add else "unassign"
+
+        if attribute == "resource_roles":
+            return partial(
+                getattr(client, f"{verb}_{self.kind}_resource_role"),
+                resource_crn=item[0],
+                resource_role_crn=item[1],
+                **{principal_arg: self.name},
+            )
+        return partial(
+            getattr(client, f"{verb}_{self.kind}_role"),
+            role=item,
+            **{principal_arg: self.name},
+        )
+
+    def calls(self, client: "CdpIamClient") -> List[Tuple[str, Callable[[], Any]]]:
+        """
+        Return the client calls making the planned changes, without making them.
+
+        Args:
+            client: CdpIamClient used to make the changes
+
+        Returns:
+            Pairs of a label identifying the changed item and a function
+            without arguments making the change, in plan order
+        """
+        return [
+            (
+                (
+                    f"{change['item'][0]}:{change['item'][1]}"
+                    if change["attribute"] == "resource_roles"
+                    else change["item"]
+                ),
+                self._call(client, change),
+            )
+            for change in self.changes
+        ]
+
+    def apply(self, client: "CdpIamClient", parallelism: int = 1) -> int:
+        """
+        Make the planned changes.
+
+        Args:
+            client: CdpIamClient used to make the changes
+            parallelism: Maximum number of concurrent changes
+
+        Returns:
+            The number of changes made
+
+        Raises:
+            CdpMutationError: If any change failed
+        """
+        return apply_mutations(client, self.calls(client), parallelism)
@@ -18,13 +18,17 @@
 A REST client for the Cloudera on Cloud Platform (CDP) AI API
 """
 
-import time
-
 from typing import Any, Dict, List, Optional
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
     CdpError,
+    CdpListFilter,
+    concurrent_requests,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
 )
 
 
@@ -71,9 +75,11 @@ class CdpMlClient:
             squelch={404: []},
         )
 
-        if env:
-            workspaces = resp.get("workspaces", [])
-            resp["workspaces"] = [x for x in workspaces if env == x["environmentName"]]
+        # The API has no environment filter, so the workspaces are filtered
+        # as they are read
+        predicate = CdpListFilter(environmentName=env or None)
+        if predicate:
+            resp["workspaces"] = list(predicate.apply(resp.get("workspaces", [])))
 
         return resp
 
@@ -117,23 +123,51 @@ class CdpMlClient:
     def describe_all_workspaces(
         self,
         env: Optional[str] = None,
+        parallelism: int = 1,
+        summary: bool = False,
+        summary_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Describe all ML Workspaces in the Tenant, optionally filtered by environment.
 
+        The workspaces are described concurrently by up to C(parallelism)
+        workers, in the order they are listed. In summary mode, the list
+        entries are returned as-is, and only the workspaces whose list entry
+        lacks one of C(summary_fields) are described.
+
         Args:
             env: Optional environment name to filter workspaces by.
+            parallelism: Maximum number of concurrent describe calls.
+            summary: Whether to return the list entries rather than describing each workspace.
+            summary_fields: Fields a list entry must carry to be returned in summary mode.
 
         Returns:
             List of workspace details for all workspaces in the tenant.
         """
-        ws_list = self.list_workspaces(env)
-        resp = []
+        workspaces = self.list_workspaces(env).get("workspaces", [])
+
+        if summary:
+            required = summary_fields or []
+            incomplete = [
+                ws for ws in workspaces if any(field not in ws for field in required)
+            ]
+        else:
+            incomplete = workspaces
 
-        for ws in ws_list.get("workspaces", []):
-            ws_desc = self.describe_workspace(crn=ws["crn"])
-            if ws_desc is not None:
-                resp.append(ws_desc.get("workspace", {}))
+        descriptions = concurrent_requests(
+            self.api_client,
+            lambda ws: self.describe_workspace(crn=ws["crn"]),
+            incomplete,
+            parallelism,
+        )
+        described = {ws["crn"]: desc for ws, desc in zip(incomplete, descriptions)}
+
+        resp = []
+        for ws in workspaces:
+            if ws["crn"] not in described:
+                resp.append(ws)
+            elif described[ws["crn"]] is not None:
+                resp.append(described[ws["crn"]].get("workspace", {}))
         return resp
 
     def create_workspace(
@@ -296,7 +330,7 @@ class CdpMlClient:
             environment: The environment of the workspace to monitor.
             workspace_name: The name of the workspace to monitor.
             target_states: List of desired target states to wait for. If None, waits for workspace deletion.
-            delay: Time between status checks in seconds.
+            delay: Longest time between status checks in seconds; polling speeds up after state changes and slows back to this interval while the state is unchanged.
             timeout: Maximum time to wait in seconds.
             ignore_failures: If True, ignore failed states and continue waiting.
 
@@ -307,33 +341,22 @@ class CdpMlClient:
             CdpError: If workspace enters a failed state (when ignore_failures=False) or timeout occurs.
         """
 
-        start_time = time.time()
-
-        # Wait for target state(s) to be reached, polling at the specified interval
-        while True:
-            workspace = self.describe_workspace(env=environment, name=workspace_name)
+        def instance_status(workspace: Optional[Dict[str, Any]]) -> Optional[str]:
+            # A missing workspace is either deleted or not yet visible (post-creation lag)
+            if workspace is None or workspace.get("workspace") is None:
+                return None
+            return workspace["workspace"].get("instanceStatus")
 
-            # Check if workspace has been deleted (None or empty response)
+        def settled(workspace: Optional[Dict[str, Any]]) -> bool:
             if workspace is None or workspace.get("workspace") is None:
-                if target_states is None:
-                    # Deletion was expected - successfully deleted
-                    return {}
-                else:
-                    # Workspace doesn't exist yet (post-creation lag) or was deleted unexpectedly
-                    # Continue polling to allow for API lag where workspace isn't visible yet
-                    if time.time() - start_time > timeout:
-                        raise CdpError(
-                            f"Timeout waiting for workspace {workspace_name} in environment {environment} to appear. "
-                            f"The workspace may not have been created successfully.",
-                        )
-                    time.sleep(delay)
-                    continue
-
-            current_state = workspace.get("workspace", {}).get("instanceStatus")
+                # Deletion was expected; otherwise keep polling for the workspace to appear
+                return target_states is None
+
+            current_state = instance_status(workspace)
 
             # Check if in target state
             if target_states is not None and current_state in target_states:
-                return workspace
+                return True
 
             # Check if in failed state
             if not ignore_failures and current_state in self.FAILED_STATES:
@@ -345,16 +368,35 @@ class CdpMlClient:
                     f"Workspace {workspace_name} in environment {environment} entered failed state '{current_state}': {msg}.",
                 )
 
-            if time.time() - start_time > timeout:
-                if target_states is None:
-                    raise CdpError(
-                        f"Timeout waiting for workspace {workspace_name} in environment {environment} to be deleted after {timeout} seconds. "
-                        f"Current state: {current_state}",
-                    )
-                else:
-                    raise CdpError(
-                        f"Timeout waiting for workspace {workspace_name} in environment {environment} to reach states {target_states} after {timeout} seconds. "
-                        f"Current state: {current_state}",
-                    )
-
-            time.sleep(delay)
+            return False
+
+        waiter = CdpWaiter(
+            timeout=timeout,
+            delay=delay,
+            label=f"workspace {workspace_name} in environment {environment}",
+        )
+
+        try:
+            workspace = waiter.wait(
+                lambda: self.describe_workspace(env=environment, name=workspace_name),
+                until=settled,
+                state=instance_status,
+            )
+        except CdpWaitTimeout as e:
+            if target_states is None:
+                raise CdpError(
+                    f"Timeout waiting for workspace {workspace_name} in environment {environment} to be deleted after {timeout} seconds. "
+                    f"Current state: {e.state}",
+                )
+            elif instance_status(e.last) is None:
+                raise CdpError(
+                    f"Timeout waiting for workspace {workspace_name} in environment {environment} to appear. "
+                    f"The workspace may not have been created successfully.",
+                )
+            else:
+                raise CdpError(
+                    f"Timeout waiting for workspace {workspace_name} in environment {environment} to reach states {target_states} after {timeout} seconds. "
+                    f"Current state: {e.state}",
+                )
+
+        return workspace if target_states is not None else {}
@@ -14,14 +14,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import json
+import os
 import re
+import threading
+
+from typing import Any, Dict, List, Optional, Union
 
 from ansible.errors import AnsibleError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils.common.text.converters import to_text, to_native
 from ansible.utils.display import Display
 
-from cdpy.cdpy import Cdpy
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    CdpConnectionPool,
+    CdpCredentialError,
+    CdpError,
+    CdpResponseCache,
+    load_cdp_config,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_datalake import (
+    CdpDatalakeClient,
+)
 
 display = Display()
 SEMVER = re.compile("(\d+\.[.\d]*\d+)")
@@ -56,8 +72,190 @@ def parse_services(
         raise AnsibleError("Error parsing result for '%s':'" % name, to_native(e))
 
 
+class CdpLookupClient(AnsibleCdpClient):
+    """
+    Controller-side CDP client shared by lookup plugins.
+
+    Lookups run on the controller without an Ansible module and are templated
+    repeatedly, so the client keeps its connections alive in a pool and
+    memoises describe and list responses for the life of the process. Failed
+    requests raise CdpError.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        access_key: str,
+        private_key: str,
+        validate_certs: bool = True,
+        http_agent: str = "cloudera.cloud",
+        pool_size: int = 4,
+        pool_idle_timeout: int = 30,
+        timeout_seconds: int = 60,
+    ):
+        """
+        Initialize the lookup client.
+
+        Args:
+            base_url: Base URL for CDP API
+            access_key: CDP access key ID
+            private_key: Base64-encoded Ed25519 private key seed
+            validate_certs: Verify the TLS certificate of the endpoint
+            http_agent: User-Agent header value
+            pool_size: Number of keep-alive connections retained per host
+            pool_idle_timeout: Seconds an idle pooled connection may be reused
+            timeout_seconds: Request timeout in seconds
+        """
+        super().__init__(
+            module=None,
+            base_url=base_url,
+            access_key=access_key,
+            private_key=private_key,
+            timeout_seconds=timeout_seconds,
+        )
+
+        self.pool = CdpConnectionPool(
+            max_size=max(pool_size, 1),
+            idle_timeout=pool_idle_timeout,
+            validate_certs=validate_certs,
+            http_agent=http_agent,
+        )
+
+        # Describe and list responses, by request
+        self._memo: Dict[str, Any] = {}
+        self._memo_lock = threading.Lock()
+
+    def _warn(self, msg: str) -> None:
+        display.vvv(msg)
+
+    def _fail(self, error: Exception) -> None:
+        if isinstance(error, CdpError):
+            raise error
+        raise CdpError(str(error)) from error
+
+    def _make_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        json_data: Optional[Union[Dict[str, Any], List[Any]]] = None,
+        max_retries: int = 3,
+        squelch: Dict[int, Any] = {},
+    ) -> Any:
+        """
+        Make an HTTP request, answering repeated describe and list calls from
+        the memoised responses.
+
+        Memoised responses are shared by every caller and must not be
+        modified.
+        """
+        if not CdpResponseCache.cacheable(method, path):
+            return super()._make_request(
+                method,
+                path,
+                params=params,
+                data=data,
+                json_data=json_data,
+                max_retries=max_retries,
+                squelch=squelch,
+            )
+
+        payload = json_data if json_data is not None else data
+        key = json.dumps([method, path, params, payload], sort_keys=True)
+
+        with self._memo_lock:
+            if key in self._memo:
+                return self._memo[key]
+
+        result = super()._make_request(
+            method,
+            path,
+            params=params,
+            data=data,
+            json_data=json_data,
+            max_retries=max_retries,
+            squelch=squelch,
+        )
+
+        with self._memo_lock:
+            return self._memo.setdefault(key, result)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_lookup_client(
+    base_url: str,
+    access_key: str,
+    private_key: str,
+    validate_certs: bool,
+) -> CdpLookupClient:
+    return CdpLookupClient(
+        base_url=base_url,
+        access_key=access_key,
+        private_key=private_key,
+        validate_certs=validate_certs,
+    )
+
+
+def get_lookup_client(validate_certs: bool = True) -> CdpLookupClient:
+    """
+    Return the CDP client shared by the lookups of this process.
+
+    The credentials and endpoint are resolved as the modules resolve them:
+    C(CDP_ACCESS_KEY_ID) and C(CDP_PRIVATE_KEY), else the C(CDP_PROFILE)
+    profile of the C(CDP_CREDENTIALS_PATH) credentials file, and
+    C(CDP_ENDPOINT_URL), else the endpoint of the C(CDP_REGION) region (or the
+    region of the profile). One client, with its connection pool and memoised
+    responses, is kept per endpoint and credentials.
+
+    Args:
+        validate_certs: Verify the TLS certificate of the endpoint
+
+    Returns:
+        The shared CdpLookupClient
+
+    Raises:
+        AnsibleError: If the credentials cannot be loaded
+    """
+    access_key = os.environ.get("CDP_ACCESS_KEY_ID")
+    private_key = os.environ.get("CDP_PRIVATE_KEY")
+    region = os.environ.get("CDP_REGION")
+
+    if access_key is None or private_key is None:
+        try:
+            file_access_key, file_private_key, file_region = load_cdp_config(
+                credentials_path=os.environ.get(
+                    "CDP_CREDENTIALS_PATH",
+                    "~/.cdp/credentials",
+                ),
+                profile=os.environ.get("CDP_PROFILE", "default"),
+            )
+        except CdpCredentialError as e:
+            raise AnsibleError(
+                "Failed to load CDP credentials: %s" % to_native(e),
+            )
+        access_key = access_key or file_access_key
+        private_key = private_key or file_private_key
+        region = region or file_region
+
+    if region in (None, "default"):
+        region = "us-west-1"
+
+    endpoint = os.environ.get(
+        "CDP_ENDPOINT_URL",
+        "https://api.%s.cdp.cloudera.com" % region,
+    )
+
+    return _shared_lookup_client(endpoint, access_key, private_key, validate_certs)
+
+
 def parse_environment(environment: str):
-    env = Cdpy().datalake.describe_all_datalakes(environment)
+    try:
+        env = CdpDatalakeClient(
+            api_client=get_lookup_client(),
+        ).describe_all_datalakes(environment)
+    except CdpError as e:
+        raise AnsibleError("Error connecting to CDP: %s" % to_native(e))
 
     if not env:
         raise AnsibleError("No Datalake found for Environment '%s'" % environment)
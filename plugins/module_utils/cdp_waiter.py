@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adaptive and multiplexed polling for long-running Cloudera on Cloud Platform
+(CDP) operations
+"""
+
+import logging
+import random
+import time
+
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+
+_NOT_SET = object()
+
+
+class CdpWaitTimeout(CdpError):
+    """Raised when a waited-on resource does not settle before the timeout."""
+
+    def __init__(self, msg: str, last: Any = None, state: Any = None):
+        """
+        Initialize the wait timeout error.
+
+        Args:
+            msg: Error message
+            last: The last polled result
+            state: The last observed state
+        """
+        super().__init__(msg)
+        self.last = last
+        self.state = state
+
+
+class CdpWaiter:
+    """
+    Adaptive, jittered polling engine for wait_for_* loops.
+
+    The interval starts at C(min_delay) and grows by C(backoff) for each poll
+    that observes the same state, up to C(max_delay), by default C(delay)
+    itself. When the state changes, the interval resets to C(min_delay), since
+    one transition is usually followed closely by the next, e.g. PROVISIONING
+    then INSTALLING then RUNNING. Each interval is randomised by +/- C(jitter),
+    without exceeding C(max_delay), so that concurrent waiters do not poll in
+    lockstep, and the last poll always lands on the deadline.
+
+    After each wait, C(metrics) holds the number of polls, the elapsed time,
+    the number of state changes, and the time-to-detect, i.e. the interval
+    before the final poll and thus an upper bound on how late the final
+    state was noticed.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 3600,
+        delay: float = 30,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
+        label: str = "resource",
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            delay: Longest polling interval in seconds, i.e. the user-facing C(delay) option
+            min_delay: Shortest interval; defaults to a quarter of C(delay), but at least 1 second
+            max_delay: Longest interval; defaults to C(delay)
+            backoff: Factor by which the interval grows while the state is unchanged
+            jitter: Fraction by which each interval is randomly shortened or lengthened
+            label: Description of the waited-on resource, used in messages
+        """
+        self.timeout = timeout
+        self.min_delay = (
+            min_delay if min_delay is not None else min(delay, max(1.0, delay / 4))
+        )
+        self.max_delay = max(
+            max_delay if max_delay is not None else delay,
+            self.min_delay,
+        )
+        self.backoff = backoff
+        self.jitter = jitter
+        self.label = label
+        self.logger = logging.getLogger("cloudera.cloud")
+        self.metrics: Dict[str, Any] = {}
+
+    def _next_interval(self, interval: float) -> float:
+        """Return the jittered interval before the next poll."""
+        if self.jitter:
+            interval = min(
+                interval * random.uniform(1 - self.jitter, 1 + self.jitter),
+                self.max_delay,
+            )
+        return max(interval, 0)
+
+    def wait(
+        self,
+        poll: Callable[[], Any],
+        until: Callable[[Any], bool],
+        state: Callable[[Any], Any] = lambda result: result,
+        initial: Any = _NOT_SET,
+    ) -> Any:
+        """
+        Poll until a condition holds or the timeout expires.
+
+        Args:
+            poll: Function returning the current result, e.g. a describe call
+            until: Predicate on the result that ends the wait; may raise to abort on failure states
+            state: Function extracting the comparable state from a result, used to detect changes
+            initial: A result already in hand, evaluated before the first poll
+
+        Returns:
+            The result for which C(until) returned True
+
+        Raises:
+            CdpWaitTimeout: If the condition does not hold before the timeout
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        interval = self.min_delay
+        polls = 0
+        state_changes = 0
+        last_poll = None
+        last_state = _NOT_SET
+
+        result = initial
+        while True:
+            now = time.monotonic()
+            if result is _NOT_SET:
+                result = poll()
+                polls += 1
+            time_to_detect = now - last_poll if last_poll is not None else 0.0
+            last_poll = now
+
+            current_state = state(result)
+            if last_state is not _NOT_SET and current_state != last_state:
+                state_changes += 1
+                interval = self.min_delay
+            elif last_state is not _NOT_SET:
+                interval = min(interval * self.backoff, self.max_delay)
+            last_state = current_state
+
+            self.metrics = dict(
+                polls=polls,
+                elapsed=now - start,
+                state_changes=state_changes,
+                time_to_detect=time_to_detect,
+            )
+
+            if until(result):
+                self.logger.debug(
+                    "Waited %.1fs for %s: %d polls, %d state changes, detected within %.1fs",
+                    self.metrics["elapsed"],
+                    self.label,
+                    polls,
+                    state_changes,
+                    time_to_detect,
+                )
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CdpWaitTimeout(
+                    f"Timeout waiting for {self.label} after {self.timeout} seconds. "
+                    f"Current state: {current_state}",
+                    last=result,
+                    state=current_state,
+                )
+
+            time.sleep(min(self._next_interval(interval), remaining))
+            result = _NOT_SET
+
+
+class CdpWatcher:
+    """
+    Multiplexed polling of many resources with one list call per poll and scope.
+
+    Each resource type is registered once with the function listing its
+    resources within a scope, e.g. the Virtual Warehouses of a cluster, and
+    the functions extracting the key and the state of a listed resource.
+    Each waited-on resource is then watched by its type, scope, and key.
+
+    Every poll calls each registered list function once for each scope that
+    still has an unsettled resource, and checks all of that scope's
+    resources against the one listing, rather than describing every
+    resource on its own. A resource that is not listed is checked as
+    None. When the state of a resource changes, its C(on_change) callback
+    is called with the previous and current state. Once a resource's
+    C(until) predicate holds, it is settled and no longer checked, and a
+    scope without unsettled resources is no longer listed.
+
+    The polls are paced by a single CdpWaiter, whose interval resets
+    whenever any watched resource changes state.
+    """
+
+    def __init__(self, waiter: CdpWaiter):
+        """
+        Initialize the watcher.
+
+        Args:
+            waiter: The waiter pacing the polls and enforcing the timeout
+        """
+        self.waiter = waiter
+        self.logger = logging.getLogger("cloudera.cloud")
+        self._sources: Dict[str, Tuple[Callable, Callable, Callable]] = {}
+        self._watches: Dict[Tuple[str, Hashable, Hashable], Dict[str, Any]] = {}
+        self._settled: Dict[Tuple[str, Hashable, Hashable], Optional[Any]] = {}
+
+    def register(
+        self,
+        kind: str,
+        lister: Callable[[Hashable], Iterable[Any]],
+        key: Callable[[Any], Hashable],
+        state: Callable[[Any], Any] = lambda resource: resource,
+    ) -> None:
+        """
+        Register a resource type.
+
+        Args:
+            kind: Name of the resource type, e.g. C(vw)
+            lister: Function returning the resources within a scope
+            key: Function returning the key of a listed resource
+            state: Function extracting the comparable state from a listed resource
+        """
+        self._sources[kind] = (lister, key, state)
+
+    def watch(
+        self,
+        kind: str,
+        scope: Hashable,
+        key: Hashable,
+        until: Callable[[Optional[Any]], bool],
+        on_change: Optional[Callable[[Any, Any, Optional[Any]], None]] = None,
+    ) -> None:
+        """
+        Watch a resource of a registered type.
+
+        Args:
+            kind: Name of the registered resource type
+            scope: The scope passed to the list function, e.g. a cluster ID
+            key: The key of the resource within the listing
+            until: Predicate on the resource, or None if it is not listed, that
+                ends the wait for it; may raise to abort on failure states
+            on_change: Function called with the previous state, the current
+                state, and the resource whenever the resource changes state
+
+        Raises:
+            KeyError: If the resource type is not registered
+        """
+        if kind not in self._sources:
+            raise KeyError(f"Unregistered resource type: {kind}")
+        self._watches[(kind, scope, key)] = dict(
+            until=until,
+            on_change=on_change,
+            state=_NOT_SET,
+        )
+
+    def _poll(self) -> Dict[Tuple[str, Hashable, Hashable], Optional[Any]]:
+        """List each pending type and scope once and check its watched resources."""
+        listings: Dict[Tuple[str, Hashable], Dict[Hashable, Any]] = {}
+        unsettled = {}
+        for watched in list(self._watches):
+            kind, scope, key = watched
+            lister, key_of, state_of = self._sources[kind]
+            if (kind, scope) not in listings:
+                listings[(kind, scope)] = {
+                    key_of(resource): resource for resource in lister(scope)
+                }
+            resource = listings[(kind, scope)].get(key)
+
+            watch = self._watches[watched]
+            current = state_of(resource) if resource is not None else None
+            if watch["state"] is not _NOT_SET and current != watch["state"]:
+                self.logger.debug(
+                    "%s %s in %s changed state: %s -> %s",
+                    kind,
+                    key,
+                    scope,
+                    watch["state"],
+                    current,
+                )
+                if watch["on_change"] is not None:
+                    watch["on_change"](watch["state"], current, resource)
+            watch["state"] = current
+
+            if watch["until"](resource):
+                self._settled[watched] = resource
+                del self._watches[watched]
+            else:
+                unsettled[watched] = resource
+        return unsettled
+
+    def wait(self) -> Dict[Tuple[str, Hashable, Hashable], Optional[Any]]:
+        """
+        Poll until every watched resource settles or the timeout expires.
+
+        Returns:
+            Dictionary of the settled resource, or None if it is not listed,
+            keyed by the triple of resource type, scope, and key
+
+        Raises:
+            CdpWaitTimeout: If any resource does not settle before the timeout;
+                its C(last) is the dictionary of the unsettled resources
+        """
+        self._settled = {}
+        if self._watches:
+            self.waiter.wait(
+                self._poll,
+                until=lambda unsettled: not unsettled,
+                state=lambda unsettled: [
+                    self._watches[watched]["state"] for watched in unsettled
+                ],
+            )
+        return self._settled
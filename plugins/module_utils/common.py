@@ -22,9 +22,10 @@ import abc
 import io
 import logging
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -44,6 +45,7 @@ from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     load_cdp_config,
     AnsibleCdpClient,
     CdpCredentialError,
+    CdpResponseCache,
 )
 
 
@@ -56,66 +58,146 @@ T = TypeVar("T")
 NULLABLE = object  # Sentinel value to allow explicit None values in to_dict()
 
 
-def from_dict(cls: Type[T], data: Any) -> T:
+# Conversion functions by type hint and field names by dataclass, built once
+# per process and shared by all from_dict(), to_dict() and diff_dict() calls
+_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {}
+_DIFF_FIELDS: Dict[Type[Any], Tuple[str, ...]] = {}
+_FIELD_NAMES: Dict[Type[Any], Tuple[str, ...]] = {}
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _converter(cls: Any) -> Callable[[Any], Any]:
     """
-    Recursively loads a dict into a dataclass
+    Return the function loading data into the given type hint, building the
+    conversion plan of the type hint on first use.
     """
-
-    def _from_dict_recursive(current_cls: Type[Any], current_data: Any) -> Any:
-        if current_data is None:
-            return None
-
-        origin = get_origin(current_cls)
-
-        if origin is Union:
-            # If a Union, check each type in the Union
-            for union_arg in get_args(current_cls):
-                # Ignore NoneType
-                if union_arg is type(None):
-                    continue
-
-                # Process only dataclasses (not instances) and Lists
-                if isinstance(union_arg, type) and (
-                    is_dataclass(union_arg) or get_origin(union_arg) in (list, List)
-                ):
-                    # If Union contains a dataclass or List, parse accordingly
-                    return _from_dict_recursive(union_arg, current_data)
-            # If a Union of primitives, return data as-is
-            return current_data
-
-        if origin is list or origin is List:
-            # If a list, get the item type and parse each item
-            item_type = get_args(current_cls)[0]
-            if isinstance(current_data, list):
-                return [_from_dict_recursive(item_type, item) for item in current_data]
+    try:
+        return _CONVERTERS[cls]
+    except KeyError:
+        converter = _CONVERTERS[cls] = _build_converter(cls)
+        return converter
+    except TypeError:
+        # Unhashable type hint; build a plan without caching it
+        return _build_converter(cls)
+
+
+def _build_converter(cls: Any) -> Callable[[Any], Any]:
+    origin = get_origin(cls)
+
+    if origin is Union:
+        # If a Union, use the first dataclass (or List) type in the Union
+        for union_arg in get_args(cls):
+            # Ignore NoneType
+            if union_arg is type(None):
+                continue
+
+            # Process only dataclasses (not instances) and Lists
+            if isinstance(union_arg, type) and (
+                is_dataclass(union_arg) or get_origin(union_arg) in (list, List)
+            ):
+                return _converter(union_arg)
+        # If a Union of primitives, return data as-is
+        return _identity
+
+    if origin is list or origin is List:
+        # If a list, parse each item with the item type's plan
+        convert_item = _converter(get_args(cls)[0])
+
+        def _convert_list(data: Any) -> Any:
+            if data is None:
+                return None
+            if isinstance(data, list):
+                return [convert_item(item) for item in data]
             return []  # or raise error if data isn't a list
 
-        if is_dataclass(current_cls) and isinstance(current_data, dict):
-            # Get type hints for all fields in this specific dataclass
-            type_hints = get_type_hints(current_cls)
-
-            return current_cls(
+        return _convert_list
+
+    if is_dataclass(cls):
+        # The field plans are resolved on first call, so that a dataclass
+        # may refer to itself
+        converters: Optional[Dict[str, Callable[[Any], Any]]] = None
+
+        def _convert_dataclass(data: Any) -> Any:
+            nonlocal converters
+            if not isinstance(data, dict):
+                return data
+            if converters is None:
+                converters = {
+                    name: _converter(hint) for name, hint in get_type_hints(cls).items()
+                }
+            return cls(
                 **{
-                    field: _from_dict_recursive(
-                        type_hints[field],
-                        current_data.get(field),
-                    )
-                    for field in current_data
-                    if field in type_hints
+                    name: converters[name](value)
+                    for name, value in data.items()
+                    if name in converters
                 },
             )
 
-        if isinstance(current_data, dict):
-            # If a dict, parse each value, assuming keys are strings
-            value_cls = get_args(current_cls)[1]
-            return {
-                k: _from_dict_recursive(value_cls, v) for k, v in current_data.items()
-            }
+        return _convert_dataclass
+
+    args = get_args(cls)
+    if len(args) == 2:
+        # If a dict, parse each value, assuming keys are strings
+        convert_value = _converter(args[1])
+
+        def _convert_dict(data: Any) -> Any:
+            if isinstance(data, dict):
+                return {k: convert_value(v) for k, v in data.items()}
+            return data
+
+        return _convert_dict
+
+    # Return primitives (int, str, bool)
+    return _identity
+
+
+def _diff_fields(cls: Type[Any]) -> Tuple[str, ...]:
+    """
+    Return the names of the fields of a dataclass compared by diff_dict().
+    """
+    try:
+        return _DIFF_FIELDS[cls]
+    except KeyError:
+        names = _DIFF_FIELDS[cls] = tuple(get_type_hints(cls))
+        return names
+
 
-        # Return primitives (int, str, bool)
-        return current_data
+def from_dict(cls: Type[T], data: Any) -> T:
+    """
+    Recursively loads a dict into a dataclass
 
-    return _from_dict_recursive(cls, data)
+    The conversion plan of each dataclass, i.e. its resolved type hints and
+    the converter of each field, is built on first use and reused by later
+    calls.
+    """
+    return _converter(cls)(data)
+
+
+def _field_names(cls: Type[Any]) -> Tuple[str, ...]:
+    """
+    Return the names of the init and non-init fields of a dataclass.
+    """
+    try:
+        return _FIELD_NAMES[cls]
+    except KeyError:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+        return names
+
+
+def _plain(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return to_dict(value)
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_plain(item) for item in value)
+    # Primitives are immutable and shared rather than copied
+    return value
 
 
 def to_dict(instance: Any) -> Dict[str, Any]:
@@ -123,19 +205,74 @@ def to_dict(instance: Any) -> Dict[str, Any]:
     Recursively convert a dataclass instance to a dictionary, skipping default NULLABLE values.
     NoneType values are included in the dictionary.
 
+    Nested dataclasses, lists and dicts are converted to new containers, but
+    unlike C(dataclasses.asdict), their primitive values are not deep-copied.
+
     Args:
         instance: The dataclass instance to convert.
     """
 
-    def _skip_none_factory(data):
-        return {k: v for k, v in data if v is not NULLABLE}
-
     if is_dataclass(instance) and not isinstance(instance, type):
-        return asdict(instance, dict_factory=_skip_none_factory)
+        result = {}
+        for name in _field_names(type(instance)):
+            value = getattr(instance, name)
+            if value is not NULLABLE:
+                result[name] = _plain(value)
+        return result
 
     raise TypeError(f"Expected dataclass type, got {type(instance)}")
 
 
+class CdpModel:
+    """
+    Base class of compact CDP resource models.
+
+    Models are declared with the C(cdp_model) decorator, which turns them into
+    slotted dataclasses: instances hold their fields in fixed slots instead of
+    a per-instance C(__dict__), so large listings take less memory and are
+    faster to build.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the model to a dictionary, skipping default NULLABLE values.
+        """
+        return to_dict(self)
+
+
+def cdp_model(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator declaring a slotted dataclass model.
+
+    The class is processed by C(dataclass) and then rebuilt with a
+    C(__slots__) entry per field, as C(dataclass(slots=True)) does on Python
+    3.10 and later. The class should derive from C(CdpModel) (or another
+    slotted class) so its instances carry no C(__dict__).
+
+    Args:
+        cls: The class to declare as a model.
+
+    Returns:
+        The slotted dataclass.
+    """
+    cls = dataclass(cls)
+
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # Field defaults live in the generated __init__, not the class
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
 def diff_dict(
     prev: Any,
     next: Any,
@@ -227,8 +364,7 @@ def diff_dict(
             new_dict = {}
             has_diff = False
 
-            type_hints = get_type_hints(type(prev_val))
-            for field_name in type_hints:
+            for field_name in _diff_fields(type(prev_val)):
                 old_field = getattr(prev_val, field_name, NULLABLE)
                 new_field = getattr(new_val, field_name, NULLABLE)
 
@@ -504,6 +640,52 @@ class ServicesModule(abc.ABC, metaclass=AutoExecuteMeta):
                     default="cloudera.cloud",
                     aliases=["agent_header"],
                 ),
+                pool_size=dict(
+                    required=False,
+                    type="int",
+                    default=0,
+                    aliases=["connection_pool_size"],
+                ),
+                pool_idle_timeout=dict(
+                    required=False,
+                    type="int",
+                    default=30,
+                ),
+                rate_limit=dict(
+                    required=False,
+                    type="float",
+                    default=0,
+                ),
+                rate_limit_burst=dict(
+                    required=False,
+                    type="int",
+                ),
+                endpoint_rate_limits=dict(
+                    required=False,
+                    type="dict",
+                ),
+                response_cache=dict(
+                    required=False,
+                    type="bool",
+                    default=False,
+                    fallback=(env_fallback, ["CDP_RESPONSE_CACHE"]),
+                ),
+                response_cache_dir=dict(
+                    required=False,
+                    type="path",
+                    default="~/.cache/cloudera.cloud/responses",
+                    fallback=(env_fallback, ["CDP_RESPONSE_CACHE_DIR"]),
+                ),
+                response_cache_ttl=dict(
+                    required=False,
+                    type="int",
+                    default=300,
+                ),
+                response_cache_max_size=dict(
+                    required=False,
+                    type="int",
+                    default=50,
+                ),
             ),
             required_together=required_together + [["access_key", "private_key"]],
             bypass_checks=bypass_checks,
@@ -601,12 +783,30 @@ class ServicesModule(abc.ABC, metaclass=AutoExecuteMeta):
 
         self.logger.debug("cloudera.cloud API agent: %s", self.get_param("http_agent"))
 
+        # Create the optional response cache, shared by later tasks and runs
+        response_cache = None
+        if self.get_param("response_cache", False):
+            response_cache = CdpResponseCache(
+                directory=self.get_param(
+                    "response_cache_dir",
+                    "~/.cache/cloudera.cloud/responses",
+                ),
+                ttl=self.get_param("response_cache_ttl", 300),
+                max_size=self.get_param("response_cache_max_size", 50) * 1024 * 1024,
+            )
+
         # Create the CDP client using the configured client class
         self.api_client = self._client_class(
             module=self.module,
             base_url=self.endpoint,
             access_key=self.access_key,
             private_key=self.private_key,
+            pool_size=self.get_param("pool_size", 0),
+            pool_idle_timeout=self.get_param("pool_idle_timeout", 30),
+            rate_limit=self.get_param("rate_limit", 0),
+            rate_limit_burst=self.get_param("rate_limit_burst"),
+            endpoint_rate_limits=self.get_param("endpoint_rate_limits"),
+            response_cache=response_cache,
         )
 
     def get_param(self, param, default=None) -> Any:
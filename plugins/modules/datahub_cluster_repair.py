@@ -63,6 +63,8 @@ options:
   delay:
     description:
       - Number of seconds for the I(wait) polling interval.
+      - The interval used while waiting for the instances adapts, shortening after each change and lengthening, up
+        to this value, while nothing changes.
     type: int
     default: 15
   timeout:
@@ -381,11 +383,13 @@ sdk_out_lines:
   elements: str
 """
 
-from time import time, sleep
-
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_common import CdpModule
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
+)
 
 
 class DatahubClusterRepair(CdpModule):
@@ -489,10 +493,9 @@ class DatahubClusterRepair(CdpModule):
             self.output = existing
 
     def _wait_for_instance_state(self, datahub, state, node_count):
-        current = datahub
         state = state if isinstance(state, list) else [state]
 
-        def parse_instances():
+        def parse_instances(current):
             return [
                 i["id"]
                 for ig in current["instanceGroups"]
@@ -500,18 +503,32 @@ class DatahubClusterRepair(CdpModule):
                 if i["state"] not in state
             ]
 
-        start_time = time()
-        while time() < start_time + self.timeout:
-            outstanding_instances = parse_instances()
+        def settled(current):
+            outstanding_instances = parse_instances(current)
             if outstanding_instances or current["nodeCount"] != node_count:
                 self.module.warn(
                     f"Waiting for state(s) [{str(state)}] for instances: {str(outstanding_instances)}; Node count: {str(current['nodeCount'])}/{str(node_count)}",
                 )
-                sleep(self.delay)
-                current = self.cdpy.datahub.describe_cluster(self.datahub)
-                outstanding_instances = parse_instances()
-            else:
-                break
+                return False
+            return True
+
+        try:
+            CdpWaiter(
+                timeout=self.timeout,
+                delay=self.delay,
+                label=f"Datahub {self.datahub} instances",
+            ).wait(
+                lambda: self.cdpy.datahub.describe_cluster(self.datahub),
+                until=settled,
+                state=lambda current: (
+                    tuple(parse_instances(current)),
+                    current["nodeCount"],
+                ),
+                initial=datahub,
+            )
+        except CdpWaitTimeout:
+            # Timing out is not fatal; the repair proceeds with the cluster as is
+            pass
 
 
 def main():
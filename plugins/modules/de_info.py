@@ -49,6 +49,14 @@ options:
     required: False
     aliases:
       - environment
+  parallelism:
+    description:
+      - The maximum number of Data Engineering Services described at once when listing the services.
+      - Services are returned in the same order regardless of this setting.
+      - If V(1), the services are described one after another.
+    type: int
+    required: False
+    default: 1
 
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
@@ -71,6 +79,10 @@ EXAMPLES = r"""
 # Gather detailed information about a Data Engineering Service using an Environment name
 - cloudera.cloud.de_info:
     env_name: my-environment
+
+# Gather detailed information about all Data Engineering Services, four at a time
+- cloudera.cloud.de_info:
+    parallelism: 4
 """
 
 RETURN = r"""
@@ -254,6 +266,7 @@ class DEServiceInfo(ServicesModule):
                 name=dict(required=False, type="str"),
                 cluster_id=dict(required=False, type="str", aliases=["id"]),
                 env_name=dict(required=False, type="str", aliases=["environment"]),
+                parallelism=dict(required=False, type="int", default=1),
             ),
             supports_check_mode=True,
             mutually_exclusive=[["name", "cluster_id"], ["cluster_id", "env_name"]],
@@ -263,6 +276,7 @@ class DEServiceInfo(ServicesModule):
         self.name = self.get_param("name")
         self.cluster_id = self.get_param("cluster_id")
         self.env_name = self.get_param("env_name")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.services = []
@@ -282,14 +296,10 @@ class DEServiceInfo(ServicesModule):
             if service:
                 self.services.append(service.get("service", {}))
         else:
-            response = self.de_client.list_services(env_name=self.env_name)
-            for svc in response.get("services", []):
-                if svc.get("status") in CdpDeClient.FAILED_STATUSES:
-                    self.services.append(svc)
-                else:
-                    service_details = self.de_client.describe_service(svc["clusterId"])
-                    if service_details.get("service"):
-                        self.services.append(service_details["service"])
+            self.services = self.de_client.describe_all_services(
+                env_name=self.env_name,
+                parallelism=self.parallelism,
+            )
 
 
 def main():
@@ -35,6 +35,8 @@ options:
   file:
     description:
       - The path to the JSON file containing the CustomFlow definition to be imported from the controller.
+      - The file is streamed from disk, so large flow definitions are not read into memory.
+      - If the CustomFlow exists and was imported by this module, a new version is imported only when the content has changed. See O(manifest_dir).
       - Mutually exclusive with O(content).
     type: path
     default: None
@@ -81,6 +83,15 @@ options:
           - The color of the version tag.
         type: str
         required: False
+  manifest_dir:
+    description:
+      - The directory on the controller in which the SHA-256 digest of the content of each imported CustomFlow is recorded.
+      - DataFlow does not store a digest of flow definitions, so the record is used to detect changed content without uploading it.
+      - A record is only used while the version it describes is still the latest version of the CustomFlow.
+      - If an existing CustomFlow has no such record, its content is not compared and it is left unchanged.
+    type: path
+    required: False
+    default: ~/.cache/cloudera.cloud/customflows
   state:
     description:
       - The declarative state of the CustomFlow
@@ -130,6 +141,12 @@ EXAMPLES = r"""
       - tag_name: stable
         tag_color: green
 
+# Import a new version of a CustomFlow, but only if the file has changed
+- cloudera.cloud.df_customflow:
+    name: my-customflow-name
+    file: /tmp/my-custom-flow.json
+    comments: Updated by the deployment pipeline
+
 # Delete a CustomFlow from the DataFlow Catalog
 - cloudera.cloud.df_customflow:
     name: my-customflow-name
@@ -216,8 +233,11 @@ from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
     CdpDfClient,
+    CdpFlowManifest,
     DataFlowModule,
+    flow_content_hash,
     format_tags_for_api,
+    latest_flow_version,
 )
 
 
@@ -240,6 +260,11 @@ class DFCustomFlow(DataFlowModule, ServicesModule):
                         tag_color=dict(required=False, type="str"),
                     ),
                 ),
+                manifest_dir=dict(
+                    required=False,
+                    type="path",
+                    default="~/.cache/cloudera.cloud/customflows",
+                ),
                 state=dict(
                     type="str",
                     choices=["present", "absent"],
@@ -265,8 +290,9 @@ class DFCustomFlow(DataFlowModule, ServicesModule):
         self.tags: Optional[list] = self.get_param("tags")
         self.state: str = self.get_param("state")
 
-        # Initialize the DataFlow client
+        # Initialize the DataFlow client and the record of imported content
         self.df_client = CdpDfClient(self.api_client)
+        self.manifest = CdpFlowManifest(self.get_param("manifest_dir"))
 
         # Initialize return values
         self.flow = {}
@@ -276,39 +302,64 @@ class DFCustomFlow(DataFlowModule, ServicesModule):
         existing_flow = self.df_client.get_flow_by_name(self.name)
 
         if self.state == "present":
+            # Hash the flow content from the file (on controller) or content
+            try:
+                digest = flow_content_hash(file_path=self.file, content=self.content)
+            except Exception as e:
+                self.module.fail_json(
+                    msg=f"Failed to read file '{self.file}': {str(e)}",
+                )
+
+            # Convert tags format from Ansible to API format
+            api_tags = format_tags_for_api(self.tags)
+
             if existing_flow:
-                self.flow = existing_flow  # Flow already exists, no update operation for CustomFlows
-                self.module.warn(
-                    "CustomFlow '%s' already exists. Updates are not supported for CustomFlows. "
-                    "To update flow content, delete and re-import with new parameters."
-                    % self.name,
+                self.flow = existing_flow
+                flow_crn = existing_flow.get("crn")
+                recorded = self.manifest.get(
+                    flow_crn,
+                    latest_flow_version(existing_flow),
                 )
+
+                if recorded is None:
+                    self.module.warn(
+                        "CustomFlow '%s' already exists and its content was not imported by this module, "
+                        "so changes cannot be detected. "
+                        "To update flow content, delete and re-import with new parameters."
+                        % self.name,
+                    )
+                elif recorded != digest:
+                    # The content changed since its import, so import a new version
+                    self.changed = True
+                    if not self.module.check_mode:
+                        version = self.df_client.import_flow_definition_version(
+                            flow_crn=flow_crn,
+                            file_content=self.content,
+                            comments=self.comments,
+                            tags=api_tags,
+                            file_path=self.file,
+                        )
+                        self.manifest.put(flow_crn, digest, version.get("version"))
+                        self.flow = (
+                            self.df_client.get_flow_by_crn(flow_crn) or existing_flow
+                        )
             else:
                 self.changed = True
                 if not self.module.check_mode:
-                    # Get flow content from either file (on controller) or content parameter
-                    file_content = None
-                    if self.file:
-                        try:
-                            with open(self.file, "r") as f:
-                                file_content = f.read()
-                        except Exception as e:
-                            self.module.fail_json(
-                                msg=f"Failed to read file '{self.file}': {str(e)}",
-                            )
-                    elif self.content:
-                        file_content = self.content
-
-                    # Convert tags format from Ansible to API format
-                    api_tags = format_tags_for_api(self.tags)
-
+                    # Stream flow content from the file, or send the content parameter
                     self.flow = self.df_client.import_flow_definition(
                         name=self.name,
-                        file_content=file_content,
+                        file_content=self.content,
                         description=self.description,
                         comments=self.comments,
                         collection_crn=self.collection_crn,
                         tags=api_tags,
+                        file_path=self.file,
+                    )
+                    self.manifest.put(
+                        self.flow.get("crn"),
+                        digest,
+                        latest_flow_version(self.flow) or 1,
                     )
 
         elif self.state == "absent":
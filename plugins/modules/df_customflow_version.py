@@ -34,6 +34,7 @@ options:
   file:
     description:
       - The JSON file containing the CustomFlow definition to be imported as a new version.
+      - A new version is imported only if the content differs from the latest version imported by this collection. See O(manifest_dir).
     type: str
     required: True
   comments:
@@ -42,6 +43,15 @@ options:
     type: str
     default: None
     required: False
+  manifest_dir:
+    description:
+      - The directory on the controller in which the SHA-256 digest of the content of each imported CustomFlow version is recorded.
+      - DataFlow does not store a digest of flow definitions, so the record is used to detect changed content without uploading it.
+      - A record is only used while the version it describes is still the latest version of the CustomFlow.
+      - If the latest version has no such record, the file is imported as a new version.
+    type: path
+    required: False
+    default: ~/.cache/cloudera.cloud/customflows
   state:
     description:
       - The declarative state of the CustomerFlow version
@@ -97,6 +107,11 @@ customflow_version:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_common import CdpModule
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
+    CdpFlowManifest,
+    flow_content_hash,
+    latest_flow_version,
+)
 
 
 class DFCustomFlowVersion(CdpModule):
@@ -107,6 +122,7 @@ class DFCustomFlowVersion(CdpModule):
         self.flow_crn = self._get_param("flow_crn")
         self.file = self._get_param("file")
         self.comments = self._get_param("comments")
+        self.manifest = CdpFlowManifest(self._get_param("manifest_dir"))
         self.state = self._get_param("state")
 
         # Initialize return values
@@ -125,13 +141,35 @@ class DFCustomFlowVersion(CdpModule):
             )
         else:
             # Only possible state is "present"
-            self.changed = True
-            if not self.module.check_mode:
-                self.flow_version = self.cdpy.df.import_customflow_version(
-                    self.flow_crn,
-                    self.file,
-                    self.comments,
+            try:
+                digest = flow_content_hash(file_path=self.file)
+            except OSError as e:
+                self.module.fail_json(
+                    msg="Failed to read file '{}': {}".format(self.file, str(e)),
+                )
+
+            # Skip the upload if the latest version was imported from the same content
+            latest = latest_flow_version(flow)
+            if self.manifest.get(self.flow_crn, latest) == digest:
+                versions = flow.get("versions") or []
+                self.flow_version = next(
+                    (v for v in versions if v.get("version") == latest),
+                    None,
                 )
+            else:
+                self.changed = True
+                if not self.module.check_mode:
+                    self.flow_version = self.cdpy.df.import_customflow_version(
+                        self.flow_crn,
+                        self.file,
+                        self.comments,
+                    )
+                    if self.flow_version:
+                        self.manifest.put(
+                            self.flow_crn,
+                            digest,
+                            self.flow_version.get("version"),
+                        )
 
 
 def main():
@@ -140,6 +178,11 @@ def main():
             flow_crn=dict(required=True, type="str"),
             file=dict(required=True, type="str"),
             comments=dict(required=False, type="str"),
+            manifest_dir=dict(
+                required=False,
+                type="path",
+                default="~/.cache/cloudera.cloud/customflows",
+            ),
             state=dict(type="str", choices=["present"], default="present"),
         ),
         supports_check_mode=True,
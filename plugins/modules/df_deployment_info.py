@@ -40,6 +40,21 @@ options:
     aliases:
       - dep_crn
     required: False
+  describe:
+    description:
+      - If V(true), each listed DataFlow Deployment is described, returning its full details rather than its summary.
+      - Ignored if O(name) or O(crn) is provided.
+    type: bool
+    required: False
+    default: False
+  parallelism:
+    description:
+      - The maximum number of DataFlow Deployments described at once when O(describe=true).
+      - Deployments are returned in the same order regardless of this setting.
+      - If V(1), the deployments are described one after another.
+    type: int
+    required: False
+    default: 1
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
 """
@@ -50,6 +65,11 @@ EXAMPLES = r"""
 # List basic information about all DataFlow Deployments
 - cloudera.cloud.df_deployment_info:
 
+# Gather detailed information about all DataFlow Deployments, four at a time
+- cloudera.cloud.df_deployment_info:
+    describe: true
+    parallelism: 4
+
 # Gather detailed information about a named DataFlow Deployment using a crn
 - cloudera.cloud.df_deployment_info:
     crn: crn:cdp:df:region:tenant-uuid4:deployment:deployment-uuid4/deployment-uuid4
@@ -219,6 +239,8 @@ class DFDeploymentInfo(ServicesModule):
             argument_spec=dict(
                 name=dict(required=False, type="str"),
                 crn=dict(required=False, type="str", aliases=["dep_crn"]),
+                describe=dict(required=False, type="bool", default=False),
+                parallelism=dict(required=False, type="int", default=1),
             ),
             supports_check_mode=True,
             mutually_exclusive=[("name", "crn")],
@@ -227,6 +249,8 @@ class DFDeploymentInfo(ServicesModule):
         # Set parameters
         self.name = self.get_param("name")
         self.crn = self.get_param("crn")
+        self.describe = self.get_param("describe")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.deployments = []
@@ -237,6 +261,11 @@ class DFDeploymentInfo(ServicesModule):
             deployment = client.get_deployment_by_crn(self.crn)
         elif self.name:
             deployment = client.get_deployment_by_name(self.name)
+        elif self.describe:
+            self.deployments = client.describe_all_deployments(
+                parallelism=self.parallelism,
+            )
+            return
         else:
             response = client.list_deployments()
             self.deployments = response.get("deployments", [])
@@ -45,6 +45,14 @@ options:
       - Mutually exclusive with name and df_crn
     type: str
     required: False
+  parallelism:
+    description:
+      - The maximum number of DataFlow Services described at once when listing the services.
+      - Services are returned in the same order regardless of this setting.
+      - If V(1), the services are described one after another.
+    type: int
+    required: False
+    default: 1
 
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
@@ -56,6 +64,10 @@ EXAMPLES = r"""
 # List basic information about all DataFlow Services
 - cloudera.cloud.df_service_info:
 
+# Gather detailed information about all DataFlow Services, four at a time
+- cloudera.cloud.df_service_info:
+    parallelism: 4
+
 # Gather detailed information about a named DataFlow Service using a name
 - cloudera.cloud.df_service_info:
     name: example-service
@@ -174,6 +186,7 @@ class DFServiceInfo(ServicesModule):
                 name=dict(required=False, type="str"),
                 df_crn=dict(required=False, type="str"),
                 env_crn=dict(required=False, type="str"),
+                parallelism=dict(required=False, type="int", default=1),
             ),
             supports_check_mode=True,
             mutually_exclusive=[["name", "df_crn", "env_crn"]],
@@ -183,6 +196,7 @@ class DFServiceInfo(ServicesModule):
         self.name = self.get_param("name")
         self.df_crn = self.get_param("df_crn")
         self.env_crn = self.get_param("env_crn")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.services = []
@@ -197,12 +211,9 @@ class DFServiceInfo(ServicesModule):
         elif self.env_crn:
             service = self.df_client.get_service_by_env_crn(self.env_crn)
         else:
-            response = self.df_client.list_services()
-            self.services = [
-                self.df_client.describe_service(svc["crn"]).get("service", {})
-                for svc in response.get("services", [])
-                if svc.get("status", {}).get("state") not in CdpDfClient.DISABLED_STATES
-            ]
+            self.services = self.df_client.describe_all_services(
+                parallelism=self.parallelism,
+            )
             return
 
         if service:
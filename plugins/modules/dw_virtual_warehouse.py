@@ -44,8 +44,9 @@ options:
   cluster_id:
     description:
       - The identifier of the parent Data Warehouse Cluster of the Virtual Warehouse.
+      - Required unless O(warehouses) is set, where it is the default cluster of
+        each entry.
     type: str
-    required: true
   catalog_id:
     description:
       - The identifier of the parent Database Catalog attached to the Virtual Warehouse.
@@ -247,11 +248,123 @@ options:
       - V(present) creates the warehouse if it does not exist, and reconciles
         O(node_count) and O(connectors) if it does.
       - V(absent) deletes the warehouse if it exists (idempotent).
+      - Defaults to V(present). Not valid with O(warehouses), where each entry has
+        its own state.
     type: str
-    default: present
     choices:
       - present
       - absent
+  warehouses:
+    description:
+      - A list of Virtual Warehouses to reconcile together, each with the options
+        of a single Virtual Warehouse.
+      - The warehouses of each cluster are looked up with one listing, the changes
+        are made concurrently, and the module waits on all of them at once,
+        listing each cluster once per poll instead of describing every warehouse.
+      - Apart from O(cluster_id), the options of a single Virtual Warehouse, such
+        as O(state), O(name), or O(node_count), must be set in each entry rather
+        than at the top level.
+    type: list
+    elements: dict
+    suboptions:
+      warehouse_id:
+        description:
+          - See O(warehouse_id).
+        type: str
+        aliases:
+          - vw_id
+          - id
+      cluster_id:
+        description:
+          - See O(cluster_id); defaults to the top-level O(cluster_id).
+        type: str
+      catalog_id:
+        description:
+          - See O(catalog_id).
+        type: str
+        aliases:
+          - dbc_id
+      type:
+        description:
+          - See O(type).
+        type: str
+        choices:
+          - hive
+          - impala
+          - trino
+      name:
+        description:
+          - See O(name).
+        type: str
+      tshirt_size:
+        description:
+          - See O(tshirt_size).
+        type: str
+        choices:
+          - xsmall
+          - small
+          - medium
+          - large
+        aliases:
+          - template
+      node_count:
+        description:
+          - See O(node_count).
+        type: int
+      instance_type:
+        description:
+          - See O(instance_type).
+        type: str
+      connectors:
+        description:
+          - See O(connectors).
+        type: list
+        elements: str
+      autoscaling:
+        description:
+          - See O(autoscaling).
+        type: dict
+      common_configs:
+        description:
+          - See O(common_configs).
+        type: dict
+      application_configs:
+        description:
+          - See O(application_configs).
+        type: dict
+      impala_ha:
+        description:
+          - See O(impala_ha).
+        type: dict
+      ldap_groups:
+        description:
+          - See O(ldap_groups).
+        type: list
+        elements: str
+      enable_sso:
+        description:
+          - See O(enable_sso).
+        type: bool
+      enable_unified_analytics:
+        description:
+          - See O(enable_unified_analytics).
+        type: bool
+      enable_platform_jwt_auth:
+        description:
+          - See O(enable_platform_jwt_auth).
+        type: bool
+      tags:
+        description:
+          - See O(tags).
+        type: dict
+      state:
+        description:
+          - See O(state).
+        type: str
+        default: present
+        choices:
+          - present
+          - absent
   wait:
     description:
       - Flag to enable internal polling to wait for the Virtual Warehouse to
@@ -263,6 +376,8 @@ options:
     description:
       - The internal polling interval (in seconds) while the module waits for the
         Virtual Warehouse to achieve the declared state.
+      - The interval adapts to the Virtual Warehouse, shortening after each status
+        change and lengthening, up to this value, while the status is unchanged.
     type: int
     default: 15
     aliases:
@@ -275,6 +390,12 @@ options:
     default: 3600
     aliases:
       - polling_timeout
+  parallelism:
+    description:
+      - The maximum number of changes to make at once with O(warehouses).
+      - If V(1), the changes are made one after another.
+    type: int
+    default: 4
 extends_documentation_fragment:
   - ansible.builtin.action_common_attributes
   - cloudera.cloud.cdp_client
@@ -323,12 +444,27 @@ EXAMPLES = r"""
     cluster_id: example-cluster-id
     warehouse_id: example-trino-vw-id
     state: absent
+- name: Reconcile several Virtual Warehouses at once
+  cloudera.cloud.dw_virtual_warehouse:
+    cluster_id: example-cluster-id
+    warehouses:
+      - catalog_id: example-catalog-id
+        name: example-hive-vw
+        type: hive
+      - catalog_id: example-catalog-id
+        name: example-impala-vw
+        type: impala
+        node_count: 4
+      - cluster_id: other-cluster-id
+        warehouse_id: example-old-vw-id
+        state: absent
+    parallelism: 8
 """
 
 RETURN = r"""
 virtual_warehouse:
   description: The details about the CDP Data Warehouse Virtual Warehouse.
-  returned: always
+  returned: when O(warehouses) is not set
   type: dict
   contains:
     id:
@@ -382,6 +518,14 @@ virtual_warehouse:
           connector id.
       returned: when available
       type: dict
+virtual_warehouses:
+  description:
+    - The details about each Virtual Warehouse of O(warehouses), in order.
+    - Each entry has the contents of RV(virtual_warehouse), or is empty if the
+      warehouse is absent.
+  returned: when O(warehouses) is set
+  type: list
+  elements: dict
 sdk_out:
   description: Returns the captured CDP SDK log.
   returned: when debug is true
@@ -393,256 +537,394 @@ sdk_out_lines:
   elements: str
 """
 
-import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from typing import Any, Dict, List, Optional
+from ansible.module_utils.common.validation import check_required_if
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     ServicesModule,
     to_dict,
 )
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+    CdpMutationError,
+    apply_mutations,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import (
     CdpDwClient,
     VirtualWarehouse,
 )
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
+)
 
 
 # Virtual Warehouse lifecycle status groupings
 ENABLED_STATES = frozenset({"Running", "Created", "Stopped"})
 FAILED_STATES = frozenset({"Failed", "Error"})
 
+# The options describing one Virtual Warehouse, at the top level or in each
+# entry of the warehouses option
+VW_ARGUMENT_SPEC = dict(
+    warehouse_id=dict(type="str", aliases=["vw_id", "id"]),
+    cluster_id=dict(type="str"),
+    catalog_id=dict(type="str", aliases=["dbc_id"]),
+    type=dict(type="str", choices=["hive", "impala", "trino"]),
+    name=dict(type="str"),
+    tshirt_size=dict(
+        type="str",
+        choices=["xsmall", "small", "medium", "large"],
+        aliases=["template"],
+    ),
+    node_count=dict(type="int"),
+    instance_type=dict(type="str"),
+    connectors=dict(type="list", elements="str"),
+    autoscaling=dict(
+        type="dict",
+        options=dict(
+            min_nodes=dict(type="int"),
+            max_nodes=dict(type="int"),
+            auto_suspend_timeout_seconds=dict(type="int"),
+            disable_auto_suspend=dict(type="bool"),
+            hive_desired_free_capacity=dict(type="int"),
+            hive_scale_wait_time_seconds=dict(type="int"),
+            impala_scale_down_delay_seconds=dict(type="int"),
+            impala_scale_up_delay_seconds=dict(type="int"),
+            pod_config_name=dict(type="str"),
+        ),
+    ),
+    common_configs=dict(
+        type="dict",
+        options=dict(
+            configBlocks=dict(
+                type="list",
+                elements="dict",
+                options=dict(
+                    id=dict(type="str"),
+                    format=dict(
+                        type="str",
+                        choices=[
+                            "HADOOP_XML",
+                            "PROPERTIES",
+                            "TEXT",
+                            "JSON",
+                            "BINARY",
+                            "ENV",
+                            "FLAGFILE",
+                        ],
+                    ),
+                    content=dict(
+                        type="dict",
+                        options=dict(
+                            keyValues=dict(type="dict"),
+                            text=dict(type="str"),
+                            json=dict(type="json"),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+    ),
+    application_configs=dict(type="dict"),
+    impala_ha=dict(
+        type="dict",
+        options=dict(
+            enable_catalog_high_availability=dict(type="bool"),
+            enable_shutdown_of_coordinator=dict(type="bool"),
+            high_availability_mode=dict(
+                type="str",
+                choices=["ACTIVE_PASSIVE", "ACTIVE_ACTIVE", "DISABLED"],
+            ),
+            num_of_active_coordinators=dict(type="int"),
+            shutdown_of_coordinator_delay_seconds=dict(type="int"),
+        ),
+    ),
+    ldap_groups=dict(type="list", elements="str"),
+    enable_sso=dict(type="bool"),
+    enable_unified_analytics=dict(type="bool"),
+    enable_platform_jwt_auth=dict(type="bool"),
+    tags=dict(type="dict"),
+    state=dict(
+        type="str",
+        choices=["present", "absent"],
+        default="present",
+    ),
+)
+
+VW_REQUIRED_IF = [
+    ("state", "absent", ("warehouse_id",)),
+    ("state", "present", ("catalog_id", "type", "name")),
+]
+
+
+class VwSpec:
+    """The desired state of one Virtual Warehouse and the outcome of reconciling it."""
+
+    def __init__(self, params: Dict[str, Any]):
+        self.warehouse_id = params.get("warehouse_id")
+        self.cluster_id = params.get("cluster_id")
+        self.catalog_id = params.get("catalog_id")
+        self.type = params.get("type")
+        self.name = params.get("name")
+        self.tshirt_size = params.get("tshirt_size")
+        self.node_count = params.get("node_count")
+        self.instance_type = params.get("instance_type")
+        self.connectors = params.get("connectors")
+        self.autoscaling = params.get("autoscaling")
+        self.common_configs = params.get("common_configs")
+        self.application_configs = params.get("application_configs")
+        self.impala_ha = params.get("impala_ha")
+        self.ldap_groups = params.get("ldap_groups")
+        self.enable_sso = params.get("enable_sso")
+        self.enable_unified_analytics = params.get("enable_unified_analytics")
+        self.enable_platform_jwt_auth = params.get("enable_platform_jwt_auth")
+        self.tags = params.get("tags")
+        self.state = params.get("state") or "present"
+
+        # The reconciliation plan and its outcome
+        self.existing: Optional[VirtualWarehouse] = None
+        self.action: Optional[Callable[[CdpDwClient], None]] = None
+        self.vw_id: Optional[str] = None
+        self.current: Optional[VirtualWarehouse] = None
+        self.associate: Optional[List[str]] = None
+        self.changed = False
+        self.diff: Dict[str, Any] = {"before": {}, "after": {}}
+
+    @property
+    def label(self) -> str:
+        """Identify the warehouse in messages."""
+        return f"{self.cluster_id}/{self.warehouse_id or self.name}"
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """The pair of cluster ID and Virtual Warehouse ID to wait for."""
+        return (self.cluster_id, self.vw_id)
+
 
 class DwVirtualWarehouse(ServicesModule):
     def __init__(self):
         super().__init__(
             argument_spec=dict(
-                warehouse_id=dict(type="str", aliases=["vw_id", "id"]),
-                cluster_id=dict(required=True, type="str"),
-                catalog_id=dict(type="str", aliases=["dbc_id"]),
-                type=dict(type="str", choices=["hive", "impala", "trino"]),
-                name=dict(type="str"),
-                tshirt_size=dict(
-                    type="str",
-                    choices=["xsmall", "small", "medium", "large"],
-                    aliases=["template"],
-                ),
-                node_count=dict(type="int"),
-                instance_type=dict(type="str"),
-                connectors=dict(type="list", elements="str"),
-                autoscaling=dict(
-                    type="dict",
-                    options=dict(
-                        min_nodes=dict(type="int"),
-                        max_nodes=dict(type="int"),
-                        auto_suspend_timeout_seconds=dict(type="int"),
-                        disable_auto_suspend=dict(type="bool"),
-                        hive_desired_free_capacity=dict(type="int"),
-                        hive_scale_wait_time_seconds=dict(type="int"),
-                        impala_scale_down_delay_seconds=dict(type="int"),
-                        impala_scale_up_delay_seconds=dict(type="int"),
-                        pod_config_name=dict(type="str"),
-                    ),
-                ),
-                common_configs=dict(
-                    type="dict",
-                    options=dict(
-                        configBlocks=dict(
-                            type="list",
-                            elements="dict",
-                            options=dict(
-                                id=dict(type="str"),
-                                format=dict(
-                                    type="str",
-                                    choices=[
-                                        "HADOOP_XML",
-                                        "PROPERTIES",
-                                        "TEXT",
-                                        "JSON",
-                                        "BINARY",
-                                        "ENV",
-                                        "FLAGFILE",
-                                    ],
-                                ),
-                                content=dict(
-                                    type="dict",
-                                    options=dict(
-                                        keyValues=dict(type="dict"),
-                                        text=dict(type="str"),
-                                        json=dict(type="json"),
-                                    ),
-                                ),
-                            ),
-                        ),
-                    ),
-                ),
-                application_configs=dict(type="dict"),
-                impala_ha=dict(
-                    type="dict",
-                    options=dict(
-                        enable_catalog_high_availability=dict(type="bool"),
-                        enable_shutdown_of_coordinator=dict(type="bool"),
-                        high_availability_mode=dict(
-                            type="str",
-                            choices=["ACTIVE_PASSIVE", "ACTIVE_ACTIVE", "DISABLED"],
-                        ),
-                        num_of_active_coordinators=dict(type="int"),
-                        shutdown_of_coordinator_delay_seconds=dict(type="int"),
-                    ),
-                ),
-                ldap_groups=dict(type="list", elements="str"),
-                enable_sso=dict(type="bool"),
-                enable_unified_analytics=dict(type="bool"),
-                enable_platform_jwt_auth=dict(type="bool"),
-                tags=dict(type="dict"),
-                state=dict(
-                    type="str",
-                    choices=["present", "absent"],
-                    default="present",
+                VW_ARGUMENT_SPEC,
+                # No default, so that a top-level state is detected in batch mode
+                state=dict(type="str", choices=["present", "absent"]),
+                warehouses=dict(
+                    type="list",
+                    elements="dict",
+                    options=VW_ARGUMENT_SPEC,
+                    required_if=VW_REQUIRED_IF,
                 ),
                 wait=dict(type="bool", default=True),
                 delay=dict(type="int", default=15, aliases=["polling_delay"]),
                 timeout=dict(type="int", default=3600, aliases=["polling_timeout"]),
+                parallelism=dict(type="int", default=4),
             ),
-            required_if=[
-                ("state", "absent", ("warehouse_id",)),
-                ("state", "present", ("catalog_id", "type", "name")),
+            required_one_of=[
+                ("cluster_id", "warehouses"),
+            ],
+            mutually_exclusive=[
+                ("warehouses", "warehouse_id"),
+                ("warehouses", "name"),
             ],
             supports_check_mode=True,
         )
 
-        self.warehouse_id = self.get_param("warehouse_id")
         self.cluster_id = self.get_param("cluster_id")
-        self.catalog_id = self.get_param("catalog_id")
-        self.type = self.get_param("type")
-        self.name = self.get_param("name")
-        self.tshirt_size = self.get_param("tshirt_size")
-        self.node_count = self.get_param("node_count")
-        self.instance_type = self.get_param("instance_type")
-        self.connectors = self.get_param("connectors")
-        self.autoscaling = self.get_param("autoscaling")
-        self.common_configs = self.get_param("common_configs")
-        self.application_configs = self.get_param("application_configs")
-        self.impala_ha = self.get_param("impala_ha")
-        self.ldap_groups = self.get_param("ldap_groups")
-        self.enable_sso = self.get_param("enable_sso")
-        self.enable_unified_analytics = self.get_param("enable_unified_analytics")
-        self.enable_platform_jwt_auth = self.get_param("enable_platform_jwt_auth")
-        self.tags = self.get_param("tags")
-        self.state = self.get_param("state")
+        self.warehouses = self.get_param("warehouses")
         self.wait = self.get_param("wait")
         self.delay = self.get_param("delay")
         self.timeout = self.get_param("timeout")
+        self.parallelism = self.get_param("parallelism")
 
         self.virtual_warehouse: Dict[str, Any] = {}
+        self.virtual_warehouses: List[Dict[str, Any]] = []
         self.changed = False
         self.diff: Dict[str, Any] = {"before": {}, "after": {}}
 
     def process(self):
         client = CdpDwClient(api_client=self.api_client)
 
-        # Connector association is a Trino-only capability.
-        if (
-            self.connectors is not None
-            and self.type is not None
-            and self.type != "trino"
-        ):
-            self.module.fail_json(
-                msg=(
-                    "The 'connectors' parameter is only valid for Trino Virtual "
-                    f"Warehouses; got type={self.type!r}."
-                ),
+        if self.warehouses is None:
+            params = {k: v for k, v in self.module.params.items() if v is not None}
+            params.setdefault("state", "present")
+            try:
+                check_required_if(VW_REQUIRED_IF, params)
+            except TypeError as e:
+                self.module.fail_json(msg=str(e))
+            specs = [VwSpec(self.module.params)]
+        else:
+            # Only cluster_id is inherited; other options belong in each entry
+            top_level = sorted(
+                option
+                for option in VW_ARGUMENT_SPEC
+                if option != "cluster_id" and self.module.params[option] is not None
             )
+            if top_level:
+                self.module.fail_json(
+                    msg=(
+                        "Options of a single Virtual Warehouse are not valid with "
+                        f"warehouses; set them in each entry: {', '.join(top_level)}"
+                    ),
+                )
+            specs = [
+                VwSpec(dict(entry, cluster_id=entry["cluster_id"] or self.cluster_id))
+                for entry in self.warehouses
+            ]
 
-        existing = self._find_existing(client)
-
-        if self.state == "absent":
-            self._handle_absent(client, existing)
-            return
+        for spec in specs:
+            if spec.cluster_id is None:
+                self.module.fail_json(
+                    msg=f"No cluster_id for Virtual Warehouse {spec.label}.",
+                )
+            # Connector association is a Trino-only capability.
+            if (
+                spec.connectors is not None
+                and spec.type is not None
+                and spec.type != "trino"
+            ):
+                self.module.fail_json(
+                    msg=(
+                        "The 'connectors' parameter is only valid for Trino Virtual "
+                        f"Warehouses; got type={spec.type!r}."
+                    ),
+                )
 
-        # state == "present"
-        if existing is None:
-            self._handle_create(client)
+        if self.warehouses is None:
+            specs[0].existing = self._find_existing(client, specs[0])
         else:
-            self._handle_reconcile(client, existing)
+            self._find_all_existing(client, specs)
 
-    def _find_existing(self, client) -> Optional[VirtualWarehouse]:
-        if self.warehouse_id is not None:
-            return client.get_vw_by_id(self.cluster_id, self.warehouse_id)
-        if self.name is not None:
-            return client.get_vw_by_name(self.cluster_id, self.name)
-        return None
+        try:
+            self._reconcile(client, specs)
+        except CdpMutationError as e:
+            self.module.fail_json(msg=str(e), errors=e.errors)
+        except CdpError as e:
+            self.module.fail_json(msg=str(e))
 
-    def _handle_absent(self, client, existing) -> None:
-        if existing is None:
-            return
-        self.changed = True
-        if self.module._diff:
-            self.diff["before"] = to_dict(existing)
-        if not self.module.check_mode:
-            client.delete_vw(self.cluster_id, existing.id)
-            if self.wait:
-                self._wait_for_absence(client, existing.id)
+        self.changed = any(spec.changed for spec in specs)
+        if self.warehouses is None:
+            self.diff = specs[0].diff
+            self.virtual_warehouse = self._result(specs[0])
+        else:
+            changed = [spec for spec in specs if spec.changed]
+            if self.module._diff and changed:
+                self.diff = {
+                    "before": [spec.diff["before"] for spec in changed],
+                    "after": [spec.diff["after"] for spec in changed],
+                }
+            self.virtual_warehouses = [self._result(spec) for spec in specs]
 
-    def _handle_create(self, client) -> None:
-        self.changed = True
+    def _find_existing(self, client, spec) -> Optional[VirtualWarehouse]:
+        if spec.warehouse_id is not None:
+            return client.get_vw_by_id(spec.cluster_id, spec.warehouse_id)
+        if spec.name is not None:
+            return client.get_vw_by_name(spec.cluster_id, spec.name)
+        return None
 
-        desired_connectors = self._desired_connector_ids()
+    def _find_all_existing(self, client, specs) -> None:
+        """Look up every warehouse with a single list call per cluster."""
+        listings: Dict[str, List[VirtualWarehouse]] = {}
+        for spec in specs:
+            if spec.cluster_id not in listings:
+                listings[spec.cluster_id] = client.list_vws(spec.cluster_id)
+            spec.existing = next(
+                (
+                    vw
+                    for vw in listings[spec.cluster_id]
+                    if (
+                        vw.id == spec.warehouse_id
+                        if spec.warehouse_id is not None
+                        else vw.name == spec.name
+                    )
+                ),
+                None,
+            )
 
-        if self.module._diff:
-            after: Dict[str, Any] = {
-                "name": self.name,
-                "vwType": self.type,
-                "dbcId": self.catalog_id,
-            }
-            if self.node_count is not None:
-                after["nodeCount"] = self.node_count
-            if desired_connectors is not None:
-                after["associatedConnectors"] = sorted(desired_connectors)
-            self.diff["after"] = after
+    def _reconcile(self, client, specs) -> None:
+        """Plan every warehouse, then apply the changes and wait for them together."""
+        for spec in specs:
+            if spec.state == "absent":
+                self._plan_absent(spec)
+            elif spec.existing is None:
+                self._plan_create(spec)
+            else:
+                self._plan_reconcile(spec)
 
         if self.module.check_mode:
             return
 
-        created = client.create_vw(
-            cluster_id=self.cluster_id,
-            dbc_id=self.catalog_id,
-            vw_type=self.type,
-            name=self.name,
-            tshirt_size=self.tshirt_size,
-            node_count=self.node_count,
-            instance_type=self.instance_type,
-            autoscaling=self.autoscaling,
-            config=self._build_service_config(),
-            impala_ha=self.impala_ha,
-            tags=self.tags,
-            enable_unified_analytics=self.enable_unified_analytics,
-            enable_platform_jwt_auth=self.enable_platform_jwt_auth,
-        )
-        if created is None:
-            self.module.fail_json(
-                msg="Virtual Warehouse creation did not return a warehouse.",
+        self._apply(client, [spec for spec in specs if spec.action is not None])
+
+        if self.wait:
+            self._wait_for_presence(
+                client,
+                [s for s in specs if s.action is not None and s.state == "present"],
+            )
+            self._wait_for_absence(
+                client,
+                [s for s in specs if s.action is not None and s.state == "absent"],
             )
 
-        vw_id = created.id
-        current = created
+        # Step 2: associate connectors (Trino two-step) once the warehouses exist.
+        associate = [spec for spec in specs if spec.associate]
+        for spec in associate:
+            spec.action = self._associate_connectors
+        self._apply(client, associate)
         if self.wait:
-            current = self._wait_for_presence(client, vw_id)
+            self._wait_for_presence(client, associate)
 
-        # Step 2: associate connectors (Trino two-step) once the warehouse exists.
+    def _apply(self, client, specs) -> None:
+        """Submit the planned changes, concurrently in batch mode."""
+        if not specs:
+            return
+        if self.warehouses is None:
+            for spec in specs:
+                spec.action(client, spec)
+            return
+        apply_mutations(
+            self.api_client,
+            [(spec.label, partial(spec.action, client, spec)) for spec in specs],
+            parallelism=self.parallelism,
+        )
+
+    def _plan_absent(self, spec) -> None:
+        if spec.existing is None:
+            return
+        spec.changed = True
+        spec.vw_id = spec.existing.id
+        spec.action = self._delete
+        if self.module._diff:
+            spec.diff["before"] = to_dict(spec.existing)
+
+    def _plan_create(self, spec) -> None:
+        spec.changed = True
+        spec.action = self._create
+
+        desired_connectors = self._desired_connector_ids(spec)
         if desired_connectors:
-            current = client.update_vw(
-                cluster_id=self.cluster_id,
-                vw_id=vw_id,
-                associated_connectors=sorted(desired_connectors),
-            )
-            if self.wait:
-                current = self._wait_for_presence(client, vw_id)
+            spec.associate = sorted(desired_connectors)
 
-        self.virtual_warehouse = to_dict(current) if current else {}
+        if self.module._diff:
+            after: Dict[str, Any] = {
+                "name": spec.name,
+                "vwType": spec.type,
+                "dbcId": spec.catalog_id,
+            }
+            if spec.node_count is not None:
+                after["nodeCount"] = spec.node_count
+            if desired_connectors is not None:
+                after["associatedConnectors"] = sorted(desired_connectors)
+            spec.diff["after"] = after
+
+    def _plan_reconcile(self, spec) -> None:
+        existing = spec.existing
+        spec.vw_id = existing.id
+        spec.current = existing
 
-    def _handle_reconcile(self, client, existing) -> None:
         node_changed = (
-            self.node_count is not None and self.node_count != existing.nodeCount
+            spec.node_count is not None and spec.node_count != existing.nodeCount
         )
 
         current_connector_ids = set(
@@ -652,112 +934,205 @@ class DwVirtualWarehouse(ServicesModule):
                 else []
             ),
         )
-        desired_connectors = self._desired_connector_ids()
+        desired_connectors = self._desired_connector_ids(spec)
         connectors_changed = (
             desired_connectors is not None
             and set(desired_connectors) != current_connector_ids
         )
 
-        if node_changed or connectors_changed:
-            self.changed = True
-            if self.module._diff:
-                before: Dict[str, Any] = {}
-                after: Dict[str, Any] = {}
-                if node_changed:
-                    before["nodeCount"] = existing.nodeCount
-                    after["nodeCount"] = self.node_count
-                if connectors_changed:
-                    before["associatedConnectors"] = sorted(current_connector_ids)
-                    after["associatedConnectors"] = sorted(desired_connectors)
-                self.diff["before"] = before
-                self.diff["after"] = after
-
-            if not self.module.check_mode:
-                updated = client.update_vw(
-                    cluster_id=self.cluster_id,
-                    vw_id=existing.id,
-                    node_count=self.node_count if node_changed else None,
-                    associated_connectors=(
-                        sorted(desired_connectors) if connectors_changed else None
-                    ),
-                )
-                if self.wait:
-                    updated = self._wait_for_presence(client, existing.id)
-                self.virtual_warehouse = to_dict(updated) if updated else {}
-                return
+        if not (node_changed or connectors_changed):
+            return
+
+        spec.changed = True
+        spec.action = partial(
+            self._update,
+            node_count=spec.node_count if node_changed else None,
+            associated_connectors=(
+                sorted(desired_connectors) if connectors_changed else None
+            ),
+        )
+        if self.module._diff:
+            before: Dict[str, Any] = {}
+            after: Dict[str, Any] = {}
+            if node_changed:
+                before["nodeCount"] = existing.nodeCount
+                after["nodeCount"] = spec.node_count
+            if connectors_changed:
+                before["associatedConnectors"] = sorted(current_connector_ids)
+                after["associatedConnectors"] = sorted(desired_connectors)
+            spec.diff["before"] = before
+            spec.diff["after"] = after
+
+    def _create(self, client, spec) -> None:
+        created = client.create_vw(
+            cluster_id=spec.cluster_id,
+            dbc_id=spec.catalog_id,
+            vw_type=spec.type,
+            name=spec.name,
+            tshirt_size=spec.tshirt_size,
+            node_count=spec.node_count,
+            instance_type=spec.instance_type,
+            autoscaling=spec.autoscaling,
+            config=self._build_service_config(spec),
+            impala_ha=spec.impala_ha,
+            tags=spec.tags,
+            enable_unified_analytics=spec.enable_unified_analytics,
+            enable_platform_jwt_auth=spec.enable_platform_jwt_auth,
+        )
+        if created is None:
+            raise CdpError("Virtual Warehouse creation did not return a warehouse.")
+        spec.vw_id = created.id
+        spec.current = created
+
+    def _update(self, client, spec, node_count=None, associated_connectors=None):
+        spec.current = client.update_vw(
+            cluster_id=spec.cluster_id,
+            vw_id=spec.vw_id,
+            node_count=node_count,
+            associated_connectors=associated_connectors,
+        )
+
+    def _associate_connectors(self, client, spec) -> None:
+        spec.current = client.update_vw(
+            cluster_id=spec.cluster_id,
+            vw_id=spec.vw_id,
+            associated_connectors=spec.associate,
+        )
+
+    def _delete(self, client, spec) -> None:
+        client.delete_vw(spec.cluster_id, spec.vw_id)
+        spec.current = None
 
-        # No change, or check_mode: report the existing representation.
-        self.virtual_warehouse = to_dict(existing)
+    def _result(self, spec) -> Dict[str, Any]:
+        """Report the latest representation, or the existing one if unchanged."""
+        if spec.state == "absent":
+            return {}
+        if self.module.check_mode:
+            return to_dict(spec.existing) if spec.existing else {}
+        return to_dict(spec.current) if spec.current else {}
 
-    def _desired_connector_ids(self) -> Optional[List[str]]:
+    def _desired_connector_ids(self, spec) -> Optional[List[str]]:
         """Resolve the desired connector id set, warning on the empty (no-op) case.
 
         Returns None when connectors are unmanaged (parameter omitted). An empty
         desired set cannot be applied (the API will not detach all connectors),
         so it is treated as unmanaged after warning.
         """
-        if self.connectors is None:
+        if spec.connectors is None:
             return None
-        if len(self.connectors) == 0:
+        if len(spec.connectors) == 0:
             self.module.warn(
                 "An empty 'connectors' set cannot detach all connectors; "
                 "the connector association is left unchanged.",
             )
             return None
-        return self.connectors
+        return spec.connectors
 
-    def _build_service_config(self) -> Optional[Dict[str, Any]]:
+    def _build_service_config(self, spec) -> Optional[Dict[str, Any]]:
         """Assemble the ServiceConfigReq payload from the discrete config params."""
         config: Dict[str, Any] = {}
-        if self.common_configs is not None:
-            config["commonConfigs"] = self.common_configs
-        if self.application_configs is not None:
-            config["applicationConfigs"] = self.application_configs
-        if self.ldap_groups is not None:
-            config["ldapGroups"] = self.ldap_groups
-        if self.enable_sso is not None:
-            config["enableSSO"] = self.enable_sso
+        if spec.common_configs is not None:
+            config["commonConfigs"] = spec.common_configs
+        if spec.application_configs is not None:
+            config["applicationConfigs"] = spec.application_configs
+        if spec.ldap_groups is not None:
+            config["ldapGroups"] = spec.ldap_groups
+        if spec.enable_sso is not None:
+            config["enableSSO"] = spec.enable_sso
         return config or None
 
-    def _wait_for_presence(self, client, vw_id):
-        """Poll until the Virtual Warehouse reaches a running state or fails.
+    def _wait_for_presence(self, client, specs) -> None:
+        """Poll until the Virtual Warehouses reach a running state or fail.
 
-        Returns the settled VirtualWarehouse so callers avoid an extra describe.
+        Records each settled VirtualWarehouse so callers avoid an extra describe.
         """
-        deadline = time.time() + self.timeout
-        while time.time() < deadline:
-            vw = client.get_vw_by_id(self.cluster_id, vw_id)
+        if not specs:
+            return
+
+        def settled(vw_id, vw) -> bool:
             status = vw.status if vw is not None else None
-            if status in ENABLED_STATES:
-                return vw
             if status in FAILED_STATES:
                 self.module.fail_json(
                     msg=f"Virtual Warehouse {vw_id} entered a failed state: {status}",
                 )
-            time.sleep(self.delay)
-        self.module.fail_json(
-            msg=f"Timed out waiting for Virtual Warehouse {vw_id} to reach a running state.",
-        )
+            return status in ENABLED_STATES
+
+        if self.warehouses is None:
+            for spec in specs:
+                waiter = self._waiter(f"Virtual Warehouse {spec.vw_id}")
+                try:
+                    spec.current = waiter.wait(
+                        lambda: client.get_vw_by_id(spec.cluster_id, spec.vw_id),
+                        until=partial(settled, spec.vw_id),
+                        state=lambda vw: vw.status if vw is not None else None,
+                    )
+                except CdpWaitTimeout:
+                    self.module.fail_json(
+                        msg=f"Timed out waiting for {waiter.label} to reach a running state.",
+                    )
+            return
+
+        try:
+            results = client.wait_for_vws(
+                [spec.key for spec in specs],
+                until=lambda vw: vw is not None and settled(vw.id, vw),
+                waiter=self._waiter(f"{len(specs)} Virtual Warehouses"),
+            )
+        except CdpWaitTimeout as e:
+            self.module.fail_json(
+                msg="Timed out waiting for Virtual Warehouses to reach a running state: "
+                + ", ".join(vw_id for _, vw_id in e.last),
+            )
+        for spec in specs:
+            spec.current = results[spec.key]
+
+    def _wait_for_absence(self, client, specs) -> None:
+        """Poll until the Virtual Warehouses no longer exist."""
+        if not specs:
+            return
+        if self.warehouses is None:
+            for spec in specs:
+                waiter = self._waiter(f"Virtual Warehouse {spec.vw_id}")
+                try:
+                    waiter.wait(
+                        lambda: client.get_vw_by_id(spec.cluster_id, spec.vw_id),
+                        until=lambda vw: vw is None,
+                        state=lambda vw: vw.status if vw is not None else None,
+                    )
+                except CdpWaitTimeout:
+                    self.module.fail_json(
+                        msg=f"Timed out waiting for {waiter.label} to be deleted.",
+                    )
+            return
+
+        try:
+            client.wait_for_vws(
+                [spec.key for spec in specs],
+                until=lambda vw: vw is None,
+                waiter=self._waiter(f"{len(specs)} Virtual Warehouses"),
+            )
+        except CdpWaitTimeout as e:
+            self.module.fail_json(
+                msg="Timed out waiting for Virtual Warehouses to be deleted: "
+                + ", ".join(vw_id for _, vw_id in e.last),
+            )
 
-    def _wait_for_absence(self, client, vw_id) -> None:
-        """Poll until the Virtual Warehouse no longer exists."""
-        deadline = time.time() + self.timeout
-        while time.time() < deadline:
-            if client.get_vw_by_id(self.cluster_id, vw_id) is None:
-                return
-            time.sleep(self.delay)
-        self.module.fail_json(
-            msg=f"Timed out waiting for Virtual Warehouse {vw_id} to be deleted.",
+    def _waiter(self, label) -> CdpWaiter:
+        return CdpWaiter(
+            timeout=self.timeout,
+            delay=self.delay,
+            label=label,
         )
 
 
 def main():
     result = DwVirtualWarehouse()
 
-    output: Dict[str, Any] = dict(
-        changed=result.changed,
-        virtual_warehouse=result.virtual_warehouse,
-    )
+    output: Dict[str, Any] = dict(changed=result.changed)
+    if result.warehouses is None:
+        output["virtual_warehouse"] = result.virtual_warehouse
+    else:
+        output["virtual_warehouses"] = result.virtual_warehouses
 
     if result.diff["before"] or result.diff["after"]:
         output["diff"] = result.diff
@@ -196,11 +196,10 @@ class DwVirtualWarehouseInfo(ServicesModule):
             vw = client.get_vw_by_name(self.cluster_id, self.name)
             self.virtual_warehouses = [vw] if vw is not None else []
         elif self.catalog_id is not None:
-            self.virtual_warehouses = [
-                vw
-                for vw in client.list_vws(self.cluster_id)
-                if vw.dbcId == self.catalog_id
-            ]
+            self.virtual_warehouses = client.list_vws(
+                self.cluster_id,
+                catalog_id=self.catalog_id,
+            )
         else:
             self.virtual_warehouses = client.list_vws(self.cluster_id)
 
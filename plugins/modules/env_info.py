@@ -39,6 +39,22 @@ options:
     type: bool
     required: False
     default: False
+  parallelism:
+    description:
+      - The maximum number of descendant lookups to run at once, across all services and environments.
+      - Only used when O(descendants=true).
+      - If V(1), the lookups run one after another.
+    type: int
+    required: False
+    default: 4
+  descendant_timeout:
+    description:
+      - The number of seconds each descendant lookup, i.e. one service in one environment, may take.
+      - A lookup that fails or takes longer is reported in RV(environments[].descendants.errors) rather than failing the module.
+      - If V(0), lookups are not limited.
+    type: int
+    required: False
+    default: 300
 extends_documentation_fragment:
   - cloudera.cloud.cdp_sdk_options
   - cloudera.cloud.cdp_auth_options
@@ -54,6 +70,12 @@ EXAMPLES = r"""
 - cloudera.cloud.env_info:
     name: example-environment
     descendants: true
+
+# Gather the descendants of all Environments, at most 8 lookups at a time
+- cloudera.cloud.env_info:
+    descendants: true
+    parallelism: 8
+    descendant_timeout: 120
 """
 
 RETURN = r"""
@@ -83,6 +105,12 @@ environments:
         opdb:
           type: list
           description: List of descriptions of zero or more Operational Database Experiences in this Environment
+        errors:
+          description:
+            - The error of each descendant lookup that failed or timed out, keyed by service, for example C(ml).
+            - The descendants of a failed service are returned as an empty list.
+          returned: when a descendant lookup fails
+          type: dict
     authentication:
       description: Additional SSH key authentication configuration for accessing cluster node instances of the
         Environment.
@@ -401,7 +429,14 @@ sdk_out_lines:
   elements: str
 """
 
+import threading
+
+from functools import partial
+
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    concurrent_calls,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_common import CdpModule
 
 
@@ -412,6 +447,11 @@ class EnvironmentInfo(CdpModule):
         # Set variables
         self.name = self._get_param("name")
         self.descendants = self._get_param("descendants")
+        self.parallelism = self._get_param("parallelism", 4)
+        self.descendant_timeout = self._get_param("descendant_timeout", 300)
+
+        # Descendant lookups raise SDK errors rather than fail the module
+        self._lookup = threading.local()
 
         # Initialize return values
         self.environments = []
@@ -419,6 +459,33 @@ class EnvironmentInfo(CdpModule):
         # Execute logic process
         self.process()
 
+    def _cdp_module_throw_error(self, error):
+        if getattr(self._lookup, "active", False):
+            raise error
+        super(EnvironmentInfo, self)._cdp_module_throw_error(error)
+
+    def _descendant_lookups(self, env):
+        """Return the (service, lookup) pairs for the descendants of an environment."""
+        name = env["environmentName"]
+        return [
+            ("datahub", lambda: self.cdpy.datahub.describe_all_clusters(name)),
+            ("dw", lambda: self.cdpy.dw.gather_clusters(env["crn"])),
+            ("ml", lambda: self.cdpy.ml.describe_all_workspaces(name)),
+            (
+                "de",
+                lambda: self.cdpy.de.list_services(name, remove_deleted=True),
+            ),
+            ("opdb", lambda: self.cdpy.opdb.describe_all_databases(name)),
+            ("df", lambda: self.cdpy.df.list_services(env_crn=env["crn"])),
+        ]
+
+    def _run_lookup(self, lookup):
+        self._lookup.active = True
+        try:
+            return lookup()
+        finally:
+            self._lookup.active = False
+
     @CdpModule._Decorators.process_debug
     def process(self):
         if self.name:
@@ -428,30 +495,25 @@ class EnvironmentInfo(CdpModule):
         else:
             self.environments = self.cdpy.environments.describe_all_environments()
         if self.descendants and self.environments:
-            updated_envs = []
-            for this_env in self.environments:
-                df = None
-                # Removing until DF is GA so we are not dependent on Beta functionality
-                df = self.cdpy.df.list_services(env_crn=this_env["crn"])
-                this_env["descendants"] = {
-                    "datahub": self.cdpy.datahub.describe_all_clusters(
-                        this_env["environmentName"],
-                    ),
-                    "dw": self.cdpy.dw.gather_clusters(this_env["crn"]),
-                    "ml": self.cdpy.ml.describe_all_workspaces(
-                        this_env["environmentName"],
-                    ),
-                    "de": self.cdpy.de.list_services(
-                        this_env["environmentName"],
-                        remove_deleted=True,
-                    ),
-                    "opdb": self.cdpy.opdb.describe_all_databases(
-                        this_env["environmentName"],
-                    ),
-                    "df": df if df is not None else [],
-                }
-                updated_envs.append(this_env)
-            self.environments = updated_envs
+            # Run the lookups of every service in every environment together
+            lookups = [
+                (env, service, lookup)
+                for env in self.environments
+                for service, lookup in self._descendant_lookups(env)
+            ]
+            results = concurrent_calls(
+                [partial(self._run_lookup, lookup) for _, _, lookup in lookups],
+                parallelism=self.parallelism,
+                timeout=self.descendant_timeout or None,
+            )
+
+            for (env, service, _), (result, error) in zip(lookups, results):
+                descendants = env.setdefault("descendants", {})
+                descendants[service] = result if result is not None else []
+                if error is not None:
+                    descendants.setdefault("errors", {})[service] = str(
+                        getattr(error, "message", None) or error,
+                    )
 
 
 def main():
@@ -459,6 +521,8 @@ def main():
         argument_spec=CdpModule.argument_spec(
             name=dict(required=False, type="str", aliases=["environment"]),
             descendants=dict(required=False, type="bool", default=False),
+            parallelism=dict(required=False, type="int", default=4),
+            descendant_timeout=dict(required=False, type="int", default=300),
         ),
         supports_check_mode=True,
     )
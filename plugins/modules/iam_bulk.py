@@ -0,0 +1,852 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = r"""
+module: iam_bulk
+short_description: Create, update, or remove many CDP IAM users, groups, and machine users
+description:
+    - Create, update, and remove many Cloudera Data Platform IAM users, groups, and machine users in a single task.
+    - The current state of the tenant is loaded once with bulk list calls, rather than with lookups per entity.
+    - All changes are planned before any is made, so check mode and diff mode only read the current state.
+    - Changes are made in three batches, each running up to O(parallelism) calls at once. Entities are
+      created first, then memberships and roles are changed, and last entities are removed.
+    - All changes are attempted, and the results are reported per entity.
+author:
+  - "Webster Mudge (@wmudge)"
+version_added: "3.3.0"
+options:
+  groups:
+    description:
+      - A list of groups to manage.
+    type: list
+    elements: dict
+    required: False
+    suboptions:
+      name:
+        description:
+          - The name of the group.
+        type: str
+        required: True
+        aliases:
+          - group_name
+      resource_roles:
+        description:
+          - A list of resource role assignments.
+        type: list
+        elements: dict
+        required: False
+        suboptions:
+          resource:
+            description:
+              - The resource CRN for the rights assignment.
+            type: str
+            required: True
+            aliases:
+              - resource_crn
+          role:
+            description:
+              - The resource role CRN to be assigned.
+            type: str
+            required: True
+            aliases:
+              - resource_role_crn
+      roles:
+        description:
+          - A list of role CRNs assigned to the group.
+        type: list
+        elements: str
+        required: False
+      state:
+        description:
+          - The state of the group.
+        type: str
+        required: False
+        default: present
+        choices:
+          - present
+          - absent
+      sync:
+        description:
+          - Whether group membership is synced when a user logs in.
+        type: bool
+        required: False
+        default: True
+        aliases:
+          - sync_membership
+      users:
+        description:
+          - A list of the users and machine users assigned to the group.
+          - Users can be given by user ID, email, workload username, or CRN.
+          - Machine users can be given by name or CRN.
+        type: list
+        elements: str
+        required: False
+  machine_users:
+    description:
+      - A list of machine users to manage.
+    type: list
+    elements: dict
+    required: False
+    suboptions:
+      name:
+        description:
+          - The name of the machine user.
+        type: str
+        required: True
+        aliases:
+          - machine_user_name
+      resource_roles:
+        description:
+          - A list of resource role assignments.
+        type: list
+        elements: dict
+        required: False
+        suboptions:
+          resource:
+            description:
+              - The resource CRN for the rights assignment.
+            type: str
+            required: True
+            aliases:
+              - resource_crn
+          role:
+            description:
+              - The resource role CRN to be assigned.
+            type: str
+            required: True
+            aliases:
+              - resource_role_crn
+      roles:
+        description:
+          - A list of role CRNs assigned to the machine user.
+        type: list
+        elements: str
+        required: False
+      state:
+        description:
+          - The state of the machine user.
+        type: str
+        required: False
+        default: present
+        choices:
+          - present
+          - absent
+  parallelism:
+    description:
+      - The maximum number of changes to make at once.
+      - If V(1), the changes are made one after another.
+    type: int
+    required: False
+    default: 4
+  purge:
+    description:
+      - Flag to replace the groups, users, roles, and resource roles of each entity with their specified values.
+      - Applies only to the attributes given for an entity; for example, the roles of a user without O(users[].roles) are left unchanged.
+    type: bool
+    required: False
+    default: False
+  users:
+    description:
+      - A list of users to manage.
+      - Users are identified by their email address.
+    type: list
+    elements: dict
+    required: False
+    suboptions:
+      email:
+        description:
+          - The email address of the user.
+        type: str
+        required: True
+      first_name:
+        description:
+          - The user's first name.
+          - Only used when creating a new user.
+        type: str
+        required: False
+      groups:
+        description:
+          - A list of the names of the groups the user belongs to.
+          - Groups must already exist, or be given in O(groups).
+        type: list
+        elements: str
+        required: False
+      identity_provider_user_id:
+        description:
+          - The identity provider user ID for the user.
+          - If not provided, defaults to the email address.
+          - Only used when creating a new user.
+        type: str
+        required: False
+        aliases:
+          - idp_user_id
+      last_name:
+        description:
+          - The user's last name.
+          - Only used when creating a new user.
+        type: str
+        required: False
+      resource_roles:
+        description:
+          - A list of resource role assignments.
+        type: list
+        elements: dict
+        required: False
+        suboptions:
+          resource:
+            description:
+              - The resource CRN for the rights assignment.
+            type: str
+            required: True
+            aliases:
+              - resource_crn
+          role:
+            description:
+              - The resource role CRN to be assigned.
+            type: str
+            required: True
+            aliases:
+              - resource_role_crn
+      roles:
+        description:
+          - A list of role CRNs assigned to the user.
+        type: list
+        elements: str
+        required: False
+      saml_provider_name:
+        description:
+          - The name or CRN of the SAML provider the user will use for login.
+          - If not provided, the default identity provider is used.
+          - Only used when creating a new user.
+        type: str
+        required: False
+        aliases:
+          - saml_provider
+      state:
+        description:
+          - The state of the user.
+        type: str
+        required: False
+        default: present
+        choices:
+          - present
+          - absent
+extends_documentation_fragment:
+  - cloudera.cloud.cdp_client
+notes:
+  - Workload passwords are not managed by this module; use M(cloudera.cloud.iam_user).
+"""
+
+EXAMPLES = r"""
+# Note: These examples do not set authentication details.
+
+# Create groups and users, and add the users to the groups
+- cloudera.cloud.iam_bulk:
+    groups:
+      - name: developers
+        roles:
+          - crn:cdp:iam:us-west-1:altus:role:PowerUser
+      - name: analysts
+    users:
+      - email: alice@example.com
+        first_name: Alice
+        groups:
+          - developers
+      - email: bob@example.com
+        groups:
+          - developers
+          - analysts
+
+# Sync the members of a group, removing any others
+- cloudera.cloud.iam_bulk:
+    groups:
+      - name: developers
+        users: "{{ developer_emails }}"
+    purge: true
+    parallelism: 8
+
+# Remove users and a machine user
+- cloudera.cloud.iam_bulk:
+    users:
+      - email: alice@example.com
+        state: absent
+    machine_users:
+      - name: ci-bot
+        state: absent
+"""
+
+RETURN = r"""
+users:
+  description: The results for each user, in the order of O(users).
+  type: list
+  elements: dict
+  returned: always
+  contains:
+    name:
+      description: The email address of the user.
+      returned: always
+      type: str
+    state:
+      description: The requested state of the user.
+      returned: always
+      type: str
+    crn:
+      description: The CRN of the user.
+      returned: when known
+      type: str
+    changed:
+      description: Whether the user was, or in check mode would be, changed.
+      returned: always
+      type: bool
+    mutations:
+      description: The number of changes made to the user.
+      returned: always
+      type: int
+    errors:
+      description: The changes that failed, with the affected item and the error message.
+      returned: always
+      type: list
+      elements: dict
+groups:
+  description: The results for each group, in the order of O(groups); see RV(users) for the contents.
+  type: list
+  elements: dict
+  returned: always
+machine_users:
+  description: The results for each machine user, in the order of O(machine_users); see RV(users) for the contents.
+  type: list
+  elements: dict
+  returned: always
+mutations:
+  description: The total number of changes made.
+  type: int
+  returned: always
+elapsed:
+  description: The time taken to reconcile all entities, in seconds.
+  type: float
+  returned: always
+sdk_out:
+  description: Returns the captured CDP SDK log.
+  returned: when supported
+  type: str
+sdk_out_lines:
+  description: Returns a list of each line of the captured CDP SDK log.
+  returned: when supported
+  type: list
+  elements: str
+"""
+
+import time
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
+    ServicesModule,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    concurrent_calls,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
+    CdpIamClient,
+    CdpIamPlan,
+    CdpIamSnapshot,
+)
+
+RESOURCE_ROLE_SPEC = dict(
+    type="list",
+    elements="dict",
+    options=dict(
+        resource=dict(required=True, type="str", aliases=["resource_crn"]),
+        role=dict(required=True, type="str", aliases=["resource_role_crn"]),
+    ),
+)
+
+STATE_SPEC = dict(type="str", choices=["present", "absent"], default="present")
+
+
+class IAMBulk(ServicesModule):
+    def __init__(self):
+        super().__init__(
+            argument_spec=dict(
+                users=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        email=dict(required=True, type="str"),
+                        state=STATE_SPEC,
+                        first_name=dict(type="str"),
+                        last_name=dict(type="str"),
+                        identity_provider_user_id=dict(
+                            type="str",
+                            aliases=["idp_user_id"],
+                        ),
+                        saml_provider_name=dict(
+                            type="str",
+                            aliases=["saml_provider"],
+                        ),
+                        groups=dict(type="list", elements="str"),
+                        roles=dict(type="list", elements="str"),
+                        resource_roles=RESOURCE_ROLE_SPEC,
+                    ),
+                ),
+                groups=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(required=True, type="str", aliases=["group_name"]),
+                        state=STATE_SPEC,
+                        sync=dict(
+                            type="bool",
+                            default=True,
+                            aliases=["sync_membership"],
+                        ),
+                        users=dict(type="list", elements="str"),
+                        roles=dict(type="list", elements="str"),
+                        resource_roles=RESOURCE_ROLE_SPEC,
+                    ),
+                ),
+                machine_users=dict(
+                    required=False,
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        name=dict(
+                            required=True,
+                            type="str",
+                            aliases=["machine_user_name"],
+                        ),
+                        state=STATE_SPEC,
+                        roles=dict(type="list", elements="str"),
+                        resource_roles=RESOURCE_ROLE_SPEC,
+                    ),
+                ),
+                purge=dict(required=False, type="bool", default=False),
+                parallelism=dict(required=False, type="int", default=4),
+            ),
+            supports_check_mode=True,
+        )
+
+        # Set parameters
+        self.users = self.get_param("users") or []
+        self.groups = self.get_param("groups") or []
+        self.machine_users = self.get_param("machine_users") or []
+        self.purge = self.get_param("purge")
+        self.parallelism = self.get_param("parallelism")
+
+        # Initialize return values
+        self.results: Dict[str, List[Dict[str, Any]]] = dict(
+            users=[],
+            groups=[],
+            machine_users=[],
+        )
+        self.changed = False
+        self.diff = {}
+        self.mutations = 0
+        self.elapsed = 0.0
+
+        # Initialize client
+        self.client = CdpIamClient(api_client=self.api_client)
+
+    def process(self):
+        start = time.monotonic()
+        try:
+            self._reconcile()
+        finally:
+            self.elapsed = round(time.monotonic() - start, 3)
+
+        errors = [
+            dict(item=f"{result['name']}: {error['item']}", error=error["error"])
+            for results in self.results.values()
+            for result in results
+            for error in result["errors"]
+        ]
+        if errors:
+            self.module.fail_json(
+                msg=f"{len(errors)} changes failed: "
+                + "; ".join(f"{e['item']}: {e['error']}" for e in errors),
+                mutations=self.mutations,
+                elapsed=self.elapsed,
+                **self.results,
+            )
+
+    def _run(
+        self,
+        changes: List[Tuple[Dict[str, Any], str, Callable[[], Any]]],
+    ) -> List[Any]:
+        """
+        Make a batch of changes, recording the outcome on each entity result.
+
+        Args:
+            changes: Triples of the entity result, a label identifying the
+                changed item, and a function without arguments making the change
+
+        Returns:
+            The response of each change, or None if it failed, in input order
+        """
+
+        def run(call: Callable[[], Any]) -> Any:
+            with self.client.raising_errors():
+                return call()
+
+        outcomes = concurrent_calls(
+            [partial(run, call) for _, _, call in changes],
+            parallelism=self.parallelism,
+        )
+
+        for (result, label, _), (_, error) in zip(changes, outcomes):
+            if error is None:
+                result["mutations"] += 1
+                self.mutations += 1
+            else:
+                result["errors"].append(dict(item=label, error=str(error)))
+        return [response for response, _ in outcomes]
+
+    def _reconcile(self):
+        snapshot = CdpIamSnapshot(self.client, parallelism=self.parallelism)
+
+        # Load the current state once, with bulk list calls
+        users = {}
+        if self.users or any(g["users"] for g in self.groups):
+            for user in snapshot.users:
+                for key in ("email", "userId", "workloadUsername", "crn"):
+                    if user.get(key):
+                        users[user[key]] = user
+        machine_users = {}
+        if self.machine_users or any(g["users"] for g in self.groups):
+            for machine_user in snapshot.machine_users:
+                for key in ("machineUserName", "crn"):
+                    if machine_user.get(key):
+                        machine_users[machine_user[key]] = machine_user
+        groups = {}
+        if self.groups or any(u["groups"] is not None for u in self.users):
+            groups = {g["groupName"]: g for g in snapshot.groups}
+        group_names = {g["crn"]: g["groupName"] for g in groups.values()}
+
+        user_entities = [
+            self._entity("users", spec["email"], spec, users.get(spec["email"]))
+            for spec in self.users
+        ]
+        group_entities = [
+            self._entity(
+                "groups",
+                spec["name"],
+                spec,
+                groups.get(spec["name"]),
+            )
+            for spec in self.groups
+        ]
+        machine_user_entities = [
+            self._entity(
+                "machine_users",
+                spec["name"],
+                spec,
+                machine_users.get(spec["name"]),
+            )
+            for spec in self.machine_users
+        ]
+
+        # Complete the details of the existing entities that are kept
+        for entities, details in (
+            (user_entities, snapshot.user_details),
+            (group_entities, snapshot.group_details),
+            (machine_user_entities, snapshot.machine_user_details),
+        ):
+            kept = [
+                e for e in entities if e["current"] and e["spec"]["state"] == "present"
+            ]
+            for entity, current in zip(kept, details([e["current"] for e in kept])):
+                entity["current"] = current
+
+        # Check the groups of the users exist, before creating anything
+        states = {spec["name"]: spec["state"] for spec in self.groups}
+        known_groups = {
+            name
+            for name in set(groups) | set(states)
+            if states.get(name, "present") == "present"
+        }
+        for entity in user_entities:
+            for group in entity["spec"]["groups"] or []:
+                if group not in known_groups:
+                    entity["result"]["errors"].append(
+                        dict(
+                            item=group,
+                            error=f"Group '{group}' does not exist. Please create the "
+                            "group before adding users to it.",
+                        ),
+                    )
+
+        entities = user_entities + group_entities + machine_user_entities
+        present = [
+            e
+            for e in entities
+            if e["spec"]["state"] == "present" and not e["result"]["errors"]
+        ]
+
+        # Create the missing entities
+        created = [e for e in present if not e["current"]]
+        for entity in created:
+            self._changed(entity, before={}, after=dict(name=entity["name"]))
+        if created and not self.module.check_mode:
+            default_idp = None
+            if any(
+                e["kind"] == "users" and not e["spec"]["saml_provider_name"]
+                for e in created
+            ):
+                default_idp = self.client.get_default_identity_provider().get("crn")
+            responses = self._run(
+                [
+                    (e["result"], "create", self._create_call(e, default_idp))
+                    for e in created
+                ],
+            )
+            for entity, response in zip(created, responses):
+                if response is not None:
+                    entity["current"] = dict(
+                        response.get(
+                            dict(
+                                users="user",
+                                groups="group",
+                                machine_users="machineUser",
+                            )[entity["kind"]],
+                            {},
+                        ),
+                    )
+                    entity["result"]["crn"] = entity["current"].get("crn")
+                    # Index the new users and machine users as group members
+                    if entity["kind"] == "users":
+                        index = users
+                        keys = ("email", "userId", "workloadUsername", "crn")
+                    elif entity["kind"] == "machine_users":
+                        index = machine_users
+                        keys = ("machineUserName", "crn")
+                    else:
+                        continue
+                    index[entity["name"]] = entity["current"]
+                    for key in keys:
+                        if entity["current"].get(key):
+                            index[entity["current"][key]] = entity["current"]
+
+        # Plan the membership and role changes
+        membership = set()
+        plans = []
+        for entity in [e for e in present if not e["result"]["errors"]]:
+            current = entity["current"] or {}
+            spec = entity["spec"]
+
+            if entity["kind"] == "users":
+                plan = CdpIamPlan(CdpIamPlan.USER, current.get("userId"), self.purge)
+                if spec["groups"] is not None:
+                    plan.plan(
+                        "groups",
+                        [
+                            group_names[crn]
+                            for crn in current.get("groups", [])
+                            if crn in group_names
+                        ],
+                        spec["groups"],
+                    )
+                membership.update(
+                    (change["item"], current.get("crn")) for change in plan.changes
+                )
+            elif entity["kind"] == "groups":
+                plan = CdpIamPlan(CdpIamPlan.GROUP, entity["name"], self.purge)
+                if spec["users"] is not None:
+                    plan.plan(
+                        "members",
+                        current.get("members", []),
+                        [
+                            self._member_crn(member, users, machine_users)
+                            for member in spec["users"]
+                        ],
+                    )
+                if (
+                    entity["current"]
+                    and current.get("syncMembershipOnUserLogin") is not None
+                    and current.get("syncMembershipOnUserLogin") != spec["sync"]
+                ):
+                    entity["sync"] = True
+                    self._changed(entity)
+            else:
+                plan = CdpIamPlan(CdpIamPlan.MACHINE_USER, entity["name"], self.purge)
+
+            if spec["roles"] is not None:
+                plan.plan("roles", current.get("roles", []), spec["roles"])
+            if spec["resource_roles"] is not None:
+                plan.plan(
+                    "resource_roles",
+                    current.get("resourceAssignments", []),
+                    spec["resource_roles"],
+                )
+            if plan:
+                self._changed(entity, **plan.diff())
+            plans.append((entity, plan))
+
+        # A membership given for both the user and the group is changed once
+        for entity, plan in plans:
+            if entity["kind"] == "groups":
+                plan.changes = [
+                    change
+                    for change in plan.changes
+                    if change["attribute"] != "members"
+                    or (entity["name"], change["item"]) not in membership
+                ]
+
+        if not self.module.check_mode:
+            changes = []
+            for entity, plan in plans:
+                if entity.get("sync"):
+                    changes.append(
+                        (
+                            entity["result"],
+                            "sync",
+                            partial(
+                                self.client.update_group,
+                                group_name=entity["name"],
+                                sync_membership_on_user_login=entity["spec"]["sync"],
+                            ),
+                        ),
+                    )
+                changes.extend(
+                    (entity["result"], label, call)
+                    for label, call in plan.calls(self.client)
+                )
+            self._run(changes)
+
+        # Remove the entities last, so that memberships in the same batch are
+        # changed first
+        removed = [
+            e for e in entities if e["spec"]["state"] == "absent" and e["current"]
+        ]
+        for entity in removed:
+            self._changed(entity, before=dict(name=entity["name"]), after={})
+        if removed and not self.module.check_mode:
+            self._run([(e["result"], "delete", self._delete_call(e)) for e in removed])
+
+    def _entity(
+        self,
+        kind: str,
+        name: str,
+        spec: Dict[str, Any],
+        current: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Register an entity and its result."""
+        result = dict(
+            name=name,
+            state=spec["state"],
+            changed=False,
+            mutations=0,
+            errors=[],
+        )
+        if current and current.get("crn"):
+            result["crn"] = current["crn"]
+        self.results[kind].append(result)
+        return dict(kind=kind, name=name, spec=spec, current=current, result=result)
+
+    def _changed(
+        self,
+        entity: Dict[str, Any],
+        before: Optional[Dict[str, Any]] = None,
+        after: Optional[Dict[str, Any]] = None,
+    ):
+        """Mark an entity as changed, recording its diff in diff mode."""
+        entity["result"]["changed"] = True
+        self.changed = True
+        if self.module._diff and (before is not None or after is not None):
+            for side, value in (("before", before), ("after", after)):
+                self.diff.setdefault(side, {}).setdefault(
+                    entity["kind"],
+                    {},
+                ).setdefault(entity["name"], {}).update(value or {})
+
+    def _create_call(self, entity: Dict[str, Any], default_idp: Optional[str]):
+        """Return the client call creating an entity."""
+        spec = entity["spec"]
+        if entity["kind"] == "users":
+            return partial(
+                self.client.create_user,
+                email=spec["email"],
+                identity_provider_user_id=spec["identity_provider_user_id"]
+                or spec["email"],
+                first_name=spec["first_name"],
+                last_name=spec["last_name"],
+                saml_provider_name=spec["saml_provider_name"] or default_idp,
+            )
+        if entity["kind"] == "groups":
+            return partial(
+                self.client.create_group,
+                group_name=entity["name"],
+                sync_membership_on_user_login=spec["sync"],
+            )
+        return partial(
+            self.client.create_machine_user,
+            machine_user_name=entity["name"],
+        )
+
+    def _delete_call(self, entity: Dict[str, Any]):
+        """Return the client call removing an entity."""
+        if entity["kind"] == "users":
+            return partial(
+                self.client.delete_user,
+                user_id=entity["current"]["userId"],
+            )
+        if entity["kind"] == "groups":
+            return partial(self.client.delete_group, group_name=entity["name"])
+        return partial(
+            self.client.delete_machine_user,
+            machine_user_name=entity["name"],
+        )
+
+    @staticmethod
+    def _member_crn(
+        member: str,
+        users: Dict[str, Dict[str, Any]],
+        machine_users: Dict[str, Dict[str, Any]],
+    ) -> str:
+        """Resolve a user or machine user identifier to its CRN, if known."""
+        if member.startswith("crn:"):
+            return member
+        entity = machine_users.get(member) or users.get(member)
+        return entity.get("crn", member) if entity else member
+
+
+def main():
+    result = IAMBulk()
+
+    output: Dict[str, Any] = dict(
+        changed=result.changed,
+        mutations=result.mutations,
+        elapsed=result.elapsed,
+        **result.results,
+    )
+
+    if result.diff:
+        output.update(diff=result.diff)
+
+    if result.debug_log:
+        output.update(
+            sdk_out=result.log_out,
+            sdk_out_lines=result.log_lines,
+        )
+
+    result.module.exit_json(**output)
+
+
+if __name__ == "__main__":
+    main()
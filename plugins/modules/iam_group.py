@@ -48,6 +48,15 @@ options:
     default: False
     aliases:
       - replace
+  parallelism:
+    description:
+      - The maximum number of membership and role changes to make at once.
+      - All changes are planned before any is made, so check mode and diff mode only read the current state.
+      - All changes are attempted, and those that fail are reported together.
+      - If V(1), the changes are made one after another.
+    type: int
+    required: False
+    default: 1
   resource_roles:
     description:
       - A list of resource role assignments.
@@ -149,6 +158,13 @@ EXAMPLES = r"""
       - role-c
       - role-d
     purge: true
+
+# Sync a large group membership, eight changes at a time
+- cloudera.cloud.iam_group:
+    name: group-example
+    users: "{{ idp_group_members }}"
+    purge: true
+    parallelism: 8
 """
 
 RETURN = r"""
@@ -200,6 +216,21 @@ group:
         group membership.
       returned: when supported
       type: bool
+mutations:
+  description: The number of changes made to the group, its members, and its role assignments.
+  returned: always
+  type: int
+  sample: 12
+elapsed:
+  description: The time taken by the module to reconcile the group, in seconds.
+  returned: always
+  type: float
+  sample: 3.214
+errors:
+  description: The changes that failed, each with the affected C(item), for example a member CRN, and the C(error).
+  returned: on failure
+  type: list
+  elements: dict
 sdk_out:
   description: Returns the captured CDP SDK log.
   returned: when supported
@@ -211,13 +242,19 @@ sdk_out_lines:
   elements: str
 """
 
+import time
+
 from typing import Any, Dict
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     ServicesModule,
 )
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpMutationError,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
+    CdpIamPlan,
 )
 
 
@@ -258,6 +295,7 @@ class IAMGroup(ServicesModule):
                     ),
                 ),
                 purge=dict(required=False, type="bool", default=False),
+                parallelism=dict(required=False, type="int", default=1),
             ),
             supports_check_mode=True,
         )
@@ -270,15 +308,33 @@ class IAMGroup(ServicesModule):
         self.roles = self.get_param("roles")
         self.resource_roles = self.get_param("resource_roles")
         self.purge = self.get_param("purge")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.group = {}
         self.changed = False
+        self.diff = {}
+        self.mutations = 0
+        self.elapsed = 0.0
 
         # Initialize client
         self.client = CdpIamClient(api_client=self.api_client)
 
     def process(self):
+        start = time.monotonic()
+        try:
+            self._reconcile()
+        except CdpMutationError as e:
+            self.mutations += e.applied
+            self.module.fail_json(
+                msg=str(e),
+                errors=e.errors,
+                mutations=self.mutations,
+                elapsed=round(time.monotonic() - start, 3),
+            )
+        self.elapsed = round(time.monotonic() - start, 3)
+
+    def _reconcile(self):
         current_group = self.client.get_group_details(group_name=self.name)
 
         # Delete
@@ -286,6 +342,7 @@ class IAMGroup(ServicesModule):
             if current_group:
                 if not self.module.check_mode:
                     self.client.delete_group(group_name=self.name)
+                    self.mutations += 1
                 self.changed = True
 
         if self.state == "present":
@@ -298,8 +355,26 @@ class IAMGroup(ServicesModule):
                     )
                     self.group = response.get("group", {})
                     current_group = self.client.get_group_details(group_name=self.name)
+                    self.mutations += 1
                 self.changed = True
 
+            # Plan the membership and role changes; check and diff mode are
+            # served from the plan
+            plan = (
+                CdpIamPlan(CdpIamPlan.GROUP, self.name, self.purge)
+                .plan("members", (current_group or {}).get("members", []), self.users)
+                .plan("roles", (current_group or {}).get("roles", []), self.roles)
+                .plan(
+                    "resource_roles",
+                    (current_group or {}).get("resourceAssignments", []),
+                    self.resource_roles,
+                )
+            )
+            if plan:
+                self.changed = True
+                if self.module._diff:
+                    self.diff = plan.diff()
+
             # Reconcile
             if not self.module.check_mode and current_group:
 
@@ -308,37 +383,10 @@ class IAMGroup(ServicesModule):
                         group_name=self.name,
                         sync_membership_on_user_login=self.sync,
                     )
+                    self.mutations += 1
                     self.changed = True
 
-                if self.users is not None or self.purge:
-                    if self.client.manage_group_users(
-                        group_name=self.name,
-                        current_members=current_group.get("members", []),
-                        desired_users=self.users or [],
-                        purge=self.purge,
-                    ):
-                        self.changed = True
-
-                if self.roles is not None or self.purge:
-                    if self.client.manage_group_roles(
-                        group_name=self.name,
-                        current_roles=current_group.get("roles", []),
-                        desired_roles=self.roles or [],
-                        purge=self.purge,
-                    ):
-                        self.changed = True
-
-                if self.resource_roles is not None or self.purge:
-                    if self.client.manage_group_resource_roles(
-                        group_name=self.name,
-                        current_assignments=current_group.get(
-                            "resourceAssignments",
-                            [],
-                        ),
-                        desired_assignments=(self.resource_roles or []),
-                        purge=self.purge,
-                    ):
-                        self.changed = True
+                self.mutations += plan.apply(self.client, self.parallelism)
 
             if self.changed and not self.module.check_mode:
                 self.group = self.client.get_group_details(group_name=self.name)
@@ -352,8 +400,13 @@ def main():
     output: Dict[str, Any] = dict(
         changed=result.changed,
         group=result.group,
+        mutations=result.mutations,
+        elapsed=result.elapsed,
     )
 
+    if result.diff:
+        output.update(diff=result.diff)
+
     if result.debug_log:
         output.update(
             sdk_out=result.log_out,
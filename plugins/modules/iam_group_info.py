@@ -153,6 +153,7 @@ from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
+    CdpIamSnapshot,
 )
 
 
@@ -195,14 +196,9 @@ class IAMGroupInfo(ServicesModule):
                     if group_details:
                         self.groups.append(group_details)
             else:
-                result = self.client.list_groups()
-                basic_groups = result.get("groups", [])
-                self.groups = []
-                for group in basic_groups:
-                    group_name = group.get("groupName")
-                    group_details = self.client.get_group_details(group_name)
-                    if group_details:
-                        self.groups.append(group_details)
+                # Answer from a single IAM snapshot rather than per-group lookups
+                snapshot = CdpIamSnapshot(self.client)
+                self.groups = snapshot.group_details(snapshot.groups)
         else:
             result = self.client.list_groups(group_names=self.name)
             self.groups = result.get("groups", [])
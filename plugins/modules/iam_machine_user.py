@@ -40,6 +40,14 @@ options:
     type: bool
     required: False
     default: False
+  parallelism:
+    description:
+      - The maximum number of role changes to make at once.
+      - All changes are planned before any is made, so check mode and diff mode only read the current state.
+      - If V(1), the changes are made one after another.
+    type: int
+    required: False
+    default: 1
   resource_roles:
     description:
       - A list of resource role assignments.
@@ -181,8 +189,12 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     ServicesModule,
 )
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpMutationError,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
+    CdpIamPlan,
 )
 
 
@@ -216,6 +228,7 @@ class IAMMachineUser(ServicesModule):
                     ),
                 ),
                 purge=dict(required=False, type="bool", default=False),
+                parallelism=dict(required=False, type="int", default=1),
             ),
             supports_check_mode=True,
         )
@@ -226,14 +239,27 @@ class IAMMachineUser(ServicesModule):
         self.roles = self.get_param("roles")
         self.resource_roles = self.get_param("resource_roles")
         self.purge = self.get_param("purge")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.machine_user = {}
         self.changed = False
+        self.diff = {}
 
         # Initialize client
         self.client = CdpIamClient(api_client=self.api_client)
 
+    def _apply(self, plan):
+        """Apply the planned changes, failing with the per-item errors."""
+        try:
+            plan.apply(self.client, self.parallelism)
+        except CdpMutationError as e:
+            self.module.fail_json(
+                msg=str(e),
+                errors=e.errors,
+                changed=self.changed or e.applied > 0,
+            )
+
     def process(self):
         current_machine_user = self.client.get_machine_user_details(
             machine_user_name=self.name,
@@ -262,28 +288,27 @@ class IAMMachineUser(ServicesModule):
                     )
                 self.changed = True
 
-            if not self.module.check_mode and current_machine_user:
+            # Plan the role changes; check and diff mode are served from the plan
+            plan = (
+                CdpIamPlan(CdpIamPlan.MACHINE_USER, self.name, self.purge)
+                .plan(
+                    "roles",
+                    (current_machine_user or {}).get("roles", []),
+                    self.roles,
+                )
+                .plan(
+                    "resource_roles",
+                    (current_machine_user or {}).get("resourceAssignments", []),
+                    self.resource_roles,
+                )
+            )
+            if plan:
+                self.changed = True
+                if self.module._diff:
+                    self.diff = plan.diff()
 
-                if self.roles is not None or self.purge:
-                    if self.client.manage_machine_user_roles(
-                        machine_user_name=self.name,
-                        current_roles=current_machine_user.get("roles", []),
-                        desired_roles=self.roles or [],
-                        purge=self.purge,
-                    ):
-                        self.changed = True
-
-                if self.resource_roles is not None or self.purge:
-                    if self.client.manage_machine_user_resource_roles(
-                        machine_user_name=self.name,
-                        current_assignments=current_machine_user.get(
-                            "resourceAssignments",
-                            [],
-                        ),
-                        desired_assignments=(self.resource_roles or []),
-                        purge=self.purge,
-                    ):
-                        self.changed = True
+                if not self.module.check_mode and current_machine_user:
+                    self._apply(plan)
 
             if self.changed and not self.module.check_mode:
                 self.machine_user = self.client.get_machine_user_details(
@@ -306,6 +331,9 @@ def main():
         machine_user=result.machine_user,
     )
 
+    if result.diff:
+        output.update(diff=result.diff)
+
     if result.debug_log:
         output.update(
             sdk_out=result.log_out,
@@ -68,6 +68,14 @@ options:
     type: bool
     required: False
     default: False
+  parallelism:
+    description:
+      - The maximum number of group membership and role changes to make at once.
+      - All changes are planned before any is made, so check mode and diff mode only read the current state.
+      - If V(1), the changes are made one after another.
+    type: int
+    required: False
+    default: 1
   resource_roles:
     description:
       - A list of resource role assignments.
@@ -136,6 +144,28 @@ options:
     required: False
     aliases:
       - user
+  user_index:
+    description:
+      - Whether to persist the index of the users of the tenant on disk, so later tasks and runs can reuse it.
+      - Without it, users are indexed in memory for the current task only.
+      - Users are looked up in the index by O(email); a lookup that is not found in a persisted index reads the users of the tenant again.
+      - A user found in a persisted index is confirmed before it is changed.
+    type: bool
+    required: False
+    default: False
+  user_index_dir:
+    description:
+      - The directory in which the user index is persisted.
+      - The index holds the email addresses of the users, so the directory and its files are created readable by the owner only.
+    type: path
+    required: False
+    default: ~/.cache/cloudera.cloud/users
+  user_index_ttl:
+    description:
+      - The number of seconds for which a persisted user index is reused.
+    type: int
+    required: False
+    default: 300
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
 """
@@ -284,10 +314,14 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     ServicesModule,
-    diff_dict,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpMutationError,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
+    CdpIamUserIndex,
+    CdpIamPlan,
 )
 
 
@@ -341,6 +375,14 @@ class IAMUser(ServicesModule):
                     ),
                 ),
                 purge=dict(required=False, type="bool", default=False),
+                parallelism=dict(required=False, type="int", default=1),
+                user_index=dict(required=False, type="bool", default=False),
+                user_index_dir=dict(
+                    required=False,
+                    type="path",
+                    default="~/.cache/cloudera.cloud/users",
+                ),
+                user_index_ttl=dict(required=False, type="int", default=300),
             ),
             required_one_of=[
                 ["user_id", "email"],
@@ -364,6 +406,7 @@ class IAMUser(ServicesModule):
         self.roles = self.get_param("roles")
         self.resource_roles = self.get_param("resource_roles")
         self.purge = self.get_param("purge")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize return values
         self.user = {}
@@ -373,6 +416,17 @@ class IAMUser(ServicesModule):
         # Initialize client
         self.client = CdpIamClient(api_client=self.api_client)
 
+        # Persist the user index, if requested
+        if self.get_param("user_index"):
+            self.client.use_user_index(
+                path=CdpIamUserIndex.file_for(
+                    self.get_param("user_index_dir"),
+                    self.endpoint,
+                    self.access_key,
+                ),
+                ttl=self.get_param("user_index_ttl"),
+            )
+
     def _find_existing_user(self):
         if self.email:
             user = self.client.get_user_details_by_email(email=self.email)
@@ -381,6 +435,28 @@ class IAMUser(ServicesModule):
             return user
         return self.client.get_user_details(user_id=self.user_id)
 
+    def _plan(self, user):
+        """Plan the membership and role changes to the user, without making them."""
+        return CdpIamPlan.for_user(
+            self.client,
+            user,
+            groups=self.groups,
+            roles=self.roles,
+            resource_roles=self.resource_roles,
+            purge=self.purge,
+        )
+
+    def _apply(self, plan):
+        """Apply the planned changes, failing with the per-item errors."""
+        try:
+            plan.apply(self.client, self.parallelism)
+        except CdpMutationError as e:
+            self.module.fail_json(
+                msg=str(e),
+                errors=e.errors,
+                changed=self.changed or e.applied > 0,
+            )
+
     def process(self):
         existing_user = self._find_existing_user()
 
@@ -399,18 +475,18 @@ class IAMUser(ServicesModule):
             if not existing_user:
                 idp_user_id = self.identity_provider_user_id or self.email
 
+                # Plan, and check the groups exist, before creating the user
+                plan = self._plan(None)
+
+                self.changed = True
+
                 if self.module._diff:
                     expected_user = {"email": self.email}
                     if self.first_name:
                         expected_user["first_name"] = self.first_name
                     if self.last_name:
                         expected_user["last_name"] = self.last_name
-                    if self.groups:
-                        expected_user["groups"] = self.groups
-                    if self.roles:
-                        expected_user["roles"] = self.roles
-                    if self.resource_roles:
-                        expected_user["resource_assignments"] = self.resource_roles
+                    expected_user.update(plan.after)
                     self.diff = {"before": {}, "after": expected_user}
 
                 if not self.module.check_mode:
@@ -425,32 +501,8 @@ class IAMUser(ServicesModule):
                         user_id=response.get("user", {}).get("userId"),
                     )
 
-                    if self.groups is not None or self.purge:
-                        self.client.manage_user_groups(
-                            user_id=created_user.get("userId"),
-                            current_groups=created_user.get("groups", []),
-                            desired_groups=self.groups or [],
-                            purge=self.purge,
-                        )
-
-                    if self.roles is not None or self.purge:
-                        self.client.manage_user_roles(
-                            user_id=created_user.get("userId"),
-                            current_roles=created_user.get("roles", []),
-                            desired_roles=self.roles or [],
-                            purge=self.purge,
-                        )
-
-                    if self.resource_roles is not None or self.purge:
-                        self.client.manage_user_resource_roles(
-                            user_id=created_user.get("userId"),
-                            current_assignments=created_user.get(
-                                "resourceAssignments",
-                                [],
-                            ),
-                            desired_assignments=self.resource_roles or [],
-                            purge=self.purge,
-                        )
+                    plan.name = created_user.get("userId")
+                    self._apply(plan)
 
                     if self.workload_password is not None:
                         self.client.set_workload_password(
@@ -462,116 +514,29 @@ class IAMUser(ServicesModule):
                         user_id=created_user.get("userId"),
                     )
 
-                self.changed = True
-
             else:
-                if self.module.check_mode:
-                    expected_user = dict(existing_user)
-
-                    if self.groups is not None:
-                        expected_user["groups"] = (
-                            self.groups
-                            if self.purge
-                            else list(
-                                set(existing_user.get("groups", []) + self.groups),
-                            )
-                        )
-                    elif self.purge:
-                        expected_user["groups"] = []
-
-                    if self.roles is not None:
-                        expected_user["roles"] = (
-                            self.roles
-                            if self.purge
-                            else list(
-                                set(existing_user.get("roles", []) + self.roles),
-                            )
-                        )
-                    elif self.purge:
-                        expected_user["roles"] = []
-
-                    if self.resource_roles is not None:
-                        expected_user["resourceAssignments"] = (
-                            self.resource_roles
-                            if self.purge
-                            else existing_user.get("resourceAssignments", [])
-                            + self.resource_roles
-                        )
-                    elif self.purge:
-                        expected_user["resourceAssignments"] = []
-
-                    exclude_keys = CdpIamClient.get_user_diff_exclude_keys()
-                    prev_diff, next_diff = diff_dict(
-                        camel_dict_to_snake_dict(existing_user),
-                        camel_dict_to_snake_dict(expected_user),
-                        exclude_keys=exclude_keys,
-                    )
+                # Check and diff mode are served from the plan
+                plan = self._plan(existing_user)
 
-                    if prev_diff or next_diff or self.workload_password is not None:
-                        self.changed = True
-                        if self.module._diff and (prev_diff or next_diff):
-                            self.diff = {"before": prev_diff, "after": next_diff}
+                if plan or self.workload_password is not None:
+                    self.changed = True
+                if self.module._diff and plan:
+                    self.diff = plan.diff()
 
+                if self.module.check_mode or not self.changed:
                     self.user = existing_user
-
                 else:
-                    original_user = dict(existing_user)
-
-                    if self.groups is not None or self.purge:
-                        if self.client.manage_user_groups(
-                            user_id=existing_user.get("userId"),
-                            current_groups=existing_user.get("groups", []),
-                            desired_groups=self.groups or [],
-                            purge=self.purge,
-                        ):
-                            self.changed = True
-
-                    if self.roles is not None or self.purge:
-                        if self.client.manage_user_roles(
-                            user_id=existing_user.get("userId"),
-                            current_roles=existing_user.get("roles", []),
-                            desired_roles=self.roles or [],
-                            purge=self.purge,
-                        ):
-                            self.changed = True
-
-                    if self.resource_roles is not None or self.purge:
-                        if self.client.manage_user_resource_roles(
-                            user_id=existing_user.get("userId"),
-                            current_assignments=existing_user.get(
-                                "resourceAssignments",
-                                [],
-                            ),
-                            desired_assignments=(self.resource_roles or []),
-                            purge=self.purge,
-                        ):
-                            self.changed = True
+                    self._apply(plan)
 
                     if self.workload_password is not None:
                         self.client.set_workload_password(
                             password=self.workload_password,
                             actor_crn=existing_user.get("crn"),
                         )
-                        self.changed = True
 
-                    if self.changed:
-                        updated_user = self.client.get_user_details(
-                            user_id=existing_user.get("userId"),
-                        )
-
-                        if self.module._diff:
-                            exclude_keys = CdpIamClient.get_user_diff_exclude_keys()
-                            prev_diff, next_diff = diff_dict(
-                                camel_dict_to_snake_dict(original_user),
-                                camel_dict_to_snake_dict(updated_user),
-                                exclude_keys=exclude_keys,
-                            )
-                            if prev_diff or next_diff:
-                                self.diff = {"before": prev_diff, "after": next_diff}
-
-                        self.user = updated_user
-                    else:
-                        self.user = existing_user
+                    self.user = self.client.get_user_details(
+                        user_id=existing_user.get("userId"),
+                    )
 
         self.user = camel_dict_to_snake_dict(self.user)
 
@@ -67,6 +67,37 @@ options:
     choices:
       - summary
       - full
+  parallelism:
+    description:
+      - The maximum number of users whose details are fetched concurrently when O(view=full).
+      - Each user requires several API calls, so raising this value greatly reduces the run time for large numbers of users.
+      - Users are returned in the same order regardless of this setting.
+      - V(1) fetches the details of each user sequentially.
+    type: int
+    required: False
+    default: 1
+  user_index:
+    description:
+      - Whether to persist the index of the users of the tenant on disk, so later tasks and runs can reuse it.
+      - Without it, users are indexed in memory for the current task only.
+      - Users are looked up in the index by O(name); a lookup that is not found in a persisted index reads the users of the tenant again.
+      - A persisted index may include users removed within O(user_index_ttl) seconds.
+    type: bool
+    required: False
+    default: False
+  user_index_dir:
+    description:
+      - The directory in which the user index is persisted.
+      - The index holds the email addresses of the users, so the directory and its files are created readable by the owner only.
+    type: path
+    required: False
+    default: ~/.cache/cloudera.cloud/users
+  user_index_ttl:
+    description:
+      - The number of seconds for which a persisted user index is reused.
+    type: int
+    required: False
+    default: 300
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
 """
@@ -94,6 +125,11 @@ EXAMPLES = r"""
 # Gather detailed information about the current user
 - cloudera.cloud.iam_user_info:
     current_user: true
+
+# Gather detailed information about all users, eight users at a time
+- cloudera.cloud.iam_user_info:
+    parallelism: 8
+    pool_size: 8
 """
 
 RETURN = r"""
@@ -188,11 +224,16 @@ sdk_out_lines:
 
 from typing import Any, Dict
 
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    concurrent_requests,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     ServicesModule,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
+    CdpIamUserIndex,
+    CdpIamSnapshot,
 )
 
 
@@ -226,6 +267,18 @@ class IAMUserInfo(ServicesModule):
                     choices=["summary", "full"],
                     default="full",
                 ),
+                parallelism=dict(
+                    required=False,
+                    type="int",
+                    default=1,
+                ),
+                user_index=dict(required=False, type="bool", default=False),
+                user_index_dir=dict(
+                    required=False,
+                    type="path",
+                    default="~/.cache/cloudera.cloud/users",
+                ),
+                user_index_ttl=dict(required=False, type="int", default=300),
             ),
             mutually_exclusive=[
                 ["name", "current_user"],
@@ -243,6 +296,7 @@ class IAMUserInfo(ServicesModule):
         self.user_id = self.get_param("user_id")
         self.filter = self.get_param("filter")
         self.view = self.get_param("view")
+        self.parallelism = self.get_param("parallelism")
 
         # Initialize the return values
         self.users = []
@@ -250,7 +304,22 @@ class IAMUserInfo(ServicesModule):
         # Initialize client
         self.client = CdpIamClient(api_client=self.api_client)
 
+        # Persist the user index, if requested
+        if self.get_param("user_index"):
+            self.client.use_user_index(
+                path=CdpIamUserIndex.file_for(
+                    self.get_param("user_index_dir"),
+                    self.endpoint,
+                    self.access_key,
+                ),
+                ttl=self.get_param("user_index_ttl"),
+            )
+
     def process(self):
+        # Queries spanning the tenant are answered from a single IAM snapshot,
+        # while targeted lookups fetch each user's details directly
+        snapshot = None
+
         if self.current_user:
             user = self.client.get_user()
             if user:
@@ -261,24 +330,29 @@ class IAMUserInfo(ServicesModule):
             self.users = result.get("users", [])
 
         elif self.name:
-            result = self.client.list_users()
-            user_list = result.get("users", [])
-            for user in user_list:
-                if user.get("workloadUsername") in self.name:
-                    self.users.append(user)
+            self.users = self.client.find_users("workloadUsername", self.name)
 
         elif self.filter is not None:
+            snapshot = CdpIamSnapshot(self.client, parallelism=self.parallelism)
             self.users = self.client.list_users_filtered(self.filter)
 
         else:
-            result = self.client.list_users()
-            self.users = result.get("users", [])
+            snapshot = CdpIamSnapshot(self.client, parallelism=self.parallelism)
+            self.users = snapshot.users
 
         if self.view == "full":
+            if snapshot is not None:
+                user_details = snapshot.user_details(self.users)
+            else:
+                user_details = concurrent_requests(
+                    self.api_client,
+                    self.client.get_user_details,
+                    [user.get("userId") for user in self.users],
+                    parallelism=self.parallelism,
+                )
+
             details = []
-            for user in self.users:
-                uid = user.get("userId")
-                detail = self.client.get_user_details(uid)
+            for detail in user_details:
                 if detail:
                     # Rename resourceAssignments to resource_roles for backward compatibility
                     if "resourceAssignments" in detail:
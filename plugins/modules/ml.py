@@ -388,6 +388,8 @@ options:
     description:
       - The internal polling interval (in seconds) while the module waits for the ML Workspace to achieve the declared
         state.
+      - The interval adapts to the ML Workspace, shortening after each state change and lengthening, up to this value,
+        while the state is unchanged.
     type: int
     required: False
     default: 15
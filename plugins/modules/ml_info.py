@@ -49,6 +49,28 @@ options:
     required: False
     aliases:
       - workspace_crn
+  parallelism:
+    description:
+      - The maximum number of Workspaces to describe at once when listing Workspaces.
+      - If V(1), the Workspaces are described one after another.
+    type: int
+    required: False
+    default: 1
+  summary:
+    description:
+      - Whether to return the Workspace entries of the list call rather than describing each Workspace.
+      - The entries carry fewer details than a description, but need a single API call.
+      - Only used when listing Workspaces.
+    type: bool
+    required: False
+    default: False
+  summary_fields:
+    description:
+      - The fields each Workspace entry must carry when O(summary=true).
+      - Workspaces whose list entry lacks any of these fields are described instead.
+    type: list
+    elements: str
+    required: False
 extends_documentation_fragment:
   - cloudera.cloud.cdp_client
 """
@@ -67,6 +89,17 @@ EXAMPLES = r"""
 - name: Gather detailed information about a named Workspace using a CRN
   cloudera.cloud.ml_info:
     crn: example-workspace-crn
+
+- name: Describe all Workspaces, four at a time
+  cloudera.cloud.ml_info:
+    parallelism: 4
+
+- name: List the status of all Workspaces without describing each one
+  cloudera.cloud.ml_info:
+    summary: true
+    summary_fields:
+      - instanceName
+      - instanceStatus
 """
 
 RETURN = r"""
@@ -284,6 +317,9 @@ class MLInfo(ServicesModule):
                 name=dict(required=False, type="str", aliases=["workspace"]),
                 environment=dict(required=False, type="str", aliases=["env"]),
                 crn=dict(required=False, type="str", aliases=["workspace_crn"]),
+                parallelism=dict(required=False, type="int", default=1),
+                summary=dict(required=False, type="bool", default=False),
+                summary_fields=dict(required=False, type="list", elements="str"),
             ),
             supports_check_mode=True,
             required_by={"name": ["environment"]},
@@ -293,6 +329,9 @@ class MLInfo(ServicesModule):
         self.name = self.get_param("name")
         self.env = self.get_param("environment")
         self.crn = self.get_param("crn")
+        self.parallelism = self.get_param("parallelism")
+        self.summary = self.get_param("summary")
+        self.summary_fields = self.get_param("summary_fields")
 
         # Initialize return values
         self.workspaces = []
@@ -311,7 +350,12 @@ class MLInfo(ServicesModule):
             if workspace_single is not None:
                 self.workspaces.append(workspace_single.get("workspace", []))
         else:
-            self.workspaces = client.describe_all_workspaces(self.env)
+            self.workspaces = client.describe_all_workspaces(
+                self.env,
+                parallelism=self.parallelism,
+                summary=self.summary,
+                summary_fields=self.summary_fields,
+            )
 
 
 def main():
@@ -16,17 +16,21 @@
 
 import os
 
+import datetime
 import json
 import pytest
+import ssl
+import threading
 import time
 import warnings
 
 from email.utils import formatdate
 from functools import wraps
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from urllib.parse import urlencode, urlparse
 from urllib.error import HTTPError, URLError
 from http.client import HTTPResponse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from ansible.module_utils.urls import Request
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
@@ -392,3 +396,131 @@ class CdpTestClient(CdpClient):
                 private_key=self.private_key,
             ),
         )
+
+
+def create_self_signed_cert(directory: str) -> Tuple[str, str]:
+    """Write a self-signed certificate and key for C(localhost) to a directory."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+
+    cert_path = os.path.join(directory, "stub.crt")
+    key_path = os.path.join(directory, "stub.key")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.TraditionalOpenSSL,
+                serialization.NoEncryption(),
+            ),
+        )
+    return cert_path, key_path
+
+
+class StubCdpServer:
+    """Local HTTP(S) stub of the CDP API for transport-level tests and benchmarks.
+
+    Every request is answered by C(responder), a callable receiving the method,
+    path, headers, and body and returning a C((status, headers, body)) tuple.
+    The server speaks HTTP/1.1 with keep-alive and counts the connections (and
+    therefore TLS handshakes) it accepts, the requests it serves, and the bytes
+    it receives and sends.
+    """
+
+    def __init__(
+        self,
+        responder: Callable[
+            [str, str, Dict[str, str], bytes], Tuple[int, Dict[str, str], bytes]
+        ],
+        cert_dir: Optional[str] = None,
+    ):
+        stub = self
+        self.responder = responder
+        self.connections = 0
+        self.requests = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, headers, payload = stub.responder(
+                    self.command,
+                    self.path,
+                    dict(self.headers),
+                    body,
+                )
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_received += len(body)
+                    stub.bytes_sent += len(payload)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.server.daemon_threads = True
+        self.scheme = "http"
+
+        if cert_dir is not None:
+            cert_path, key_path = create_self_signed_cert(cert_dir)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_path, key_path)
+            self.server.socket = context.wrap_socket(
+                self.server.socket,
+                server_side=True,
+            )
+            self.scheme = "https"
+
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"{self.scheme}://localhost:{self.server.server_address[1]}"
+
+    def __enter__(self) -> "StubCdpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
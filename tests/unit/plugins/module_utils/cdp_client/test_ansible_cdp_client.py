@@ -25,6 +25,7 @@ from ansible_collections.cloudera.cloud.tests.unit import AnsibleFailJson
 
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     AnsibleCdpClient,
+    CdpError,
 )
 
 BASE_URL = "https://cloudera.internal/api"
@@ -112,7 +113,7 @@ def test_make_request_http_200(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -152,7 +153,7 @@ def test_make_request_http_204(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -184,7 +185,7 @@ def test_make_request_http_401(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -217,7 +218,7 @@ def test_make_request_http_403(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -256,7 +257,7 @@ def test_make_request_http_404(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -291,7 +292,7 @@ def test_make_request_http_500_with_retry(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -335,7 +336,7 @@ def test_make_request_http_429_with_retry(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -374,7 +375,7 @@ def test_make_request_connection_error_with_retry(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -416,7 +417,7 @@ def test_make_request_empty_response(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -446,7 +447,7 @@ def test_make_request_json_decode_error(mock_ansible_module, mocker):
 
     # Mock the signature header generation
     mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.make_signature_header",
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
         return_value="mock_signature",
     )
 
@@ -461,3 +462,36 @@ def test_make_request_json_decode_error(mock_ansible_module, mocker):
 
     assert "response" in response
     assert response["response"] == "invalid json {"
+
+
+def test_make_request_raising_errors(mock_ansible_module, mocker):
+    """Test that failed requests raise rather than fail the module when requested."""
+
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_fetch_url.return_value = (None, {"status": 404, "msg": "Not Found"})
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=BASE_URL,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    with client.raising_errors():
+        with pytest.raises(CdpError, match="Not Found"):
+            client.post("/test/path")
+
+    mock_ansible_module.fail_json.assert_not_called()
+
+    # Outside the context, the module fails as before
+    with pytest.raises(AnsibleFailJson):
+        client.post("/test/path")
+
+    mock_ansible_module.fail_json.assert_called_once()
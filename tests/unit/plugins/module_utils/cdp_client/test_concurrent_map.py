@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import threading
+import time
+
+import pytest
+
+from ansible_collections.cloudera.cloud.tests.unit import (
+    AnsibleFailJson,
+    StubCdpServer,
+)
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    concurrent_calls,
+    concurrent_map,
+    concurrent_requests,
+)
+
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+
+def test_concurrent_map_preserves_order():
+    """Test that results follow input order even when workers finish out of order."""
+
+    def slow_for_small(value):
+        time.sleep(0.01 * (5 - value))
+        return value * 10
+
+    assert concurrent_map(slow_for_small, range(5), parallelism=5) == [
+        0,
+        10,
+        20,
+        30,
+        40,
+    ]
+
+
+def test_concurrent_map_bounded():
+    """Test that no more than the requested number of calls run at once."""
+
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def track(value):
+        with lock:
+            active.append(value)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(value)
+        return value
+
+    assert concurrent_map(track, range(12), parallelism=3) == list(range(12))
+    assert max(peak) <= 3
+
+
+def test_concurrent_map_sequential():
+    """Test that a parallelism of 1 runs every call in the calling thread."""
+
+    threads = concurrent_map(
+        lambda _: threading.current_thread(),
+        range(3),
+        parallelism=1,
+    )
+
+    assert threads == [threading.current_thread()] * 3
+
+
+def test_concurrent_map_raises_first_error():
+    """Test that the first failure in input order is re-raised."""
+
+    def fail_on_odd(value):
+        if value % 2:
+            raise ValueError(f"odd {value}")
+        return value
+
+    with pytest.raises(ValueError, match="odd 1"):
+        concurrent_map(fail_on_odd, range(6), parallelism=3)
+
+
+def test_concurrent_calls_collects_errors():
+    """Test that failures are returned in place and do not abort other calls."""
+
+    def fail():
+        raise ValueError("failed")
+
+    results = concurrent_calls(
+        [lambda: 1, fail, lambda: 3],
+        parallelism=3,
+    )
+
+    assert results[0] == (1, None)
+    assert results[1][0] is None
+    assert isinstance(results[1][1], ValueError)
+    assert results[2] == (3, None)
+
+
+def test_concurrent_calls_sequential():
+    """Test that without a timeout, a parallelism of 1 runs in the calling thread."""
+
+    results = concurrent_calls(
+        [threading.current_thread] * 2,
+        parallelism=1,
+    )
+
+    assert results == [(threading.current_thread(), None)] * 2
+
+
+def test_concurrent_calls_timeout():
+    """Test that a slow call is abandoned and its slot given to the next call."""
+
+    release = threading.Event()
+
+    def hang():
+        release.wait(5)
+        return "late"
+
+    start = time.monotonic()
+    results = concurrent_calls(
+        [hang, lambda: "second", lambda: "third"],
+        parallelism=1,
+        timeout=0.1,
+    )
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert isinstance(results[0][1], TimeoutError)
+    assert results[1:] == [("second", None), ("third", None)]
+    assert elapsed < 1
+
+
+def test_concurrent_calls_bounded():
+    """Test that no more than the requested number of calls run at once."""
+
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def track(value):
+        with lock:
+            active.append(value)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(value)
+        return value
+
+    results = concurrent_calls(
+        [lambda value=value: track(value) for value in range(12)],
+        parallelism=3,
+        timeout=5,
+    )
+
+    assert [result for result, _ in results] == list(range(12))
+    assert max(peak) <= 3
+
+
+def test_concurrent_requests_signed_independently(mock_ansible_module, mocker):
+    """Test that concurrent requests on one client each carry their own signature."""
+
+    def echo_auth(method, path, headers, body):
+        return (
+            200,
+            {"Content-Type": "application/json"},
+            json.dumps(
+                {"path": path, "auth": headers.get("x-altus-auth")},
+            ).encode("utf-8"),
+        )
+
+    def sign(method, url, headers):
+        # Yield to other threads between signing and sending
+        time.sleep(0.001)
+        return f"signed:{url}"
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        side_effect=sign,
+    )
+    mock_ansible_module.params.update(endpoint_tls=False)
+
+    with StubCdpServer(echo_auth) as server:
+        client = AnsibleCdpClient(
+            module=mock_ansible_module,
+            base_url=server.url,
+            access_key=ACCESS_KEY,
+            private_key=PRIVATE_KEY,
+            pool_size=4,
+        )
+
+        responses = concurrent_map(
+            lambda i: client.post(f"/api/v1/item/{i}", json_data={}),
+            range(20),
+            parallelism=4,
+        )
+
+    for i, response in enumerate(responses):
+        assert response["path"] == f"/api/v1/item/{i}"
+        assert response["auth"] == f"signed:{server.url}/api/v1/item/{i}"
+
+    # The shared headers are never signed in place
+    assert "x-altus-auth" not in client.headers
+
+
+def test_concurrent_requests_fail_once_from_calling_thread(
+    mock_ansible_module,
+    mocker,
+):
+    """Test that failed requests in workers fail the module once, from the calling thread."""
+
+    def responder(method, path, headers, body):
+        status = 400 if path.endswith(("/3", "/5")) else 200
+        return (
+            status,
+            {"Content-Type": "application/json"},
+            json.dumps({"path": path}).encode("utf-8"),
+        )
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+    failed_on = []
+
+    def fail_json(**kwargs):
+        failed_on.append(threading.current_thread())
+        raise AnsibleFailJson(kwargs)
+
+    mock_ansible_module.fail_json.side_effect = fail_json
+    mock_ansible_module.params.update(endpoint_tls=False)
+
+    with StubCdpServer(responder) as server:
+        client = AnsibleCdpClient(
+            module=mock_ansible_module,
+            base_url=server.url,
+            access_key=ACCESS_KEY,
+            private_key=PRIVATE_KEY,
+            pool_size=4,
+        )
+
+        with pytest.raises(AnsibleFailJson, match="/api/v1/item/3"):
+            concurrent_requests(
+                client,
+                lambda i: client.post(f"/api/v1/item/{i}", json_data={}),
+                range(8),
+                parallelism=4,
+            )
+
+    assert failed_on == [threading.main_thread()]
+
+
+def test_rate_limit_backoff_shared(mock_ansible_module, mocker):
+    """Test that a 429 on one request holds back other requests on the same client."""
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_resp = mocker.Mock()
+    mock_resp.read.return_value = b"{}"
+    mock_fetch_url.side_effect = [
+        (None, {"status": 429, "msg": "Too Many Requests"}),
+        (mock_resp, {"status": 200}),
+        (mock_resp, {"status": 200}),
+    ]
+    mock_sleep = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.sleep",
+    )
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url="https://cloudera.internal/api",
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    # The first request is rate limited, then succeeds on retry
+    assert client.post("/api/v1/first") == {}
+    assert mock_sleep.call_count == 1
+    assert 0 < mock_sleep.call_args.args[0] <= 0.5
+
+    # Still inside the cool-down (time.sleep is mocked), so the next request waits too
+    assert client.post("/api/v1/second") == {}
+    assert mock_sleep.call_count == 2
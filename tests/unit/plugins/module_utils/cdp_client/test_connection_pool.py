@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import http.client
+import json
+import socket
+import time
+
+import pytest
+
+from ansible_collections.cloudera.cloud.tests.unit import (
+    AnsibleFailJson,
+    StubCdpServer,
+)
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    CdpClient,
+    CdpConnectionPool,
+)
+
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+
+def json_responder(method, path, headers, body):
+    """Echo the request method and path back as JSON."""
+    return (
+        200,
+        {"Content-Type": "application/json"},
+        json.dumps({"method": method, "path": path}).encode("utf-8"),
+    )
+
+
+@pytest.fixture
+def stub_server(tmp_path):
+    with StubCdpServer(json_responder, cert_dir=str(tmp_path)) as server:
+        yield server
+
+
+@pytest.fixture
+def no_signature(mocker):
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+
+def test_pool_reuses_connection_across_verbs(stub_server):
+    """Test that all verbs share the single keep-alive connection."""
+
+    pool = CdpConnectionPool(max_size=1, validate_certs=False)
+
+    for method in ["GET", "POST", "PUT", "DELETE"]:
+        resp, info = pool.request(
+            method,
+            f"{stub_server.url}/api/v1/test",
+            headers={"Content-Type": "application/json"},
+            body="{}" if method in ["POST", "PUT"] else None,
+        )
+        assert info["status"] == 200
+        assert json.loads(resp.read()) == {"method": method, "path": "/api/v1/test"}
+
+    pool.close()
+
+    assert stub_server.connections == 1
+    assert pool.connections_opened == 1
+    assert pool.requests_sent == 4
+    assert pool.handshakes_avoided == 3
+
+
+def test_pool_error_status_returns_body(tmp_path):
+    """Test that error statuses are returned in the fetch_url info format."""
+
+    def responder(method, path, headers, body):
+        return 404, {"Content-Type": "application/json"}, b'{"message": "missing"}'
+
+    with StubCdpServer(responder, cert_dir=str(tmp_path)) as server:
+        pool = CdpConnectionPool(validate_certs=False)
+        resp, info = pool.request("POST", f"{server.url}/missing", headers={})
+        pool.close()
+
+    assert resp is None
+    assert info["status"] == 404
+    assert json.loads(info["body"]) == {"message": "missing"}
+    assert info["content-type"] == "application/json"
+
+
+def test_pool_discards_idle_connections(stub_server, mocker):
+    """Test that connections idle past the timeout are not reused."""
+
+    pool = CdpConnectionPool(max_size=1, idle_timeout=5, validate_certs=False)
+    mock_monotonic = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.monotonic",
+    )
+
+    mock_monotonic.return_value = 100.0
+    pool.request("GET", f"{stub_server.url}/first", headers={})
+
+    mock_monotonic.return_value = 110.0
+    pool.request("GET", f"{stub_server.url}/second", headers={})
+    pool.close()
+
+    assert pool.connections_opened == 2
+    assert pool.handshakes_avoided == 0
+
+
+def test_pool_reconnects_when_server_closes(tmp_path):
+    """Test that a connection closed by the server is replaced transparently."""
+
+    def responder(method, path, headers, body):
+        return 200, {"Connection": "close"}, b"{}"
+
+    with StubCdpServer(responder, cert_dir=str(tmp_path)) as server:
+        pool = CdpConnectionPool(validate_certs=False)
+        for _ in range(3):
+            resp, info = pool.request("GET", f"{server.url}/closing", headers={})
+            assert info["status"] == 200
+        pool.close()
+
+    assert server.connections == 3
+    assert pool.handshakes_avoided == 0
+
+
+def fake_connection(mocker, error=None, on="getresponse"):
+    """Return a connection that answers 200, or raises the error from the given call."""
+    conn = mocker.Mock()
+    conn.getresponse.return_value.read.return_value = b"{}"
+    conn.getresponse.return_value.status = 200
+    conn.getresponse.return_value.will_close = True
+    conn.getresponse.return_value.getheaders.return_value = []
+    if error is not None:
+        if on == "read":
+            conn.getresponse.return_value.read.side_effect = error
+        else:
+            getattr(conn, on).side_effect = error
+    return conn
+
+
+@pytest.mark.parametrize(
+    "error,on",
+    [
+        (http.client.RemoteDisconnected("closed"), "getresponse"),
+        (BrokenPipeError(), "request"),
+        (ConnectionResetError(), "request"),
+    ],
+)
+def test_pool_retries_stale_connection(mocker, error, on):
+    """Test that a request on a closed keep-alive connection is sent again once."""
+
+    pool = CdpConnectionPool(validate_certs=False)
+    stale = fake_connection(mocker, error, on)
+    fresh = fake_connection(mocker)
+    mocker.patch.object(pool, "_acquire", return_value=(stale, True))
+    mocker.patch.object(pool, "_connect", return_value=fresh)
+
+    resp, info = pool.request("POST", "https://cloudera.internal/create", {}, "{}")
+
+    assert info["status"] == 200
+    stale.close.assert_called_once()
+    fresh.request.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "error,on",
+    [
+        (socket.timeout("timed out"), "getresponse"),
+        (socket.timeout("timed out"), "request"),
+        (ConnectionResetError(), "read"),
+        (http.client.IncompleteRead(b""), "read"),
+    ],
+)
+def test_pool_does_not_resend_after_timeout_or_response(mocker, error, on):
+    """Test that a request the server may have processed is never sent again."""
+
+    pool = CdpConnectionPool(validate_certs=False)
+    reused = fake_connection(mocker, error, on)
+    mocker.patch.object(pool, "_acquire", return_value=(reused, True))
+    connect = mocker.patch.object(pool, "_connect")
+
+    with pytest.raises(type(error)):
+        pool.request("POST", "https://cloudera.internal/create", {}, "{}")
+
+    reused.request.assert_called_once()
+    reused.close.assert_called_once()
+    connect.assert_not_called()
+
+
+def test_client_pool_reused_across_pages(
+    stub_server,
+    mock_ansible_module,
+    no_signature,
+):
+    """Test that paginated calls through AnsibleCdpClient reuse one connection."""
+
+    pages = iter(
+        [
+            {"items": [1, 2], "nextToken": "a"},
+            {"items": [3, 4], "nextToken": "b"},
+            {"items": [5]},
+        ],
+    )
+    stub_server.responder = lambda m, p, h, b: (
+        200,
+        {},
+        json.dumps(next(pages)).encode(),
+    )
+
+    mock_ansible_module.params = {"endpoint_tls": False}
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=stub_server.url,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+        pool_size=1,
+    )
+
+    class TestClient(CdpClient):
+        @CdpClient.paginated()
+        def list_items(self, pageToken=None, pageSize=None):
+            return client.post("/api/v1/test/listItems", json_data={})
+
+    response = TestClient().list_items()
+    client.pool.close()
+
+    assert response["items"] == [1, 2, 3, 4, 5]
+    assert stub_server.requests == 3
+    assert stub_server.connections == 1
+
+
+def test_client_does_not_resend_timed_out_create(
+    stub_server,
+    mock_ansible_module,
+    no_signature,
+):
+    """Test that a create call whose response times out is not sent again."""
+
+    received = []
+
+    def slow_responder(method, path, headers, body):
+        received.append(path)
+        time.sleep(1)
+        return (200, {}, b"{}")
+
+    stub_server.responder = slow_responder
+
+    mock_ansible_module.params = {"endpoint_tls": False}
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=stub_server.url,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+        timeout_seconds=0.2,
+        pool_size=1,
+    )
+
+    with pytest.raises(AnsibleFailJson):
+        client.post("/api/v1/dw/createVw", json_data={"name": "vw"})
+    client.pool.close()
+
+    assert received == ["/api/v1/dw/createVw"]
+
+
+def test_client_without_pool_uses_fetch_url(mock_ansible_module, mocker):
+    """Test that the fetch_url transport remains the default."""
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url="https://cloudera.internal/api",
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    assert client.pool is None
+
+
+@pytest.mark.slow
+def test_benchmark_pool_handshakes(
+    tmp_path,
+    mock_ansible_module,
+    no_signature,
+    mocker,
+    capsys,
+):
+    """Benchmark handshakes and wall time for pooled versus per-request connections."""
+
+    requests = 200
+
+    with StubCdpServer(json_responder, cert_dir=str(tmp_path)) as server:
+        mock_ansible_module.params = {"endpoint_tls": False, "validate_certs": False}
+
+        results = {}
+        for label, pool_size in [("fetch_url", 0), ("pooled", 1)]:
+            connections_before = server.connections
+            client = AnsibleCdpClient(
+                module=mock_ansible_module,
+                base_url=server.url,
+                access_key=ACCESS_KEY,
+                private_key=PRIVATE_KEY,
+                pool_size=pool_size,
+            )
+
+            start = time.perf_counter()
+            for _ in range(requests):
+                client.post("/api/v1/test/describe", json_data={})
+            elapsed = time.perf_counter() - start
+
+            if client.pool is not None:
+                client.pool.close()
+
+            results[label] = (server.connections - connections_before, elapsed)
+
+    with capsys.disabled():
+        print()
+        for label, (handshakes, elapsed) in results.items():
+            print(
+                f"{label:>10}: {requests} requests, {handshakes} TLS handshakes, "
+                f"{elapsed:.3f}s ({elapsed / requests * 1000:.2f} ms/request)",
+            )
+        print(
+            f"handshakes avoided: {results['fetch_url'][0] - results['pooled'][0]}",
+        )
+
+    assert results["fetch_url"][0] == requests
+    assert results["pooled"][0] == 1
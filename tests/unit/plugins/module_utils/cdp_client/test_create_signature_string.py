@@ -40,7 +40,7 @@ def test_create_signature_string_basic(mocker):
     mock_private_key.sign.return_value = mock_signature
 
     mock_ed25519_class = mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.ed25519.Ed25519PrivateKey",
+        "cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey",
     )
     mock_ed25519_class.from_private_bytes.return_value = mock_private_key
 
@@ -99,7 +99,7 @@ def test_create_signature_string_empty_canonical_string(mocker):
     mock_private_key.sign.return_value = mock_signature
 
     mock_ed25519_class = mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.ed25519.Ed25519PrivateKey",
+        "cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey",
     )
     mock_ed25519_class.from_private_bytes.return_value = mock_private_key
 
@@ -133,7 +133,7 @@ def test_create_signature_string_unicode_canonical_string(mocker):
     mock_private_key.sign.return_value = mock_signature
 
     mock_ed25519_class = mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.ed25519.Ed25519PrivateKey",
+        "cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey",
     )
     mock_ed25519_class.from_private_bytes.return_value = mock_private_key
 
@@ -170,7 +170,7 @@ def test_create_signature_string_whitespace_handling(mocker):
     mock_private_key.sign.return_value = mock_signature
 
     mock_ed25519_class = mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.ed25519.Ed25519PrivateKey",
+        "cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey",
     )
     mock_ed25519_class.from_private_bytes.return_value = mock_private_key
 
@@ -228,7 +228,7 @@ def test_create_signature_string_crypto_error(mocker):
 
     # Mock Ed25519 to raise an exception during key creation
     mock_ed25519_class = mocker.patch(
-        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.ed25519.Ed25519PrivateKey",
+        "cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey",
     )
     mock_ed25519_class.from_private_bytes.side_effect = ValueError(
         "Invalid key material",
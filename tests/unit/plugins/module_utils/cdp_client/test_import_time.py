@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins import modules
+
+# Modules loaded on first use rather than when a module is imported
+LAZY_MODULES = ("cryptography", "ansible.module_utils.urls", "cdpy.cdpy")
+
+# Import time budget of a module, on top of ansible.module_utils.basic, in ms
+IMPORT_BUDGET_MS = 75
+
+COLLECTION = "ansible_collections.cloudera.cloud"
+
+
+def services_modules():
+    """Return the names of the modules built on ServicesModule."""
+    directory = next(iter(modules.__path__))
+    names = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        with open(os.path.join(directory, filename)) as source:
+            if "(ServicesModule)" in source.read():
+                names.append(filename[:-3])
+    return names
+
+
+def run_python(*args):
+    """Run a Python interpreter with the collection importable."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time_ms(module):
+    """Return the cumulative import time of a module as reported by -X importtime."""
+    result = run_python(
+        "-X",
+        "importtime",
+        "-c",
+        f"import ansible.module_utils.basic; import {module}",
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise AssertionError(f"No import time reported for {module}")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        f"{COLLECTION}.plugins.module_utils.cdp_client",
+        f"{COLLECTION}.plugins.module_utils.common",
+        f"{COLLECTION}.plugins.modules.dw_connector",
+        f"{COLLECTION}.plugins.modules.iam_user_info",
+    ],
+)
+def test_import_is_lazy(module):
+    """Test importing a module does not load the lazily imported dependencies."""
+
+    result = run_python(
+        "-c",
+        f"import sys; import {module}; print('\\n'.join(sys.modules))",
+    )
+    loaded = result.stdout.splitlines()
+
+    assert module in loaded
+    assert [m for m in loaded if m.startswith(LAZY_MODULES)] == []
+
+
+@pytest.mark.slow
+def test_benchmark_import_time(capsys):
+    """Benchmark the import time of every ServicesModule-based module."""
+
+    times = {
+        name: import_time_ms(f"{COLLECTION}.plugins.modules.{name}")
+        for name in services_modules()
+    }
+
+    with capsys.disabled():
+        print()
+        for name, elapsed in sorted(times.items(), key=lambda item: -item[1]):
+            print(f"{name}: {elapsed:.1f} ms")
+        print(f"budget: {IMPORT_BUDGET_MS} ms")
+
+    assert times
+    assert {name: t for name, t in times.items() if t > IMPORT_BUDGET_MS} == {}
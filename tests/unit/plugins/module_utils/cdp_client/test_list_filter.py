@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+    CdpListFilter,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_de import CdpDeClient
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import CdpDfClient
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import CdpDwClient
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_ml import CdpMlClient
+
+ACCOUNT = "crn:cdp:df:us-west-1:altus"
+ENV_ACCOUNT = "crn:cdp:environments:us-west-1:altus"
+
+SERVICES = [
+    {
+        "name": f"env-{i:03d}",
+        "crn": f"{ACCOUNT}:service:{i}",
+        "environmentCrn": f"{ENV_ACCOUNT}:environment:env-{i:03d}",
+        "status": {"state": "GOOD_HEALTH"},
+    }
+    for i in range(250)
+]
+
+DEPLOYMENTS = [
+    {"name": name, "crn": f"{ACCOUNT}:deployment:{name}"}
+    for name in ["etl-2", "etl", "ingest", "etl-archive"]
+    + [f"d-{i}" for i in range(96)]
+]
+
+
+class ApiStub:
+    """
+    Stub of the CDP list endpoints, recording each request and the bytes
+    of each response.
+
+    The DataFlow endpoints paginate, and filter by C(searchTerm) as any part
+    of the name, like the API does.
+    """
+
+    LISTS = {
+        "/api/v1/df/listServices": ("services", SERVICES),
+        "/api/v1/df/listDeployments": ("deployments", DEPLOYMENTS),
+    }
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.requests = []
+        self.bytes = 0
+
+    def post(self, path, data=None, json_data=None, squelch=None):
+        body = data if data is not None else json_data
+        self.requests.append((path, dict(body or {})))
+
+        if path in self.LISTS:
+            key, entries = self.LISTS[path]
+            term = body.get("searchTerm")
+            if term is not None:
+                entries = [e for e in entries if term in e["name"]]
+            start = int(body.get("startingToken") or 0)
+            size = body.get("pageSize", 100)
+            response = {key: entries[start : start + size]}
+            if start + size < len(entries):
+                response["nextToken"] = str(start + size)
+        elif path.startswith("/api/v1/df/describe"):
+            response = {"described": body}
+        else:
+            response = self.responses[path]
+
+        self.bytes += len(json.dumps(response))
+        return response
+
+    def calls_to(self, path):
+        return [body for p, body in self.requests if p == path]
+
+
+@pytest.fixture
+def stub(mocker):
+    stub = ApiStub()
+    api_client = mocker.create_autospec(CdpClient, instance=True)
+    api_client.post.side_effect = stub.post
+    stub.api_client = api_client
+    return stub
+
+
+def test_list_filter_matches_nested_fields():
+    """Test that predicates compare nested fields and ignore None values."""
+
+    predicate = CdpListFilter({"status.state": "GOOD_HEALTH"}, name="a", crn=None)
+
+    assert predicate.predicates == {"status.state": "GOOD_HEALTH", "name": "a"}
+    assert predicate.matches({"name": "a", "status": {"state": "GOOD_HEALTH"}})
+    assert not predicate.matches({"name": "a", "status": "GOOD_HEALTH"})
+    assert not predicate.matches({"name": "b", "status": {"state": "GOOD_HEALTH"}})
+    assert not CdpListFilter(name=None)
+
+
+def test_list_filter_arguments():
+    """Test that only predicates the API can evaluate are pushed down."""
+
+    predicate = CdpListFilter(name="a", crn="c")
+
+    assert predicate.arguments(name="search_term", environmentCrn="env") == {
+        "search_term": "a",
+    }
+
+
+def test_list_filter_apply_streams():
+    """Test that entries are consumed only as far as the caller reads."""
+
+    consumed = []
+
+    def entries():
+        for i in range(10):
+            consumed.append(i)
+            yield {"id": i % 3}
+
+    assert next(CdpListFilter(id=1).apply(entries())) == {"id": 1}
+    assert consumed == [0, 1]
+
+
+def test_df_service_by_name_pushdown(stub):
+    """Test that the service name is sent as the search term."""
+
+    client = CdpDfClient(api_client=stub.api_client)
+
+    result = client.get_service_by_name("env-042")
+
+    assert result == {"described": {"serviceCrn": f"{ACCOUNT}:service:42"}}
+    assert stub.calls_to("/api/v1/df/listServices") == [
+        {"searchTerm": "env-042", "pageSize": 100},
+    ]
+
+    # Only the matching service is transferred, rather than every page
+    single_bytes = stub.bytes
+    stub.bytes = 0
+    list(CdpClient.iter_items(client.list_services, "services"))
+    assert single_bytes * 50 < stub.bytes
+
+
+def test_df_service_by_env_crn_stops_paging(stub):
+    """Test that the environment lookup stops reading pages at the match."""
+
+    client = CdpDfClient(api_client=stub.api_client)
+
+    result = client.get_service_by_env_crn(SERVICES[120]["environmentCrn"])
+
+    assert result == {"described": {"serviceCrn": SERVICES[120]["crn"]}}
+    assert stub.calls_to("/api/v1/df/listServices") == [
+        {"pageSize": 100},
+        {"pageSize": 100, "startingToken": "100"},
+    ]
+
+
+def test_df_deployment_by_name_exact_match(stub):
+    """Test that the search term narrows the listing and the name is matched exactly."""
+
+    client = CdpDfClient(api_client=stub.api_client)
+
+    result = client.get_deployment_by_name("etl")
+
+    assert result == {"described": {"deploymentCrn": f"{ACCOUNT}:deployment:etl"}}
+    assert stub.calls_to("/api/v1/df/listDeployments") == [
+        {"searchTerm": "etl", "pageSize": 100},
+    ]
+    assert client.get_deployment_by_name("missing") is None
+
+
+def test_de_list_services_filters_client_side(stub):
+    """Test that the environment filter, unsupported by the API, applies to the response."""
+
+    stub.responses["/api/v1/de/listServices"] = {
+        "services": [
+            {"clusterId": "a", "environmentName": "env-1"},
+            {"clusterId": "b", "environmentName": "env-2"},
+        ],
+    }
+    client = CdpDeClient(api_client=stub.api_client)
+
+    result = client.list_services(env_name="env-2")
+
+    assert result["services"] == [{"clusterId": "b", "environmentName": "env-2"}]
+    assert stub.requests == [("/api/v1/de/listServices", {"removeDeleted": True})]
+
+
+def test_ml_list_workspaces_filters_client_side(stub):
+    """Test that the environment filter, unsupported by the API, applies to the response."""
+
+    stub.responses["/api/v1/ml/listWorkspaces"] = {
+        "workspaces": [
+            {"instanceName": "a", "environmentName": "env-1"},
+            {"instanceName": "b"},
+        ],
+    }
+    client = CdpMlClient(api_client=stub.api_client)
+
+    result = client.list_workspaces("env-1")
+
+    assert result["workspaces"] == [{"instanceName": "a", "environmentName": "env-1"}]
+    assert stub.requests == [("/api/v1/ml/listWorkspaces", {})]
+
+
+def test_dw_list_vws_marshals_only_matches(stub, mocker):
+    """Test that Virtual Warehouses are filtered before they are marshalled."""
+
+    stub.responses["/api/v1/dw/listVws"] = {
+        "vws": [
+            {"id": "compute-1", "name": "vw-one", "dbcId": "warehouse-1"},
+            {"id": "compute-2", "name": "vw-two", "dbcId": "warehouse-1"},
+            {"id": "compute-3", "name": "vw-one", "dbcId": "warehouse-2"},
+        ],
+    }
+    from_dict = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw.from_dict",
+        side_effect=lambda cls, vw: vw["id"],
+    )
+    client = CdpDwClient(api_client=stub.api_client)
+
+    result = client.list_vws("cluster-1", name="vw-one", catalog_id="warehouse-2")
+
+    assert result == ["compute-3"]
+    assert from_dict.call_count == 1
+    assert stub.requests == [("/api/v1/dw/listVws", {"clusterId": "cluster-1"})]
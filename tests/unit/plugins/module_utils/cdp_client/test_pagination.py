@@ -18,6 +18,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import pytest
+
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
 )
@@ -310,3 +312,116 @@ def test_paginated_decorator_with_explicit_page_size_multiple(mocker):
             mocker.call(pageSize=2, pageToken="token123"),
         ],
     )
+
+
+def test_iter_pages_is_lazy(mocker):
+    """Test that pages are only requested as the iterator is consumed."""
+
+    mock_func = mocker.Mock()
+    mock_func.side_effect = [
+        {"users": [{"id": "user1"}], "nextToken": "token1"},
+        {"users": [{"id": "user2"}], "nextToken": "token2"},
+        {"users": [{"id": "user3"}]},
+    ]
+
+    class TestClient(CdpClient):
+        @CdpClient.paginated()
+        def decorated_func(self, *args, **kwargs):
+            return mock_func(*args, **kwargs)
+
+    pages = CdpClient.iter_pages(TestClient().decorated_func)
+
+    # Nothing is requested until the first page is consumed
+    assert mock_func.call_count == 0
+
+    assert next(pages)["users"] == [{"id": "user1"}]
+    assert mock_func.call_count == 1
+
+    assert next(pages)["users"] == [{"id": "user2"}]
+    assert mock_func.call_count == 2
+
+    mock_func.assert_has_calls(
+        [
+            mocker.call(pageSize=100),
+            mocker.call(pageSize=100, pageToken="token1"),
+        ],
+    )
+
+
+def test_iter_items_across_pages(mocker):
+    """Test that list entries are yielded from every page in order."""
+
+    mock_func = mocker.Mock()
+    mock_func.side_effect = [
+        {"records": [{"id": "record1"}, {"id": "record2"}], "nextPageToken": "token1"},
+        {"records": [{"id": "record3"}], "nextPageToken": ""},
+    ]
+
+    class TestClient(CdpClient):
+        page_size = 2
+
+        @CdpClient.paginated()
+        def decorated_func(self, *args, **kwargs):
+            return mock_func(*args, **kwargs)
+
+    items = list(
+        CdpClient.iter_items(TestClient().decorated_func, "records", filter="x"),
+    )
+
+    assert [i["id"] for i in items] == ["record1", "record2", "record3"]
+
+    # An empty token ends pagination
+    mock_func.assert_has_calls(
+        [
+            mocker.call(filter="x", pageSize=2),
+            mocker.call(filter="x", pageSize=2, pageToken="token1"),
+        ],
+    )
+    assert mock_func.call_count == 2
+
+
+def test_iter_items_early_exit(mocker):
+    """Test that breaking out of the iterator stops further requests."""
+
+    mock_func = mocker.Mock()
+    mock_func.side_effect = [
+        {"users": [{"id": "user1"}, {"id": "user2"}], "nextToken": "token1"},
+        {"users": [{"id": "user3"}], "nextToken": "token2"},
+        {"users": [{"id": "user4"}]},
+    ]
+
+    class TestClient(CdpClient):
+        @CdpClient.paginated()
+        def decorated_func(self, *args, **kwargs):
+            return mock_func(*args, **kwargs)
+
+    found = next(
+        u
+        for u in CdpClient.iter_items(TestClient().decorated_func, "users")
+        if u["id"] == "user3"
+    )
+
+    assert found == {"id": "user3"}
+    assert mock_func.call_count == 2
+
+
+def test_iter_items_non_dict_response(mocker):
+    """Test that a non-dict response yields no items."""
+
+    class TestClient(CdpClient):
+        @CdpClient.paginated()
+        def decorated_func(self, *args, **kwargs):
+            return None
+
+    assert list(CdpClient.iter_items(TestClient().decorated_func, "users")) == []
+
+
+def test_iter_pages_requires_paginated_method():
+    """Test that a method without the pagination decorator is rejected."""
+
+    class TestClient(CdpClient):
+        def undecorated_func(self, *args, **kwargs):
+            return {}
+
+    with pytest.raises(TypeError, match="undecorated_func"):
+        CdpClient.iter_pages(TestClient().undecorated_func)
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import threading
+import time
+
+from email.utils import formatdate
+
+import pytest
+
+from ansible_collections.cloudera.cloud.tests.unit import (
+    AnsibleFailJson,
+    StubCdpServer,
+)
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    CdpRateLimiter,
+    CdpRetryBudget,
+    concurrent_map,
+    full_jitter_backoff,
+    parse_retry_after,
+)
+
+BASE_URL = "https://cloudera.internal/api"
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    fake = FakeClock()
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.monotonic",
+        side_effect=fake.monotonic,
+    )
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.sleep",
+        side_effect=fake.sleep,
+    )
+    return fake
+
+
+@pytest.fixture
+def no_signature(mocker):
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+
+def test_parse_retry_after():
+    """Test parsing delay-seconds and HTTP-date Retry-After values."""
+
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("-2") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    delay = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert 28 <= delay <= 30
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0
+
+
+def test_full_jitter_backoff_bounds():
+    """Test the backoff stays between zero and the capped exponential ceiling."""
+
+    for attempt, ceiling in [(0, 0.5), (1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+        delays = [full_jitter_backoff(attempt) for _ in range(200)]
+        assert all(0 <= d <= ceiling for d in delays)
+        assert max(delays) > ceiling / 2
+
+
+def test_rate_limiter_paces_requests(clock):
+    """Test requests beyond the burst are spaced by the rate."""
+
+    limiter = CdpRateLimiter(rate=2, burst=2)
+
+    waits = [limiter.acquire("/api/v1/iam/listUsers") for _ in range(5)]
+
+    assert waits == [0, 0, 0.5, 0.5, 0.5]
+
+
+def test_rate_limiter_unlimited(clock):
+    """Test a rate of 0 never delays requests."""
+
+    limiter = CdpRateLimiter()
+
+    assert [limiter.acquire("/api/v1/iam/listUsers") for _ in range(100)] == [0] * 100
+
+
+def test_rate_limiter_endpoint_buckets(clock):
+    """Test the longest matching prefix selects an independent bucket."""
+
+    limiter = CdpRateLimiter(
+        rate=0,
+        endpoints={"/api/v1/iam/": 1, "api/v1/iam/listUsers": 0.5},
+    )
+
+    assert limiter.acquire("/api/v1/iam/listGroups") == 0
+    assert limiter.acquire("/api/v1/iam/listUsers") == 0
+    assert limiter.acquire("/api/v1/iam/listUsers") == 2
+    assert limiter.acquire("/api/v1/iam/listGroups") == 0
+    assert limiter.acquire("/api/v1/iam/listGroups") == 1
+
+    # Unmatched paths use the unlimited default bucket
+    assert limiter.acquire("/api/v1/ml/listWorkspaces") == 0
+
+
+def test_rate_limiter_pause(clock):
+    """Test a pause holds back every request sharing the bucket."""
+
+    limiter = CdpRateLimiter(endpoints={"/api/v1/dw/": 0})
+
+    limiter.pause("/api/v1/iam/listUsers", 3)
+
+    assert limiter.acquire("/api/v1/iam/listGroups") == 3
+    assert limiter.acquire("/api/v1/iam/listGroups") == 0
+    assert limiter.acquire("/api/v1/dw/listVws") == 0
+
+
+def test_retry_budget():
+    """Test retries are limited to the minimum plus a fraction of requests."""
+
+    budget = CdpRetryBudget(ratio=0.5, minimum=1)
+
+    assert budget.spend() is True
+    assert budget.spend() is False
+
+    for _ in range(4):
+        budget.record_request()
+
+    assert budget.spend() is True
+    assert budget.spend() is True
+    assert budget.spend() is False
+
+
+def test_make_request_honours_retry_after(
+    mock_ansible_module,
+    mocker,
+    clock,
+    no_signature,
+):
+    """Test a 429 with Retry-After waits the requested time before retrying."""
+
+    mock_resp = mocker.Mock()
+    mock_resp.read.return_value = b'{"ok": true}'
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_fetch_url.side_effect = [
+        (None, {"status": 429, "msg": "Too Many Requests", "retry-after": "7"}),
+        (mock_resp, {"status": 200}),
+    ]
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=BASE_URL,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    assert client._make_request("POST", "/api/v1/iam/listUsers") == {"ok": True}
+    assert clock.sleeps == [7]
+    assert mock_fetch_url.call_count == 2
+
+
+def test_make_request_fails_on_long_retry_after(
+    mock_ansible_module,
+    mocker,
+    clock,
+    no_signature,
+):
+    """Test a Retry-After beyond the request timeout fails instead of waiting."""
+
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_fetch_url.return_value = (
+        None,
+        {"status": 503, "msg": "Service Unavailable", "retry-after": "7200"},
+    )
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=BASE_URL,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+        timeout_seconds=60,
+    )
+
+    with pytest.raises(AnsibleFailJson):
+        client._make_request("GET", "/test/path")
+
+    assert "Retry-After of 7200 seconds" in (
+        mock_ansible_module.fail_json.call_args.kwargs["msg"]
+    )
+
+    assert clock.sleeps == []
+    assert mock_fetch_url.call_count == 1
+
+
+def test_make_request_signs_each_attempt(mock_ansible_module, mocker, clock):
+    """Test that every retry is sent with a fresh date and signature."""
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.formatdate",
+        side_effect=["date-1", "date-2"],
+    )
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        side_effect=lambda method, url, headers: f"signed-{headers['x-altus-date']}",
+    )
+
+    mock_resp = mocker.Mock()
+    mock_resp.read.return_value = b'{"ok": true}'
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_fetch_url.side_effect = [
+        (None, {"status": 503, "msg": "Service Unavailable"}),
+        (mock_resp, {"status": 200}),
+    ]
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=BASE_URL,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    assert client._make_request("GET", "/test/path") == {"ok": True}
+
+    sent = [c.kwargs["headers"] for c in mock_fetch_url.call_args_list]
+    assert [h["x-altus-date"] for h in sent] == ["date-1", "date-2"]
+    assert [h["x-altus-auth"] for h in sent] == ["signed-date-1", "signed-date-2"]
+
+
+def test_make_request_retry_budget_exhausted(
+    mock_ansible_module,
+    mocker,
+    clock,
+    no_signature,
+):
+    """Test that no retry is made once the retry budget is spent."""
+
+    mock_fetch_url = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+    )
+    mock_fetch_url.return_value = (
+        None,
+        {"status": 503, "msg": "Service Unavailable"},
+    )
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url=BASE_URL,
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+    client.retry_budget = CdpRetryBudget(ratio=0, minimum=1)
+
+    with pytest.raises(AnsibleFailJson):
+        client._make_request("GET", "/test/path", max_retries=5)
+
+    # One retry from the budget, then the error is raised
+    assert mock_fetch_url.call_count == 2
+
+
+class ThrottlingResponder:
+    """Allow a fixed number of requests per second, rejecting the rest with 429."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.window = None
+        self.count = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, headers, body):
+        with self.lock:
+            now = int(time.monotonic())
+            if now != self.window:
+                self.window, self.count = now, 0
+            self.count += 1
+            if self.count > self.rate:
+                self.rejected += 1
+                return (
+                    429,
+                    {"Content-Type": "application/json", "Retry-After": "1"},
+                    json.dumps({"message": "Too Many Requests"}).encode("utf-8"),
+                )
+        return (200, {"Content-Type": "application/json"}, b"{}")
+
+
+@pytest.mark.slow
+def test_rate_limiter_benchmark(mock_ansible_module, no_signature, capsys):
+    """Benchmark bursts against a throttling stub, with and without client-side pacing."""
+
+    mock_ansible_module.params.update(endpoint_tls=False)
+    total, workers, server_rate = 60, 8, 20
+    results = {}
+
+    for label, rate_limit in [("unlimited", 0), ("rate_limit=18", 18)]:
+        responder = ThrottlingResponder(server_rate)
+        with StubCdpServer(responder) as server:
+            client = AnsibleCdpClient(
+                module=mock_ansible_module,
+                base_url=server.url,
+                access_key=ACCESS_KEY,
+                private_key=PRIVATE_KEY,
+                pool_size=workers,
+                rate_limit=rate_limit,
+            )
+
+            def call(_):
+                try:
+                    client._make_request("POST", "/api/v1/iam/listUsers", max_retries=5)
+                    return True
+                except AnsibleFailJson:
+                    return False
+
+            start = time.perf_counter()
+            outcomes = concurrent_map(call, range(total), parallelism=workers)
+            elapsed = time.perf_counter() - start
+
+        results[label] = (
+            elapsed,
+            server.requests,
+            responder.rejected,
+            outcomes.count(False),
+        )
+
+    with capsys.disabled():
+        print(f"\n{total} requests, {workers} threads, server limit {server_rate}/s")
+        for label, (elapsed, requests, rejected, failed) in results.items():
+            print(
+                f"  {label:>14}: {elapsed:6.2f}s wall, {requests} requests, "
+                f"{rejected} throttled, {failed} failed",
+            )
+
+    # Pacing below the server limit avoids the 429 storm entirely
+    assert results["rate_limit=18"][2] == 0
+    assert results["rate_limit=18"][3] == 0
+    assert results["rate_limit=18"][1] < results["unlimited"][1]
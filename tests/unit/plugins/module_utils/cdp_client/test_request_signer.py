@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from base64 import b64encode
+
+import pytest
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    CdpCredentialError,
+    CdpRequestSigner,
+    get_request_signer,
+    make_signature_header,
+)
+
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = b64encode(bytes(range(32))).decode("utf-8")  # 44 chars
+URI = "https://api.us-west-1.cdp.cloudera.com/api/v1/iam/listUsers"
+HEADERS = {
+    "Content-Type": "application/json",
+    "x-altus-date": "Mon, 01 Jan 2024 00:00:00 GMT",
+}
+
+
+def test_signer_matches_make_signature_header():
+    """Test that the signer produces the same header as the stateless function."""
+
+    signer = CdpRequestSigner(ACCESS_KEY, PRIVATE_KEY)
+
+    assert signer.sign("POST", URI, HEADERS) == make_signature_header(
+        "POST",
+        URI,
+        HEADERS,
+        ACCESS_KEY,
+        PRIVATE_KEY,
+    )
+
+
+def test_signer_parses_key_once(mocker):
+    """Test that the private key is parsed at construction, not per request."""
+
+    spy = mocker.spy(ed25519.Ed25519PrivateKey, "from_private_bytes")
+
+    signer = CdpRequestSigner(ACCESS_KEY, PRIVATE_KEY)
+    for _ in range(5):
+        signer.sign("GET", URI, HEADERS)
+
+    assert spy.call_count == 1
+
+
+def test_signer_invalid_key_length():
+    """Test that non-ed25519v1 keys are rejected."""
+
+    with pytest.raises(CdpCredentialError, match="Only ed25519v1 keys are supported!"):
+        CdpRequestSigner(ACCESS_KEY, "short_key")
+
+
+def test_get_request_signer_cached_by_credentials():
+    """Test that signers are shared per access key and private key pair."""
+
+    other_key = b64encode(bytes(range(1, 33))).decode("utf-8")
+
+    assert get_request_signer(ACCESS_KEY, PRIVATE_KEY) is get_request_signer(
+        ACCESS_KEY,
+        PRIVATE_KEY,
+    )
+    assert get_request_signer(ACCESS_KEY, PRIVATE_KEY) is not get_request_signer(
+        ACCESS_KEY,
+        other_key,
+    )
+
+
+def test_client_builds_signer_once(mock_ansible_module):
+    """Test that AnsibleCdpClient reuses one signer for every request."""
+
+    client = AnsibleCdpClient(
+        module=mock_ansible_module,
+        base_url="https://api.us-west-1.cdp.cloudera.com",
+        access_key=ACCESS_KEY,
+        private_key=PRIVATE_KEY,
+    )
+
+    first = client._sign("POST", URI, HEADERS)
+    signer = client._signer
+    second = client._sign("POST", URI, HEADERS)
+
+    assert signer is not None
+    assert client._signer is signer
+    assert first == second
+
+
+@pytest.mark.slow
+def test_benchmark_signing_cost(capsys):
+    """Benchmark per-request signing cost before and after caching the parsed key."""
+
+    iterations = 5000
+    signer = CdpRequestSigner(ACCESS_KEY, PRIVATE_KEY)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        make_signature_header("POST", URI, HEADERS, ACCESS_KEY, PRIVATE_KEY)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        signer.sign("POST", URI, HEADERS)
+    cached = time.perf_counter() - start
+
+    with capsys.disabled():
+        print()
+        print(
+            f"make_signature_header: {uncached / iterations * 1e6:.1f} us/request",
+        )
+        print(f"CdpRequestSigner.sign: {cached / iterations * 1e6:.1f} us/request")
+        print(f"speedup: {uncached / cached:.2f}x")
+
+    assert cached < uncached
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import stat
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    AnsibleCdpClient,
+    CdpResponseCache,
+)
+
+BASE_URL = "https://cloudera.internal/api"
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+DESCRIBE = "/api/v1/ml/describeWorkspace"
+LIST = "/api/v1/ml/listWorkspaces"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CdpResponseCache(directory=str(tmp_path / "responses"))
+
+
+@pytest.fixture
+def clock(mocker):
+    clock = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.time",
+    )
+    clock.return_value = 1000.0
+    return clock
+
+
+def store(cache, path, body, response, access_key=ACCESS_KEY):
+    key = cache.key(BASE_URL, "POST", path, body, access_key)
+    cache.put(key, path, body, response)
+    return key
+
+
+def reader(cache):
+    """Return a fresh cache on the same directory, i.e. a later task."""
+    return CdpResponseCache(
+        directory=cache.directory,
+        ttl=cache.ttl,
+        max_size=cache.max_size,
+    )
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("POST", DESCRIBE, True),
+        ("POST", LIST, True),
+        ("POST", "/api/v1/ml/createWorkspace", False),
+        ("POST", "/api/v1/ml/deleteWorkspace", False),
+        ("GET", "/dfx/api/rpc-v1/deployments/describe", False),
+    ],
+)
+def test_cacheable(method, path, expected):
+    """Only POST describe and list operations are cacheable."""
+    assert CdpResponseCache.cacheable(method, path) is expected
+
+
+def test_key_is_canonical():
+    """Key ignores body key order, but not values or the access key."""
+    cache = CdpResponseCache(directory="unused")
+
+    body = {"a": "1", "b": "2"}
+    key = cache.key(BASE_URL, "POST", DESCRIBE, body, ACCESS_KEY)
+
+    reordered = {"b": "2", "a": "1"}
+
+    assert key == cache.key(BASE_URL, "POST", DESCRIBE, reordered, ACCESS_KEY)
+    assert key != cache.key(BASE_URL, "POST", DESCRIBE, {"a": "1"}, ACCESS_KEY)
+    assert key != cache.key(BASE_URL, "POST", DESCRIBE, body, "other")
+    assert key != cache.key("https://other", "POST", DESCRIBE, body, ACCESS_KEY)
+
+
+def test_hit_across_instances(cache, clock):
+    """An entry written by one task is served to a later task."""
+    body = {"workspaceName": "ws"}
+    key = store(cache, DESCRIBE, body, {"workspace": {"instanceName": "ws"}})
+
+    later = reader(cache)
+
+    assert later.get(key, DESCRIBE) == {"workspace": {"instanceName": "ws"}}
+    assert later.hits == 1
+
+
+def test_served_once_per_instance(cache, clock):
+    """A repeated read in the same task, e.g. a poll, is a miss."""
+    key = store(cache, DESCRIBE, {"workspaceName": "ws"}, {"workspace": {}})
+
+    later = reader(cache)
+
+    assert later.get(key, DESCRIBE) == {"workspace": {}}
+    assert later.get(key, DESCRIBE) is None
+    assert later.misses == 1
+
+
+def test_ttl_expiry(cache, clock):
+    """Expired entries are misses and are removed."""
+    key = store(cache, DESCRIBE, {"workspaceName": "ws"}, {"workspace": {}})
+
+    clock.return_value += cache.ttl + 1
+
+    assert reader(cache).get(key, DESCRIBE) is None
+    assert not os.path.exists(cache._file(key, DESCRIBE))
+
+
+def test_entry_permissions(cache, clock):
+    """Entries are readable by the owner only."""
+    key = store(cache, DESCRIBE, {"workspaceName": "ws"}, {"workspace": {}})
+
+    mode = stat.S_IMODE(os.stat(cache._file(key, DESCRIBE)).st_mode)
+
+    assert mode == 0o600
+
+
+def test_lru_eviction(tmp_path, clock):
+    """The least recently used entries are evicted beyond the size limit."""
+    cache = CdpResponseCache(directory=str(tmp_path), max_size=3500)
+    payload = "x" * 1000
+
+    keys = []
+    for i, name in enumerate(["a", "b", "c"]):
+        keys.append(store(cache, DESCRIBE, {"workspaceName": name}, {"p": payload}))
+        # Distinct access times, in order of use
+        os.utime(cache._file(keys[-1], DESCRIBE), (1000 + i, 1000 + i))
+
+    # Use "a", so "b" is now the least recently used
+    os.utime(cache._file(keys[0], DESCRIBE), (1010, 1010))
+    store(cache, DESCRIBE, {"workspaceName": "d"}, {"p": payload})
+
+    remaining = sorted(os.listdir(os.path.dirname(cache._file(keys[0], DESCRIBE))))
+
+    assert f"{keys[1]}.json" not in remaining
+    assert f"{keys[0]}.json" in remaining
+    assert len(remaining) == 3
+
+
+def test_invalidate(cache, clock):
+    """Mutations drop list entries and describe entries sharing an identifier."""
+    ws = store(cache, DESCRIBE, {"workspaceName": "ws"}, {"workspace": {}})
+    other = store(cache, DESCRIBE, {"workspaceName": "other"}, {"workspace": {}})
+    listing = store(cache, LIST, {}, {"workspaces": []})
+    iam = store(cache, "/api/v1/iam/describeUser", {"userId": "ws"}, {"user": {}})
+
+    removed = cache.invalidate("/api/v1/ml/deleteWorkspace", {"workspaceName": "ws"})
+
+    assert removed == 2
+    assert not os.path.exists(cache._file(ws, DESCRIBE))
+    assert not os.path.exists(cache._file(listing, LIST))
+    assert os.path.exists(cache._file(other, DESCRIBE))
+    assert os.path.exists(cache._file(iam, "/api/v1/iam/describeUser"))
+
+
+def test_client_serves_from_cache(mock_ansible_module, mocker, tmp_path):
+    """The client serves describe calls from the cache and invalidates on mutation."""
+    responses = iter(
+        [
+            {"workspace": {"instanceStatus": "provisioning"}},
+            {"workspace": {"instanceStatus": "deleting"}},
+            {"workspace": {"instanceStatus": "deleted"}},
+        ],
+    )
+
+    def send(method, url, headers, body):
+        resp = mocker.Mock()
+        if url.endswith("describeWorkspace"):
+            resp.read.return_value = json.dumps(next(responses)).encode("utf-8")
+        else:
+            resp.read.return_value = b"{}"
+        return resp, {"status": 200}
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+    def make_client():
+        client = AnsibleCdpClient(
+            module=mock_ansible_module,
+            base_url=BASE_URL,
+            access_key=ACCESS_KEY,
+            private_key=PRIVATE_KEY,
+            response_cache=CdpResponseCache(directory=str(tmp_path)),
+        )
+        client._send = mocker.Mock(side_effect=send)
+        return client
+
+    body = {"workspaceName": "ws"}
+
+    first = make_client()
+    assert first.post(DESCRIBE, data=body)["workspace"] == {
+        "instanceStatus": "provisioning",
+    }
+
+    # A later task is served from the cache
+    second = make_client()
+    assert second.post(DESCRIBE, data=body)["workspace"] == {
+        "instanceStatus": "provisioning",
+    }
+    second._send.assert_not_called()
+
+    # A mutation invalidates the entry, so the next task reads through
+    second.post("/api/v1/ml/deleteWorkspace", data=body)
+    third = make_client()
+    assert third.post(DESCRIBE, data=body)["workspace"] == {
+        "instanceStatus": "deleting",
+    }
+
+    # Polling within the task always reads through
+    assert third.post(DESCRIBE, data=body)["workspace"] == {
+        "instanceStatus": "deleted",
+    }
+    assert third._send.call_count == 2
@@ -155,3 +155,40 @@ class TestCdpConsumptionClientIntegration:
         assert "records" in response
         assert len(response["records"]) > 0
         assert isinstance(response["records"][0], dict)
+
+    def test_iter_compute_usage_records(self, mocker):
+        """Test iterating compute usage records page by page."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {
+                "records": [{"id": "record1"}, {"id": "record2"}],
+                "nextPageToken": "token1",
+            },
+            {
+                "records": [{"id": "record3"}],
+                "nextPageToken": "token2",
+            },
+        ]
+
+        client = CdpConsumptionClient(api_client=api_client)
+        records = client.iter_compute_usage_records(
+            from_timestamp=FROM_TIMESTAMP,
+            to_timestamp=TO_TIMESTAMP,
+        )
+
+        # Consuming the first page's records does not fetch the next page
+        assert next(records)["id"] == "record1"
+        assert next(records)["id"] == "record2"
+        assert api_client.post.call_count == 1
+
+        assert next(records)["id"] == "record3"
+        api_client.post.assert_called_with(
+            "/api/v1/consumption/listComputeUsageRecords",
+            json_data={
+                "fromTimestamp": FROM_TIMESTAMP,
+                "toTimestamp": TO_TIMESTAMP,
+                "pageToken": "token1",
+                "pageSize": 100,
+            },
+        )
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_datalake import (
+    CdpDatalakeClient,
+)
+
+
+ENV_NAME = "example-env"
+
+
+class TestCdpDatalakeClient:
+    """Unit tests for CdpDatalakeClient."""
+
+    def test_list_datalakes(self, mocker):
+        """Test listing the Data Lakes of an environment."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = {"datalakes": [{"datalakeName": "dl"}]}
+
+        client = CdpDatalakeClient(api_client=api_client)
+
+        assert client.list_datalakes(ENV_NAME) == [{"datalakeName": "dl"}]
+        api_client.post.assert_called_once_with(
+            "/api/v1/datalake/listDatalakes",
+            json_data={"environmentName": ENV_NAME},
+            squelch={404: {"datalakes": []}},
+        )
+
+    def test_describe_datalake_not_found(self, mocker):
+        """Test describing a Data Lake that doesn't exist."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = None
+
+        client = CdpDatalakeClient(api_client=api_client)
+
+        assert client.describe_datalake("missing") is None
+
+    def test_describe_all_datalakes(self, mocker):
+        """Test describing the Data Lakes of an environment by CRN."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {"datalakes": [{"crn": "crn-1"}, {"crn": "crn-2"}]},
+            {"datalake": {"crn": "crn-1", "datalakeName": "dl-1"}},
+            None,
+        ]
+
+        client = CdpDatalakeClient(api_client=api_client)
+
+        assert client.describe_all_datalakes(ENV_NAME) == [
+            {"crn": "crn-1", "datalakeName": "dl-1"},
+        ]
+        assert [c.kwargs["json_data"] for c in api_client.post.call_args_list] == [
+            {"environmentName": ENV_NAME},
+            {"datalakeName": "crn-1"},
+            {"datalakeName": "crn-2"},
+        ]
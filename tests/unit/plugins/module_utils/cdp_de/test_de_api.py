@@ -293,6 +293,54 @@ class TestCdpDeClient:
         # Verify the methods were called
         client.list_services.assert_called_once()
 
+    @pytest.mark.parametrize("parallelism", [1, 4])
+    def test_describe_all_services(self, mocker, parallelism):
+        """Test describing all services keeps the listed order."""
+
+        list_mock = {
+            "services": [
+                {"clusterId": "cluster-1", "name": "one", "status": "Running"},
+                {
+                    "clusterId": "cluster-2",
+                    "name": "two",
+                    "status": "ClusterDeletionFailed",
+                },
+                {"clusterId": "cluster-3", "name": "three", "status": "Running"},
+                {"clusterId": "cluster-4", "name": "four", "status": "Running"},
+            ],
+        }
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        client = CdpDeClient(api_client=api_client)
+
+        mocker.patch.object(client, "list_services", return_value=list_mock)
+        mocker.patch.object(
+            client,
+            "describe_service",
+            side_effect=lambda cluster_id: (
+                {}
+                if cluster_id == "cluster-3"
+                else {"service": {"clusterId": cluster_id, "described": True}}
+            ),
+        )
+
+        response = client.describe_all_services(
+            env_name=ENV_NAME,
+            parallelism=parallelism,
+        )
+
+        assert response == [
+            {"clusterId": "cluster-1", "described": True},
+            list_mock["services"][1],
+            {"clusterId": "cluster-4", "described": True},
+        ]
+        client.list_services.assert_called_once_with(env_name=ENV_NAME)
+        assert sorted(c.args[0] for c in client.describe_service.call_args_list) == [
+            "cluster-1",
+            "cluster-3",
+            "cluster-4",
+        ]
+
     def test_get_service_by_cluster_id(self, mocker):
         """Test getting service details by cluster ID."""
 
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
+    CdpDfClient,
+)
+
+
+SERVICES = [
+    {"name": "env-1", "crn": "service-1", "status": {"state": "GOOD_HEALTH"}},
+    {"name": "env-2", "crn": "service-2", "status": {"state": "NOT_ENABLED"}},
+    {"name": "env-3", "crn": "service-3", "status": {"state": "GOOD_HEALTH"}},
+    {"name": "env-4", "crn": "service-4", "status": {"state": "GOOD_HEALTH"}},
+]
+
+DEPLOYMENTS = [
+    {"name": "deployment-1", "crn": "deployment-1"},
+    {"name": "deployment-2", "crn": "deployment-2"},
+    {"name": "deployment-3", "crn": "deployment-3"},
+]
+
+
+def df_responder(gone=()):
+    """Answer the DataFlow list and describe calls; CRNs in gone are not found."""
+
+    def responder(path, data=None, **kwargs):
+        if path.endswith("/listServices"):
+            return {"services": SERVICES}
+        if path.endswith("/listDeployments"):
+            return {"deployments": DEPLOYMENTS}
+        if path.endswith("/describeService"):
+            crn = data["serviceCrn"]
+            return {} if crn in gone else {"service": {"crn": crn, "described": True}}
+        if path.endswith("/describeDeployment"):
+            crn = data["deploymentCrn"]
+            return {} if crn in gone else {"deployment": {"crn": crn}}
+        raise AssertionError(f"Unexpected request to {path}")
+
+    return responder
+
+
+def request_paths(api_client):
+    return [c.args[0].rsplit("/", 1)[-1] for c in api_client.post.call_args_list]
+
+
+class TestCdpDfClient:
+    """Unit tests for CdpDfClient concurrent describes and name lookups."""
+
+    @pytest.mark.parametrize("parallelism", [1, 4])
+    def test_describe_all_services(self, mocker, parallelism):
+        """Test describing all enabled services in the listed order."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder(gone={"service-3"})
+
+        client = CdpDfClient(api_client=api_client)
+
+        assert client.describe_all_services(parallelism=parallelism) == [
+            {"crn": "service-1", "described": True},
+            {"crn": "service-4", "described": True},
+        ]
+        assert sorted(request_paths(api_client)) == [
+            "describeService",
+            "describeService",
+            "describeService",
+            "listServices",
+        ]
+
+    def test_get_service_by_name_memoised(self, mocker):
+        """Test repeated lookups by name reuse the listed CRN."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder()
+
+        client = CdpDfClient(api_client=api_client)
+
+        assert client.get_service_by_name("env-1")["service"]["crn"] == "service-1"
+        assert client.get_service_by_name("env-4")["service"]["crn"] == "service-4"
+        assert request_paths(api_client) == [
+            "listServices",
+            "describeService",
+            "describeService",
+        ]
+
+    def test_get_service_by_name_disabled_not_memoised(self, mocker):
+        """Test disabled services are not remembered."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder()
+
+        client = CdpDfClient(api_client=api_client)
+
+        assert client.get_service_by_name("env-2") is None
+        assert client.get_service_by_name("env-2") is None
+        assert request_paths(api_client) == ["listServices", "listServices"]
+
+    def test_get_deployment_by_name_memoised(self, mocker):
+        """Test listed deployments are described by CRN without listing again."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder()
+
+        client = CdpDfClient(api_client=api_client)
+        client.list_deployments()
+
+        response = client.get_deployment_by_name("deployment-2")
+
+        assert response["deployment"]["crn"] == "deployment-2"
+        assert request_paths(api_client) == ["listDeployments", "describeDeployment"]
+
+    def test_get_deployment_by_name_memoised_stale(self, mocker):
+        """Test a remembered deployment that is gone is looked up again."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder(gone={"deployment-gone"})
+
+        client = CdpDfClient(api_client=api_client)
+        client._deployment_crns["deployment-1"] = "deployment-gone"
+
+        response = client.get_deployment_by_name("deployment-1")
+
+        assert response["deployment"]["crn"] == "deployment-1"
+        assert request_paths(api_client) == [
+            "describeDeployment",
+            "listDeployments",
+            "describeDeployment",
+        ]
+        assert (
+            api_client.post.call_args_list[1].kwargs["data"]["searchTerm"]
+            == "deployment-1"
+        )
+
+    @pytest.mark.parametrize("parallelism", [1, 4])
+    def test_describe_all_deployments(self, mocker, parallelism):
+        """Test describing all deployments in the listed order."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = df_responder(gone={"deployment-2"})
+
+        client = CdpDfClient(api_client=api_client)
+
+        response = client.describe_all_deployments(
+            filters=["state:RUNNING"],
+            parallelism=parallelism,
+        )
+
+        assert response == [{"crn": "deployment-1"}, {"crn": "deployment-3"}]
+        assert api_client.post.call_args_list[0].kwargs["data"]["filters"] == [
+            "state:RUNNING",
+        ]
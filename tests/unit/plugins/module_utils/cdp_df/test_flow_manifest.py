@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import os
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
+    CdpFlowManifest,
+    flow_content_hash,
+    latest_flow_version,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df_client import (
+    FlowDefinitionFile,
+)
+
+FLOW_CRN = "crn:cdp:df:us-west-1:tenant:flow:flow-123"
+FLOW_CONTENT = '{"flowContents": {"name": "café"}}'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_flow_content_hash_file_and_content(tmp_path, monkeypatch, chunk_size):
+    """Test a file hashed in chunks has the digest of the same content string."""
+
+    monkeypatch.setattr(FlowDefinitionFile, "CHUNK_SIZE", chunk_size)
+    path = tmp_path / "flow.json"
+    path.write_bytes(FLOW_CONTENT.encode("utf-8"))
+
+    expected = hashlib.sha256(FLOW_CONTENT.encode("utf-8")).hexdigest()
+
+    assert flow_content_hash(file_path=str(path)) == expected
+    assert flow_content_hash(content=FLOW_CONTENT) == expected
+
+
+@pytest.mark.parametrize(
+    "flow, expected",
+    [
+        (None, None),
+        ({"crn": FLOW_CRN}, None),
+        ({"versionCount": 3}, 3),
+        ({"versionCount": 3, "versions": [{"version": 2}, {"version": 4}]}, 4),
+    ],
+)
+def test_latest_flow_version(flow, expected):
+    """Test the latest version is read from the versions or the version count."""
+
+    assert latest_flow_version(flow) == expected
+
+
+def test_flow_manifest_records_latest_version(tmp_path):
+    """Test a recorded digest is only returned for the version it was recorded for."""
+
+    manifest = CdpFlowManifest(str(tmp_path / "manifest"))
+    manifest.put(FLOW_CRN, "digest-1", 1)
+
+    assert manifest.get(FLOW_CRN, 1) == "digest-1"
+    assert manifest.get(FLOW_CRN, 2) is None
+    assert manifest.get("crn:cdp:df:us-west-1:tenant:flow:other", 1) is None
+
+    manifest.put(FLOW_CRN, "digest-2", 2)
+
+    assert manifest.get(FLOW_CRN, 1) is None
+    assert manifest.get(FLOW_CRN, 2) == "digest-2"
+    assert os.listdir(str(tmp_path / "manifest")) == [
+        hashlib.sha256(FLOW_CRN.encode("utf-8")).hexdigest() + ".json",
+    ]
+
+
+def test_flow_manifest_best_effort(tmp_path):
+    """Test unknown versions and unwritable directories are treated as missing records."""
+
+    blocker = tmp_path / "file"
+    blocker.write_text("not a directory")
+    manifest = CdpFlowManifest(str(blocker / "manifest"))
+
+    manifest.put(FLOW_CRN, "digest", 1)
+    manifest.put(FLOW_CRN, "digest", None)
+
+    assert manifest.get(FLOW_CRN, 1) is None
+    assert manifest.get(None, 1) is None
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import json
+import os
+import subprocess
+import sys
+
+from urllib.parse import quote
+
+import pytest
+
+from ansible_collections.cloudera.cloud.tests.unit import StubCdpServer
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpStreamingBody,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
+    CdpDfClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df_client import (
+    CdpDfApiClient,
+    FlowDefinitionFile,
+)
+
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+FLOW_CONTENT = '{\r\n  "name": "café \U0001f600",\n\t"quote": "\\"q\\""\n}\n'
+
+IMPORT_PATH = "/api/v1/df/importFlowDefinition"
+CATALOG_PATH = "/dfx/api/v1/catalog/flows/import"
+
+
+def read_all(body):
+    """Open a streaming body and return its content and declared length."""
+    reader, length = body.open()
+    try:
+        return reader.read(), length
+    finally:
+        reader.close()
+
+
+def redirecting_responder(requests):
+    """Redirect flow imports to the catalog, as DataFlow does, and record the requests."""
+
+    def responder(method, path, headers, body):
+        requests.append((path, headers, body))
+        if path == IMPORT_PATH:
+            return 308, {"Location": f"{responder.url}{CATALOG_PATH}"}, b""
+        return 200, {"Content-Type": "application/json"}, b'{"crn": "flow-crn"}'
+
+    return responder
+
+
+@pytest.fixture
+def no_signature(mocker):
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+
+@pytest.fixture
+def flow_file(tmp_path):
+    path = tmp_path / "flow.json"
+    path.write_bytes(FLOW_CONTENT.encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_flow_definition_body_matches_json(flow_file, monkeypatch, chunk_size):
+    """Test the streamed JSON body is the body that would be serialized in memory."""
+
+    monkeypatch.setattr(FlowDefinitionFile, "CHUNK_SIZE", chunk_size)
+    data = {"name": "flow", "tags": [{"tagName": "t"}]}
+
+    body, length = read_all(FlowDefinitionFile(flow_file, data))
+
+    assert body == json.dumps(dict(data, file=FLOW_CONTENT)).encode("utf-8")
+    assert length == len(body)
+
+
+def test_flow_definition_reader_rewinds(flow_file):
+    """Test the JSON body reader can be rewound and read again."""
+
+    reader, length = FlowDefinitionFile(flow_file, {"name": "flow"}).open()
+
+    first = reader.read(10)
+    assert reader.tell() == 10
+    reader.seek(0)
+
+    assert reader.tell() == 0
+    body = reader.read()
+    assert body.startswith(first)
+    assert len(body) == length
+
+    with pytest.raises(io.UnsupportedOperation):
+        reader.seek(5)
+
+    reader.close()
+
+
+def test_flow_definition_extension_from_offset(tmp_path):
+    """Test the extension format body streams the raw file from its offset."""
+
+    path = tmp_path / "bundle.bin"
+    path.write_bytes(b"HEADER" + FLOW_CONTENT.encode("utf-8"))
+
+    upload = FlowDefinitionFile(
+        str(path),
+        {"name": "my flow", "comments": "v1"},
+        offset=len(b"HEADER"),
+    )
+    headers = {}
+
+    body, length = read_all(upload.extension(headers))
+
+    assert body == FLOW_CONTENT.encode("utf-8")
+    assert length == len(body)
+    assert headers == {
+        "Flow-Definition-Name": quote("my flow"),
+        "Flow-Definition-Comments": "v1",
+    }
+    assert json.loads(read_all(upload)[0])["file"] == FLOW_CONTENT
+
+
+def test_streaming_body_requires_open():
+    """Test that a streaming body must define how its reader is opened."""
+
+    with pytest.raises(TypeError):
+        CdpStreamingBody()
+
+    assert issubclass(FlowDefinitionFile, CdpStreamingBody)
+
+
+@pytest.mark.parametrize("pool_size", [0, 1], ids=["fetch_url", "pooled"])
+def test_import_flow_definition_streams_redirect(
+    flow_file,
+    mock_ansible_module,
+    no_signature,
+    pool_size,
+):
+    """Test a streamed flow import follows the catalog redirect with the raw file."""
+
+    requests = []
+    responder = redirecting_responder(requests)
+
+    with StubCdpServer(responder) as server:
+        responder.url = server.url
+        mock_ansible_module.params = {"endpoint_tls": False}
+
+        client = CdpDfClient(
+            CdpDfApiClient(
+                module=mock_ansible_module,
+                base_url=server.url,
+                access_key=ACCESS_KEY,
+                private_key=PRIVATE_KEY,
+                pool_size=pool_size,
+            ),
+        )
+
+        response = client.import_flow_definition(
+            name="my flow",
+            description="streamed",
+            file_path=flow_file,
+        )
+
+    assert response == {"crn": "flow-crn"}
+    assert [path for path, _, _ in requests] == [IMPORT_PATH, CATALOG_PATH]
+
+    _, headers, body = requests[0]
+    assert json.loads(body) == {
+        "name": "my flow",
+        "description": "streamed",
+        "file": FLOW_CONTENT,
+    }
+
+    _, headers, body = requests[1]
+    assert body == FLOW_CONTENT.encode("utf-8")
+    assert headers["Content-Length"] == str(len(body))
+    assert headers["Flow-Definition-Name"] == quote("my flow")
+    assert headers["Flow-Definition-Description"] == "streamed"
+
+
+BENCHMARK_SCRIPT = """
+import base64, sys, tracemalloc, types
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import CdpDfClient
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df_client import (
+    CdpDfApiClient,
+)
+
+url, path, mode = sys.argv[1:4]
+
+def fail_json(**kwargs):
+    sys.exit(kwargs["msg"])
+
+module = types.SimpleNamespace(params={}, warn=print, fail_json=fail_json)
+client = CdpDfClient(
+    CdpDfApiClient(
+        module=module,
+        base_url=url,
+        access_key="access-key",
+        private_key=base64.b64encode(bytes(32)).decode(),
+        pool_size=1,
+    ),
+)
+
+# Peak RSS would include the parent's, so measure the allocations instead
+tracemalloc.start()
+if mode == "content":
+    with open(path, "r") as f:
+        client.import_flow_definition(name="benchmark", file_content=f.read())
+elif mode == "file_path":
+    client.import_flow_definition(name="benchmark", file_path=path)
+
+print(tracemalloc.get_traced_memory()[1])
+"""
+
+
+def write_synthetic_flow(path, size_mb):
+    """Write a NiFi-like flow definition of roughly the given size."""
+    processor = {
+        "identifier": "0f3c6b2e-0000-1000-0000-000000000000",
+        "name": "UpdateAttribute",
+        "type": "org.apache.nifi.processors.attributes.UpdateAttribute",
+        "properties": {"Store State": "Do not store state", "note": "é" * 16},
+    }
+    block = ",".join([json.dumps(processor)] * 2048)
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"flowContents": {"processors": [')
+        while written < size_mb * 1024 * 1024:
+            if written:
+                f.write(",")
+            f.write(block)
+            written += len(block)
+        f.write("]}}")
+
+
+@pytest.mark.slow
+def test_benchmark_flow_upload_memory(tmp_path, capsys):
+    """Benchmark the peak memory of importing a large flow definition from disk."""
+
+    size_mb = 256
+    path = str(tmp_path / "large-flow.json")
+    write_synthetic_flow(path, size_mb)
+
+    def responder(method, path, headers, body):
+        if path == IMPORT_PATH:
+            return 308, {"Location": f"{responder.url}{CATALOG_PATH}"}, b""
+        received.append(len(body))
+        return 200, {"Content-Type": "application/json"}, b'{"crn": "flow-crn"}'
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    results = {}
+    with StubCdpServer(responder) as server:
+        responder.url = server.url
+        for mode in ["content", "file_path"]:
+            received = []
+            result = subprocess.run(
+                [sys.executable, "-c", BENCHMARK_SCRIPT, server.url, path, mode],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            results[mode] = int(result.stdout.split()[-1]) / 1024 / 1024
+            assert received == [os.path.getsize(path)]
+
+    with capsys.disabled():
+        print()
+        print(f"flow definition: {os.path.getsize(path) / 1024 / 1024:.0f} MB")
+        for mode, peak in results.items():
+            print(f"{mode:>10}: peak allocated {peak:.1f} MB")
+
+    # Streaming holds no copy of the file; in memory holds several
+    assert results["file_path"] < 16
+    assert results["content"] > size_mb * 2
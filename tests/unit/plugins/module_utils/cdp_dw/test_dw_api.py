@@ -31,6 +31,10 @@ from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import (
     DwSecretProperties,
     VirtualWarehouse,
 )
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
+)
 from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
     NULLABLE,
     from_dict,
@@ -996,3 +1000,90 @@ class TestCdpDwClientVw:
             data={"clusterId": CLUSTER_ID, "vwId": VW_ID},
             squelch={404: {}},
         )
+
+    def test_wait_for_vws_lists_each_cluster_once_per_poll(self, mocker):
+        """wait_for_vws lists each pending cluster once per poll, never describing."""
+        mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        )
+        statuses = {
+            "cluster-1": iter(
+                [
+                    {"vw-a": "Starting", "vw-b": "Starting"},
+                    {"vw-a": "Running", "vw-b": "Starting"},
+                    {"vw-a": "Running", "vw-b": "Running"},
+                ],
+            ),
+            "cluster-2": iter([{"vw-c": "Running"}]),
+        }
+        listed = []
+
+        def responder(path, data=None, squelch=None):
+            assert path == "/api/v1/dw/listVws"
+            listed.append(data["clusterId"])
+            vws = next(statuses[data["clusterId"]])
+            return {
+                "vws": [dict(id=id, status=status) for id, status in vws.items()],
+            }
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = responder
+
+        client = CdpDwClient(api_client=api_client)
+        result = client.wait_for_vws(
+            [("cluster-1", "vw-a"), ("cluster-1", "vw-b"), ("cluster-2", "vw-c")],
+            until=lambda vw: vw is not None and vw.status == "Running",
+            waiter=CdpWaiter(timeout=60, delay=1),
+        )
+
+        # The settled cluster-2 is not listed again, nor cluster-1 after the third poll
+        assert listed == ["cluster-1", "cluster-2", "cluster-1", "cluster-1"]
+        assert {key: vw.status for key, vw in result.items()} == {
+            ("cluster-1", "vw-a"): "Running",
+            ("cluster-1", "vw-b"): "Running",
+            ("cluster-2", "vw-c"): "Running",
+        }
+
+    def test_wait_for_vws_absence(self, mocker):
+        """wait_for_vws settles a warehouse on None once it is no longer listed."""
+        mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        )
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {"vws": [{"id": VW_ID, "status": "Deleting"}]},
+            {"vws": []},
+        ]
+
+        client = CdpDwClient(api_client=api_client)
+        result = client.wait_for_vws(
+            [(CLUSTER_ID, VW_ID)],
+            until=lambda vw: vw is None,
+            waiter=CdpWaiter(timeout=60, delay=1),
+        )
+
+        assert result == {(CLUSTER_ID, VW_ID): None}
+        assert api_client.post.call_count == 2
+
+    def test_wait_for_vws_timeout(self, mocker):
+        """wait_for_vws raises CdpWaitTimeout carrying the unsettled warehouses."""
+        mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        )
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = {
+            "vws": [
+                {"id": "vw-a", "status": "Running"},
+                {"id": "vw-b", "status": "Starting"},
+            ],
+        }
+
+        client = CdpDwClient(api_client=api_client)
+        with pytest.raises(CdpWaitTimeout) as e:
+            client.wait_for_vws(
+                [(CLUSTER_ID, "vw-a"), (CLUSTER_ID, "vw-b")],
+                until=lambda vw: vw is not None and vw.status == "Running",
+                waiter=CdpWaiter(timeout=0, delay=1),
+            )
+
+        assert list(e.value.last) == [(CLUSTER_ID, "vw-b")]
@@ -18,8 +18,12 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import pytest
+
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
+    CdpError,
+    CdpMutationError,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
     CdpIamClient,
@@ -405,3 +409,138 @@ class TestCdpIamClient:
                 "role": SAMPLE_ROLES[0],
             },
         )
+
+    def test_manage_group_users(self, mocker):
+        """Test that only the membership differences are applied."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = {}
+
+        client = CdpIamClient(api_client=api_client)
+
+        count = client.manage_group_users(
+            group_name="data-engineers",
+            current_members=[SAMPLE_USERS[0], SAMPLE_MACHINE_USERS[0]],
+            desired_users=[SAMPLE_USERS[1], SAMPLE_MACHINE_USERS[0], SAMPLE_USERS[1]],
+            purge=True,
+        )
+
+        assert count == 2
+        assert [c.args[0] for c in api_client.post.call_args_list] == [
+            "/api/v1/iam/removeUserFromGroup",
+            "/api/v1/iam/addUserToGroup",
+        ]
+        api_client.post.assert_called_with(
+            "/api/v1/iam/addUserToGroup",
+            json_data={"userId": SAMPLE_USERS[1], "groupName": "data-engineers"},
+        )
+
+    def test_manage_group_roles_unchanged(self, mocker):
+        """Test that no calls are made when the roles already match."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+
+        client = CdpIamClient(api_client=api_client)
+
+        count = client.manage_group_roles(
+            group_name="data-engineers",
+            current_roles=SAMPLE_ROLES,
+            desired_roles=list(reversed(SAMPLE_ROLES)),
+            purge=True,
+        )
+
+        assert count == 0
+        api_client.post.assert_not_called()
+
+    def test_manage_group_users_collects_errors(self, mocker):
+        """Test that every change is attempted and the failures are reported together."""
+
+        members = [
+            f"crn:cdp:iam:us-west-1:altus:user:user-{i}@example.com" for i in range(20)
+        ]
+        failing = {members[3], members[11]}
+
+        def post_side_effect(path, json_data):
+            if json_data["userId"] in failing:
+                raise CdpError("Internal error", status=500)
+            return {}
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = post_side_effect
+
+        client = CdpIamClient(api_client=api_client)
+
+        with pytest.raises(CdpMutationError, match="2 of 20 changes failed") as e:
+            client.manage_group_users(
+                group_name="data-engineers",
+                current_members=[],
+                desired_users=members,
+                parallelism=4,
+            )
+
+        assert api_client.post.call_count == 20
+        assert e.value.applied == 18
+        assert e.value.errors == [
+            dict(item=members[3], error="Internal error"),
+            dict(item=members[11], error="Internal error"),
+        ]
+
+    def test_get_user_details_by_email_stops_paging(self, mocker):
+        """Test that the email lookup stops requesting pages once the user is found."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {
+                "users": [{"userId": "user-1", "email": "alice@example.com"}],
+                "nextToken": "token1",
+            },
+            {
+                "users": [{"userId": "user-2", "email": "bob@example.com"}],
+                "nextToken": "token2",
+            },
+        ]
+
+        client = CdpIamClient(api_client=api_client)
+        details = mocker.patch.object(
+            client,
+            "get_user_details",
+            return_value={"userId": "user-1"},
+        )
+
+        result = client.get_user_details_by_email("alice@example.com")
+
+        assert result == {"userId": "user-1"}
+        details.assert_called_once_with(user_id="user-1")
+
+        # Only the first page of users is requested
+        api_client.post.assert_called_once_with(
+            "/api/v1/iam/listUsers",
+            json_data={"pageSize": 100},
+        )
+
+    def test_list_users_filtered_streams_pages(self, mocker):
+        """Test that the regex user filter is applied across all pages."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {
+                "users": [
+                    {"userId": "user-1", "workloadUsername": "alice"},
+                    {"userId": "user-2", "workloadUsername": "bob"},
+                ],
+                "nextToken": "token1",
+            },
+            {
+                "users": [{"userId": "user-3", "workloadUsername": "alicia"}],
+            },
+        ]
+
+        client = CdpIamClient(api_client=api_client)
+        result = client.list_users_filtered({"workloadUsername": "^ali"})
+
+        assert [u["userId"] for u in result] == ["user-1", "user-3"]
+        assert api_client.post.call_count == 2
+        api_client.post.assert_called_with(
+            "/api/v1/iam/listUsers",
+            json_data={"startingToken": "token1", "pageSize": 100},
+        )
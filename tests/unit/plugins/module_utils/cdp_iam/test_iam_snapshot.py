@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
+    CdpIamClient,
+    CdpIamSnapshot,
+)
+
+ACCOUNT = "crn:cdp:iam:us-west-1:altus"
+
+USERS = [
+    {"userId": "alice", "crn": f"{ACCOUNT}:user:alice", "email": "alice@example.com"},
+    {"userId": "bob", "crn": f"{ACCOUNT}:user:bob", "email": "bob@example.com"},
+]
+MACHINE_USERS = [
+    {"machineUserName": "robot", "crn": f"{ACCOUNT}:machineUser:robot"},
+]
+GROUPS = [
+    {"groupName": "admins", "crn": f"{ACCOUNT}:group:admins"},
+    {"groupName": "analysts", "crn": f"{ACCOUNT}:group:analysts"},
+]
+MEMBERS = {
+    f"{ACCOUNT}:group:admins": [USERS[0]["crn"], MACHINE_USERS[0]["crn"]],
+    f"{ACCOUNT}:group:analysts": [USERS[0]["crn"], USERS[1]["crn"]],
+}
+ROLES = {
+    "alice": [f"{ACCOUNT}:role:PowerUser"],
+    "bob": [],
+    "admins": [f"{ACCOUNT}:role:IamAdmin"],
+    "analysts": [],
+    "robot": [f"{ACCOUNT}:role:DFCatalogViewer"],
+}
+
+
+@pytest.fixture
+def iam_api(mocker):
+    """Mock the IAM REST endpoints used to assemble a snapshot."""
+
+    def post(path, json_data=None, squelch={}):
+        json_data = json_data or {}
+        if path == "/api/v1/iam/listUsers":
+            return {"users": USERS}
+        if path == "/api/v1/iam/listMachineUsers":
+            return {"machineUsers": MACHINE_USERS}
+        if path == "/api/v1/iam/listGroups":
+            return {"groups": GROUPS}
+        if path == "/api/v1/iam/listGroupMembers":
+            return {"memberCrns": MEMBERS[json_data["groupName"]]}
+        if path == "/api/v1/iam/listGroupsForUser":
+            crn = next(u["crn"] for u in USERS if u["userId"] == json_data["userId"])
+            return {"groupCrns": [g for g, m in MEMBERS.items() if crn in m]}
+        if path == "/api/v1/iam/listUserAssignedRoles":
+            return {"roleCrns": ROLES[json_data["user"]]}
+        if path == "/api/v1/iam/listGroupAssignedRoles":
+            return {"roleCrns": ROLES[json_data["groupName"]]}
+        if path == "/api/v1/iam/listMachineUserAssignedRoles":
+            return {"roleCrns": ROLES[json_data["machineUserName"]]}
+        if path in [
+            "/api/v1/iam/listUserAssignedResourceRoles",
+            "/api/v1/iam/listGroupAssignedResourceRoles",
+            "/api/v1/iam/listMachineUserAssignedResourceRoles",
+        ]:
+            return {"resourceAssignments": []}
+        raise AssertionError(f"Unexpected call to {path}")
+
+    api_client = mocker.create_autospec(CdpClient, instance=True)
+    api_client.post.side_effect = post
+    return api_client
+
+
+def calls_to(api_client, path):
+    return [c for c in api_client.post.call_args_list if c.args[0] == path]
+
+
+def test_snapshot_lists_each_collection_once(iam_api):
+    """Test that repeated queries are answered from the cached collections."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    for _ in range(3):
+        assert snapshot.users == USERS
+        assert snapshot.groups == GROUPS
+        assert snapshot.machine_users == MACHINE_USERS
+        assert snapshot.group_members == MEMBERS
+
+    assert len(calls_to(iam_api, "/api/v1/iam/listUsers")) == 1
+    assert len(calls_to(iam_api, "/api/v1/iam/listGroups")) == 1
+    assert len(calls_to(iam_api, "/api/v1/iam/listMachineUsers")) == 1
+    assert len(calls_to(iam_api, "/api/v1/iam/listGroupMembers")) == 2
+
+
+def test_snapshot_member_groups_index(iam_api):
+    """Test the member to groups index inverts the group members."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api), parallelism=2)
+
+    assert snapshot.member_groups == {
+        USERS[0]["crn"]: [GROUPS[0]["crn"], GROUPS[1]["crn"]],
+        MACHINE_USERS[0]["crn"]: [GROUPS[0]["crn"]],
+        USERS[1]["crn"]: [GROUPS[1]["crn"]],
+    }
+
+
+def test_snapshot_get_by_crn(iam_api):
+    """Test CRN lookups only fetch the collection of the entity type."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    assert snapshot.get(MACHINE_USERS[0]["crn"]) == MACHINE_USERS[0]
+    assert calls_to(iam_api, "/api/v1/iam/listUsers") == []
+    assert calls_to(iam_api, "/api/v1/iam/listGroups") == []
+
+    assert snapshot.get(USERS[1]["crn"]) == USERS[1]
+    assert snapshot.get(GROUPS[0]["crn"]) == GROUPS[0]
+    assert snapshot.get(f"{ACCOUNT}:user:nobody") is None
+    assert snapshot.get("not-a-crn") is None
+
+
+def test_snapshot_user_details(iam_api):
+    """Test user details match the shape of CdpIamClient.get_user_details."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api), parallelism=4)
+
+    details = snapshot.user_details(snapshot.users)
+
+    assert details == [
+        {
+            **USERS[0],
+            "roles": ROLES["alice"],
+            "resourceAssignments": [],
+            "groups": [GROUPS[0]["crn"], GROUPS[1]["crn"]],
+        },
+        {
+            **USERS[1],
+            "roles": [],
+            "resourceAssignments": [],
+            "groups": [GROUPS[1]["crn"]],
+        },
+    ]
+
+    # No per-user profile or group membership lookups
+    assert calls_to(iam_api, "/api/v1/iam/getUser") == []
+    assert calls_to(iam_api, "/api/v1/iam/listGroupsForUser") == []
+
+
+def test_snapshot_user_details_fewer_users_than_groups(iam_api):
+    """Test group memberships of a few users are listed per user."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    details = snapshot.user_details([USERS[1]])
+
+    assert details == [
+        {
+            **USERS[1],
+            "roles": [],
+            "resourceAssignments": [],
+            "groups": [GROUPS[1]["crn"]],
+        },
+    ]
+
+    # No per-group member lookups across the tenant
+    assert calls_to(iam_api, "/api/v1/iam/listGroupMembers") == []
+    assert len(calls_to(iam_api, "/api/v1/iam/listGroupsForUser")) == 1
+
+
+def test_snapshot_group_details(iam_api):
+    """Test group details match the shape of CdpIamClient.get_group_details."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    details = snapshot.group_details(snapshot.groups)
+
+    assert details[0] == {
+        "groupName": "admins",
+        "crn": GROUPS[0]["crn"],
+        "creationDate": None,
+        "syncMembershipOnUserLogin": None,
+        "members": MEMBERS[GROUPS[0]["crn"]],
+        "roles": ROLES["admins"],
+        "resourceAssignments": [],
+    }
+    assert details[1]["members"] == MEMBERS[GROUPS[1]["crn"]]
+
+    # Groups are listed once, not once per group
+    assert len(calls_to(iam_api, "/api/v1/iam/listGroups")) == 1
+
+
+def test_snapshot_machine_user_details(iam_api):
+    """Test machine user details match the shape of get_machine_user_details."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    details = snapshot.machine_user_details(snapshot.machine_users)
+
+    assert details == [
+        {
+            "machineUserName": "robot",
+            "crn": MACHINE_USERS[0]["crn"],
+            "creationDate": None,
+            "status": None,
+            "workloadUsername": None,
+            "roles": ROLES["robot"],
+            "resourceAssignments": [],
+        },
+    ]
+    assert len(calls_to(iam_api, "/api/v1/iam/listMachineUsers")) == 1
+
+
+def test_snapshot_details_empty(iam_api):
+    """Test that no indexes are built when there is nothing to describe."""
+
+    snapshot = CdpIamSnapshot(CdpIamClient(api_client=iam_api))
+
+    assert snapshot.user_details([]) == []
+    assert snapshot.group_details([]) == []
+    assert snapshot.machine_user_details([]) == []
+    iam_api.post.assert_not_called()
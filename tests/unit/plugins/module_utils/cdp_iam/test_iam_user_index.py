@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import time
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpClient,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_iam import (
+    CdpIamClient,
+    CdpIamUserIndex,
+)
+
+ACCOUNT = "crn:cdp:iam:us-west-1:altus"
+
+PAGES = [
+    [
+        {"userId": "alice", "email": "alice@example.com", "workloadUsername": "alice"},
+        {"userId": "bob", "email": "bob@example.com", "workloadUsername": "bob"},
+    ],
+    [
+        {"userId": "carol", "email": "carol@example.com", "workloadUsername": "carol"},
+    ],
+    [
+        {
+            "userId": "dave",
+            "email": "dave@example.com",
+            "workloadUsername": "dave",
+            "crn": f"{ACCOUNT}:user:dave",
+        },
+    ],
+]
+
+
+@pytest.fixture
+def iam_api(mocker):
+    """Mock the listUsers endpoint, returning one page per request."""
+
+    def post(path, json_data=None, squelch={}):
+        assert path == "/api/v1/iam/listUsers"
+        page = int(json_data.get("startingToken") or 0)
+        response = {"users": PAGES[page]}
+        if page + 1 < len(PAGES):
+            response["nextToken"] = str(page + 1)
+        return response
+
+    api_client = mocker.create_autospec(CdpClient, instance=True)
+    api_client.post.side_effect = post
+    return api_client
+
+
+def test_user_index_reads_only_needed_pages(iam_api):
+    """Test that lookups stop paging at the match and resume where they stopped."""
+
+    client = CdpIamClient(api_client=iam_api)
+
+    assert client.user_index.find("email", "bob@example.com")["userId"] == "bob"
+    assert iam_api.post.call_count == 1
+
+    assert client.user_index.find("workloadUsername", "carol")["userId"] == "carol"
+    assert iam_api.post.call_count == 2
+
+    # Users already read are answered from memory
+    assert client.user_index.find("userId", "alice")["email"] == "alice@example.com"
+    assert iam_api.post.call_count == 2
+
+
+def test_user_index_miss_reads_all_pages_once(iam_api):
+    """Test that a miss reads the remaining pages, and later misses make no calls."""
+
+    index = CdpIamUserIndex(CdpIamClient(api_client=iam_api))
+
+    assert index.find("email", "nobody@example.com") is None
+    assert iam_api.post.call_count == 3
+    assert index.complete is True
+
+    assert index.find("email", "nobody@example.com") is None
+    assert index.find("crn", f"{ACCOUNT}:user:dave")["userId"] == "dave"
+    assert len(index.users) == 4
+    assert iam_api.post.call_count == 3
+
+
+def test_user_index_find_all(iam_api):
+    """Test finding several users in the order given, skipping missing ones."""
+
+    index = CdpIamUserIndex(CdpIamClient(api_client=iam_api))
+
+    users = index.find_all("workloadUsername", ["carol", "missing", "alice"])
+
+    assert [u["userId"] for u in users] == ["carol", "alice"]
+
+    with pytest.raises(ValueError, match="status"):
+        index.find_all("status", ["ACTIVE"])
+
+
+def test_user_index_persisted(iam_api, tmp_path):
+    """Test that a complete index is persisted and reused by a later run."""
+
+    path = CdpIamUserIndex.file_for(str(tmp_path), "https://api", "key")
+
+    first = CdpIamUserIndex(CdpIamClient(api_client=iam_api), path=path, ttl=60)
+    assert len(first.users) == 4
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+    iam_api.post.reset_mock()
+    second = CdpIamUserIndex(CdpIamClient(api_client=iam_api), path=path, ttl=60)
+
+    assert second.persisted is True
+    assert second.find("email", "dave@example.com")["userId"] == "dave"
+    iam_api.post.assert_not_called()
+
+    # Tenants and access keys do not share an index
+    assert CdpIamUserIndex.file_for(str(tmp_path), "https://api", "other") != path
+
+
+def test_user_index_persisted_miss(iam_api, tmp_path):
+    """Test that a miss against a persisted index reads the tenant again."""
+
+    path = str(tmp_path / "users.json")
+    with open(path, "w") as f:
+        json.dump([{"userId": "old", "email": "old@example.com"}], f)
+
+    index = CdpIamUserIndex(CdpIamClient(api_client=iam_api), path=path, ttl=60)
+
+    assert index.find("email", "carol@example.com")["userId"] == "carol"
+    assert index.persisted is False
+    assert iam_api.post.call_count == 2
+
+
+def test_user_index_persisted_expired(iam_api, tmp_path):
+    """Test that a persisted index older than the TTL is ignored."""
+
+    path = str(tmp_path / "users.json")
+    with open(path, "w") as f:
+        json.dump([{"userId": "old", "email": "old@example.com"}], f)
+    expired = time.time() - 120
+    os.utime(path, (expired, expired))
+
+    index = CdpIamUserIndex(CdpIamClient(api_client=iam_api), path=path, ttl=60)
+
+    assert index.persisted is False
+    assert index.find("email", "old@example.com") is None
+
+
+def test_get_user_details_by_email_stale_index(iam_api, tmp_path, mocker):
+    """Test that a stale hit in a persisted index falls back to the tenant."""
+
+    path = str(tmp_path / "users.json")
+    with open(path, "w") as f:
+        json.dump([{"userId": "removed", "email": "carol@example.com"}], f)
+
+    client = CdpIamClient(api_client=iam_api)
+    client.use_user_index(path=path, ttl=60)
+    details = mocker.patch.object(
+        client,
+        "get_user_details",
+        side_effect=lambda user_id: (
+            None if user_id == "removed" else {"userId": user_id}
+        ),
+    )
+
+    assert client.get_user_details_by_email("carol@example.com") == {"userId": "carol"}
+    assert [c.kwargs["user_id"] for c in details.call_args_list] == ["removed", "carol"]
@@ -18,8 +18,11 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import pytest
+
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
     CdpClient,
+    CdpError,
 )
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_ml import (
     CdpMlClient,
@@ -511,6 +514,90 @@ class TestCdpMlClient:
             squelch={404: []},
         )
 
+    def test_describe_all_workspaces_parallel(self, mocker):
+        """Test describing all workspaces concurrently, preserving list order."""
+
+        crns = [f"crn:cdp:ml:us-west-1:account:workspace:ws{i}" for i in range(6)]
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+
+        def post_side_effect(endpoint, json_data, squelch=None):
+            if endpoint == "/api/v1/ml/listWorkspaces":
+                return {"workspaces": [{"crn": crn} for crn in crns]}
+            return {
+                "workspace": {
+                    "crn": json_data["workspaceCrn"],
+                    "instanceStatus": "installation:finished",
+                },
+            }
+
+        api_client.post.side_effect = post_side_effect
+
+        client = CdpMlClient(api_client=api_client)
+        result = client.describe_all_workspaces(parallelism=3)
+
+        assert [ws["crn"] for ws in result] == crns
+        assert all(ws["instanceStatus"] == "installation:finished" for ws in result)
+        assert api_client.post.call_count == 7  # 1 list + 6 describe calls
+
+    def test_describe_all_workspaces_summary(self, mocker):
+        """Test summary mode describing only the entries missing requested fields."""
+
+        mock_list_response = {
+            "workspaces": [
+                {
+                    "crn": "crn:cdp:ml:us-west-1:account:workspace:ws1",
+                    "instanceName": "workspace1",
+                    "instanceStatus": "installation:finished",
+                },
+                {
+                    "crn": "crn:cdp:ml:us-west-1:account:workspace:ws2",
+                    "instanceName": "workspace2",
+                },
+            ],
+        }
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+
+        def post_side_effect(endpoint, json_data, squelch=None):
+            if endpoint == "/api/v1/ml/listWorkspaces":
+                return mock_list_response
+            return {
+                "workspace": {
+                    "crn": json_data["workspaceCrn"],
+                    "instanceName": "workspace2",
+                    "instanceStatus": "provision:started",
+                    "instanceUrl": "https://workspace2.cloudera.site",
+                },
+            }
+
+        api_client.post.side_effect = post_side_effect
+
+        client = CdpMlClient(api_client=api_client)
+
+        # Every entry carries the requested fields, so no describe calls
+        result = client.describe_all_workspaces(
+            summary=True,
+            summary_fields=["instanceName"],
+        )
+        assert result == mock_list_response["workspaces"]
+        assert api_client.post.call_count == 1
+
+        # Only the entry missing a requested field is described
+        api_client.post.reset_mock()
+        result = client.describe_all_workspaces(
+            summary=True,
+            summary_fields=["instanceName", "instanceStatus"],
+        )
+        assert result[0] == mock_list_response["workspaces"][0]
+        assert result[1]["instanceStatus"] == "provision:started"
+        assert api_client.post.call_count == 2
+        api_client.post.assert_called_with(
+            "/api/v1/ml/describeWorkspace",
+            json_data={"workspaceCrn": "crn:cdp:ml:us-west-1:account:workspace:ws2"},
+            squelch={404: {}, 500: {}},
+        )
+
     def test_create_workspace_minimal(self, mocker):
         """Test creating a workspace with minimal required parameters."""
 
@@ -741,3 +828,90 @@ class TestCdpMlClient:
             },
             squelch={},
         )
+
+    def test_wait_for_workspace_state_adaptive(self, mocker):
+        """Test waiting polls faster after each state change."""
+
+        sleep = mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        )
+        mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.random.uniform",
+            return_value=1.0,
+        )
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {},
+            {"workspace": {"instanceStatus": "provision:started"}},
+            {"workspace": {"instanceStatus": "provision:started"}},
+            {"workspace": {"instanceStatus": "installation:started"}},
+            {"workspace": {"instanceStatus": "installation:finished"}},
+        ]
+
+        client = CdpMlClient(api_client=api_client)
+        result = client.wait_for_workspace_state(
+            environment="test-env",
+            workspace_name="test-ws",
+            target_states=["installation:finished"],
+            delay=20,
+        )
+
+        assert result["workspace"]["instanceStatus"] == "installation:finished"
+        assert [c.args[0] for c in sleep.call_args_list] == [5, 5, 7.5, 5]
+
+    def test_wait_for_workspace_state_deleted(self, mocker):
+        """Test waiting for deletion returns an empty dict once the workspace is gone."""
+
+        mocker.patch(
+            "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        )
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.side_effect = [
+            {"workspace": {"instanceStatus": "deprovision:started"}},
+            {},
+        ]
+
+        client = CdpMlClient(api_client=api_client)
+        assert (
+            client.wait_for_workspace_state(
+                environment="test-env",
+                workspace_name="test-ws",
+            )
+            == {}
+        )
+
+    def test_wait_for_workspace_state_failed(self, mocker):
+        """Test that a failed state aborts the wait."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = {
+            "workspace": {
+                "instanceStatus": "installation:failed",
+                "failureMessage": "boom",
+            },
+        }
+
+        client = CdpMlClient(api_client=api_client)
+        with pytest.raises(CdpError, match="entered failed state.*boom"):
+            client.wait_for_workspace_state(
+                environment="test-env",
+                workspace_name="test-ws",
+                target_states=["installation:finished"],
+            )
+
+    def test_wait_for_workspace_state_timeout_missing(self, mocker):
+        """Test the timeout message when the workspace never appears."""
+
+        api_client = mocker.create_autospec(CdpClient, instance=True)
+        api_client.post.return_value = {}
+
+        client = CdpMlClient(api_client=api_client)
+        with pytest.raises(CdpError, match="to appear"):
+            client.wait_for_workspace_state(
+                environment="test-env",
+                workspace_name="test-ws",
+                target_states=["installation:finished"],
+                timeout=0,
+            )
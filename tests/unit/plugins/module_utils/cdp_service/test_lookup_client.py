@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_service import (
+    CdpLookupClient,
+    _shared_lookup_client,
+    get_lookup_client,
+    parse_environment,
+)
+from ansible_collections.cloudera.cloud.tests.unit import StubCdpServer
+
+
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+
+ENV_NAME = "example-env"
+DATALAKE_CRN = "crn:cdp:datalake:us-west-1:tenant:datalake:dl-123"
+
+
+def datalake_responder(method, path, headers, body):
+    """Answer the Data Lake list and describe calls of an environment."""
+    if path.endswith("/listDatalakes"):
+        payload = {"datalakes": [{"datalakeName": "dl", "crn": DATALAKE_CRN}]}
+    elif path.endswith("/describeDatalake"):
+        payload = {
+            "datalake": {
+                "datalakeName": "dl",
+                "crn": DATALAKE_CRN,
+                "cloudPlatform": "AWS",
+                "productVersions": [{"name": "CDH", "version": "7.2.18-1.cdh7"}],
+            },
+        }
+    elif path.endswith("/missing"):
+        return 400, {}, json.dumps({"message": "Bad request"}).encode("utf-8")
+    else:
+        payload = {"path": path, "body": json.loads(body or b"{}")}
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+@pytest.fixture
+def stub_server():
+    with StubCdpServer(datalake_responder) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def no_signature(mocker):
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+
+
+@pytest.fixture
+def lookup_env(monkeypatch, stub_server):
+    """Point the shared lookup client at the stub server."""
+    _shared_lookup_client.cache_clear()
+    monkeypatch.setenv("CDP_ACCESS_KEY_ID", ACCESS_KEY)
+    monkeypatch.setenv("CDP_PRIVATE_KEY", PRIVATE_KEY)
+    monkeypatch.setenv("CDP_ENDPOINT_URL", stub_server.url)
+    yield stub_server
+    _shared_lookup_client.cache_clear()
+
+
+def test_lookup_client_memoises_describe(stub_server):
+    """Test repeated describe and list calls are answered from the memo."""
+
+    client = CdpLookupClient(stub_server.url, ACCESS_KEY, PRIVATE_KEY)
+
+    first = client.post("/api/v1/test/describeThing", json_data={"name": "a"})
+    second = client.post("/api/v1/test/describeThing", json_data={"name": "a"})
+    other = client.post("/api/v1/test/describeThing", json_data={"name": "b"})
+    client.post("/api/v1/test/listThings", json_data={})
+    client.post("/api/v1/test/listThings", json_data={})
+
+    assert first is second
+    assert other["body"] == {"name": "b"}
+    assert stub_server.requests == 3
+    assert stub_server.connections == 1
+
+
+def test_lookup_client_does_not_memoise_mutations(stub_server):
+    """Test mutating calls are always sent."""
+
+    client = CdpLookupClient(stub_server.url, ACCESS_KEY, PRIVATE_KEY)
+
+    client.post("/api/v1/test/createThing", json_data={"name": "a"})
+    client.post("/api/v1/test/createThing", json_data={"name": "a"})
+
+    assert stub_server.requests == 2
+
+
+def test_lookup_client_raises(stub_server):
+    """Test failed requests raise CdpError rather than failing a module."""
+
+    client = CdpLookupClient(stub_server.url, ACCESS_KEY, PRIVATE_KEY)
+
+    with pytest.raises(CdpError, match="Bad request"):
+        client.post("/api/v1/test/missing", json_data={})
+
+    assert client.post(
+        "/api/v1/test/missing",
+        json_data={},
+        squelch={400: {"squelched": True}},
+    ) == {"squelched": True}
+
+
+def test_get_lookup_client_shared(lookup_env):
+    """Test lookups share one client per endpoint and credentials."""
+
+    client = get_lookup_client()
+
+    assert isinstance(client, CdpLookupClient)
+    assert client is get_lookup_client()
+    assert client.base_url == lookup_env.url
+    assert client.pool is not None
+
+
+def test_get_lookup_client_credentials_file(monkeypatch, tmp_path):
+    """Test the credentials and region are read from the profile."""
+
+    credentials = tmp_path / "credentials"
+    credentials.write_text(
+        "[example]\n"
+        "cdp_access_key_id = file-access-key\n"
+        "cdp_private_key = file-private-key\n"
+        "cdp_region = eu-1\n",
+    )
+
+    _shared_lookup_client.cache_clear()
+    for name in ["CDP_ACCESS_KEY_ID", "CDP_PRIVATE_KEY", "CDP_REGION"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.delenv("CDP_ENDPOINT_URL", raising=False)
+    monkeypatch.setenv("CDP_CREDENTIALS_PATH", str(credentials))
+    monkeypatch.setenv("CDP_PROFILE", "example")
+
+    client = get_lookup_client()
+
+    assert client.access_key == "file-access-key"
+    assert client.base_url == "https://api.eu-1.cdp.cloudera.com"
+    _shared_lookup_client.cache_clear()
+
+
+def test_get_lookup_client_no_credentials(monkeypatch, tmp_path):
+    """Test missing credentials raise an AnsibleError."""
+
+    for name in ["CDP_ACCESS_KEY_ID", "CDP_PRIVATE_KEY"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("CDP_CREDENTIALS_PATH", str(tmp_path / "missing"))
+
+    with pytest.raises(AnsibleError, match="Failed to load CDP credentials"):
+        get_lookup_client()
+
+
+def test_parse_environment(lookup_env):
+    """Test the Data Lake runtime of an environment is parsed once per run."""
+
+    for _ in range(3):
+        assert parse_environment(ENV_NAME) == ("AWS", "7.2.18-1.cdh7", "7.2.18")
+
+    assert lookup_env.requests == 2
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter import (
+    CdpWaiter,
+    CdpWaitTimeout,
+    CdpWatcher,
+)
+
+
+class FakeClock:
+    """Monotonic clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    fake = FakeClock()
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.monotonic",
+        side_effect=fake.monotonic,
+    )
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_waiter.time.sleep",
+        side_effect=fake.sleep,
+    )
+    return fake
+
+
+def states(*values):
+    """Return a poll function yielding the given states, repeating the last."""
+    remaining = list(values)
+
+    def poll():
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    return poll
+
+
+def test_waiter_backs_off_while_unchanged(clock):
+    """Test the interval grows geometrically up to the delay while the state is unchanged."""
+
+    waiter = CdpWaiter(timeout=3600, delay=8, jitter=0)
+    result = waiter.wait(
+        states(*["PENDING"] * 9, "DONE"),
+        until=lambda s: s == "DONE",
+    )
+
+    assert result == "DONE"
+    assert clock.sleeps == [2, 3, 4.5, 6.75, 8, 8, 8, 8, 8]
+    assert waiter.metrics["polls"] == 10
+    assert waiter.metrics["state_changes"] == 1
+    assert waiter.metrics["time_to_detect"] == 8
+
+
+def test_waiter_resets_on_state_change(clock):
+    """Test the interval drops back to the minimum when the state changes."""
+
+    waiter = CdpWaiter(timeout=3600, delay=8, jitter=0)
+    waiter.wait(
+        states("A", "A", "A", "B", "B", "C"),
+        until=lambda s: s == "C",
+    )
+
+    assert clock.sleeps == [2, 3, 4.5, 2, 3]
+    assert waiter.metrics["state_changes"] == 2
+    assert waiter.metrics["time_to_detect"] == 3
+
+
+def test_waiter_jitter_bounds(clock):
+    """Test that jitter keeps each interval within the configured fraction."""
+
+    waiter = CdpWaiter(timeout=3600, delay=4, max_delay=4, backoff=1, jitter=0.5)
+    waiter.wait(
+        states(*["PENDING"] * 50, "DONE"),
+        until=lambda s: s == "DONE",
+    )
+
+    assert all(0.5 <= s <= 1.5 for s in clock.sleeps)
+    assert len(set(clock.sleeps)) > 1
+
+
+def test_waiter_jitter_stays_below_max_delay(clock):
+    """Test that jitter never lengthens the interval beyond the maximum."""
+
+    waiter = CdpWaiter(timeout=3600, delay=4, min_delay=4, backoff=1, jitter=0.5)
+    waiter.wait(
+        states(*["PENDING"] * 50, "DONE"),
+        until=lambda s: s == "DONE",
+    )
+
+    assert all(2 <= s <= 4 for s in clock.sleeps)
+    assert max(clock.sleeps) == 4
+
+
+def test_waiter_timeout(clock):
+    """Test that the last poll lands on the deadline before timing out."""
+
+    polls = []
+
+    def poll():
+        polls.append(clock.now)
+        return {"status": "PENDING"}
+
+    waiter = CdpWaiter(timeout=10, delay=8, jitter=0)
+
+    with pytest.raises(CdpWaitTimeout, match="after 10 seconds") as e:
+        waiter.wait(poll, until=lambda r: False, state=lambda r: r["status"])
+
+    assert polls == [0, 2, 5, 9.5, 10]
+    assert e.value.state == "PENDING"
+    assert e.value.last == {"status": "PENDING"}
+    assert isinstance(e.value, CdpError)
+
+
+def test_waiter_failure_propagates(clock):
+    """Test that an error raised by the predicate aborts the wait."""
+
+    def until(state):
+        if state == "FAILED":
+            raise CdpError("failed")
+        return False
+
+    with pytest.raises(CdpError, match="failed"):
+        CdpWaiter(delay=1, jitter=0).wait(states("PENDING", "FAILED"), until=until)
+
+    assert clock.sleeps == [1]
+
+
+def test_waiter_initial_result(clock, mocker):
+    """Test that an initial result is evaluated without polling."""
+
+    poll = mocker.Mock(return_value="DONE")
+
+    waiter = CdpWaiter(delay=1, jitter=0)
+    assert waiter.wait(poll, until=lambda s: s == "DONE", initial="DONE") == "DONE"
+
+    poll.assert_not_called()
+    assert waiter.metrics["polls"] == 0
+
+
+def listings(*values):
+    """Return a list function yielding the given listings per scope, repeating the last."""
+    remaining = {scope: list(pages) for scope, pages in values}
+    calls = []
+
+    def lister(scope):
+        calls.append(scope)
+        pages = remaining[scope]
+        return pages.pop(0) if len(pages) > 1 else pages[0]
+
+    return lister, calls
+
+
+def test_watcher_lists_each_scope_once_per_poll(clock):
+    """Test that the watcher lists each pending scope once and stops listing settled ones."""
+
+    lister, calls = listings(
+        ("a", [[("x", "PENDING"), ("y", "PENDING")], [("x", "DONE"), ("y", "DONE")]]),
+        ("b", [[("z", "DONE")]]),
+    )
+    watcher = CdpWatcher(CdpWaiter(delay=1, jitter=0))
+    watcher.register("thing", lister, key=lambda r: r[0], state=lambda r: r[1])
+    for scope, key in [("a", "x"), ("a", "y"), ("b", "z")]:
+        watcher.watch(
+            "thing",
+            scope,
+            key,
+            until=lambda r: r is not None and r[1] == "DONE",
+        )
+
+    result = watcher.wait()
+
+    assert calls == ["a", "b", "a"]
+    assert result == {
+        ("thing", "a", "x"): ("x", "DONE"),
+        ("thing", "a", "y"): ("y", "DONE"),
+        ("thing", "b", "z"): ("z", "DONE"),
+    }
+
+
+def test_watcher_groups_by_resource_type(clock, mocker):
+    """Test that each resource type is listed with its own function."""
+
+    clusters = mocker.Mock(return_value=[{"name": "c1", "state": "AVAILABLE"}])
+    lakes = mocker.Mock(return_value=[{"name": "l1", "state": "AVAILABLE"}])
+
+    watcher = CdpWatcher(CdpWaiter(delay=1, jitter=0))
+    watcher.register("cluster", clusters, key=lambda r: r["name"])
+    watcher.register("lake", lakes, key=lambda r: r["name"])
+    watcher.watch("cluster", "env", "c1", until=lambda r: r is not None)
+    watcher.watch("cluster", "env", "c2", until=lambda r: r is None)
+    watcher.watch("lake", "env", "l1", until=lambda r: r is not None)
+
+    result = watcher.wait()
+
+    clusters.assert_called_once_with("env")
+    lakes.assert_called_once_with("env")
+    assert result[("cluster", "env", "c2")] is None
+
+
+def test_watcher_dispatches_state_changes(clock, mocker):
+    """Test that each watch is told about the state changes of its own resource."""
+
+    lister, _ = listings(
+        (
+            None,
+            [
+                [("x", "STARTING"), ("y", "STARTING")],
+                [("x", "RUNNING"), ("y", "STARTING")],
+                [("x", "RUNNING"), ("y", "RUNNING")],
+            ],
+        ),
+    )
+    on_x = mocker.Mock()
+    on_y = mocker.Mock()
+
+    watcher = CdpWatcher(CdpWaiter(delay=1, jitter=0))
+    watcher.register("thing", lister, key=lambda r: r[0], state=lambda r: r[1])
+    watcher.watch("thing", None, "x", until=lambda r: r[1] == "RUNNING", on_change=on_x)
+    watcher.watch("thing", None, "y", until=lambda r: r[1] == "RUNNING", on_change=on_y)
+
+    watcher.wait()
+
+    on_x.assert_called_once_with("STARTING", "RUNNING", ("x", "RUNNING"))
+    on_y.assert_called_once_with("STARTING", "RUNNING", ("y", "RUNNING"))
+
+
+def test_watcher_timeout(clock):
+    """Test that a timeout reports only the unsettled resources."""
+
+    lister, _ = listings((None, [[("x", "DONE"), ("y", "PENDING")]]))
+
+    watcher = CdpWatcher(CdpWaiter(timeout=10, delay=8, jitter=0))
+    watcher.register("thing", lister, key=lambda r: r[0], state=lambda r: r[1])
+    watcher.watch("thing", None, "x", until=lambda r: r[1] == "DONE")
+    watcher.watch("thing", None, "y", until=lambda r: r[1] == "DONE")
+
+    with pytest.raises(CdpWaitTimeout) as e:
+        watcher.wait()
+
+    assert e.value.last == {("thing", None, "y"): ("y", "PENDING")}
+
+
+def test_watcher_failure_propagates(clock):
+    """Test that an error raised by a predicate aborts the wait."""
+
+    def until(resource):
+        if resource[1] == "FAILED":
+            raise CdpError("failed")
+        return False
+
+    lister, _ = listings((None, [[("x", "PENDING")], [("x", "FAILED")]]))
+
+    watcher = CdpWatcher(CdpWaiter(delay=1, jitter=0))
+    watcher.register("thing", lister, key=lambda r: r[0], state=lambda r: r[1])
+    watcher.watch("thing", None, "x", until=until)
+
+    with pytest.raises(CdpError, match="failed"):
+        watcher.wait()
+
+
+def test_watcher_unregistered_type():
+    """Test that watching an unregistered resource type is rejected."""
+
+    with pytest.raises(KeyError, match="Unregistered"):
+        CdpWatcher(CdpWaiter()).watch("thing", None, "x", until=lambda r: True)
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+import tracemalloc
+
+from dataclasses import asdict, dataclass, fields, make_dataclass, replace
+from typing import Any, Dict, List, Union
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
+    NULLABLE,
+    CdpModel,
+    cdp_model,
+    diff_dict,
+    from_dict,
+    to_dict,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import (
+    Connector,
+    DwSecret,
+    DwSecretProperties,
+    VirtualWarehouse,
+)
+
+
+@cdp_model
+class Item(CdpModel):
+    """Model with nested models and containers."""
+
+    name: Union[str, None, NULLABLE] = NULLABLE
+    secrets: Union[List[DwSecret], None, NULLABLE] = NULLABLE
+    labels: Union[Dict[str, Any], None, NULLABLE] = NULLABLE
+
+
+def vw_record(index):
+    return {
+        "id": f"compute-{index}",
+        "name": f"vw-{index}",
+        "vwType": "hive",
+        "dbcId": f"warehouse-{index}",
+        "status": "Running",
+        "instanceType": "r5d.4xlarge",
+        "nodeCount": index % 10,
+        "crn": f"crn:cdp:dw:us-west-1:tenant:vw:compute-{index}",
+        "creator": {"email": "user@example.com"},
+        "creationDate": "2026-01-01T00:00:00Z",
+        "endpoints": {"hue": f"https://hue-{index}.example.com"},
+        "tags": [{"key": "owner", "value": "team"}],
+    }
+
+
+def connector_record(index):
+    return {
+        "id": f"conn-{index}",
+        "name": f"connector-{index}",
+        "template": "postgres",
+        "crn": f"crn:cdp:dw:us-west-1:tenant:connector:conn-{index}",
+        "config": {"host": f"db-{index}.example.com", "port": "5432"},
+        "createdAt": index,
+        "createdBy": "user@example.com",
+    }
+
+
+def plain_dataclass(model):
+    """Return an equivalent, unslotted dataclass of a model."""
+    return make_dataclass(
+        model.__name__,
+        [(f.name, f.type, NULLABLE) for f in fields(model)],
+    )
+
+
+def asdict_to_dict(instance):
+    """Convert a dataclass to a dict as to_dict() did with dataclasses.asdict."""
+    return asdict(
+        instance,
+        dict_factory=lambda data: {k: v for k, v in data if v is not NULLABLE},
+    )
+
+
+def test_cdp_model_is_slotted():
+    """Test model instances hold their fields in slots."""
+
+    connector = Connector(name="connector", config={"host": "db"})
+
+    assert not hasattr(connector, "__dict__")
+    assert Connector.__slots__ == tuple(f.name for f in fields(Connector))
+    assert connector == Connector(name="connector", config={"host": "db"})
+    assert connector.id is NULLABLE
+    assert repr(connector).startswith("Connector(id=")
+
+    with pytest.raises(AttributeError):
+        connector.unknown = "value"
+
+
+def test_cdp_model_replace():
+    """Test models work with dataclasses.replace()."""
+
+    connector = Connector(name="connector", template="postgres")
+    updated = replace(connector, description="updated")
+
+    assert updated.name == "connector"
+    assert updated.description == "updated"
+    assert connector.description is NULLABLE
+
+
+def test_cdp_model_to_dict():
+    """Test to_dict() skips NULLABLE fields and converts nested values."""
+
+    item = Item(
+        name="item",
+        secrets=[
+            DwSecret(
+                secretName="secret",
+                properties=DwSecretProperties(version="1"),
+            ),
+        ],
+        labels={"key": ["value"], "none": None},
+    )
+
+    result = item.to_dict()
+
+    assert result == {
+        "name": "item",
+        "secrets": [{"secretName": "secret", "properties": {"version": "1"}}],
+        "labels": {"key": ["value"], "none": None},
+    }
+    assert result == asdict_to_dict(item)
+
+    # Containers are new, so the result can be changed freely
+    assert result["labels"] is not item.labels
+    assert result["labels"]["key"] is not item.labels["key"]
+
+
+def test_cdp_model_to_dict_none():
+    """Test to_dict() keeps explicit None values."""
+
+    assert to_dict(DwSecret(secretName=None)) == {"secretName": None}
+
+
+def test_to_dict_plain_dataclass():
+    """Test to_dict() converts plain dataclasses and rejects other values."""
+
+    @dataclass
+    class Plain:
+        name: Any = NULLABLE
+        item: Any = NULLABLE
+
+    assert to_dict(Plain(name="plain", item=Item(name="item"))) == {
+        "name": "plain",
+        "item": {"name": "item"},
+    }
+
+    with pytest.raises(TypeError):
+        to_dict(Plain)
+
+    with pytest.raises(TypeError):
+        to_dict({"name": "plain"})
+
+
+def test_cdp_model_from_dict_and_diff():
+    """Test models load and compare like plain dataclasses."""
+
+    prev = from_dict(DwSecret, {"secretName": "a", "properties": {"version": "1"}})
+    next = from_dict(DwSecret, {"secretName": "a", "properties": {"version": "2"}})
+
+    assert isinstance(prev.properties, DwSecretProperties)
+    assert not hasattr(prev.properties, "__dict__")
+    assert diff_dict(prev, next) == (
+        {"properties": {"version": "1"}},
+        {"properties": {"version": "2"}},
+    )
+
+
+@pytest.mark.slow
+def test_benchmark_cdp_model(capsys):
+    """Benchmark memory and throughput of slotted models over plain dataclasses."""
+
+    listings = [
+        (VirtualWarehouse, [vw_record(i) for i in range(5000)]),
+        (Connector, [connector_record(i) for i in range(5000)]),
+    ]
+
+    def run(model, records, convert):
+        tracemalloc.start()
+        start = time.perf_counter()
+        instances = [from_dict(model, record) for record in records]
+        built = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for instance in instances:
+            convert(instance)
+        converted = time.perf_counter() - start
+
+        return memory, built, converted
+
+    results = []
+    for model, records in listings:
+        plain = run(plain_dataclass(model), records, asdict_to_dict)
+        slotted = run(model, records, to_dict)
+        results.append((model.__name__, plain, slotted))
+
+    with capsys.disabled():
+        print()
+        for name, plain, slotted in results:
+            print(
+                f"{name}: memory {plain[0] / 1024:.0f} KiB -> "
+                f"{slotted[0] / 1024:.0f} KiB, from_dict "
+                f"{plain[1] * 1e3:.1f} ms -> {slotted[1] * 1e3:.1f} ms, to_dict "
+                f"{plain[2] * 1e3:.1f} ms -> {slotted[2] * 1e3:.1f} ms",
+            )
+
+    for _, plain, slotted in results:
+        assert slotted[0] < plain[0]
+        assert slotted[2] < plain[2]
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+from ansible_collections.cloudera.cloud.plugins.module_utils import common
+from ansible_collections.cloudera.cloud.plugins.module_utils.common import (
+    NULLABLE,
+    diff_dict,
+    from_dict,
+)
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import (
+    Connector,
+    DwSecret,
+    DwSecretProperties,
+    VirtualWarehouse,
+)
+
+
+@dataclass
+class Node:
+    """Self-referencing dataclass."""
+
+    name: Union[str, None, NULLABLE] = NULLABLE
+    children: Optional[List["Node"]] = None
+    parent: Union["Node", None, NULLABLE] = NULLABLE
+
+
+def vw_record(index):
+    return {
+        "id": f"compute-{index}",
+        "name": f"vw-{index}",
+        "vwType": "hive",
+        "status": "Running",
+        "nodeCount": index % 10,
+        "creator": {"email": "user@example.com"},
+        "endpoints": {"hue": f"https://hue-{index}.example.com"},
+        "tags": [{"key": "owner", "value": "team"}],
+        "associatedConnectors": {f"conn-{index}": {"name": "connector"}},
+        "unknownField": "ignored",
+    }
+
+
+def connector_record(index):
+    return {
+        "id": f"conn-{index}",
+        "name": f"connector-{index}",
+        "template": "postgres",
+        "config": {"host": f"db-{index}.example.com", "port": "5432"},
+        "createdAt": index,
+    }
+
+
+def test_from_dict_reuses_plan(mocker):
+    """Test the type hints of a dataclass are resolved only once."""
+
+    common._CONVERTERS.pop(Connector, None)
+    hints = mocker.spy(common, "get_type_hints")
+
+    connectors = [from_dict(Connector, connector_record(i)) for i in range(3)]
+
+    assert [c.name for c in connectors] == [
+        "connector-0",
+        "connector-1",
+        "connector-2",
+    ]
+    assert connectors[0].config == {"host": "db-0.example.com", "port": "5432"}
+    assert connectors[0].crn is NULLABLE
+    assert hints.call_count == 1
+
+
+def test_from_dict_nested_dataclass():
+    """Test nested dataclasses are loaded with their own plan."""
+
+    secret = from_dict(
+        DwSecret,
+        {
+            "secretName": "secret",
+            "properties": {"cloudProvider": "azure", "extra": "ignored"},
+        },
+    )
+
+    assert secret.secretName == "secret"
+    assert secret.properties == DwSecretProperties(cloudProvider="azure")
+
+
+def test_from_dict_self_referencing():
+    """Test a dataclass referring to itself is loaded."""
+
+    node = from_dict(
+        Node,
+        {
+            "name": "root",
+            "children": [{"name": "leaf"}],
+            "parent": {"name": "super"},
+        },
+    )
+
+    # Optional lists are kept as-is, as before
+    assert node.children == [{"name": "leaf"}]
+    assert node.parent == Node(name="super")
+
+
+def test_from_dict_containers():
+    """Test lists, dicts and None are loaded item by item."""
+
+    assert from_dict(List[Connector], [{"name": "a"}, None]) == [
+        Connector(name="a"),
+        None,
+    ]
+    assert from_dict(List[Connector], "invalid") == []
+    assert from_dict(Dict[str, Connector], {"a": {"name": "a"}}) == {
+        "a": Connector(name="a"),
+    }
+    assert from_dict(Connector, None) is None
+    assert from_dict(Connector, "primitive") == "primitive"
+
+
+def test_diff_dict_reuses_fields(mocker):
+    """Test the compared fields of a dataclass are resolved only once."""
+
+    common._DIFF_FIELDS.pop(DwSecret, None)
+    common._DIFF_FIELDS.pop(DwSecretProperties, None)
+    hints = mocker.spy(common, "get_type_hints")
+
+    prev = DwSecret(secretName="a", properties=DwSecretProperties(version="1"))
+    next = DwSecret(secretName="a", properties=DwSecretProperties(version="2"))
+
+    for _ in range(3):
+        assert diff_dict(prev, next) == (
+            {"properties": {"version": "1"}},
+            {"properties": {"version": "2"}},
+        )
+
+    assert hints.call_count == 2
+
+
+@pytest.mark.slow
+def test_benchmark_dataclass_plans(capsys):
+    """Benchmark marshalling and diffing with and without the cached plans."""
+
+    vws = [vw_record(i) for i in range(5000)]
+    connectors = [connector_record(i) for i in range(5000)]
+
+    def marshal(cold):
+        for vw, connector in zip(vws, connectors):
+            if cold:
+                common._CONVERTERS.clear()
+            from_dict(VirtualWarehouse, vw)
+            from_dict(Connector, connector)
+
+    prev = [from_dict(VirtualWarehouse, vw) for vw in vws]
+    next = [from_dict(VirtualWarehouse, dict(vw, nodeCount=11)) for vw in vws]
+
+    def diff(cold):
+        for p, n in zip(prev, next):
+            if cold:
+                common._DIFF_FIELDS.clear()
+            diff_dict(p, n)
+
+    results = {}
+    for name, func in (("from_dict", marshal), ("diff_dict", diff)):
+        start = time.perf_counter()
+        func(cold=True)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        func(cold=False)
+        warm = time.perf_counter() - start
+
+        results[name] = (cold, warm)
+
+    with capsys.disabled():
+        print()
+        for name, (cold, warm) in results.items():
+            print(
+                f"{name}: {cold * 1e3:.1f} ms uncached, {warm * 1e3:.1f} ms cached "
+                f"({cold / warm:.2f}x)",
+            )
+
+    for cold, warm in results.values():
+        assert warm < cold
@@ -18,6 +18,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from functools import partial
+
 import pytest
 
 from ansible_collections.cloudera.cloud.tests.unit import (
@@ -65,6 +67,11 @@ def test_de_info_list_all(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services response
     client.list_services.return_value = {
@@ -106,6 +113,45 @@ def test_de_info_list_all(module_args, mocker):
     assert client.describe_service.call_count == 2
 
 
+def test_de_info_parallelism(module_args, mocker):
+    """Test de_info module passes the parallelism to the service describes."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "env_name": ENV_NAME,
+            "parallelism": 4,
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDeClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
+        autospec=True,
+    ).return_value
+    client.describe_all_services.return_value = [
+        {"clusterId": "cluster-123", "name": "service-1"},
+    ]
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        de_info.main()
+
+    assert result.value.services == [{"clusterId": "cluster-123", "name": "service-1"}]
+    client.describe_all_services.assert_called_once_with(
+        env_name=ENV_NAME,
+        parallelism=4,
+    )
+
+
 def test_de_info_by_name(module_args, mocker):
     """Test de_info module filtering by service name."""
 
@@ -129,6 +175,11 @@ def test_de_info_by_name(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_name response
     client.get_service_by_name.return_value = {
@@ -179,6 +230,11 @@ def test_de_info_by_cluster_id(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_cluster_id response (direct lookup by cluster_id)
     client.get_service_by_cluster_id.return_value = {
@@ -227,6 +283,11 @@ def test_de_info_by_env_name(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services response with env_name filter
     client.list_services.return_value = {
@@ -288,6 +349,11 @@ def test_de_info_multiple_services_same_env(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services response with multiple services in same environment
     client.list_services.return_value = {
@@ -369,6 +435,11 @@ def test_de_info_not_found_by_name(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_name returning None
     client.get_service_by_name.return_value = None
@@ -412,6 +483,11 @@ def test_de_info_not_found_by_cluster_id(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_cluster_id returning None
     client.get_service_by_cluster_id.return_value = None
@@ -449,6 +525,11 @@ def test_de_info_empty_list(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services returning empty list
     client.list_services.return_value = {"services": []}
@@ -488,6 +569,11 @@ def test_de_info_deleted_service_via_cluster_id(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_cluster_id returning deleted service
     client.get_service_by_cluster_id.return_value = {
@@ -533,6 +619,11 @@ def test_de_info_service_details(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.de_info.CdpDeClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDeClient.describe_all_services,
+        client,
+    )
 
     # Mock get_service_by_cluster_id with full details
     client.get_service_by_cluster_id.return_value = {
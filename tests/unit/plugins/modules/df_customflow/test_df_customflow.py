@@ -26,6 +26,10 @@ from ansible_collections.cloudera.cloud.tests.unit import (
 )
 
 from ansible_collections.cloudera.cloud.plugins.modules import df_customflow
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_df import (
+    CdpFlowManifest,
+    flow_content_hash,
+)
 
 
 BASE_URL = "https://cloudera.internal/api"
@@ -40,6 +44,13 @@ FLOW_CRN = "crn:cdp:df:us-west-1:tenant:flow:flow-123"
 FLOW_FILE_CONTENT = '{"flow": "definition"}'
 
 
+@pytest.fixture(autouse=True)
+def home(monkeypatch, tmp_path):
+    """Keep the default content manifest out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return tmp_path / "home"
+
+
 def test_df_customflow_import_success_from_file(module_args, mocker, tmp_path):
     """Test importing a new CustomFlow successfully from file."""
 
@@ -98,7 +109,8 @@ def test_df_customflow_import_success_from_file(module_args, mocker, tmp_path):
     client.import_flow_definition.assert_called_once()
     call_args = client.import_flow_definition.call_args[1]
     assert call_args["name"] == FLOW_NAME
-    assert call_args["file_content"] == FLOW_FILE_CONTENT
+    assert call_args["file_content"] is None
+    assert call_args["file_path"] == str(flow_file)
     assert call_args["description"] == "Test flow description"
     assert call_args["comments"] == "Initial version"
 
@@ -531,3 +543,231 @@ def test_df_customflow_file_read_error(module_args, mocker):
         df_customflow.main()
 
     assert "Failed to read file" in result.value.msg
+
+
+def test_df_customflow_import_records_manifest(module_args, mocker, tmp_path):
+    """Test importing a new CustomFlow records the digest of its content."""
+
+    flow_file = tmp_path / "test-flow.json"
+    flow_file.write_text(FLOW_FILE_CONTENT)
+    manifest_dir = tmp_path / "manifest"
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": FLOW_NAME,
+            "file": str(flow_file),
+            "manifest_dir": str(manifest_dir),
+            "state": "present",
+        },
+    )
+
+    # Patch load_cdp_config
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_customflow.CdpDfClient",
+        autospec=True,
+    ).return_value
+
+    client.get_flow_by_name.return_value = None
+    client.import_flow_definition.return_value = {
+        "crn": FLOW_CRN,
+        "name": FLOW_NAME,
+        "versionCount": 1,
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_customflow.main()
+
+    assert result.value.changed is True
+
+    assert CdpFlowManifest(str(manifest_dir)).get(FLOW_CRN, 1) == flow_content_hash(
+        content=FLOW_FILE_CONTENT,
+    )
+
+
+def test_df_customflow_unchanged_content_not_uploaded(module_args, mocker, tmp_path):
+    """Test an existing CustomFlow with recorded, unchanged content is not uploaded."""
+
+    manifest_dir = tmp_path / "manifest"
+    CdpFlowManifest(str(manifest_dir)).put(
+        FLOW_CRN,
+        flow_content_hash(content=FLOW_FILE_CONTENT),
+        2,
+    )
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": FLOW_NAME,
+            "content": FLOW_FILE_CONTENT,
+            "manifest_dir": str(manifest_dir),
+            "state": "present",
+        },
+    )
+
+    # Patch load_cdp_config
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_customflow.CdpDfClient",
+        autospec=True,
+    ).return_value
+
+    client.get_flow_by_name.return_value = {
+        "crn": FLOW_CRN,
+        "name": FLOW_NAME,
+        "versionCount": 2,
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_customflow.main()
+
+    assert result.value.changed is False
+    assert result.value.customflow["crn"] == FLOW_CRN
+
+    client.import_flow_definition.assert_not_called()
+    client.import_flow_definition_version.assert_not_called()
+
+
+@pytest.mark.parametrize("check_mode", [False, True])
+def test_df_customflow_changed_content_imports_version(
+    module_args,
+    mocker,
+    tmp_path,
+    check_mode,
+):
+    """Test changed content of a recorded CustomFlow is imported as a new version."""
+
+    flow_file = tmp_path / "test-flow.json"
+    flow_file.write_text(FLOW_FILE_CONTENT)
+    manifest_dir = tmp_path / "manifest"
+    manifest = CdpFlowManifest(str(manifest_dir))
+    manifest.put(FLOW_CRN, flow_content_hash(content='{"flow": "previous"}'), 1)
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": FLOW_NAME,
+            "file": str(flow_file),
+            "comments": "Second version",
+            "manifest_dir": str(manifest_dir),
+            "state": "present",
+            "_ansible_check_mode": check_mode,
+        },
+    )
+
+    # Patch load_cdp_config
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_customflow.CdpDfClient",
+        autospec=True,
+    ).return_value
+
+    client.get_flow_by_name.return_value = {
+        "crn": FLOW_CRN,
+        "name": FLOW_NAME,
+        "versions": [{"version": 1}],
+    }
+    client.import_flow_definition_version.return_value = {"version": 2}
+    client.get_flow_by_crn.return_value = {
+        "crn": FLOW_CRN,
+        "name": FLOW_NAME,
+        "versions": [{"version": 1}, {"version": 2}],
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_customflow.main()
+
+    assert result.value.changed is True
+    client.import_flow_definition.assert_not_called()
+
+    if check_mode:
+        client.import_flow_definition_version.assert_not_called()
+        assert manifest.get(FLOW_CRN, 2) is None
+    else:
+        client.import_flow_definition_version.assert_called_once_with(
+            flow_crn=FLOW_CRN,
+            file_content=None,
+            comments="Second version",
+            tags=None,
+            file_path=str(flow_file),
+        )
+        assert len(result.value.customflow["versions"]) == 2
+        assert manifest.get(FLOW_CRN, 2) == flow_content_hash(
+            content=FLOW_FILE_CONTENT,
+        )
+
+
+def test_df_customflow_untracked_not_uploaded(module_args, mocker, tmp_path):
+    """Test an existing CustomFlow whose latest version has no record is left unchanged."""
+
+    manifest_dir = tmp_path / "manifest"
+    CdpFlowManifest(str(manifest_dir)).put(
+        FLOW_CRN,
+        flow_content_hash(content='{"flow": "previous"}'),
+        1,
+    )
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": FLOW_NAME,
+            "content": FLOW_FILE_CONTENT,
+            "manifest_dir": str(manifest_dir),
+            "state": "present",
+        },
+    )
+
+    # Patch load_cdp_config
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_customflow.CdpDfClient",
+        autospec=True,
+    ).return_value
+
+    # Version 2 was imported by other means
+    client.get_flow_by_name.return_value = {
+        "crn": FLOW_CRN,
+        "name": FLOW_NAME,
+        "versionCount": 2,
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_customflow.main()
+
+    assert result.value.changed is False
+
+    client.import_flow_definition.assert_not_called()
+    client.import_flow_definition_version.assert_not_called()
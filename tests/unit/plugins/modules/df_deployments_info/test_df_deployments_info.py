@@ -403,3 +403,43 @@ def test_df_deployment_info_empty_list(module_args, mocker):
 
     # Verify CdpDfClient was called correctly
     client.list_deployments.assert_called_once()
+
+
+def test_df_deployment_info_describe(module_args, mocker):
+    """Test df_deployment_info module describes all deployments when requested."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "describe": True,
+            "parallelism": 4,
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_deployment_info.CdpDfClient",
+        autospec=True,
+    ).return_value
+    client.describe_all_deployments.return_value = [
+        {"name": DEPLOYMENT_NAME, "crn": DEPLOYMENT_CRN},
+    ]
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_deployment_info.main()
+
+    assert result.value.deployments == [
+        {"name": DEPLOYMENT_NAME, "crn": DEPLOYMENT_CRN},
+    ]
+
+    client.describe_all_deployments.assert_called_once_with(parallelism=4)
+    client.list_deployments.assert_not_called()
@@ -18,6 +18,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from functools import partial
+
 import pytest
 
 from ansible_collections.cloudera.cloud.tests.unit import (
@@ -64,6 +66,11 @@ def test_df_service_info_list_all(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.df_service_info.CdpDfClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDfClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services response
     client.list_services.return_value = {
@@ -368,6 +375,11 @@ def test_df_service_info_empty_list(module_args, mocker):
         "ansible_collections.cloudera.cloud.plugins.modules.df_service_info.CdpDfClient",
         autospec=True,
     ).return_value
+    client.api_client = mocker.MagicMock()
+    client.describe_all_services.side_effect = partial(
+        CdpDfClient.describe_all_services,
+        client,
+    )
 
     # Mock list_services returning empty list
     client.list_services.return_value = {"services": []}
@@ -382,3 +394,37 @@ def test_df_service_info_empty_list(module_args, mocker):
     # Verify CdpDfClient was called correctly
     client.list_services.assert_called_once()
     client.describe_service.assert_not_called()
+
+
+def test_df_service_info_parallelism(module_args, mocker):
+    """Test df_service_info module passes parallelism to the service describes."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "parallelism": 4,
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpDfClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.df_service_info.CdpDfClient",
+        autospec=True,
+    ).return_value
+    client.describe_all_services.return_value = [{"crn": SERVICE_CRN}]
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        df_service_info.main()
+
+    assert result.value.services == [{"crn": SERVICE_CRN}]
+
+    client.describe_all_services.assert_called_once_with(parallelism=4)
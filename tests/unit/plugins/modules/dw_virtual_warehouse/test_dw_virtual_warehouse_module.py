@@ -23,6 +23,7 @@ import pytest
 # pylint: disable=redefined-outer-name,unused-argument
 
 from ansible_collections.cloudera.cloud.plugins.modules import dw_virtual_warehouse
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import CdpError
 from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_dw import (
     VirtualWarehouse,
 )
@@ -384,3 +385,241 @@ def test_absent_reports_diff(dw_vw_module_args, dw_vw_client):
 
     assert result.value.diff["before"]["id"] == VW_ID
     assert result.value.diff["after"] == {}
+
+
+def test_present_requires_name(dw_vw_module_args, dw_vw_client):
+    """A single warehouse with state=present still requires its creation options."""
+    dw_vw_module_args({"type": "hive", "catalog_id": CATALOG_ID})
+
+    with pytest.raises(AnsibleFailJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert "name" in result.value.msg
+    dw_vw_client.create_vw.assert_not_called()
+
+
+def test_batch_lists_each_cluster_once(dw_vw_module_args, dw_vw_client):
+    """Batch mode looks up every warehouse with one listing per cluster."""
+    listings = {
+        CLUSTER_ID: [_running_vw(nodeCount=2)],
+        "other-cluster-id": [_running_vw(id="hive-old", name="old-vw")],
+    }
+    dw_vw_client.list_vws.side_effect = lambda cluster_id: listings[cluster_id]
+    dw_vw_client.create_vw.return_value = _running_vw(id="hive-new", name="new-vw")
+    dw_vw_client.update_vw.return_value = _running_vw(nodeCount=4)
+
+    dw_vw_module_args(
+        {
+            "warehouses": [
+                {
+                    "name": VW_NAME,
+                    "type": "trino",
+                    "catalog_id": CATALOG_ID,
+                    "node_count": 4,
+                },
+                {"name": "new-vw", "type": "hive", "catalog_id": CATALOG_ID},
+                {
+                    "cluster_id": "other-cluster-id",
+                    "warehouse_id": "hive-old",
+                    "state": "absent",
+                },
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleExitJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert result.value.changed is True
+    assert [vw.get("id") for vw in result.value.virtual_warehouses] == [
+        VW_ID,
+        "hive-new",
+        None,
+    ]
+    assert sorted(c.args[0] for c in dw_vw_client.list_vws.call_args_list) == [
+        CLUSTER_ID,
+        "other-cluster-id",
+    ]
+    dw_vw_client.get_vw_by_id.assert_not_called()
+    dw_vw_client.get_vw_by_name.assert_not_called()
+    dw_vw_client.update_vw.assert_called_once_with(
+        cluster_id=CLUSTER_ID,
+        vw_id=VW_ID,
+        node_count=4,
+        associated_connectors=None,
+    )
+    assert dw_vw_client.create_vw.call_args.kwargs["name"] == "new-vw"
+    dw_vw_client.delete_vw.assert_called_once_with("other-cluster-id", "hive-old")
+    dw_vw_client.wait_for_vws.assert_not_called()
+
+
+def test_batch_waits_on_all_warehouses_at_once(dw_vw_module_args, dw_vw_client):
+    """Batch mode waits once for every warehouse, then for the connector step."""
+    dw_vw_client.list_vws.return_value = []
+    dw_vw_client.create_vw.side_effect = lambda **kwargs: _running_vw(
+        id=kwargs["name"] + "-id",
+        name=kwargs["name"],
+        status="Starting",
+    )
+    dw_vw_client.wait_for_vws.side_effect = lambda vws, until, waiter: {
+        key: _running_vw(id=key[1]) for key in vws
+    }
+
+    dw_vw_module_args(
+        {
+            "wait": True,
+            "warehouses": [
+                {
+                    "name": "vw-1",
+                    "type": "trino",
+                    "catalog_id": CATALOG_ID,
+                    "connectors": [CONNECTOR_2, CONNECTOR_1],
+                },
+                {"name": "vw-2", "type": "hive", "catalog_id": CATALOG_ID},
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleExitJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert result.value.changed is True
+    assert [vw["status"] for vw in result.value.virtual_warehouses] == [
+        "Running",
+        "Running",
+    ]
+    dw_vw_client.list_vws.assert_called_once_with(CLUSTER_ID)
+    assert [c.args[0] for c in dw_vw_client.wait_for_vws.call_args_list] == [
+        [(CLUSTER_ID, "vw-1-id"), (CLUSTER_ID, "vw-2-id")],
+        [(CLUSTER_ID, "vw-1-id")],
+    ]
+    dw_vw_client.update_vw.assert_called_once_with(
+        cluster_id=CLUSTER_ID,
+        vw_id="vw-1-id",
+        associated_connectors=[CONNECTOR_1, CONNECTOR_2],
+    )
+    dw_vw_client.get_vw_by_id.assert_not_called()
+
+
+def test_batch_failure_reports_errors(dw_vw_module_args, dw_vw_client):
+    """Batch mode attempts every change and reports each failed warehouse."""
+    dw_vw_client.list_vws.return_value = []
+
+    def create_vw(**kwargs):
+        if kwargs["name"] == "vw-bad":
+            raise CdpError("quota exceeded")
+        return _running_vw(id=kwargs["name"] + "-id", name=kwargs["name"])
+
+    dw_vw_client.create_vw.side_effect = create_vw
+
+    dw_vw_module_args(
+        {
+            "warehouses": [
+                {"name": "vw-bad", "type": "hive", "catalog_id": CATALOG_ID},
+                {"name": "vw-good", "type": "hive", "catalog_id": CATALOG_ID},
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleFailJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert result.value.errors == [
+        dict(item=f"{CLUSTER_ID}/vw-bad", error="quota exceeded"),
+    ]
+    assert dw_vw_client.create_vw.call_count == 2
+
+
+def test_batch_create_without_warehouse_reports_error(dw_vw_module_args, dw_vw_client):
+    """Batch mode reports a creation that returns no warehouse as a failed change."""
+    dw_vw_client.list_vws.return_value = []
+    dw_vw_client.create_vw.return_value = None
+
+    dw_vw_module_args(
+        {
+            "warehouses": [
+                {"name": "vw-new", "type": "hive", "catalog_id": CATALOG_ID},
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleFailJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert result.value.errors == [
+        dict(
+            item=f"{CLUSTER_ID}/vw-new",
+            error="Virtual Warehouse creation did not return a warehouse.",
+        ),
+    ]
+
+
+def test_batch_check_mode_reports_existing(dw_vw_module_args, dw_vw_client):
+    """check_mode in batch mode reports the changes without making them."""
+    dw_vw_client.list_vws.return_value = [_running_vw(nodeCount=2)]
+
+    dw_vw_module_args(
+        {
+            "_ansible_check_mode": True,
+            "_ansible_diff": True,
+            "warehouses": [
+                {
+                    "name": VW_NAME,
+                    "type": "trino",
+                    "catalog_id": CATALOG_ID,
+                    "node_count": 4,
+                },
+                {"name": "new-vw", "type": "hive", "catalog_id": CATALOG_ID},
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleExitJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert result.value.changed is True
+    assert result.value.virtual_warehouses[0]["nodeCount"] == 2
+    assert result.value.virtual_warehouses[1] == {}
+    assert result.value.diff["after"][0] == {"nodeCount": 4}
+    assert result.value.diff["after"][1]["name"] == "new-vw"
+    dw_vw_client.create_vw.assert_not_called()
+    dw_vw_client.update_vw.assert_not_called()
+
+
+def test_batch_excludes_single_options(dw_vw_module_args, dw_vw_client):
+    """The warehouses option cannot be combined with a single warehouse."""
+    dw_vw_module_args(
+        {
+            "name": VW_NAME,
+            "warehouses": [{"warehouse_id": VW_ID, "state": "absent"}],
+        },
+    )
+
+    with pytest.raises(AnsibleFailJson):
+        dw_virtual_warehouse.main()
+
+    dw_vw_client.list_vws.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "option",
+    [{"state": "absent"}, {"node_count": 3}, {"catalog_id": CATALOG_ID}],
+    ids=["state", "node_count", "catalog_id"],
+)
+def test_batch_rejects_top_level_options(dw_vw_module_args, dw_vw_client, option):
+    """Top-level options of a single warehouse are rejected rather than ignored."""
+    dw_vw_module_args(
+        {
+            **option,
+            "warehouses": [
+                {"name": "vw-new", "type": "hive", "catalog_id": CATALOG_ID},
+            ],
+        },
+    )
+
+    with pytest.raises(AnsibleFailJson) as result:
+        dw_virtual_warehouse.main()
+
+    assert list(option)[0] in result.value.msg
+    dw_vw_client.list_vws.assert_not_called()
+    dw_vw_client.create_vw.assert_not_called()
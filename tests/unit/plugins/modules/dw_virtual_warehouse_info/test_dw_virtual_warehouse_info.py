@@ -144,14 +144,16 @@ def test_get_by_name(module_args, mock_client):
 def test_filter_by_catalog_id(module_args, mock_client):
     """catalog_id filters the listing by dbcId."""
     module_args(_args(cluster_id=CLUSTER_ID, catalog_id=CATALOG_ID))
-    mock_client.list_vws.return_value = MOCK_VWS
+    mock_client.list_vws.return_value = [
+        vw for vw in MOCK_VWS if vw.dbcId == CATALOG_ID
+    ]
 
     with pytest.raises(AnsibleExitJson) as result:
         dw_virtual_warehouse_info.main()
 
     assert len(result.value.virtual_warehouses) == 1
     assert result.value.virtual_warehouses[0]["dbcId"] == CATALOG_ID
-    mock_client.list_vws.assert_called_once_with(CLUSTER_ID)
+    mock_client.list_vws.assert_called_once_with(CLUSTER_ID, catalog_id=CATALOG_ID)
 
 
 def test_empty_api_result(module_args, mock_client):
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2026 Cloudera, Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.cloudera.cloud.tests.unit import (
+    AnsibleFailJson,
+    AnsibleExitJson,
+)
+
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
+from ansible_collections.cloudera.cloud.plugins.modules import iam_bulk
+
+
+BASE_URL = "https://cloudera.internal/api"
+ACCESS_KEY = "test-access-key"
+PRIVATE_KEY = "test-private-key"
+FILE_ACCESS_KEY = "file-access-key"
+FILE_PRIVATE_KEY = "file-private-key"
+FILE_REGION = "default"
+
+CRN_PREFIX = "crn:cdp:iam:us-west-1:altus"
+ROLE_CRN = f"{CRN_PREFIX}:role:PowerUser"
+
+ALICE = {
+    "userId": "alice-id",
+    "email": "alice@example.com",
+    "workloadUsername": "alice",
+    "crn": f"{CRN_PREFIX}:user:alice-id",
+}
+DEVELOPERS = {
+    "groupName": "developers",
+    "crn": f"{CRN_PREFIX}:group:developers",
+    "syncMembershipOnUserLogin": True,
+}
+
+
+@pytest.fixture
+def client(module_args, mocker):
+    """Patch CdpIamClient with an empty tenant."""
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_bulk.CdpIamClient",
+        autospec=True,
+    ).return_value
+    client.list_users.return_value = {"users": []}
+    client.list_groups.return_value = {"groups": []}
+    client.list_machine_users.return_value = {"machineUsers": []}
+    client.list_group_members.return_value = {"memberCrns": []}
+    client.list_user_assigned_roles.return_value = {"roleCrns": []}
+    client.list_user_assigned_resource_roles.return_value = {"resourceAssignments": []}
+    client.list_group_assigned_roles.return_value = {"roleCrns": []}
+    client.list_group_assigned_resource_roles.return_value = {
+        "resourceAssignments": [],
+    }
+    client._is_machine_user.side_effect = lambda crn: ":machineUser:" in crn
+    client.get_default_identity_provider.return_value = {"crn": "idp-crn"}
+    return client
+
+
+def test_iam_bulk_create(module_args, client):
+    """Test iam_bulk module creating groups and users and their memberships."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "groups": [{"name": "developers", "roles": [ROLE_CRN]}],
+            "users": [
+                {"email": "alice@example.com", "groups": ["developers"]},
+                {"email": "bob@example.com", "groups": ["developers"]},
+            ],
+        },
+    )
+
+    client.create_group.return_value = {"group": DEVELOPERS}
+    client.create_user.side_effect = lambda email, **kwargs: {
+        "user": {
+            "userId": f"{email}-id",
+            "email": email,
+            "crn": f"{CRN_PREFIX}:user:{email}-id",
+        },
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_bulk.main()
+
+    assert result.value.changed is True
+    assert result.value.mutations == 6
+    assert [u["mutations"] for u in result.value.users] == [2, 2]
+    assert result.value.groups[0]["mutations"] == 2
+    assert result.value.users[0]["crn"] == f"{CRN_PREFIX}:user:alice@example.com-id"
+
+    # The state is loaded once, and the default identity provider looked up once
+    client.list_users.assert_called_once()
+    client.list_groups.assert_called_once()
+    client.get_default_identity_provider.assert_called_once()
+    client.get_user_details_by_email.assert_not_called()
+
+    assert client.create_user.call_count == 2
+    client.create_user.assert_any_call(
+        email="alice@example.com",
+        identity_provider_user_id="alice@example.com",
+        first_name=None,
+        last_name=None,
+        saml_provider_name="idp-crn",
+    )
+    assert sorted(
+        call.kwargs["user_id"] for call in client.add_user_to_group.call_args_list
+    ) == ["alice@example.com-id", "bob@example.com-id"]
+    client.assign_group_role.assert_called_once_with(
+        group_name="developers",
+        role=ROLE_CRN,
+    )
+
+
+def test_iam_bulk_no_changes(module_args, client):
+    """Test iam_bulk module with entities already in the desired state."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "groups": [{"name": "developers", "users": ["alice"]}],
+            "users": [{"email": "alice@example.com", "groups": ["developers"]}],
+        },
+    )
+
+    client.list_users.return_value = {"users": [ALICE]}
+    client.list_groups.return_value = {"groups": [DEVELOPERS]}
+    client.list_group_members.return_value = {"memberCrns": [ALICE["crn"]]}
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_bulk.main()
+
+    assert result.value.changed is False
+    assert result.value.mutations == 0
+    assert result.value.users[0]["changed"] is False
+    assert result.value.groups[0]["crn"] == DEVELOPERS["crn"]
+
+    client.list_group_members.assert_called_once()
+    client.add_user_to_group.assert_not_called()
+    client.update_group.assert_not_called()
+
+
+def test_iam_bulk_shared_membership(module_args, client):
+    """Test iam_bulk module adding a membership given for both user and group once."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "groups": [{"name": "developers", "users": ["alice@example.com"]}],
+            "users": [{"email": "alice@example.com", "groups": ["developers"]}],
+        },
+    )
+
+    client.list_users.return_value = {"users": [ALICE]}
+    client.list_groups.return_value = {"groups": [DEVELOPERS]}
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_bulk.main()
+
+    assert result.value.changed is True
+    assert result.value.mutations == 1
+    client.add_user_to_group.assert_called_once_with(
+        user_id="alice-id",
+        group_name="developers",
+    )
+
+
+def test_iam_bulk_check_mode(module_args, client):
+    """Test iam_bulk module reporting planned changes without making them."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "users": [
+                {"email": "alice@example.com", "roles": [ROLE_CRN]},
+                {"email": "bob@example.com"},
+            ],
+            "machine_users": [{"name": "ci-bot", "state": "absent"}],
+            "_ansible_check_mode": True,
+            "_ansible_diff": True,
+        },
+    )
+
+    client.list_users.return_value = {"users": [ALICE]}
+    client.list_machine_users.return_value = {
+        "machineUsers": [
+            {"machineUserName": "ci-bot", "crn": f"{CRN_PREFIX}:machineUser:ci-bot"},
+        ],
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_bulk.main()
+
+    assert result.value.changed is True
+    assert result.value.mutations == 0
+    assert [u["changed"] for u in result.value.users] == [True, True]
+    assert result.value.machine_users[0]["changed"] is True
+    assert result.value.diff["after"]["users"] == {
+        "alice@example.com": {"roles": [ROLE_CRN]},
+        "bob@example.com": {"name": "bob@example.com"},
+    }
+    assert result.value.diff["after"]["machine_users"] == {"ci-bot": {}}
+
+    client.create_user.assert_not_called()
+    client.assign_user_role.assert_not_called()
+    client.delete_machine_user.assert_not_called()
+
+
+def test_iam_bulk_errors(module_args, client):
+    """Test iam_bulk module reporting failed changes per entity."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "users": [
+                {"email": "alice@example.com", "roles": [ROLE_CRN]},
+                {"email": "bob@example.com", "groups": ["missing"]},
+            ],
+        },
+    )
+
+    client.list_users.return_value = {"users": [ALICE]}
+    client.assign_user_role.side_effect = CdpError("Internal error", status=500)
+
+    # Test module execution
+    with pytest.raises(AnsibleFailJson, match="2 changes failed") as result:
+        iam_bulk.main()
+
+    assert result.value.users[0]["errors"] == [
+        dict(item=ROLE_CRN, error="Internal error"),
+    ]
+    assert result.value.users[1]["errors"][0]["item"] == "missing"
+    assert result.value.mutations == 0
+
+    # Users in missing groups are not created
+    client.create_user.assert_not_called()
+
+
+def test_iam_bulk_new_machine_user_member(module_args, client):
+    """Test iam_bulk module adding a machine user created in the same run to a group."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "groups": [{"name": "developers", "users": ["ci-bot"]}],
+            "machine_users": [{"name": "ci-bot"}],
+        },
+    )
+
+    client.list_groups.return_value = {"groups": [DEVELOPERS]}
+    client.create_machine_user.return_value = {
+        "machineUser": {
+            "machineUserName": "ci-bot",
+            "crn": f"{CRN_PREFIX}:machineUser:ci-bot",
+        },
+    }
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_bulk.main()
+
+    assert result.value.changed is True
+    client.add_machine_user_to_group.assert_called_once_with(
+        machine_user_name=f"{CRN_PREFIX}:machineUser:ci-bot",
+        group_name="developers",
+    )
+    client.add_user_to_group.assert_not_called()
+
+
+def test_iam_bulk_group_names_match_exactly(module_args, client):
+    """Test iam_bulk module matching the groups of a user by their exact names."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "purge": True,
+            "users": [{"email": "alice@example.com", "groups": ["Developers"]}],
+        },
+    )
+
+    client.list_users.return_value = {"users": [ALICE]}
+    client.list_groups.return_value = {"groups": [DEVELOPERS]}
+    client.list_group_members.return_value = {"memberCrns": [ALICE["crn"]]}
+
+    # Test module execution
+    with pytest.raises(AnsibleFailJson, match="1 changes failed") as result:
+        iam_bulk.main()
+
+    # No group is named 'Developers', so nothing is added or removed
+    assert result.value.users[0]["errors"][0]["item"] == "Developers"
+    client.add_user_to_group.assert_not_called()
+    client.remove_user_from_group.assert_not_called()
@@ -26,6 +26,9 @@ from ansible_collections.cloudera.cloud.tests.unit import (
     AnsibleExitJson,
 )
 
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
 from ansible_collections.cloudera.cloud.plugins.modules import iam_group
 
 
@@ -87,7 +90,97 @@ def test_iam_group_absent(module_args, mocker):
 
     assert result.value.changed is True
     assert result.value.group == {}
+    assert result.value.mutations == 1
 
     # Verify CdpIamClient was called correctly
     client.get_group_details.assert_called_once_with(group_name=GROUP_NAME)
     client.delete_group.assert_called_once_with(group_name=GROUP_NAME)
+
+
+def test_iam_group_users_mutations(module_args, mocker):
+    """Test iam_group module reporting the number of membership changes."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": GROUP_NAME,
+            "users": ["user-a", "user-b", "user-c"],
+            "parallelism": 4,
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_group.CdpIamClient",
+        autospec=True,
+    ).return_value
+    client.get_group_details.return_value = {
+        "groupName": GROUP_NAME,
+        "members": ["user-a"],
+        "syncMembershipOnUserLogin": True,
+    }
+    client._is_machine_user.return_value = False
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_group.main()
+
+    assert result.value.changed is True
+    assert result.value.mutations == 2
+    assert result.value.elapsed >= 0
+
+    assert sorted(
+        call.kwargs["user_id"] for call in client.add_user_to_group.call_args_list
+    ) == ["user-b", "user-c"]
+    client.remove_user_from_group.assert_not_called()
+
+
+def test_iam_group_users_mutation_errors(module_args, mocker):
+    """Test iam_group module failing with the changes that could not be made."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": GROUP_NAME,
+            "users": ["user-a", "user-b"],
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_group.CdpIamClient",
+        autospec=True,
+    ).return_value
+    client.get_group_details.return_value = {
+        "groupName": GROUP_NAME,
+        "members": [],
+        "syncMembershipOnUserLogin": True,
+    }
+    client._is_machine_user.return_value = False
+    client.add_user_to_group.side_effect = [
+        None,
+        CdpError("Internal error", status=500),
+    ]
+
+    # Test module execution
+    with pytest.raises(AnsibleFailJson, match="1 of 2 changes failed") as result:
+        iam_group.main()
+
+    assert result.value.errors == [dict(item="user-b", error="Internal error")]
+    assert result.value.mutations == 1
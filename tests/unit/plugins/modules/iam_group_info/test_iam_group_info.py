@@ -98,17 +98,23 @@ def test_iam_group_info_list_all_groups(module_args, mocker):
         "groups": [MOCK_GROUP_1, MOCK_GROUP_2],
     }
 
-    # Mock get_group_details responses for detailed mode
-    mock_group_2_details = {
-        **MOCK_GROUP_2,
-        "members": [],
-        "roles": [],
-        "resourceAssignments": [],
+    # Mock the per-group responses for detailed mode
+    group_1_name = MOCK_GROUP_1["groupName"]
+    client.list_group_members.side_effect = lambda group_name: {
+        "memberCrns": (
+            MOCK_GROUP_DETAILS["members"] if group_name == MOCK_GROUP_1["crn"] else []
+        ),
+    }
+    client.list_group_assigned_roles.side_effect = lambda group_name: {
+        "roleCrns": MOCK_GROUP_DETAILS["roles"] if group_name == group_1_name else [],
+    }
+    client.list_group_assigned_resource_roles.side_effect = lambda group_name: {
+        "resourceAssignments": (
+            MOCK_GROUP_DETAILS["resourceAssignments"]
+            if group_name == group_1_name
+            else []
+        ),
     }
-    client.get_group_details.side_effect = [
-        MOCK_GROUP_DETAILS,
-        mock_group_2_details,
-    ]
 
     # Test module execution
     with pytest.raises(AnsibleExitJson) as result:
@@ -123,9 +129,13 @@ def test_iam_group_info_list_all_groups(module_args, mocker):
     assert "roles" in result.value.groups[0]
     assert "resourceAssignments" in result.value.groups[0]
 
-    # Verify API calls
+    assert result.value.groups[0] == MOCK_GROUP_DETAILS
+    assert result.value.groups[1]["members"] == []
+
+    # Verify API calls, with groups listed once rather than per group
     client.list_groups.assert_called_once()
-    assert client.get_group_details.call_count == 2
+    assert client.list_group_members.call_count == 2
+    client.get_group_details.assert_not_called()
 
 
 def test_iam_group_info_list_all_groups_basic(module_args, mocker):
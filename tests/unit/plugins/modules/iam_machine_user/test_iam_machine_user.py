@@ -25,6 +25,9 @@ from ansible_collections.cloudera.cloud.tests.unit import (
     AnsibleExitJson,
 )
 
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
 from ansible_collections.cloudera.cloud.plugins.modules import iam_machine_user
 
 
@@ -97,3 +100,48 @@ def test_iam_machine_user_absent(module_args, mocker):
     client.delete_machine_user.assert_called_once_with(
         machine_user_name=MACHINE_USER_NAME,
     )
+
+
+def test_iam_machine_user_assign_roles_failure(module_args, mocker):
+    """Test iam_machine_user module failing with the errors of a failed role assignment."""
+
+    role_crn = "crn:cdp:iam:us-west-1:altus:role:PowerUser"
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": MACHINE_USER_NAME,
+            "roles": [role_crn],
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_machine_user.CdpIamClient",
+        autospec=True,
+    ).return_value
+    client.get_machine_user_details.return_value = {
+        "machineUserName": MACHINE_USER_NAME,
+        "crn": f"crn:cdp:iam:us-west-1:altus:machineUser:{MACHINE_USER_NAME}",
+        "roles": [],
+        "resourceAssignments": [],
+    }
+    client.assign_machine_user_role.side_effect = CdpError(
+        "Internal error",
+        status=500,
+    )
+
+    # Test module execution
+    with pytest.raises(AnsibleFailJson, match="1 of 1 changes failed") as result:
+        iam_machine_user.main()
+
+    assert result.value.errors == [dict(item=role_crn, error="Internal error")]
+    assert result.value.changed is True
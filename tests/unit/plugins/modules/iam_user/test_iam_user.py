@@ -25,6 +25,9 @@ from ansible_collections.cloudera.cloud.tests.unit import (
     AnsibleExitJson,
 )
 
+from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
+    CdpError,
+)
 from ansible_collections.cloudera.cloud.plugins.modules import iam_user
 
 
@@ -260,8 +263,8 @@ def test_iam_user_create_with_groups(module_args, mocker):
         },
     }
 
-    # Mock manage_user_groups to return True (changes made)
-    client.manage_user_groups.return_value = True
+    # The user is not yet a member of any group
+    client.resolve_user_groups.return_value = []
 
     # Test module execution
     with pytest.raises(AnsibleExitJson) as result:
@@ -278,13 +281,15 @@ def test_iam_user_create_with_groups(module_args, mocker):
         saml_provider_name=None,
     )
 
-    # Verify manage_user_groups was called to add user to groups
-    client.manage_user_groups.assert_called_once_with(
-        user_id=USER_ID,
+    # Verify the groups were checked, then the user added to each
+    client.resolve_user_groups.assert_called_once_with(
         current_groups=[],
         desired_groups=["developers", "admins"],
-        purge=False,
     )
+    assert client.add_user_to_group.call_args_list == [
+        mocker.call(user_id=USER_ID, group_name="developers"),
+        mocker.call(user_id=USER_ID, group_name="admins"),
+    ]
 
 
 def test_iam_user_create_with_nonexistent_group(module_args, mocker):
@@ -335,12 +340,12 @@ def test_iam_user_create_with_nonexistent_group(module_args, mocker):
         },
     }
 
-    # Mock manage_user_groups to raise CdpError for non-existent group
+    # Mock resolve_user_groups to raise CdpError for non-existent group
     from ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client import (
         CdpError,
     )
 
-    client.manage_user_groups.side_effect = CdpError(
+    client.resolve_user_groups.side_effect = CdpError(
         "Group 'nonexistent-group' does not exist. "
         "Please create the group using the iam_group module before adding users to it.",
         status=404,
@@ -353,6 +358,9 @@ def test_iam_user_create_with_nonexistent_group(module_args, mocker):
     assert "nonexistent-group" in str(exc_info.value)
     assert "does not exist" in str(exc_info.value)
 
+    # The groups are checked while planning, before the user is created
+    client.create_user.assert_not_called()
+
 
 def test_iam_user_present_no_changes(module_args, mocker):
     """Test iam_user module with state=present but no changes needed."""
@@ -442,8 +450,6 @@ def test_iam_user_assign_roles(module_args, mocker):
         },
     ]
 
-    client.manage_user_roles.return_value = True
-
     # Test module execution
     with pytest.raises(AnsibleExitJson) as result:
         iam_user.main()
@@ -451,11 +457,9 @@ def test_iam_user_assign_roles(module_args, mocker):
     assert result.value.changed is True
 
     # Verify CdpIamClient was called correctly
-    client.manage_user_roles.assert_called_once_with(
+    client.assign_user_role.assert_called_once_with(
         user_id=USER_ID,  # Uses userId from the fetched user object
-        current_roles=[],
-        desired_roles=[role_crn],
-        purge=False,
+        role=role_crn,
     )
 
 
@@ -515,8 +519,6 @@ def test_iam_user_assign_resource_roles(module_args, mocker):
         },
     ]
 
-    client.manage_user_resource_roles.return_value = True
-
     # Test module execution
     with pytest.raises(AnsibleExitJson) as result:
         iam_user.main()
@@ -524,16 +526,10 @@ def test_iam_user_assign_resource_roles(module_args, mocker):
     assert result.value.changed is True
 
     # Verify CdpIamClient was called correctly
-    client.manage_user_resource_roles.assert_called_once_with(
+    client.assign_user_resource_role.assert_called_once_with(
         user_id=USER_ID,  # Uses userId from the fetched user object
-        current_assignments=[],
-        desired_assignments=[
-            {
-                "resource": resource_crn,
-                "role": resource_role_crn,
-            },
-        ],
-        purge=False,
+        resource_crn=resource_crn,
+        resource_role_crn=resource_role_crn,
     )
 
 
@@ -583,7 +579,7 @@ def test_iam_user_purge_roles(module_args, mocker):
         },
     ]
 
-    client.manage_user_roles.return_value = True
+    client.resolve_user_groups.return_value = []
 
     # Test module execution
     with pytest.raises(AnsibleExitJson) as result:
@@ -592,12 +588,11 @@ def test_iam_user_purge_roles(module_args, mocker):
     assert result.value.changed is True
 
     # Verify CdpIamClient was called correctly
-    client.manage_user_roles.assert_called_once_with(
+    client.unassign_user_role.assert_called_once_with(
         user_id=USER_ID,  # Uses userId from the fetched user object
-        current_roles=[existing_role],
-        desired_roles=[],
-        purge=True,
+        role=existing_role,
     )
+    client.assign_user_role.assert_not_called()
 
 
 def test_iam_user_set_workload_password(module_args, mocker):
@@ -728,3 +723,104 @@ def test_iam_user_create_with_workload_password(module_args, mocker):
         password="SecurePassword123!",
         actor_crn=user_crn,
     )
+
+
+def test_iam_user_check_mode_diff(module_args, mocker):
+    """Test iam_user module reporting planned changes without making them."""
+
+    role_crn = "crn:cdp:iam:us-west-1:altus:role:PowerUser"
+    old_role_crn = "crn:cdp:iam:us-west-1:altus:role:IamViewer"
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "email": USER_EMAIL,
+            "roles": [role_crn],
+            "purge": True,
+            "state": "present",
+            "_ansible_check_mode": True,
+            "_ansible_diff": True,
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_user.CdpIamClient",
+        autospec=True,
+    ).return_value
+
+    client.get_user_details_by_email.return_value = {
+        "userId": USER_ID,
+        "email": USER_EMAIL,
+        "crn": f"crn:cdp:iam:us-west-1:altus:user:{USER_ID}",
+        "roles": [old_role_crn],
+        "resourceAssignments": [],
+    }
+    client.resolve_user_groups.return_value = []
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_user.main()
+
+    assert result.value.changed is True
+    assert result.value.diff == {
+        "before": {"roles": [old_role_crn]},
+        "after": {"roles": [role_crn]},
+    }
+
+    # Verify no changes were made
+    client.assign_user_role.assert_not_called()
+    client.unassign_user_role.assert_not_called()
+    client.get_user_details_by_email.assert_called_once()
+
+
+def test_iam_user_assign_roles_failure(module_args, mocker):
+    """Test iam_user module failing with the errors of a failed role assignment."""
+
+    role_crn = "crn:cdp:iam:us-west-1:altus:role:PowerUser"
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "email": USER_EMAIL,
+            "roles": [role_crn],
+            "state": "present",
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpIamClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.iam_user.CdpIamClient",
+        autospec=True,
+    ).return_value
+    client.get_user_details_by_email.return_value = {
+        "userId": USER_ID,
+        "email": USER_EMAIL,
+        "crn": f"crn:cdp:iam:us-west-1:altus:user:{USER_ID}",
+        "roles": [],
+        "resourceAssignments": [],
+    }
+    client.assign_user_role.side_effect = CdpError("Internal error", status=500)
+
+    # Test module execution
+    with pytest.raises(AnsibleFailJson, match="1 of 1 changes failed") as result:
+        iam_user.main()
+
+    assert result.value.errors == [dict(item=role_crn, error="Internal error")]
+    assert result.value.changed is True
@@ -18,6 +18,9 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import io
+import json
+
 import pytest
 
 from ansible_collections.cloudera.cloud.tests.unit import (
@@ -94,6 +97,39 @@ def _patch_client(mocker):
     ).return_value
 
 
+# Copied, as the module renames resourceAssignments in the returned details
+MOCK_USER_ASSIGNMENTS = {
+    d["userId"]: {
+        "roles": list(d["roles"]),
+        "resourceAssignments": list(d["resourceAssignments"]),
+    }
+    for d in [MOCK_USER_1_DETAILS, MOCK_USER_2_DETAILS]
+}
+
+
+def _mock_snapshot_calls(client):
+    """Helper to mock the bulk IAM calls that assemble MOCK_USER_*_DETAILS."""
+    details = MOCK_USER_ASSIGNMENTS
+
+    client.list_groups.return_value = {
+        "groups": [
+            {
+                "groupName": "test-group",
+                "crn": "crn:cdp:iam:us-west-1:account:group:test-group",
+            },
+        ],
+    }
+    client.list_group_members.return_value = {
+        "memberCrns": [MOCK_USER_2_BASIC["crn"]],
+    }
+    client.list_user_assigned_roles.side_effect = lambda user: {
+        "roleCrns": details[user]["roles"],
+    }
+    client.list_user_assigned_resource_roles.side_effect = lambda user: {
+        "resourceAssignments": details[user]["resourceAssignments"],
+    }
+
+
 def test_iam_user_info_list_all_users(module_args, mocker):
     """Test listing all IAM users with summary view returns basic info without details."""
 
@@ -197,7 +233,7 @@ def test_iam_user_info_get_by_name(module_args, mocker):
     _patch_common(mocker)
     client = _patch_client(mocker)
 
-    client.list_users.return_value = {"users": [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]}
+    client.find_users.return_value = [MOCK_USER_1_BASIC]
     client.get_user_details.return_value = MOCK_USER_1_DETAILS
 
     with pytest.raises(AnsibleExitJson) as result:
@@ -208,7 +244,7 @@ def test_iam_user_info_get_by_name(module_args, mocker):
     assert result.value.users[0]["workloadUsername"] == "u_user1"
     assert "roles" in result.value.users[0]
 
-    client.list_users.assert_called_once()
+    client.find_users.assert_called_once_with("workloadUsername", ["u_user1"])
     client.get_user_details.assert_called_once_with("user-id-1")
 
 
@@ -227,7 +263,7 @@ def test_iam_user_info_get_by_multiple_names(module_args, mocker):
     _patch_common(mocker)
     client = _patch_client(mocker)
 
-    client.list_users.return_value = {"users": [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]}
+    client.find_users.return_value = [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]
     client.get_user_details.side_effect = [MOCK_USER_1_DETAILS, MOCK_USER_2_DETAILS]
 
     with pytest.raises(AnsibleExitJson) as result:
@@ -336,7 +372,7 @@ def test_iam_user_info_name_not_found(module_args, mocker):
     _patch_common(mocker)
     client = _patch_client(mocker)
 
-    client.list_users.return_value = {"users": [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]}
+    client.find_users.return_value = []
 
     with pytest.raises(AnsibleExitJson) as result:
         iam_user_info.main()
@@ -362,17 +398,28 @@ def test_iam_user_info_filter(module_args, mocker):
     client = _patch_client(mocker)
 
     client.list_users_filtered.return_value = [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]
-    client.get_user_details.side_effect = [MOCK_USER_1_DETAILS, MOCK_USER_2_DETAILS]
+    _mock_snapshot_calls(client)
 
     with pytest.raises(AnsibleExitJson) as result:
         iam_user_info.main()
 
     assert result.value.changed is False
     assert len(result.value.users) == 2
+    assert result.value.users[0]["groups"] == []
+    assert result.value.users[1]["groups"] == MOCK_USER_2_DETAILS["groups"]
+    assert result.value.users[1]["roles"] == MOCK_USER_2_DETAILS["roles"]
+    assert (
+        result.value.users[1]["resource_roles"]
+        == MOCK_USER_ASSIGNMENTS["user-id-2"]["resourceAssignments"]
+    )
     client.list_users_filtered.assert_called_once_with(
         {"workloadUsername": "u_user[0-9]+"},
     )
-    assert client.get_user_details.call_count == 2
+
+    # Group memberships come from the snapshot, not per-user lookups
+    client.list_group_members.assert_called_once()
+    client.list_groups_for_user.assert_not_called()
+    client.get_user_details.assert_not_called()
 
 
 def test_iam_user_info_filter_no_match(module_args, mocker):
@@ -419,7 +466,7 @@ def test_iam_user_info_filter_partial_match(module_args, mocker):
     client = _patch_client(mocker)
 
     client.list_users_filtered.return_value = [MOCK_USER_1_BASIC]
-    client.get_user_details.return_value = MOCK_USER_1_DETAILS
+    _mock_snapshot_calls(client)
 
     with pytest.raises(AnsibleExitJson) as result:
         iam_user_info.main()
@@ -427,7 +474,8 @@ def test_iam_user_info_filter_partial_match(module_args, mocker):
     assert result.value.changed is False
     assert len(result.value.users) == 1
     assert result.value.users[0]["workloadUsername"] == "u_user1"
-    client.get_user_details.assert_called_once_with("user-id-1")
+    client.list_user_assigned_roles.assert_called_once_with(user="user-id-1")
+    client.get_user_details.assert_not_called()
 
 
 def test_iam_user_info_check_mode(module_args, mocker):
@@ -501,7 +549,7 @@ def test_iam_user_info_view_summary_by_name(module_args, mocker):
     _patch_common(mocker)
     client = _patch_client(mocker)
 
-    client.list_users.return_value = {"users": [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]}
+    client.find_users.return_value = [MOCK_USER_1_BASIC]
 
     with pytest.raises(AnsibleExitJson) as result:
         iam_user_info.main()
@@ -569,3 +617,121 @@ def test_iam_user_info_view_summary_current_user(module_args, mocker):
     assert "roles" not in result.value.users[0]
     client.get_user.assert_called_once_with()
     client.get_user_details.assert_not_called()
+
+
+def test_iam_user_info_parallelism(module_args, mocker):
+    """Test that concurrent detail lookups keep the listing order."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "parallelism": 4,
+        },
+    )
+
+    _patch_common(mocker)
+    client = _patch_client(mocker)
+
+    users = [
+        {**MOCK_USER_1_BASIC, "userId": f"user-id-{i}", "workloadUsername": f"u_{i}"}
+        for i in range(10)
+    ]
+    client.list_users.return_value = {"users": users}
+    client.list_groups.return_value = {"groups": []}
+    client.list_user_assigned_roles.return_value = {"roleCrns": []}
+    client.list_user_assigned_resource_roles.return_value = {
+        "resourceAssignments": [],
+    }
+
+    with pytest.raises(AnsibleExitJson) as result:
+        iam_user_info.main()
+
+    assert [u["userId"] for u in result.value.users] == [
+        f"user-id-{i}" for i in range(10)
+    ]
+    assert all("resource_roles" in u for u in result.value.users)
+    assert client.list_user_assigned_roles.call_count == 10
+
+
+def test_iam_user_info_fails_on_detail_error(module_args, mocker):
+    """Test that a failed detail request fails the module rather than dropping the user."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "user_id": ["user-id-1", "user-id-2"],
+            "parallelism": 2,
+        },
+    )
+
+    _patch_common(mocker)
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.AnsibleCdpClient._sign",
+        return_value="mock_signature",
+    )
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.time.sleep",
+    )
+
+    users = {u["userId"]: u for u in [MOCK_USER_1_BASIC, MOCK_USER_2_BASIC]}
+
+    def fetch_url(module, url, method, headers, data, timeout):
+        path = url[len(BASE_URL) :]
+        request = json.loads(data or "{}")
+        if path == "/api/v1/iam/listGroupsForUser" and request["userId"] == "user-id-2":
+            return None, {"status": 500, "msg": "Internal Server Error"}
+        responses = {
+            "/api/v1/iam/listUsers": lambda: {"users": list(users.values())},
+            "/api/v1/iam/getUser": lambda: {"user": users[request.get("userId")]},
+            "/api/v1/iam/listUserAssignedRoles": lambda: {"roleCrns": []},
+            "/api/v1/iam/listUserAssignedResourceRoles": lambda: {
+                "resourceAssignments": [],
+            },
+            "/api/v1/iam/listGroupsForUser": lambda: {"groupCrns": []},
+        }
+        body = json.dumps(responses[path]()).encode("utf-8")
+        return io.BytesIO(body), {"status": 200}
+
+    mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.cdp_client.fetch_url",
+        side_effect=fetch_url,
+    )
+
+    with pytest.raises(AnsibleFailJson) as result:
+        iam_user_info.main()
+
+    assert "listGroupsForUser" in result.value.msg
+
+
+def test_iam_user_info_persisted_user_index(module_args, mocker, tmp_path):
+    """Test that name lookups can use a user index persisted across runs."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "name": ["u_user1"],
+            "view": "summary",
+            "user_index": True,
+            "user_index_dir": str(tmp_path),
+            "user_index_ttl": 600,
+        },
+    )
+
+    _patch_common(mocker)
+    client = _patch_client(mocker)
+
+    client.find_users.return_value = [MOCK_USER_1_BASIC]
+
+    with pytest.raises(AnsibleExitJson):
+        iam_user_info.main()
+
+    client.use_user_index.assert_called_once()
+    kwargs = client.use_user_index.call_args.kwargs
+    assert kwargs["path"].startswith(str(tmp_path))
+    assert kwargs["ttl"] == 600
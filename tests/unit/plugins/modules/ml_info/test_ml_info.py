@@ -121,7 +121,12 @@ def test_ml_info_default_list_all(module_args, mocker):
     assert len(result.value.workspaces) == len(MOCK_WORKSPACES)
 
     # Verify describe_all_workspaces was called with env=None
-    client.describe_all_workspaces.assert_called_once_with(None)
+    client.describe_all_workspaces.assert_called_once_with(
+        None,
+        parallelism=1,
+        summary=False,
+        summary_fields=None,
+    )
 
 
 def test_ml_info_list_by_environment(module_args, mocker):
@@ -171,7 +176,54 @@ def test_ml_info_list_by_environment(module_args, mocker):
         assert workspace["environmentName"] == MOCK_WORKSPACES[0]["environmentName"]
 
     # Verify describe_all_workspaces was called with env="test-env"
-    client.describe_all_workspaces.assert_called_once_with(TEST_ENV_NAME)
+    client.describe_all_workspaces.assert_called_once_with(
+        TEST_ENV_NAME,
+        parallelism=1,
+        summary=False,
+        summary_fields=None,
+    )
+
+
+def test_ml_info_summary_parallelism(module_args, mocker):
+    """Test ml_info module passing parallelism and summary mode to the client."""
+
+    module_args(
+        {
+            "endpoint": BASE_URL,
+            "access_key": ACCESS_KEY,
+            "private_key": PRIVATE_KEY,
+            "parallelism": 4,
+            "summary": True,
+            "summary_fields": ["instanceName", "instanceStatus"],
+        },
+    )
+
+    # Patch load_cdp_config to avoid reading real config files
+    config = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.module_utils.common.load_cdp_config",
+    )
+    config.return_value = (FILE_ACCESS_KEY, FILE_PRIVATE_KEY, FILE_REGION)
+
+    # Patch CdpMlClient to avoid real API calls
+    client = mocker.patch(
+        "ansible_collections.cloudera.cloud.plugins.modules.ml_info.CdpMlClient",
+        autospec=True,
+    ).return_value
+
+    client.describe_all_workspaces.return_value = MOCK_WORKSPACES
+
+    # Test module execution
+    with pytest.raises(AnsibleExitJson) as result:
+        ml_info.main()
+
+    assert result.value.workspaces == MOCK_WORKSPACES
+
+    client.describe_all_workspaces.assert_called_once_with(
+        None,
+        parallelism=4,
+        summary=True,
+        summary_fields=["instanceName", "instanceStatus"],
+    )
 
 
 def test_ml_info_describe_by_name_and_env(module_args, mocker):
@@ -327,7 +379,12 @@ def test_ml_info_empty_workspaces_list(module_args, mocker):
     assert result.value.workspaces == []
 
     # Verify describe_all_workspaces was called
-    client.describe_all_workspaces.assert_called_once_with(None)
+    client.describe_all_workspaces.assert_called_once_with(
+        None,
+        parallelism=1,
+        summary=False,
+        summary_fields=None,
+    )
 
 
 def test_ml_info_workspace_not_found(module_args, mocker):